@@ -1,12 +1,19 @@
 """CrewAI agent definitions for financial analysis."""
 
-# Ensure data providers are registered on import
-import src.data  # noqa: F401
-from src.agents.ai_technical_agent import AITechnicalAnalysisAgent
-from src.agents.analysis import FundamentalAnalysisAgent, TechnicalAnalysisAgent
-from src.agents.base import AgentConfig, BaseAgent
-from src.agents.crew import AnalysisCrew
-from src.agents.sentiment import SentimentAgent, SignalSynthesisAgent
+import importlib
+
+# Agent classes are imported on first access so that importing one agent module
+# does not load CrewAI and the LLM stack.
+_EXPORTS = {
+    "BaseAgent": "src.agents.base",
+    "AgentConfig": "src.agents.base",
+    "TechnicalAnalysisAgent": "src.agents.analysis",
+    "AITechnicalAnalysisAgent": "src.agents.ai_technical_agent",
+    "FundamentalAnalysisAgent": "src.agents.analysis",
+    "SentimentAgent": "src.agents.sentiment",
+    "SignalSynthesisAgent": "src.agents.sentiment",
+    "AnalysisCrew": "src.agents.crew",
+}
 
 __all__ = [
     "BaseAgent",
@@ -18,3 +25,9 @@ __all__ = [
     "SignalSynthesisAgent",
     "AnalysisCrew",
 ]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
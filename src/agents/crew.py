@@ -6,6 +6,7 @@ from src.agents.analysis import FundamentalAnalysisAgent, TechnicalAnalysisAgent
 from src.agents.sentiment import SentimentAgent, SignalSynthesisAgent
 from src.utils.llm_check import check_llm_configuration
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled
 
 logger = get_logger(__name__)
 
@@ -47,6 +48,7 @@ class AnalysisCrew:
                 "Set ANTHROPIC_API_KEY or OPENAI_API_KEY for AI-powered analysis."
             )
 
+    @profiled("analysis.rule_based")
     def analyze_instrument(
         self,
         ticker: str,
@@ -139,11 +141,16 @@ class AnalysisCrew:
             context = additional_context or {}
             logger.debug(f"Starting analysis for {len(tickers)} pre-filtered instruments")
 
+            self.prefetch_news(tickers, context)
+
             analysis_results = []
-            for ticker in tickers:
-                result = self.analyze_instrument(ticker, context)
-                if result.get("status") == "success":
-                    analysis_results.append(result)
+            try:
+                for ticker in tickers:
+                    result = self.analyze_instrument(ticker, context)
+                    if result.get("status") == "success":
+                        analysis_results.append(result)
+            finally:
+                self.clear_prefetched_news()
 
             # Sort by confidence
             analysis_results.sort(key=lambda x: x.get("confidence", 0), reverse=True)
@@ -163,6 +170,49 @@ class AnalysisCrew:
                 "analysis_results": [],
             }
 
+    def prefetch_news(
+        self,
+        tickers: list[str],
+        additional_context: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Fetch news for all tickers and score sentiment in a single FinBERT job.
+
+        The sentiment agent's news fetcher then serves each ticker from the prefetch.
+        Failures are logged and leave per-ticker fetching in place.
+
+        Args:
+            tickers: Tickers about to be analyzed
+            additional_context: Additional context (uses 'analysis_date' if present)
+        """
+        if len(tickers) < 2:
+            return
+
+        news_fetcher = self._news_fetcher()
+        if news_fetcher is None or not hasattr(news_fetcher, "prefetch"):
+            return
+
+        try:
+            context = additional_context or {}
+            if "analysis_date" in context:
+                news_fetcher.set_historical_date(context["analysis_date"])
+            prefetched = news_fetcher.prefetch(tickers)
+            logger.debug(f"Prefetched news for {prefetched}/{len(tickers)} tickers")
+        except Exception as e:
+            logger.warning(f"News prefetch failed, fetching per ticker: {e}")
+
+    def clear_prefetched_news(self) -> None:
+        """Drop prefetched news that no analyzed ticker consumed."""
+        news_fetcher = self._news_fetcher()
+        if news_fetcher is not None and hasattr(news_fetcher, "clear_prefetched"):
+            news_fetcher.clear_prefetched()
+
+    def _news_fetcher(self) -> Optional[Any]:
+        """Get the sentiment agent's news fetcher tool, if it has one."""
+        return next(
+            (t for t in self.sentiment_agent.tools if getattr(t, "name", None) == "NewsFetcher"),
+            None,
+        )
+
     def get_agent_status(self) -> dict[str, Any]:
         """Get status of all agents in crew.
 
@@ -1,8 +1,6 @@
 """CrewAI-based intelligent agents for analysis."""
 
-from typing import Any, Optional
-
-from crewai import Agent, Task
+from typing import TYPE_CHECKING, Any, Optional
 
 from src.agents.output_models import (
     FundamentalAnalysisOutput,
@@ -15,6 +13,9 @@ from src.config.llm import initialize_llm_client
 from src.config.schemas import LLMConfig
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
 logger = get_logger(__name__)
 
 
@@ -43,7 +44,7 @@ class CrewAIAgentFactory:
         self.llm_client = initialize_llm_client(self.llm_config)
         logger.debug(f"Initialized CrewAI factory with {self.llm_config.provider} provider")
 
-    def create_technical_analysis_agent(self, tools: list = None) -> Agent:
+    def create_technical_analysis_agent(self, tools: list = None) -> "Agent":
         """Create technical analysis agent.
 
         Args:
@@ -52,6 +53,8 @@ class CrewAIAgentFactory:
         Returns:
             Configured CrewAI Agent for technical analysis
         """
+        from crewai import Agent
+
         return Agent(
             role="Senior Technical Analyst",
             goal=(
@@ -94,7 +97,7 @@ class CrewAIAgentFactory:
             allow_delegation=False,
         )
 
-    def create_fundamental_analysis_agent(self, tools: list = None) -> Agent:
+    def create_fundamental_analysis_agent(self, tools: list = None) -> "Agent":
         """Create fundamental analysis agent.
 
         Args:
@@ -103,6 +106,8 @@ class CrewAIAgentFactory:
         Returns:
             Configured CrewAI Agent for fundamental analysis
         """
+        from crewai import Agent
+
         return Agent(
             role="Fundamental Analyst",
             goal=(
@@ -124,7 +129,7 @@ class CrewAIAgentFactory:
             allow_delegation=False,
         )
 
-    def create_sentiment_analysis_agent(self, tools: list = None) -> Agent:
+    def create_sentiment_analysis_agent(self, tools: list = None) -> "Agent":
         """Create sentiment analysis agent.
 
         Args:
@@ -133,6 +138,8 @@ class CrewAIAgentFactory:
         Returns:
             Configured CrewAI Agent for sentiment analysis
         """
+        from crewai import Agent
+
         return Agent(
             role="Sentiment Analyst",
             goal=(
@@ -162,12 +169,14 @@ class CrewAIAgentFactory:
             allow_delegation=False,
         )
 
-    def create_signal_synthesizer_agent(self) -> Agent:
+    def create_signal_synthesizer_agent(self) -> "Agent":
         """Create signal synthesizer agent.
 
         Returns:
             Configured CrewAI Agent for signal synthesis
         """
+        from crewai import Agent
+
         return Agent(
             role="Investment Signal Synthesizer",
             goal=(
@@ -211,10 +220,10 @@ class CrewAITaskFactory:
 
     @staticmethod
     def create_technical_analysis_task(
-        agent: Agent,
+        agent: "Agent",
         ticker: str,
         context: dict[str, Any],
-    ) -> Task:
+    ) -> "Task":
         """Create technical analysis task.
 
         Args:
@@ -225,6 +234,8 @@ class CrewAITaskFactory:
         Returns:
             Configured Task object
         """
+        from crewai import Task
+
         return Task(
             description=(
                 f"Extract and interpret the pre-calculated technical indicators for {ticker}.\n"
@@ -283,10 +294,10 @@ class CrewAITaskFactory:
 
     @staticmethod
     def create_fundamental_analysis_task(
-        agent: Agent,
+        agent: "Agent",
         ticker: str,
         context: dict[str, Any],
-    ) -> Task:
+    ) -> "Task":
         """Create fundamental analysis task.
 
         Args:
@@ -297,6 +308,8 @@ class CrewAITaskFactory:
         Returns:
             Configured Task object
         """
+        from crewai import Task
+
         return Task(
             description=(
                 f"Analyze fundamentals of {ticker}.\n"
@@ -373,10 +386,10 @@ class CrewAITaskFactory:
 
     @staticmethod
     def create_sentiment_analysis_task(
-        agent: Agent,
+        agent: "Agent",
         ticker: str,
         context: dict[str, Any],
-    ) -> Task:
+    ) -> "Task":
         """Create sentiment analysis task.
 
         Args:
@@ -387,6 +400,8 @@ class CrewAITaskFactory:
         Returns:
             Configured Task object
         """
+        from crewai import Task
+
         return Task(
             description=(
                 f"Analyze news sentiment for {ticker}.\n"
@@ -427,12 +442,12 @@ class CrewAITaskFactory:
 
     @staticmethod
     def create_signal_synthesis_task(
-        agent: Agent,
+        agent: "Agent",
         ticker: str,
         technical_analysis: dict[str, Any],
         fundamental_analysis: dict[str, Any],
         sentiment_analysis: dict[str, Any],
-    ) -> Task:
+    ) -> "Task":
         """Create signal synthesis task.
 
         Args:
@@ -451,6 +466,8 @@ class CrewAITaskFactory:
         w_fund = config.analysis.weight_fundamental
         w_sent = config.analysis.weight_sentiment
 
+        from crewai import Task
+
         return Task(
             description=(
                 f"Synthesize all analyses for {ticker} into a structured investment signal.\n"
@@ -1,14 +1,15 @@
 """Hybrid intelligence system combining LLM and rule-based analysis."""
 
 import gc
-from typing import Any, Optional
-
-from crewai import Agent, Crew, Task
+from typing import TYPE_CHECKING, Any, Optional
 
 from src.agents.base import BaseAgent
 from src.llm.token_tracker import TokenTracker
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
 logger = get_logger(__name__)
 
 
@@ -17,7 +18,7 @@ class HybridAnalysisAgent:
 
     def __init__(
         self,
-        crewai_agent: Agent,
+        crewai_agent: "Agent",
         fallback_agent: Optional[BaseAgent] = None,
         token_tracker: Optional[TokenTracker] = None,
         enable_fallback: bool = True,
@@ -39,7 +40,7 @@ class HybridAnalysisAgent:
 
     def execute_task(
         self,
-        task: Task,
+        task: "Task",
         context: dict[str, Any] = None,
     ) -> dict[str, Any]:
         """Execute task using LLM with fallback to rule-based.
@@ -62,6 +63,8 @@ class HybridAnalysisAgent:
             agent_llm = self.crewai_agent.llm if hasattr(self.crewai_agent, "llm") else None
 
             # Execute using minimal crew with explicit model configuration
+            from crewai import Crew
+
             crew = Crew(
                 agents=[self.crewai_agent],
                 tasks=[task],
@@ -193,7 +196,7 @@ class HybridAnalysisCrew:
 
     def execute_analysis(
         self,
-        tasks: dict[str, Task],
+        tasks: dict[str, "Task"],
         context: dict[str, Any] = None,
         progress_callback: Optional[callable] = None,
     ) -> dict[str, Any]:
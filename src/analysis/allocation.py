@@ -1,13 +1,38 @@
-"""Portfolio allocation engine with position sizing and diversification management."""
+"""Portfolio allocation engine with position sizing and diversification management.
 
-from datetime import datetime
-from typing import Any
+Two allocation methods are available. "greedy" (the default) walks signals in rank
+order and sizes each position against the capital and caps left by earlier ones.
+"optimize" sizes all positions at once: it finds the allocation closest to each
+signal's Kelly-capped size that satisfies the position, sector, market and capital
+limits together, weighting deviations by the signal's Kelly edge so that stronger
+signals are cut back less when a limit binds.
+"""
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from src.analysis.models import AllocationSuggestion, PortfolioAllocation
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from src.analysis.portfolio_risk import PortfolioRiskEngine
+
 logger = get_logger(__name__)
 
+ALLOCATION_METHODS = ("greedy", "optimize")
+
+# Share of available capital that may be allocated (5% buffer)
+CAPITAL_BUFFER = 0.95
+
+# Smallest position worth opening, in EUR
+MIN_POSITION_EUR = 50.0
+
+# Optimizer stopping criteria: constraint violation in EUR and iteration budget
+OPTIMIZER_TOLERANCE_EUR = 0.01
+OPTIMIZER_MAX_ITERATIONS = 2000
+
 
 class AllocationEngine:
     """Manages portfolio position sizing and allocation suggestions."""
@@ -19,6 +44,9 @@ class AllocationEngine:
         max_position_size_pct: float = 10.0,
         max_sector_concentration_pct: float = 20.0,
         min_diversification_score: float = 60.0,
+        max_market_concentration_pct: float = 100.0,
+        method: str = "greedy",
+        risk_engine: "PortfolioRiskEngine | None" = None,
     ):
         """Initialize allocation engine.
 
@@ -28,12 +56,27 @@ class AllocationEngine:
             max_position_size_pct: Maximum single position size (% of capital)
             max_sector_concentration_pct: Maximum sector concentration (% of capital)
             min_diversification_score: Minimum diversification score target
+            max_market_concentration_pct: Maximum market concentration (% of capital)
+            method: Allocation method, "greedy" or "optimize"
+            risk_engine: Optional PortfolioRiskEngine adding return correlations to
+                the diversification score
+
+        Raises:
+            ValueError: If method is not recognized
         """
+        if method not in ALLOCATION_METHODS:
+            raise ValueError(
+                f"Unknown allocation method: {method}. Available: {', '.join(ALLOCATION_METHODS)}"
+            )
+
         self.total_capital = total_capital
         self.monthly_deposit = monthly_deposit
         self.max_position_size_pct = max_position_size_pct
         self.max_sector_concentration_pct = max_sector_concentration_pct
+        self.max_market_concentration_pct = max_market_concentration_pct
         self.min_diversification_score = min_diversification_score
+        self.method = method
+        self.risk_engine = risk_engine
 
         logger.debug(
             f"Allocation engine initialized: capital={total_capital}€, "
@@ -68,20 +111,107 @@ class AllocationEngine:
         # Rank signals by recommendation strength and confidence
         ranked_signals = self._rank_signals(signals)
 
-        # Generate position suggestions
+        if self.method == "optimize":
+            suggested_positions, current_sector_allocation, current_market_allocation = (
+                self._allocate_optimized(ranked_signals, available_for_allocation)
+            )
+        else:
+            suggested_positions, current_sector_allocation, current_market_allocation = (
+                self._allocate_greedy(ranked_signals, available_for_allocation)
+            )
+        current_capital_used = sum(current_sector_allocation.values())
+
+        # Calculate diversification score, including positions already held
+        position_values = {
+            ticker: position.get("value", 0) for ticker, position in existing_positions.items()
+        }
+        for position in suggested_positions:
+            position_values[position.ticker] = (
+                position_values.get(position.ticker, 0) + position.eur
+            )
+        diversification_score = self._calculate_diversification_score(
+            current_sector_allocation,
+            current_market_allocation,
+            current_capital_used,
+            position_values,
+            self._analysis_date(signals),
+        )
+
+        # Convert sector/market allocations to percentages
+        sector_div = {
+            sector: round((amount / current_capital_used) * 100, 2)
+            for sector, amount in current_sector_allocation.items()
+            if current_capital_used > 0 and sector is not None
+        }
+        market_div = {
+            market: round((amount / current_capital_used) * 100, 2)
+            for market, amount in current_market_allocation.items()
+            if current_capital_used > 0 and market is not None
+        }
+
+        # Calculate instrument type diversification (approximation)
+        instrument_div = self._estimate_instrument_diversification(suggested_positions)
+
+        # Create allocation result
+        allocation = PortfolioAllocation(
+            total_capital=self.total_capital,
+            monthly_deposit=self.monthly_deposit,
+            available_for_allocation=available_for_allocation,
+            suggested_positions=suggested_positions,
+            diversification_score=round(diversification_score, 2),
+            market_diversification=market_div if market_div else {"unallocated": 100.0},
+            sector_diversification=sector_div if sector_div else {"unallocated": 100.0},
+            instrument_diversification=instrument_div,
+            total_allocated=round(current_capital_used, 2),
+            total_allocated_pct=(
+                round((current_capital_used / self.total_capital) * 100, 2)
+                if self.total_capital > 0
+                else 0
+            ),
+            unallocated=round(self.total_capital - allocated_capital - current_capital_used, 2),
+            constraints_applied={
+                "max_position_size_pct": self.max_position_size_pct,
+                "max_sector_concentration_pct": self.max_sector_concentration_pct,
+                "max_market_concentration_pct": self.max_market_concentration_pct,
+                "min_diversification_score": self.min_diversification_score,
+            },
+            generated_at=datetime.now(),
+        )
+
+        logger.debug(
+            f"Allocation complete: {len(suggested_positions)} positions, "
+            f"{allocation.total_allocated_pct}% allocated, "
+            f"diversification score: {diversification_score:.0f}"
+        )
+
+        return allocation
+
+    def _allocate_greedy(
+        self,
+        ranked_signals: list[dict[str, Any]],
+        available_capital: float,
+    ) -> tuple[list[AllocationSuggestion], dict[str, float], dict[str, float]]:
+        """Size positions one signal at a time in rank order.
+
+        Args:
+            ranked_signals: Signals ranked best first
+            available_capital: Capital available for new positions in EUR
+
+        Returns:
+            Tuple of (suggested positions, EUR by sector, EUR by market)
+        """
         suggested_positions: list[AllocationSuggestion] = []
         current_capital_used = 0.0
         current_sector_allocation: dict[str, float] = {}
         current_market_allocation: dict[str, float] = {}
 
         for signal in ranked_signals:
-            if current_capital_used >= available_for_allocation * 0.95:  # Leave 5% buffer
+            if current_capital_used >= available_capital * CAPITAL_BUFFER:
                 break
 
             ticker = signal.get("ticker", "UNKNOWN")
             sector = signal.get("sector") or "Unknown"
             market = signal.get("market") or "unknown"
-            current_price = signal.get("current_price", 0)
             confidence = signal.get("confidence", 0)
             final_score = signal.get("final_score", 50)
 
@@ -90,31 +220,14 @@ class AllocationEngine:
                 logger.debug(f"Skipping {ticker}: low confidence ({confidence}%)")
                 continue
 
-            # Calculate position size using Kelly criterion (modified)
-            max_position_eur = self.total_capital * (self.max_position_size_pct / 100)
-            expected_return = (
-                signal.get("expected_return_max", 0) + signal.get("expected_return_min", 0)
-            ) / 2
-            win_rate = confidence / 100.0
-
-            # Modified Kelly: position_size = (win_rate * avg_return - (1 - win_rate)) / avg_return
-            if expected_return > 0:
-                kelly_fraction = ((win_rate * expected_return) - (1 - win_rate)) / max(
-                    expected_return, 1
-                )
-                kelly_fraction = max(0, min(kelly_fraction, 0.25))  # Cap at 25%
-                position_size = max_position_eur * kelly_fraction
-            else:
-                position_size = 0
-
             # Enforce constraints
             position_size = self._apply_constraints(
-                position_size,
+                self._kelly_position_size(signal),
                 ticker,
                 sector,
                 market,
                 current_capital_used,
-                available_for_allocation,
+                available_capital,
                 current_sector_allocation,
                 current_market_allocation,
             )
@@ -123,17 +236,7 @@ class AllocationEngine:
                 logger.debug(f"Skipping {ticker}: position size constraint violation")
                 continue
 
-            # Create allocation suggestion
-            shares = position_size / current_price if current_price > 0 else 0
-            percentage = (position_size / self.total_capital) * 100 if self.total_capital > 0 else 0
-            allocation = AllocationSuggestion(
-                ticker=ticker,
-                eur=round(position_size, 2),
-                percentage=round(percentage, 2),
-                shares=round(shares, 2) if shares > 0 else None,
-            )
-
-            suggested_positions.append(allocation)
+            suggested_positions.append(self._suggestion(signal, position_size))
             current_capital_used += position_size
 
             # Update diversification tracking
@@ -149,58 +252,172 @@ class AllocationEngine:
                 f"(confidence: {confidence}%, score: {final_score}/100)"
             )
 
-        # Calculate diversification score
-        diversification_score = self._calculate_diversification_score(
-            current_sector_allocation, current_market_allocation, current_capital_used
-        )
+        return suggested_positions, current_sector_allocation, current_market_allocation
 
-        # Convert sector/market allocations to percentages
-        sector_div = {
-            sector: round((amount / current_capital_used) * 100, 2)
-            for sector, amount in current_sector_allocation.items()
-            if current_capital_used > 0 and sector is not None
-        }
-        market_div = {
-            market: round((amount / current_capital_used) * 100, 2)
-            for market, amount in current_market_allocation.items()
-            if current_capital_used > 0 and market is not None
-        }
+    def _allocate_optimized(
+        self,
+        ranked_signals: list[dict[str, Any]],
+        available_capital: float,
+    ) -> tuple[list[AllocationSuggestion], dict[str, float], dict[str, float]]:
+        """Size all positions at once under the position, sector, market and capital limits.
 
-        # Calculate instrument type diversification (approximation)
-        instrument_div = self._estimate_instrument_diversification(suggested_positions)
+        Args:
+            ranked_signals: Signals ranked best first
+            available_capital: Capital available for new positions in EUR
 
-        # Create allocation result
-        allocation = PortfolioAllocation(
-            total_capital=self.total_capital,
-            monthly_deposit=self.monthly_deposit,
-            available_for_allocation=available_for_allocation,
-            suggested_positions=suggested_positions,
-            diversification_score=round(diversification_score, 2),
-            market_diversification=market_div if market_div else {"unallocated": 100.0},
-            sector_diversification=sector_div if sector_div else {"unallocated": 100.0},
-            instrument_diversification=instrument_div,
-            total_allocated=round(current_capital_used, 2),
-            total_allocated_pct=(
-                round((current_capital_used / self.total_capital) * 100, 2)
-                if self.total_capital > 0
-                else 0
-            ),
-            unallocated=round(self.total_capital - allocated_capital - current_capital_used, 2),
-            constraints_applied={
-                "max_position_size_pct": self.max_position_size_pct,
-                "max_sector_concentration_pct": self.max_sector_concentration_pct,
-                "min_diversification_score": self.min_diversification_score,
-            },
-            generated_at=datetime.now(),
+        Returns:
+            Tuple of (suggested positions, EUR by sector, EUR by market)
+        """
+        candidates = [
+            signal
+            for signal in ranked_signals
+            if signal.get("confidence", 0) >= 50 and self._kelly_position_size(signal) > 0
+        ]
+        if not candidates:
+            return [], {}, {}
+
+        max_position_eur = self.total_capital * (self.max_position_size_pct / 100)
+        targets = np.array([self._kelly_position_size(s) for s in candidates])
+        sectors, sector_codes = np.unique(
+            [s.get("sector") or "Unknown" for s in candidates], return_inverse=True
         )
+        markets, market_codes = np.unique(
+            [s.get("market") or "unknown" for s in candidates], return_inverse=True
+        )
+
+        # Each limit caps the sum of its group's positions
+        limits = [
+            (
+                sector_codes,
+                np.full(len(sectors), self.total_capital * self.max_sector_concentration_pct / 100),
+            ),
+            (
+                market_codes,
+                np.full(len(markets), self.total_capital * self.max_market_concentration_pct / 100),
+            ),
+            (np.zeros(len(candidates), dtype=int), np.array([available_capital * CAPITAL_BUFFER])),
+        ]
+        sizes = self._solve_allocation(targets, targets / max_position_eur, limits)
+
+        # Positions too small to open are dropped; this only loosens the limits
+        sizes[sizes < MIN_POSITION_EUR] = 0
+
+        suggested_positions = [
+            self._suggestion(signal, size)
+            for signal, size in zip(candidates, sizes, strict=True)
+            if size > 0
+        ]
+        sector_allocation = {
+            sector: float(amount)
+            for sector, amount in zip(sectors, np.bincount(sector_codes, sizes), strict=True)
+            if amount > 0
+        }
+        market_allocation = {
+            market: float(amount)
+            for market, amount in zip(markets, np.bincount(market_codes, sizes), strict=True)
+            if amount > 0
+        }
 
         logger.debug(
-            f"Allocation complete: {len(suggested_positions)} positions, "
-            f"{allocation.total_allocated_pct}% allocated, "
-            f"diversification score: {diversification_score:.0f}"
+            f"Optimized allocation: {len(suggested_positions)}/{len(candidates)} candidates, "
+            f"{sizes.sum():.2f}€ of {available_capital:.2f}€"
         )
+        return suggested_positions, sector_allocation, market_allocation
 
-        return allocation
+    @staticmethod
+    def _solve_allocation(
+        targets: np.ndarray,
+        edges: np.ndarray,
+        limits: list[tuple[np.ndarray, np.ndarray]],
+    ) -> np.ndarray:
+        """Find the sizes closest to their targets that respect every group limit.
+
+        Minimizes sum(edge * (size - target)^2) / 2 subject to 0 <= size <= target
+        and, for each limit, the sum of sizes in each group being at most its cap. Dual
+        ascent on the limits' shadow prices gives each size in closed form as
+        target - price / edge, where price is the sum of its groups' shadow prices.
+
+        Args:
+            targets: Desired size per position (upper bounds)
+            edges: Positive weight per position; higher-edge positions shrink less
+            limits: (group index per position, cap per group) pairs
+
+        Returns:
+            Position sizes satisfying all limits
+        """
+        prices = [np.zeros(len(caps)) for _, caps in limits]
+        damping = 1.0 / len(limits)
+        sizes = targets.copy()
+
+        for _ in range(OPTIMIZER_MAX_ITERATIONS):
+            price = sum(p[codes] for p, (codes, _) in zip(prices, limits, strict=True))
+            sizes = np.clip(targets - price / edges, 0, targets)
+
+            converged = True
+            for p, (codes, caps) in zip(prices, limits, strict=True):
+                excess = np.bincount(codes, sizes, minlength=len(caps)) - caps
+                # Groups under their cap release shadow price, over-cap groups add it
+                slope = np.bincount(codes, (sizes > 0) / edges, minlength=len(caps))
+                step = damping * excess / np.maximum(slope, 1e-12)
+                converged &= bool(
+                    np.all(excess <= OPTIMIZER_TOLERANCE_EUR)
+                    and np.all(np.abs(excess[p > 0]) <= OPTIMIZER_TOLERANCE_EUR)
+                )
+                p[:] = np.maximum(0, p + step)
+
+            if converged:
+                break
+
+        # Scale down any group still over its cap; scaling never breaks another limit
+        for codes, caps in limits:
+            totals = np.bincount(codes, sizes, minlength=len(caps))
+            scale = np.minimum(1.0, caps / np.maximum(totals, 1e-12))
+            sizes = sizes * scale[codes]
+
+        return sizes
+
+    def _kelly_position_size(self, signal: dict[str, Any]) -> float:
+        """Calculate a signal's position size using the Kelly criterion (modified).
+
+        Args:
+            signal: Investment signal with confidence and expected returns
+
+        Returns:
+            Position size in EUR, capped at 25% of the maximum position size
+        """
+        max_position_eur = self.total_capital * (self.max_position_size_pct / 100)
+        expected_return = (
+            signal.get("expected_return_max", 0) + signal.get("expected_return_min", 0)
+        ) / 2
+        win_rate = signal.get("confidence", 0) / 100.0
+
+        # Modified Kelly: position_size = (win_rate * avg_return - (1 - win_rate)) / avg_return
+        if expected_return <= 0:
+            return 0
+
+        kelly_fraction = ((win_rate * expected_return) - (1 - win_rate)) / max(expected_return, 1)
+        kelly_fraction = max(0, min(kelly_fraction, 0.25))  # Cap at 25%
+        return max_position_eur * kelly_fraction
+
+    def _suggestion(self, signal: dict[str, Any], position_size: float) -> AllocationSuggestion:
+        """Create an allocation suggestion for a position size.
+
+        Args:
+            signal: Investment signal
+            position_size: Position size in EUR
+
+        Returns:
+            AllocationSuggestion with amount, share of capital and shares
+        """
+        current_price = signal.get("current_price", 0)
+        shares = position_size / current_price if current_price > 0 else 0
+        percentage = (position_size / self.total_capital) * 100 if self.total_capital > 0 else 0
+        return AllocationSuggestion(
+            ticker=signal.get("ticker", "UNKNOWN"),
+            eur=round(position_size, 2),
+            percentage=round(percentage, 2),
+            shares=round(shares, 2) if shares > 0 else None,
+        )
 
     def _rank_signals(self, signals: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Rank signals by investment quality.
@@ -274,13 +491,17 @@ class AllocationEngine:
         if current_sector_total > max_sector_eur:
             adjusted_size = max(0, max_sector_eur - sector_allocation.get(sector, 0))
 
-        # Constraint 3: Don't exceed available capital
+        # Constraint 3: Max market concentration
+        max_market_eur = self.total_capital * (self.max_market_concentration_pct / 100)
+        if market_allocation.get(market, 0) + adjusted_size > max_market_eur:
+            adjusted_size = max(0, max_market_eur - market_allocation.get(market, 0))
+
+        # Constraint 4: Don't exceed available capital
         if current_capital_used + adjusted_size > available_capital:
             adjusted_size = max(0, available_capital - current_capital_used)
 
-        # Constraint 4: Minimum position size (at least 50€ if allocated)
-        min_position = 50.0
-        if 0 < adjusted_size < min_position:
+        # Constraint 5: Minimum position size (at least 50€ if allocated)
+        if 0 < adjusted_size < MIN_POSITION_EUR:
             adjusted_size = 0
 
         return adjusted_size
@@ -290,13 +511,20 @@ class AllocationEngine:
         sector_allocation: dict[str, float],
         market_allocation: dict[str, float],
         total_allocated: float,
+        position_values: dict[str, float] | None = None,
+        as_of: date | None = None,
     ) -> float:
         """Calculate portfolio diversification score.
 
+        With a risk engine and position values, a score for the spread over
+        correlation clusters of daily returns is weighted in as well.
+
         Args:
             sector_allocation: Allocation by sector in EUR
             market_allocation: Allocation by market in EUR
             total_allocated: Total capital allocated
+            position_values: Position value in EUR by ticker, for correlations
+            as_of: Last date of price data for correlations (default: today)
 
         Returns:
             Diversification score 0-100
@@ -323,8 +551,53 @@ class AllocationEngine:
         # Combine with weights: 70% sector, 30% market
         diversification_score = (sector_score * 0.7) + (market_score * 0.3)
 
+        # With return correlations: 50% sector, 20% market, 30% correlation clusters
+        correlation_score = self._correlation_score(position_values or {}, as_of)
+        if correlation_score is not None:
+            diversification_score = (
+                (sector_score * 0.5) + (market_score * 0.2) + (correlation_score * 0.3)
+            )
+
         return max(0, min(100, diversification_score))
 
+    def _correlation_score(
+        self, position_values: dict[str, float], as_of: date | None
+    ) -> float | None:
+        """Score the spread of positions over correlation clusters.
+
+        Args:
+            position_values: Position value in EUR by ticker
+            as_of: Last date of price data to use
+
+        Returns:
+            Score 0-100, or None without a risk engine or enough price history
+        """
+        if self.risk_engine is None or len(position_values) < 2:
+            return None
+
+        try:
+            model = self.risk_engine.get_model(list(position_values), as_of)
+        except Exception as e:
+            logger.warning(f"Failed to build portfolio risk model: {e}")
+            return None
+        if model is None:
+            return None
+
+        weights = {ticker.upper(): value for ticker, value in position_values.items()}
+        score = model.diversification_score(weights)
+        logger.debug(
+            f"Correlation diversification: {score:.0f}, "
+            f"1-day 95% VaR {model.value_at_risk(weights):.2f}€ over "
+            f"{len(model.tickers)}/{len(position_values)} modeled positions"
+        )
+        return score
+
+    @staticmethod
+    def _analysis_date(signals: list[dict[str, Any]]) -> date | None:
+        """Get the latest analysis date of the signals, if they carry one."""
+        dates = [s["analysis_date"] for s in signals if s.get("analysis_date")]
+        return datetime.strptime(max(dates), "%Y-%m-%d").date() if dates else None
+
     @staticmethod
     def _estimate_instrument_diversification(
         positions: list[AllocationSuggestion],
@@ -0,0 +1,275 @@
+"""Multi-date backtesting of rule-based signals.
+
+``analyze --date`` runs the full pipeline for a single as-of date. BacktestRunner instead
+loads each ticker's price history once, computes indicator series over the whole history
+in one pass and reads every as-of date from its row, so a year of trading days costs
+about as much as one analysis run. The filter strategy likewise decides on every day
+at once with filter_series(). Indicator values and filter decisions on a date only
+use bars up to that date, which keeps future data out of each signal.
+
+Only price-derived analysis is point-in-time here: fundamental and sentiment scores are
+held neutral, as in rule-based mode when those sources are unavailable.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.agents.analysis import TechnicalAnalysisAgent
+from src.agents.sentiment import SignalSynthesisAgent
+from src.analysis.models import (
+    AnalysisMetadata,
+    ComponentScores,
+    InvestmentSignal,
+    TechnicalIndicators,
+)
+from src.analysis.risk import RiskAssessor
+from src.analysis.technical_indicators import ConfigurableTechnicalAnalyzer
+from src.config.schemas import Config
+from src.data.price_manager import PRICE_FIELD_MAPPING, PriceDataManager
+from src.filtering.strategies import FilterStrategy, get_strategy
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Calendar days of history loaded before the first as-of date (SMA-200 warm-up)
+WARMUP_DAYS = 365
+
+# Minimum number of bars passed to the filter strategy for each as-of date
+FILTER_WINDOW = 60
+
+# Stored history counts as covering a date if it has a bar within this many days
+COVERAGE_TOLERANCE_DAYS = 7
+
+# Score used for components without point-in-time data
+NEUTRAL_SCORE = 50.0
+
+# CSV column names -> price dict keys expected by FilterStrategy.filter()
+FILTER_FIELD_MAPPING = {column: field for field, column in PRICE_FIELD_MAPPING.items()}
+
+
+@dataclass
+class BacktestResult:
+    """Signals generated over a backtest date range."""
+
+    signals: list[InvestmentSignal] = field(default_factory=list)
+    trading_days: int = 0
+    evaluated: int = 0  # Ticker-days with enough history to analyze
+    filtered: int = 0  # Ticker-days passing the filter strategy
+    skipped: dict[str, str] = field(default_factory=dict)  # Ticker -> reason
+
+
+class BacktestRunner:
+    """Generate rule-based signals for every trading day in a date range."""
+
+    def __init__(
+        self,
+        config: Config,
+        strategy: FilterStrategy | str = "all",
+        strategy_config: dict | None = None,
+        price_manager: PriceDataManager | None = None,
+        provider_manager=None,
+    ):
+        """Initialize backtest runner.
+
+        Args:
+            config: Configuration object with analysis settings
+            strategy: FilterStrategy instance or strategy name applied on each date
+            strategy_config: Strategy-specific configuration
+            price_manager: PriceDataManager with stored price history
+            provider_manager: Optional ProviderManager to fetch missing history
+        """
+        self.config = config
+        if isinstance(strategy, str):
+            self.strategy = get_strategy(strategy, strategy_config)
+        else:
+            self.strategy = strategy
+        self.price_manager = price_manager or PriceDataManager()
+        self.provider_manager = provider_manager
+
+        self.analyzer = ConfigurableTechnicalAnalyzer(config.analysis.technical_indicators)
+        self.risk_assessor = RiskAssessor(
+            volatility_threshold_high=3.0,
+            volatility_threshold_very_high=5.0,
+        )
+
+        # Strategies look back over a fixed number of bars
+        self.filter_window = max(
+            FILTER_WINDOW,
+            getattr(self.strategy, "lookback_days", 0) + 1,
+            getattr(self.strategy, "trend_days", 0),
+        )
+
+    def run(self, tickers: list[str], start_date: date, end_date: date) -> BacktestResult:
+        """Generate signals for each ticker and trading day between two dates.
+
+        Args:
+            tickers: Ticker symbols
+            start_date: First as-of date (inclusive)
+            end_date: Last as-of date (inclusive)
+
+        Returns:
+            BacktestResult with signals sorted by analysis date and ticker
+        """
+        result = BacktestResult()
+        trading_days = set()
+
+        for ticker in tickers:
+            try:
+                history = self.load_history(ticker, start_date, end_date)
+            except Exception as e:
+                logger.warning(f"Failed to load price history for {ticker}: {e}")
+                result.skipped[ticker] = f"Price data error: {e}"
+                continue
+
+            if history.empty:
+                result.skipped[ticker] = "No price data"
+                continue
+
+            dates = history["date"].dt.date
+            trading_days.update(dates[(dates >= start_date) & (dates <= end_date)])
+            self._backtest_ticker(ticker, history, start_date, end_date, result)
+
+        result.signals.sort(key=lambda s: (s.analysis_date, s.ticker))
+        result.trading_days = len(trading_days)
+
+        logger.info(
+            f"Backtest {start_date} to {end_date}: {len(result.signals)} signals from "
+            f"{result.filtered}/{result.evaluated} ticker-days passing {self.strategy.name}"
+        )
+        return result
+
+    def load_history(self, ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+        """Load a ticker's price history for a backtest range, fetching it if missing.
+
+        Args:
+            ticker: Ticker symbol
+            start_date: First as-of date
+            end_date: Last as-of date
+
+        Returns:
+            Prices from WARMUP_DAYS before start_date up to end_date, sorted by date
+        """
+        history_start = start_date - timedelta(days=WARMUP_DAYS)
+        history_end = min(end_date, date.today())
+
+        stored_start, stored_end = self.price_manager.get_data_range(ticker)
+        covered = (
+            stored_start is not None
+            and stored_start <= history_start + timedelta(days=COVERAGE_TOLERANCE_DAYS)
+            and stored_end >= history_end - timedelta(days=COVERAGE_TOLERANCE_DAYS)
+        )
+
+        if not covered and self.provider_manager:
+            period = f"{(date.today() - history_start).days + 1}d"
+            logger.debug(f"Fetching {period} of prices for {ticker} backtest")
+            frame = self.provider_manager.get_price_frame(ticker, period=period)
+            self.price_manager.store_prices(ticker, frame, append=True)
+
+        return self.price_manager.get_prices(ticker, start_date=history_start, end_date=end_date)
+
+    def _backtest_ticker(
+        self,
+        ticker: str,
+        history: pd.DataFrame,
+        start_date: date,
+        end_date: date,
+        result: BacktestResult,
+    ) -> None:
+        """Filter and score one ticker on every as-of date in range."""
+        series = self.analyzer.calculate_indicator_series(history)
+        prices = history.rename(columns=FILTER_FIELD_MAPPING)
+        include = self.strategy.filter_series(prices)["include"].to_numpy()
+        dates = history["date"].dt.date.to_numpy()
+
+        # Same minimum history as a single-date analysis
+        min_periods = self.config.analysis.technical_indicators.min_periods_required
+        positions = np.flatnonzero((dates >= start_date) & (dates <= end_date))
+        positions = positions[positions >= min_periods - 1]
+        result.evaluated += len(positions)
+
+        records = prices.to_dict("records")
+        for i in positions[include[positions]]:
+            # Reasons are only needed for days passing the filter
+            window = records[max(0, i + 1 - self.filter_window) : i + 1]
+            _, reasons = self.strategy.filter(ticker, window)
+
+            result.filtered += 1
+            signal = self._create_signal(ticker, history.iloc[i], series.iloc[i], dates[i], reasons)
+            if signal:
+                result.signals.append(signal)
+
+    def _create_signal(
+        self,
+        ticker: str,
+        bar: pd.Series,
+        indicators: pd.Series,
+        analysis_date: date,
+        reasons: list[str],
+    ) -> InvestmentSignal | None:
+        """Create a signal from one day's bar and indicator values."""
+        values = {key: value for key, value in indicators.items() if pd.notna(value)}
+        technical_score = TechnicalAnalysisAgent._calculate_technical_score(values)
+
+        # Weighted like SignalSynthesisAgent, with neutral fundamental and sentiment
+        analysis = self.config.analysis
+        final_score = (
+            technical_score * analysis.weight_technical
+            + NEUTRAL_SCORE * analysis.weight_fundamental
+            + NEUTRAL_SCORE * analysis.weight_sentiment
+        )
+        confidence = max(0, 100 - abs(technical_score - NEUTRAL_SCORE) * 0.5)
+
+        price = float(bar["close"])
+        volatility_pct = values["atr"] / price * 100 if "atr" in values and price else 2.0
+        market = bar.get("market") if pd.notna(bar.get("market")) else "unknown"
+
+        try:
+            risk = self.risk_assessor.assess_signal(
+                {
+                    "ticker": ticker,
+                    "final_score": final_score,
+                    "confidence": confidence,
+                    "volatility_pct": volatility_pct,
+                    "estimated_daily_volume": float(bar["volume"]) * price,
+                    "market": market,
+                    "sector": "Unknown",
+                }
+            )
+
+            return InvestmentSignal(
+                ticker=ticker,
+                name=bar.get("name") if pd.notna(bar.get("name")) else ticker,
+                market=market,
+                current_price=price,
+                currency=bar.get("currency") if pd.notna(bar.get("currency")) else "USD",
+                scores=ComponentScores(
+                    technical=technical_score,
+                    fundamental=NEUTRAL_SCORE,
+                    sentiment=NEUTRAL_SCORE,
+                ),
+                final_score=round(final_score, 2),
+                recommendation=SignalSynthesisAgent._score_to_recommendation(final_score),
+                confidence=round(confidence, 2),
+                time_horizon="3M",
+                expected_return_min=0.0,
+                expected_return_max=10.0,
+                key_reasons=reasons,
+                risk=risk,
+                generated_at=datetime.now(),
+                analysis_date=analysis_date.strftime("%Y-%m-%d"),
+                rationale=SignalSynthesisAgent._generate_rationale(
+                    final_score, technical_score, NEUTRAL_SCORE, NEUTRAL_SCORE
+                ),
+                caveats=["Backtest: fundamental and sentiment scores held neutral"],
+                metadata=AnalysisMetadata(
+                    technical_indicators=TechnicalIndicators(
+                        **{k: v for k, v in values.items() if k != "latest_price"}
+                    )
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to create backtest signal for {ticker} on {analysis_date}: {e}")
+            return None
@@ -0,0 +1,324 @@
+"""Portfolio-level risk from the covariance of daily returns.
+
+RiskAssessor scores each signal on its own. PortfolioRiskEngine instead looks at a set
+of tickers together: it builds one matrix of daily log returns from the local price
+store and estimates a Ledoit-Wolf shrinkage covariance from it, so that correlated
+positions are recognized as concentrated even across sectors and markets. The
+estimate is computed once per universe and as-of date and shared by every caller;
+weights are only applied afterwards, so sizing many allocations against the same
+universe costs a few matrix-vector products each.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from src.data.price_manager import PriceDataManager
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Calendar days of prices used to estimate the covariance
+DEFAULT_LOOKBACK_DAYS = 365
+
+# Tickers with fewer daily returns than this are left out of the model
+DEFAULT_MIN_OBSERVATIONS = 60
+
+# Tickers correlated at least this much end up in the same cluster
+DEFAULT_CLUSTER_THRESHOLD = 0.7
+
+# Number of (universe, as-of date) models kept in memory
+DEFAULT_MODEL_CACHE_SIZE = 32
+
+
+def ledoit_wolf(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """Estimate a covariance matrix shrunk towards a scaled identity.
+
+    Uses the Ledoit-Wolf (2004) optimal shrinkage intensity, which keeps the estimate
+    well conditioned when there are many tickers relative to observations.
+
+    Args:
+        returns: Observations x tickers matrix of returns
+
+    Returns:
+        Tuple of (covariance matrix, shrinkage intensity in [0, 1])
+    """
+    observations, count = returns.shape
+    centered = returns - returns.mean(axis=0)
+    sample = centered.T @ centered / observations
+    mu = np.trace(sample) / count
+
+    # Distance of the sample covariance to the target, and its estimation noise
+    delta = ((sample - mu * np.eye(count)) ** 2).sum() / count
+    squared = centered**2
+    beta = ((squared.T @ squared).sum() / observations - (sample**2).sum()) / (observations * count)
+    shrinkage = float(min(beta, delta) / delta) if delta > 0 else 1.0
+
+    covariance = (1 - shrinkage) * sample + shrinkage * mu * np.eye(count)
+    return covariance, shrinkage
+
+
+@dataclass(frozen=True)
+class PortfolioRiskModel:
+    """Shrinkage covariance of daily log returns for a set of tickers.
+
+    Weights passed to the methods map tickers to position values in EUR. Tickers
+    without enough price history are not in the model and are ignored.
+
+    Attributes:
+        tickers: Tickers in matrix order
+        as_of: Last date of price data used
+        covariance: Daily return covariance matrix
+        correlation: Correlation matrix derived from covariance
+        shrinkage: Shrinkage intensity applied to the sample covariance
+        observations: Number of daily returns used
+    """
+
+    tickers: tuple[str, ...]
+    as_of: date
+    covariance: np.ndarray
+    correlation: np.ndarray
+    shrinkage: float
+    observations: int
+
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame, as_of: date) -> "PortfolioRiskModel":
+        """Create a model from a dates x tickers frame of daily returns.
+
+        Args:
+            returns: Daily returns without missing values, one column per ticker
+            as_of: Last date of price data used
+
+        Returns:
+            PortfolioRiskModel over the frame's columns
+        """
+        covariance, shrinkage = ledoit_wolf(returns.to_numpy())
+        volatility = np.sqrt(np.diag(covariance))
+        scale = np.where(volatility > 0, volatility, 1.0)
+        correlation = covariance / np.outer(scale, scale)
+        np.fill_diagonal(correlation, 1.0)
+
+        return cls(
+            tickers=tuple(returns.columns),
+            as_of=as_of,
+            covariance=covariance,
+            correlation=correlation,
+            shrinkage=shrinkage,
+            observations=len(returns),
+        )
+
+    @property
+    def volatilities(self) -> np.ndarray:
+        """Daily return volatility per ticker."""
+        return np.sqrt(np.diag(self.covariance))
+
+    def weight_vector(self, weights: dict[str, float]) -> np.ndarray:
+        """Align position values with the matrix order.
+
+        Args:
+            weights: Ticker -> position value
+
+        Returns:
+            Position values in ticker order, 0 for tickers without a position
+        """
+        return np.array([weights.get(ticker, 0.0) for ticker in self.tickers], dtype=float)
+
+    def value_at_risk(self, weights: dict[str, float], confidence: float = 0.95) -> float:
+        """Calculate parametric one-day value at risk of a portfolio.
+
+        Args:
+            weights: Ticker -> position value in EUR
+            confidence: Confidence level of the loss quantile
+
+        Returns:
+            Loss in EUR not exceeded on a day with the given confidence
+        """
+        w = self.weight_vector(weights)
+        return NormalDist().inv_cdf(confidence) * float(np.sqrt(w @ self.covariance @ w))
+
+    def marginal_var(self, weights: dict[str, float], confidence: float = 0.95) -> dict[str, float]:
+        """Calculate how much portfolio value at risk grows per EUR added to each ticker.
+
+        Multiplying a position's value by its marginal VaR gives its contribution to
+        the portfolio VaR; the contributions sum to the total.
+
+        Args:
+            weights: Ticker -> position value in EUR
+            confidence: Confidence level of the loss quantile
+
+        Returns:
+            Ticker -> EUR of VaR per EUR of position, for all tickers in the model
+        """
+        w = self.weight_vector(weights)
+        variance = float(w @ self.covariance @ w)
+        if variance <= 0:
+            return dict.fromkeys(self.tickers, 0.0)
+
+        marginal = NormalDist().inv_cdf(confidence) * (self.covariance @ w) / np.sqrt(variance)
+        return dict(zip(self.tickers, marginal.tolist(), strict=True))
+
+    def diversification_ratio(self, weights: dict[str, float]) -> float:
+        """Calculate weighted average volatility divided by portfolio volatility.
+
+        Args:
+            weights: Ticker -> position value
+
+        Returns:
+            1.0 for perfectly correlated positions, higher the more they offset
+        """
+        w = self.weight_vector(weights)
+        portfolio_volatility = float(np.sqrt(w @ self.covariance @ w))
+        if portfolio_volatility <= 0:
+            return 1.0
+        return float(w @ self.volatilities) / portfolio_volatility
+
+    def correlation_clusters(
+        self, threshold: float = DEFAULT_CLUSTER_THRESHOLD
+    ) -> list[tuple[str, ...]]:
+        """Group tickers linked by correlations at or above a threshold.
+
+        Clusters are connected components (single linkage): two tickers share a
+        cluster if a chain of pairwise correlations above the threshold joins them.
+
+        Args:
+            threshold: Minimum correlation linking two tickers
+
+        Returns:
+            Clusters of tickers, largest first, including single-ticker clusters
+        """
+        labels = np.arange(len(self.tickers))
+        linked = (self.correlation >= threshold) | np.eye(len(labels), dtype=bool)
+
+        # Propagate the smallest label along links until components are stable
+        while True:
+            merged = np.where(linked, labels[np.newaxis, :], len(labels)).min(axis=1)
+            if np.array_equal(merged, labels):
+                break
+            labels = merged
+
+        clusters: dict[int, list[str]] = {}
+        for ticker, label in zip(self.tickers, labels, strict=True):
+            clusters.setdefault(int(label), []).append(ticker)
+        return sorted((tuple(c) for c in clusters.values()), key=len, reverse=True)
+
+    def diversification_score(
+        self, weights: dict[str, float], threshold: float = DEFAULT_CLUSTER_THRESHOLD
+    ) -> float:
+        """Score how evenly position values spread over correlation clusters.
+
+        Args:
+            weights: Ticker -> position value
+            threshold: Minimum correlation linking two tickers
+
+        Returns:
+            Score 0-100 from the Herfindahl index of cluster weights
+        """
+        w = self.weight_vector(weights)
+        total = w.sum()
+        if total <= 0:
+            return 0.0
+
+        cluster_weights = [
+            sum(weights.get(ticker, 0.0) for ticker in cluster)
+            for cluster in self.correlation_clusters(threshold)
+        ]
+        hhi = sum((amount / total) ** 2 for amount in cluster_weights)
+        return max(0.0, min(100.0, (1 - hhi) * 100))
+
+
+class PortfolioRiskEngine:
+    """Build and cache portfolio risk models from stored price history."""
+
+    def __init__(
+        self,
+        price_manager: PriceDataManager | None = None,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        min_observations: int = DEFAULT_MIN_OBSERVATIONS,
+        cache_size: int = DEFAULT_MODEL_CACHE_SIZE,
+    ):
+        """Initialize risk engine.
+
+        Args:
+            price_manager: PriceDataManager with stored price history
+            lookback_days: Calendar days of prices used per model
+            min_observations: Minimum daily returns for a ticker to be modeled
+            cache_size: Number of models kept in memory
+        """
+        self.price_manager = price_manager or PriceDataManager()
+        self.lookback_days = lookback_days
+        self.min_observations = min_observations
+        self.cache_size = cache_size
+        self._models: OrderedDict[tuple, PortfolioRiskModel | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_model(self, tickers: list[str], as_of: date | None = None) -> PortfolioRiskModel | None:
+        """Get the risk model for a universe of tickers, building it on first use.
+
+        Args:
+            tickers: Tickers to model (order and duplicates do not matter)
+            as_of: Last date of price data to use (default: today)
+
+        Returns:
+            PortfolioRiskModel, or None if fewer than two tickers have enough history
+        """
+        as_of = as_of or date.today()
+        key = (tuple(sorted({t.upper() for t in tickers})), as_of)
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+        returns = self.build_returns(list(key[0]), as_of)
+        model = PortfolioRiskModel.from_returns(returns, as_of) if returns.shape[1] >= 2 else None
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._models[key] = model
+                if len(self._models) > self.cache_size:
+                    self._models.popitem(last=False)
+
+        if model:
+            logger.debug(
+                f"Built risk model for {len(model.tickers)}/{len(key[0])} tickers as of "
+                f"{as_of}: {model.observations} returns, shrinkage {model.shrinkage:.2f}"
+            )
+        return model
+
+    def build_returns(self, tickers: list[str], as_of: date) -> pd.DataFrame:
+        """Build a matrix of daily log returns from stored closing prices.
+
+        Dates on which only some tickers traded (different market holidays) carry
+        the last close forward, which counts as a zero return.
+
+        Args:
+            tickers: Tickers to include
+            as_of: Last date of price data to use
+
+        Returns:
+            Dates x tickers frame of returns, with tickers lacking history dropped
+        """
+        start_date = as_of - timedelta(days=self.lookback_days)
+        closes = {}
+        for ticker in tickers:
+            index = self.price_manager.get_price_index(ticker)
+            if index is None:
+                continue
+            bars = index.between(start_date, as_of)
+            if len(bars) > self.min_observations:
+                closes[ticker] = pd.Series(bars["close"].to_numpy(), index=bars["date"])
+
+        if not closes:
+            return pd.DataFrame()
+
+        prices = pd.DataFrame(closes).sort_index().ffill()
+        returns = np.log(prices).diff().iloc[1:]
+
+        # Tickers listed part way through the window have no earlier returns
+        returns = returns.loc[:, returns.notna().sum() >= self.min_observations]
+        return returns.dropna()
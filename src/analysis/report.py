@@ -11,6 +11,7 @@ from src.analysis.models import (
 )
 from src.utils.llm_check import check_llm_configuration
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled
 
 logger = get_logger(__name__)
 
@@ -44,6 +45,7 @@ class ReportGenerator:
         self.include_disclaimers = include_disclaimers
         logger.debug("Report generator initialized")
 
+    @profiled("report.generate")
     def generate_daily_report(
         self,
         signals: list[InvestmentSignal],
@@ -146,6 +148,7 @@ class ReportGenerator:
 
         return report
 
+    @profiled("report.render")
     def to_markdown(self, report: DailyReport) -> str:
         """Convert report to Markdown format.
 
@@ -333,6 +336,7 @@ class ReportGenerator:
 
         return "\n".join(md)
 
+    @profiled("report.render")
     def to_json(self, report: DailyReport) -> dict[str, Any]:
         """Convert report to JSON-serializable format.
 
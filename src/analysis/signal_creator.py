@@ -11,6 +11,7 @@ from src.analysis.metadata_extractor import extract_metadata_from_unified_result
 from src.analysis.models import ComponentScores, InvestmentSignal, UnifiedAnalysisResult
 from src.data.price_manager import PriceDataManager
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled
 
 logger = get_logger(__name__)
 
@@ -47,9 +48,14 @@ class SignalCreator:
     def price_manager(self) -> PriceDataManager:
         """Lazy-load PriceDataManager for unified CSV storage."""
         if self._price_manager is None:
-            self._price_manager = PriceDataManager()
+            # Share the cache manager's decoded price histories across signal creators
+            shared = getattr(self.cache_manager, "price_manager", None)
+            self._price_manager = (
+                shared if isinstance(shared, PriceDataManager) else PriceDataManager()
+            )
         return self._price_manager
 
+    @profiled("signal.create", ticker_arg="result")
     def create_signal(
         self,
         result: UnifiedAnalysisResult,
@@ -135,6 +141,7 @@ class SignalCreator:
             logger.error(f"Error creating signal for {result.ticker}: {e}", exc_info=True)
             return None
 
+    @profiled("signal.price_lookup")
     def _fetch_price(
         self,
         ticker: str,
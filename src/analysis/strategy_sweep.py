@@ -0,0 +1,176 @@
+"""Parameter sweeps for filtering strategies.
+
+StrategySweep evaluates filtering strategies on every trading day of a date range
+across many tickers at once. Price histories are combined into one frame with a
+column per ticker, and each strategy's filter_series() decides on all ticker-days in
+one pass of rolling window operations, so a grid of hundreds of parameter
+combinations can be compared by hit rate and the forward returns of flagged days.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import product
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.backtest import FILTER_FIELD_MAPPING
+from src.filtering.strategies import FilterStrategy, get_strategy
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Trading days after a flagged day at which forward returns are measured
+DEFAULT_HORIZONS = (5, 20)
+
+# Price dict keys used by the filtering strategies
+FILTER_FIELDS = ["open_price", "high_price", "low_price", "close_price", "volume"]
+
+
+@dataclass
+class SweepResult:
+    """Hit rate and forward returns of one strategy configuration."""
+
+    strategy: str
+    params: dict[str, Any]
+    evaluated: int  # Ticker-days in range
+    hits: int  # Ticker-days passing the filter
+    avg_returns: dict[int, float] = field(default_factory=dict)  # Horizon -> mean return %
+    win_rates: dict[int, float] = field(default_factory=dict)  # Horizon -> % positive
+
+    @property
+    def hit_rate(self) -> float:
+        """Percentage of evaluated ticker-days passing the filter."""
+        return self.hits / self.evaluated * 100 if self.evaluated else 0.0
+
+
+def parameter_grid(params: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Expand parameter value lists into every combination.
+
+    Args:
+        params: Parameter name -> candidate values
+
+    Returns:
+        List of strategy configurations (a single empty one if no parameters)
+    """
+    names = list(params)
+    return [dict(zip(names, values, strict=True)) for values in product(*params.values())]
+
+
+def build_price_panel(histories: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Combine price histories into one frame with (field, ticker) columns.
+
+    Each ticker's bars start at the first row, so rolling windows never span gaps
+    between tickers trading on different days.
+
+    Args:
+        histories: Ticker -> prices as returned by PriceDataManager.get_prices()
+
+    Returns:
+        Frame with a date field and the price dict keys used by filter strategies
+    """
+    frames = {
+        ticker: history.rename(columns=FILTER_FIELD_MAPPING).reset_index(drop=True)
+        for ticker, history in sorted(histories.items())
+        if not history.empty
+    }
+    if not frames:
+        return pd.DataFrame()
+
+    # One block per field keeps operations on a field vectorized across tickers
+    return pd.concat(
+        {
+            name: pd.DataFrame({ticker: frame[name] for ticker, frame in frames.items()})
+            for name in ["date", *FILTER_FIELDS]
+        },
+        axis=1,
+    )
+
+
+class StrategySweep:
+    """Evaluate filtering strategy configurations over a date range."""
+
+    def __init__(
+        self,
+        histories: dict[str, pd.DataFrame],
+        start_date: date,
+        end_date: date,
+        horizons: tuple[int, ...] = DEFAULT_HORIZONS,
+    ):
+        """Initialize sweep with price histories.
+
+        Args:
+            histories: Ticker -> price history, including warm-up bars before start_date
+            start_date: First day evaluated (inclusive)
+            end_date: Last day evaluated (inclusive)
+            horizons: Trading days ahead for forward returns
+        """
+        self.panel = build_price_panel(histories)
+        self.horizons = horizons
+
+        if self.panel.empty:
+            self.tickers = []
+            self.in_range = np.zeros((0, 0), dtype=bool)
+            self.forward_returns = {h: np.zeros((0, 0)) for h in horizons}
+            return
+
+        self.tickers = list(self.panel["close_price"].columns)
+        dates = self.panel["date"][self.tickers]
+        self.in_range = (
+            (dates >= pd.Timestamp(start_date)) & (dates <= pd.Timestamp(end_date))
+        ).to_numpy()
+
+        close = self.panel["close_price"][self.tickers]
+        self.forward_returns = {
+            h: ((close.shift(-h) - close) / close * 100).to_numpy() for h in horizons
+        }
+
+    def evaluate(
+        self, strategy: FilterStrategy, params: dict[str, Any] | None = None
+    ) -> SweepResult:
+        """Evaluate one strategy configuration on all ticker-days.
+
+        Args:
+            strategy: Configured filtering strategy
+            params: Parameters the strategy was configured with, for reporting
+
+        Returns:
+            SweepResult with hit rate and forward returns of flagged days
+        """
+        result = SweepResult(
+            strategy=strategy.name,
+            params=params or {},
+            evaluated=int(self.in_range.sum()),
+            hits=0,
+        )
+        if not self.tickers:
+            return result
+
+        include = strategy.filter_series(self.panel)["include"][self.tickers].to_numpy()
+        hits = include & self.in_range
+        result.hits = int(hits.sum())
+
+        for horizon, returns in self.forward_returns.items():
+            hit_returns = returns[hits]
+            hit_returns = hit_returns[~np.isnan(hit_returns)]
+            if hit_returns.size:
+                result.avg_returns[horizon] = float(hit_returns.mean())
+                result.win_rates[horizon] = float((hit_returns > 0).mean() * 100)
+        return result
+
+    def run(self, strategy_name: str, grid: list[dict[str, Any]]) -> list[SweepResult]:
+        """Evaluate a strategy for every configuration in a parameter grid.
+
+        Args:
+            strategy_name: Name of the filtering strategy
+            grid: Strategy configurations, e.g. from parameter_grid()
+
+        Returns:
+            One SweepResult per configuration, in grid order
+        """
+        results = [self.evaluate(get_strategy(strategy_name, params), params) for params in grid]
+        logger.info(
+            f"Evaluated {len(grid)} {strategy_name} configurations on {len(self.tickers)} tickers"
+        )
+        return results
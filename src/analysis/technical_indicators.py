@@ -6,6 +6,7 @@ technical indicators using the pandas-ta library.
 
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.config.schemas import IndicatorConfig, TechnicalIndicatorsConfig
@@ -125,6 +126,106 @@ class ConfigurableTechnicalAnalyzer:
 
         return results
 
+    def calculate_indicator_series(
+        self,
+        df: pd.DataFrame,
+        close_col: str = "close",
+        high_col: str = "high",
+        low_col: str = "low",
+        volume_col: str = "volume",
+    ) -> pd.DataFrame:
+        """Calculate the scoring indicators for every bar in one pass.
+
+        Each row only depends on bars up to that row, so it holds what
+        calculate_indicators() reports for the history ending on that bar
+        (EMA-based values differ slightly with the length of the warm-up).
+
+        Args:
+            df: DataFrame with price data sorted oldest to newest
+            close_col: Name of close price column
+            high_col: Name of high price column
+            low_col: Name of low price column
+            volume_col: Name of volume column
+
+        Returns:
+            DataFrame aligned with df: latest_price, volume_ratio and trend, plus rsi,
+            macd_histogram, atr and sma_<length> for indicators enabled in the configuration
+        """
+        df = self._normalize_columns(df, close_col, high_col, low_col, volume_col)
+        series = pd.DataFrame({"latest_price": df["close"].astype(float)}, index=df.index)
+
+        for ind_config in self.config.indicators:
+            name = ind_config.name.lower()
+            if not ind_config.enabled or name not in ("rsi", "macd", "atr", "sma"):
+                continue
+
+            column = self._make_indicator_key(ind_config) if name == "sma" else name
+            if name == "macd":
+                column = "macd_histogram"
+            if column in series.columns:
+                continue
+
+            try:
+                values = self._calculate_indicator_series(df, ind_config)
+                if values is not None:
+                    series[column] = values.astype(float)
+            except Exception as e:
+                logger.warning(f"Error calculating {ind_config.name} series: {e}")
+
+        # Same rules as _analyze_trend and _analyze_volume, row by row
+        if "sma_50" in series.columns and "sma_200" in series.columns:
+            series["trend"] = np.where(series["sma_50"] > series["sma_200"], "bullish", "bearish")
+            series.loc[series[["sma_50", "sma_200"]].isna().any(axis=1), "trend"] = "neutral"
+        else:
+            series["trend"] = "neutral"
+
+        if "volume" in df.columns:
+            avg_volume_20 = df["volume"].rolling(20, min_periods=1).mean()
+            series["volume_ratio"] = (df["volume"] / avg_volume_20).where(avg_volume_20 > 0, 0)
+            series["volume_ratio"] = series["volume_ratio"].round(2)
+
+        return series
+
+    def _calculate_indicator_series(
+        self,
+        df: pd.DataFrame,
+        ind_config: IndicatorConfig,
+    ) -> Optional[pd.Series]:
+        """Calculate the full series of a scoring indicator (rsi, macd histogram, atr, sma)."""
+        name = ind_config.name.lower()
+        params = ind_config.params
+
+        if self.config.use_pandas_ta and PANDAS_TA_AVAILABLE:
+            if name == "rsi":
+                return ta.rsi(df["close"], length=params.get("length", 14))
+            if name == "macd":
+                result = ta.macd(
+                    df["close"],
+                    fast=params.get("fast", 12),
+                    slow=params.get("slow", 26),
+                    signal=params.get("signal", 9),
+                )
+                if result is None:
+                    return None
+                return result[[c for c in result.columns if "MACDh_" in c][0]]
+            if name == "atr":
+                return ta.atr(df["high"], df["low"], df["close"], length=params.get("length", 14))
+            if name == "sma":
+                return ta.sma(df["close"], length=params.get("length", 20))
+            return None
+
+        if name == "rsi":
+            return self._manual_rsi_series(df["close"], params.get("length", 14))
+        if name == "macd":
+            return self._manual_macd_series(
+                df["close"], params.get("fast", 12), params.get("slow", 26), params.get("signal", 9)
+            )["histogram"]
+        if name == "atr":
+            return self._manual_atr_series(df, params.get("length", 14))
+        if name == "sma":
+            return df["close"].rolling(params.get("length", 20)).mean()
+        return None
+
     def _normalize_columns(
         self,
         df: pd.DataFrame,
@@ -401,6 +502,11 @@ class ConfigurableTechnicalAnalyzer:
 
     def _manual_rsi(self, prices: pd.Series, period: int = 14) -> float:
         """Calculate RSI manually."""
+        return float(self._manual_rsi_series(prices, period).iloc[-1])
+
+    @staticmethod
+    def _manual_rsi_series(prices: pd.Series, period: int = 14) -> pd.Series:
+        """Calculate the RSI series manually."""
         deltas = prices.diff()
         gains = deltas.where(deltas > 0, 0)
         losses = -deltas.where(deltas < 0, 0)
@@ -409,9 +515,7 @@ class ConfigurableTechnicalAnalyzer:
         avg_loss = losses.rolling(period).mean()
 
         rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return float(rsi.iloc[-1])
+        return 100 - (100 / (1 + rs))
 
     def _manual_macd(
         self,
@@ -421,29 +525,45 @@ class ConfigurableTechnicalAnalyzer:
         signal: int = 9,
     ) -> dict[str, float]:
         """Calculate MACD manually."""
+        macd = self._manual_macd_series(prices, fast, slow, signal)
+
+        return {
+            "line": float(macd["line"].iloc[-1]),
+            "signal": float(macd["signal"].iloc[-1]),
+            "histogram": float(macd["histogram"].iloc[-1]),
+        }
+
+    @staticmethod
+    def _manual_macd_series(
+        prices: pd.Series,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+    ) -> pd.DataFrame:
+        """Calculate MACD line, signal and histogram series manually."""
         ema_fast = prices.ewm(span=fast).mean()
         ema_slow = prices.ewm(span=slow).mean()
 
         macd_line = ema_fast - ema_slow
         signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
 
-        return {
-            "line": float(macd_line.iloc[-1]),
-            "signal": float(signal_line.iloc[-1]),
-            "histogram": float(histogram.iloc[-1]),
-        }
+        return pd.DataFrame(
+            {"line": macd_line, "signal": signal_line, "histogram": macd_line - signal_line}
+        )
 
     def _manual_atr(self, df: pd.DataFrame, period: int = 14) -> float:
         """Calculate ATR manually."""
+        return float(self._manual_atr_series(df, period).iloc[-1])
+
+    @staticmethod
+    def _manual_atr_series(df: pd.DataFrame, period: int = 14) -> pd.Series:
+        """Calculate the ATR series manually."""
         tr1 = df["high"] - df["low"]
         tr2 = abs(df["high"] - df["close"].shift(1))
         tr3 = abs(df["low"] - df["close"].shift(1))
 
         tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(period).mean()
-
-        return float(atr.iloc[-1])
+        return tr.rolling(period).mean()
 
     def _analyze_trend(self, df: pd.DataFrame, indicators: dict) -> dict[str, Any]:
         """Analyze overall trend based on calculated indicators."""
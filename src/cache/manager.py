@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from src.utils.logging import get_logger
+from src.utils.profiling import record_cache_access
 
 if TYPE_CHECKING:
     from src.data.price_manager import PriceDataManager
@@ -92,6 +93,7 @@ class CacheManager:
             entry = self._memory_cache[key]
             if not entry.is_expired():
                 logger.debug(f"Cache hit (memory): {key}")
+                record_cache_access(hit=True)
                 return entry.data
             else:
                 del self._memory_cache[key]
@@ -116,18 +118,22 @@ class CacheManager:
                     logger.debug(f"Cache hit (disk): {key}")
                     # Move to memory cache
                     self._memory_cache[key] = entry
+                    record_cache_access(hit=True)
                     return entry.data
                 else:
                     logger.debug(f"Disk cache expired: {key}")
                     file_path.unlink()
+                    record_cache_access(hit=False)
                     return default
 
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(f"Failed to load cache file {key}: {e}")
                 file_path.unlink()
+                record_cache_access(hit=False)
                 return default
 
         logger.debug(f"Cache miss: {key}")
+        record_cache_access(hit=False)
         return default
 
     def set(self, key: str, data: Any, ttl_hours: int) -> None:
@@ -1,7 +1,8 @@
-"""FalconSignals CLI package."""
+"""FalconSignals CLI package.
+
+Commands are registered lazily by the app's command group (see src.cli.commands).
+"""
 
-# Import commands to register them with the app
-import src.cli.commands  # noqa: F401
 from src.cli.app import app
 
 __all__ = ["app"]
@@ -1,11 +1,57 @@
 """FalconSignals CLI application setup."""
 
+import click
 import typer
+from typer.core import TyperGroup
+from typer.main import get_command_from_info
+
+from src.cli.commands import COMMAND_MODULES, command_help, load_command_module
+
+
+class LazyCommandGroup(TyperGroup):
+    """Command group that imports a command's module only when the command is run.
+
+    Heavy dependencies (CrewAI, transformers, yfinance, ...) are only imported by the
+    commands that need them, so `--help` and light commands start quickly.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List all commands, loaded or not."""
+        return list(dict.fromkeys([*COMMAND_MODULES, *super().list_commands(ctx)]))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a loaded command, or a help-only placeholder for one not yet imported."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in COMMAND_MODULES:
+            command = click.Command(cmd_name, help=command_help(cmd_name))
+        return command
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        """Import the invoked command's module before resolving it."""
+        if args and args[0] in COMMAND_MODULES and args[0] not in self.commands:
+            self._load(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load(self, cmd_name: str) -> None:
+        """Import a command module and add the commands it registered."""
+        load_command_module(cmd_name)
+        for info in app.registered_commands:
+            command = get_command_from_info(
+                info,
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=app.rich_markup_mode,
+            )
+            if command.name not in self.commands:
+                self.add_command(command)
+
 
 app = typer.Typer(
     name="falconsignals",
     help="AI-powered financial analysis and investment recommendation system",
     no_args_is_help=True,
+    cls=LazyCommandGroup,
 )
 
 
@@ -1,12 +1,66 @@
-"""CLI commands package."""
-
-# Import all commands to register them with the app
-from src.cli.commands.analyze import *  # noqa: F401, F403
-from src.cli.commands.config import *  # noqa: F401, F403
-from src.cli.commands.download import *  # noqa: F401, F403
-from src.cli.commands.journal import *  # noqa: F401, F403
-from src.cli.commands.performance import *  # noqa: F401, F403
-from src.cli.commands.publish import *  # noqa: F401, F403
-from src.cli.commands.report import *  # noqa: F401, F403
-from src.cli.commands.utils import *  # noqa: F401, F403
-from src.cli.commands.watchlist import *  # noqa: F401, F403
+"""CLI commands package.
+
+Command modules are imported lazily: the CLI group knows each command's name and module
+from COMMAND_MODULES and imports the module (registering its commands with the app)
+only when the command is invoked. Help listings read command docstrings from source.
+"""
+
+import ast
+import importlib.util
+from functools import cache
+from pathlib import Path
+
+# Command name -> module registering it, in help listing order
+COMMAND_MODULES: dict[str, str] = {
+    "analyze": "src.cli.commands.analyze",
+    "backtest": "src.cli.commands.backtest",
+    "sweep-strategy": "src.cli.commands.sweep",
+    "config-init": "src.cli.commands.config",
+    "validate-config": "src.cli.commands.config",
+    "download-prices": "src.cli.commands.download",
+    "journal": "src.cli.commands.journal",
+    "track-performance": "src.cli.commands.performance",
+    "performance-report": "src.cli.commands.performance",
+    "publish": "src.cli.commands.publish",
+    "report": "src.cli.commands.report",
+    "list-categories": "src.cli.commands.utils",
+    "list-portfolios": "src.cli.commands.utils",
+    "list-strategies": "src.cli.commands.utils",
+    "watchlist": "src.cli.commands.watchlist",
+    "watchlist-scan": "src.cli.commands.watchlist",
+    "watchlist-report": "src.cli.commands.watchlist",
+}
+
+
+def load_command_module(name: str) -> None:
+    """Import the module registering a command.
+
+    Args:
+        name: Command name (e.g., 'watchlist-scan')
+    """
+    importlib.import_module(COMMAND_MODULES[name])
+
+
+def load_all_commands() -> None:
+    """Import every command module."""
+    for module in dict.fromkeys(COMMAND_MODULES.values()):
+        importlib.import_module(module)
+
+
+@cache
+def command_help(name: str) -> str:
+    """Get a command's help text without importing its module.
+
+    Args:
+        name: Command name
+
+    Returns:
+        Docstring of the command function, or an empty string
+    """
+    spec = importlib.util.find_spec(COMMAND_MODULES[name])
+    tree = ast.parse(Path(spec.origin).read_text())
+    function_name = name.replace("-", "_")
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == function_name:
+            return ast.get_docstring(node) or ""
+    return ""
@@ -26,6 +26,7 @@ from src.MARKET_TICKERS import (
 from src.pipeline import AnalysisPipeline
 from src.utils.llm_check import get_fallback_warning_message, log_llm_status
 from src.utils.logging import get_logger, setup_logging
+from src.utils.profiling import span, start_run_profile, stop_run_profile
 from src.utils.scheduler import RunLog
 
 logger = get_logger(__name__)
@@ -122,6 +123,14 @@ def analyze(
             "'gap' (price gaps), 'all' (no filtering). Use 'list-strategies' command for details."
         ),
     ),
+    profile_output: Path = typer.Option(  # noqa: B008
+        None,
+        "--profile-output",
+        help=(
+            "Write the run profile (per-phase and per-ticker timings, cache hit rate, "
+            "provider calls) to this JSON file in Chrome trace format"
+        ),
+    ),
 ) -> None:
     """Analyze markets and generate investment signals.
 
@@ -163,6 +172,9 @@ def analyze(
 
         # Combine markets and groups
         analyze --market nordic --group us_tech_software
+
+        # Profile where the run spends its time (open in chrome://tracing or Perfetto)
+        analyze --ticker AAPL,MSFT --profile-output data/profiles/run.json
     """
     start_time = time.time()
     run_log = None
@@ -224,6 +236,8 @@ def analyze(
         )
         raise typer.Exit(code=1)
 
+    profiler = start_run_profile()
+
     try:
         # Load configuration
         config_obj = load_config(config)
@@ -285,10 +299,15 @@ def analyze(
         # Setup test mode if enabled
         if test:
             fixture_path = data_dir / "fixtures" / fixture
-            config_obj.test_mode.enabled = True
-            config_obj.test_mode.fixture_name = fixture
-            config_obj.test_mode.fixture_path = str(fixture_path)
-            config_obj.test_mode.use_mock_llm = use_llm
+            test_mode = config_obj.test_mode.model_copy(
+                update={
+                    "enabled": True,
+                    "fixture_name": fixture,
+                    "fixture_path": str(fixture_path),
+                    "use_mock_llm": use_llm,
+                }
+            )
+            config_obj = config_obj.model_copy(update={"test_mode": test_mode})
             logger.debug(f"Test mode enabled with fixture: {fixture}")
 
         pipeline = AnalysisPipeline(
@@ -451,15 +470,16 @@ def analyze(
         # Apply filtering strategy before analysis (unified for both LLM and rule-based)
         typer.echo(f"\n🔍 Stage 1: Filtering tickers (strategy: {strategy})")
         try:
-            filtered_ticker_list, _ = filter_tickers(
-                ticker_list,
-                strategy,
-                config_obj,
-                typer,
-                force_full_analysis,
-                historical_date,
-                config_obj.test_mode if test else None,
-            )
+            with span("stage.filter"):
+                filtered_ticker_list, _ = filter_tickers(
+                    ticker_list,
+                    strategy,
+                    config_obj,
+                    typer,
+                    force_full_analysis,
+                    historical_date,
+                    config_obj.test_mode if test else None,
+                )
             if filtered_ticker_list:
                 typer.echo("  ✓ Tickers selected for analysis: " + ", ".join(filtered_ticker_list))
 
@@ -519,18 +539,19 @@ def analyze(
                 f"Sentiment {config_obj.analysis.weight_sentiment:.0%}"
             )
 
-            signals, portfolio_manager = run_llm_analysis(
-                filtered_ticker_list,
-                config_obj,
-                typer,
-                debug_llm,
-                is_filtered=True,
-                cache_manager=cache_manager,
-                provider_manager=provider_manager,
-                historical_date=historical_date,
-                run_session_id=run_session_id,
-                recommendations_repo=recommendations_repo,
-            )
+            with span("stage.analysis"):
+                signals, portfolio_manager = run_llm_analysis(
+                    filtered_ticker_list,
+                    config_obj,
+                    typer,
+                    debug_llm,
+                    is_filtered=True,
+                    cache_manager=cache_manager,
+                    provider_manager=provider_manager,
+                    historical_date=historical_date,
+                    run_session_id=run_session_id,
+                    recommendations_repo=recommendations_repo,
+                )
             analysis_mode = "llm"
         else:
             typer.echo("\n📊 Stage 2: Rule-based analysis")
@@ -545,9 +566,10 @@ def analyze(
             if historical_context_data:
                 analysis_context["historical_contexts"] = historical_context_data
                 analysis_context["analysis_date"] = historical_date
-            signals, portfolio_manager = pipeline.run_analysis(
-                filtered_ticker_list, analysis_context
-            )
+            with span("stage.analysis"):
+                signals, portfolio_manager = pipeline.run_analysis(
+                    filtered_ticker_list, analysis_context
+                )
             analysis_mode = "rule_based"
         signals_count = len(signals)
 
@@ -631,12 +653,20 @@ def analyze(
         logger.debug(f"Analysis run completed successfully in {duration:.2f}s")
         typer.echo(f"\n✓ Analysis completed in {duration:.2f}s")
 
+        # Store the run profile once report rendering is included
+        if session_repo and run_session_id:
+            session_repo.store_profile(run_session_id, profiler.summary())
+        if profile_output:
+            profiler.write_trace(profile_output)
+            typer.echo(f"  Run profile saved: {profile_output}")
+
         # Log the run
         if run_log:
             run_log.log_run(
                 success=True,
                 duration_seconds=duration,
                 signal_count=signals_count,
+                metadata=_profile_metadata(profiler.summary()),
             )
 
     except FileNotFoundError as e:
@@ -649,6 +679,7 @@ def analyze(
                 duration_seconds=duration,
                 signal_count=signals_count,
                 error_message=str(e),
+                metadata=_profile_metadata(profiler.summary()),
             )
         raise typer.Exit(code=1) from e
     except ValueError as e:
@@ -661,6 +692,7 @@ def analyze(
                 duration_seconds=duration,
                 signal_count=signals_count,
                 error_message=str(e),
+                metadata=_profile_metadata(profiler.summary()),
             )
         raise typer.Exit(code=1) from e
     except Exception as e:
@@ -673,5 +705,26 @@ def analyze(
                 duration_seconds=duration,
                 signal_count=signals_count,
                 error_message=str(e),
+                metadata=_profile_metadata(profiler.summary()),
             )
         raise typer.Exit(code=1) from e
+    finally:
+        stop_run_profile()
+
+
+def _profile_metadata(summary: dict) -> dict:
+    """Condense a run profile summary for the run log.
+
+    Args:
+        summary: Summary from RunProfiler.summary().
+
+    Returns:
+        Dictionary with per-phase total seconds, cache hit rate and provider calls.
+    """
+    return {
+        "phase_seconds": {
+            name: round(stats["total_seconds"], 3) for name, stats in summary["phases"].items()
+        },
+        "cache_hit_rate": summary["cache_hit_rate"],
+        "provider_calls": summary["provider_calls"],
+    }
@@ -0,0 +1,224 @@
+"""Multi-date backtest command."""
+
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import typer
+
+from src.cli.app import app
+from src.config import load_config
+from src.MARKET_TICKERS import get_tickers_for_analysis, get_tickers_for_markets
+from src.utils.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+@app.command()
+def backtest(
+    start: str = typer.Option(
+        ...,
+        "--start",
+        help="First as-of date (YYYY-MM-DD)",
+    ),
+    end: str = typer.Option(
+        None,
+        "--end",
+        help="Last as-of date (YYYY-MM-DD, default: same as --start)",
+    ),
+    market: str = typer.Option(
+        None,
+        "--market",
+        "-m",
+        help=(
+            "Market to backtest: 'global', 'us', 'eu', 'nordic', or comma-separated (e.g., 'us,eu')"
+        ),
+    ),
+    group: str = typer.Option(
+        None,
+        "--group",
+        "-g",
+        help="Ticker group: sector categories or portfolios. Comma-separated for multiple.",
+    ),
+    ticker: str = typer.Option(
+        None,
+        "--ticker",
+        "-t",
+        help="Comma-separated list of tickers to backtest (e.g., 'AAPL,MSFT,GOOGL')",
+    ),
+    limit: int = typer.Option(
+        None,
+        "--limit",
+        "-l",
+        help="Maximum number of instruments per market or group",
+    ),
+    strategy: str = typer.Option(
+        "anomaly",
+        "--strategy",
+        "-s",
+        help="Filtering strategy applied on each date. Use 'list-strategies' for details.",
+    ),
+    config: Path = typer.Option(  # noqa: B008
+        None,
+        "--config",
+        "-c",
+        help="Path to configuration file (default: config/local.yaml or config/default.yaml)",
+        exists=True,
+    ),
+    store: bool = typer.Option(
+        True,
+        "--store/--no-store",
+        help="Store signals in the database under one run session",
+    ),
+) -> None:
+    """Backtest rule-based signals over a range of dates.
+
+    Loads each ticker's price history once, computes indicators over the whole
+    history and generates the signal each ticker would have received on every
+    trading day in the range, using only data available on that day. Fundamental
+    and sentiment scores are held neutral. Signals are stored in bulk under one
+    run session with analysis mode 'backtest', which keeps them out of live
+    analysis, performance tracking and publishing; ticker-days that already have
+    backtest signals are skipped.
+
+    Examples:
+        # Backtest a year of trading days for specific tickers
+        backtest --ticker AAPL,MSFT --start 2024-01-01 --end 2024-12-31
+
+        # Backtest a group without filtering, without storing signals
+        backtest --group us_mega_cap --start 2024-06-01 --end 2024-06-30 --strategy all --no-store
+    """
+    if not market and not group and not ticker:
+        typer.echo("❌ Error: Either --market, --group, or --ticker must be provided", err=True)
+        raise typer.Exit(code=1)
+
+    if (market or group) and ticker:
+        typer.echo("❌ Error: Cannot specify --ticker with --market or --group", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end, "%Y-%m-%d").date() if end else start_date
+    except ValueError as e:
+        typer.echo("❌ Error: Invalid date format. Use YYYY-MM-DD (e.g., 2024-06-01)", err=True)
+        raise typer.Exit(code=1) from e
+
+    if end_date < start_date:
+        typer.echo("❌ Error: --end must not be before --start", err=True)
+        raise typer.Exit(code=1)
+
+    start_time = time.time()
+
+    try:
+        from src.analysis.backtest import BacktestRunner
+        from src.data.price_manager import PriceDataManager
+        from src.data.provider_manager import ProviderManager
+
+        config_obj = load_config(config)
+        setup_logging(config_obj.logging)
+
+        # Determine tickers to backtest
+        if ticker:
+            tickers = [t.strip().upper() for t in ticker.split(",")]
+        elif group:
+            groups = [g.strip().lower() for g in group.split(",")]
+            tickers = get_tickers_for_analysis(categories=groups, limit_per_category=limit)
+        else:
+            markets = (
+                ["nordic", "eu", "us"]
+                if market.lower() == "global"
+                else [m.strip().lower() for m in market.split(",")]
+            )
+            tickers = get_tickers_for_markets(markets, limit=limit)
+
+        typer.echo(f"📅 Backtest {start_date} to {end_date}")
+        typer.echo(f"  Instruments: {len(tickers)}")
+        typer.echo(f"  Strategy: {strategy}")
+
+        provider_manager = ProviderManager(
+            primary_provider=config_obj.data.primary_provider,
+            backup_providers=config_obj.data.backup_providers,
+            historical_data_lookback_days=config_obj.analysis.historical_data_lookback_days,
+        )
+        runner = BacktestRunner(
+            config_obj,
+            strategy=strategy,
+            price_manager=PriceDataManager(prices_dir=Path("data") / "cache" / "prices"),
+            provider_manager=provider_manager,
+        )
+
+        typer.echo("\n⏳ Generating signals...")
+        result = runner.run(tickers, start_date, end_date)
+
+        for skipped_ticker, reason in result.skipped.items():
+            typer.echo(f"  ⚠️  {skipped_ticker}: {reason}")
+
+        typer.echo(f"\n✓ {len(result.signals)} signals over {result.trading_days} trading days")
+        typer.echo(
+            f"  Ticker-days passing {strategy}: {result.filtered}/{result.evaluated} evaluated"
+        )
+        for signal_type, count in sorted(
+            Counter(s.recommendation.value for s in result.signals).items()
+        ):
+            typer.echo(f"  {signal_type}: {count}")
+
+        if store and result.signals and config_obj.database.enabled:
+            from src.data.db import init_db
+            from src.data.repository import (
+                BACKTEST_ANALYSIS_MODE,
+                RecommendationsRepository,
+                RunSessionRepository,
+            )
+
+            init_db(config_obj.database.db_path)
+            session_repo = RunSessionRepository(config_obj.database.db_path)
+            recommendations_repo = RecommendationsRepository(config_obj.database.db_path)
+
+            existing = recommendations_repo.get_existing_recommendation_keys(
+                start_date, end_date, BACKTEST_ANALYSIS_MODE
+            )
+            new_signals = [
+                s
+                for s in result.signals
+                if (s.ticker, datetime.strptime(s.analysis_date, "%Y-%m-%d").date()) not in existing
+            ]
+
+            run_session_id = session_repo.create_session(
+                analysis_mode=BACKTEST_ANALYSIS_MODE,
+                analyzed_category=group,
+                analyzed_market=market,
+                analyzed_tickers_specified=tickers if ticker else None,
+                initial_tickers_count=len(tickers),
+                anomalies_count=result.filtered,
+            )
+            stored = recommendations_repo.store_recommendations(
+                new_signals, run_session_id, BACKTEST_ANALYSIS_MODE
+            )
+            session_repo.complete_session(
+                session_id=run_session_id,
+                signals_generated=stored,
+                signals_failed=result.filtered - len(result.signals),
+                status="completed",
+            )
+
+            typer.echo(f"\n💾 Stored {stored} signals in run session {run_session_id}")
+            if len(new_signals) < len(result.signals):
+                typer.echo(
+                    f"  Skipped {len(result.signals) - len(new_signals)} existing ticker-days"
+                )
+
+        typer.echo(f"\n✓ Backtest completed in {time.time() - start_time:.2f}s")
+
+    except FileNotFoundError as e:
+        logger.error(f"Configuration error: {e}")
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    except ValueError as e:
+        logger.error(f"Configuration validation error: {e}")
+        typer.echo(f"❌ Configuration error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    except Exception as e:
+        logger.exception(f"Unexpected error during backtest: {e}")
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
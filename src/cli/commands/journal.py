@@ -7,9 +7,11 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from src.cache.manager import CacheManager
 from src.cli.app import app
 from src.config import load_config
 from src.data.db import init_db
+from src.data.journal_analytics import TradingJournalAnalytics
 from src.data.provider_manager import ProviderManager
 from src.data.repository import TradingJournalRepository
 from src.utils.logging import get_logger, setup_logging
@@ -458,8 +460,11 @@ def journal(  # type: ignore[reportGeneralTypeIssues]
                     typer.echo("❌ Invalid end date format", err=True)
                     raise typer.Exit(code=1) from None
 
-            # Get closed trades for realized P&L
-            closed_trades = journal_repo.get_closed_trades(start_date=start_date, end_date=end_date)
+            # Realized statistics come from the vectorized, cached analytics engine
+            analytics = TradingJournalAnalytics(
+                db_path, cache_manager=CacheManager(str(Path("data") / "cache"))
+            ).get_analytics(start_date=start_date, end_date=end_date)
+            realized = analytics["summary"]
 
             # Get open trades for unrealized P&L
             open_trades = journal_repo.get_open_trades()
@@ -582,42 +587,15 @@ def journal(  # type: ignore[reportGeneralTypeIssues]
                 except Exception as e:
                     typer.echo(f"  ❌ Error fetching price for {ticker}: {e}")
 
-            # Calculate realized P&L from closed trades
-            realized_pl = sum(trade["profit_loss"] or 0 for trade in closed_trades)
-            realized_pl_pct_list = [
-                trade["profit_loss_pct"] for trade in closed_trades if trade["profit_loss_pct"]
-            ]
-
-            # Calculate statistics
-            total_trades = len(closed_trades)
-            winning_trades = sum(1 for trade in closed_trades if (trade["profit_loss"] or 0) > 0)
-            losing_trades = sum(1 for trade in closed_trades if (trade["profit_loss"] or 0) < 0)
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-
-            avg_win = (
-                sum(
-                    trade["profit_loss"]
-                    for trade in closed_trades
-                    if (trade["profit_loss"] or 0) > 0
-                )
-                / winning_trades
-                if winning_trades > 0
-                else 0
-            )
-            avg_loss = (
-                sum(
-                    trade["profit_loss"]
-                    for trade in closed_trades
-                    if (trade["profit_loss"] or 0) < 0
-                )
-                / losing_trades
-                if losing_trades > 0
-                else 0
-            )
-
-            avg_realized_pl_pct = (
-                sum(realized_pl_pct_list) / len(realized_pl_pct_list) if realized_pl_pct_list else 0
-            )
+            # Realized statistics from closed trades
+            realized_pl = realized["total_profit_loss"]
+            total_trades = realized["total_trades"]
+            winning_trades = realized.get("winning_trades", 0)
+            losing_trades = realized.get("losing_trades", 0)
+            win_rate = realized["win_rate"]
+            avg_win = realized.get("avg_win", 0.0)
+            avg_loss = realized.get("avg_loss", 0.0)
+            avg_realized_pl_pct = realized["avg_profit_loss_pct"]
             avg_unrealized_pl_pct = (
                 sum(unrealized_pl_pct_list) / len(unrealized_pl_pct_list)
                 if unrealized_pl_pct_list
@@ -651,6 +629,24 @@ def journal(  # type: ignore[reportGeneralTypeIssues]
                 if winning_trades > 0 and losing_trades > 0:
                     profit_factor = abs(avg_win / avg_loss) if avg_loss != 0 else 0
                     typer.echo(f"  Profit factor: {profit_factor:.2f}")
+                typer.echo(f"  Expectancy per trade: ${realized['expectancy']:,.2f}")
+                typer.echo(f"  Max drawdown: ${realized['max_drawdown']:,.2f}")
+                holding = analytics["holding_period"]
+                typer.echo(
+                    f"  Holding period: {holding['avg_days']:.1f} days avg, "
+                    f"{holding['median_days']:.0f} median"
+                )
+
+                # Monthly breakdown
+                typer.echo("\n📆 Realized P&L by Month:")
+                for month in analytics["by_month"][-12:]:
+                    month_color = "green" if month["total_profit_loss"] > 0 else "red"
+                    typer.echo(f"  {month['key']}: ", nl=False)
+                    typer.secho(
+                        f"${month['total_profit_loss']:,.2f} "
+                        f"({month['trades']} trades, {month['win_rate']:.0f}% win)",
+                        fg=month_color,
+                    )
 
             # Unrealized Performance (Open Trades)
             typer.echo("\n📊 Unrealized Performance (Open Trades):")
@@ -78,18 +78,12 @@ def track_performance(
         # Parse signal types
         signal_list = [s.strip() for s in signal_types.split(",")]
 
-        # Get active recommendations
+        # Stream active recommendations so memory stays flat as history grows
         typer.echo("\n📊 Fetching active recommendations...")
-        recommendations = perf_repo.get_active_recommendations(
+        recommendations = perf_repo.iter_active_recommendations(
             max_age_days=max_age_days, signal_types=signal_list
         )
 
-        if not recommendations:
-            typer.echo("  No active recommendations found to track")
-            return
-
-        typer.echo(f"  Found {len(recommendations)} active recommendations")
-
         # Track prices
         tracked_count = 0
         failed_count = 0
@@ -140,6 +134,10 @@ def track_performance(
                 logger.error(f"Error tracking recommendation {rec.id}: {e}")
                 failed_count += 1
 
+        if tracked_count == 0 and failed_count == 0:
+            typer.echo("  No active recommendations found to track")
+            return
+
         # Summary
         typer.echo("\n✅ Performance tracking complete:")
         typer.echo(f"  Tracked: {tracked_count} recommendations")
@@ -187,6 +185,11 @@ def performance_report(
         "--update/--no-update",
         help="Update performance summary before generating report",
     ),
+    rebuild: bool = typer.Option(
+        False,
+        "--rebuild",
+        help="Rebuild the daily performance time series from price tracking history",
+    ),
     format: str = typer.Option(
         "text",
         "--format",
@@ -204,7 +207,10 @@ def performance_report(
     """Generate performance report for recommendations.
 
     Shows aggregated performance metrics including returns, win rate,
-    alpha vs benchmark, and confidence calibration.
+    alpha vs benchmark, and confidence calibration. Metrics are read from the
+    daily performance time series maintained by track-performance, which is
+    backfilled automatically when it does not cover all tracking history; use
+    --rebuild to regenerate it.
 
     Examples:
         performance-report
@@ -212,6 +218,7 @@ def performance_report(
         performance-report --ticker AAPL
         performance-report --signal buy --mode llm
         performance-report --format json
+        performance-report --rebuild
     """
     try:
         # Load configuration
@@ -228,6 +235,18 @@ def performance_report(
         # Initialize repository
         perf_repo = PerformanceRepository(db_path)
 
+        if not rebuild and perf_repo.needs_timeseries_backfill():
+            typer.echo("\nℹ️  Daily performance time series is missing tracking history")
+            rebuild = True
+
+        if rebuild:
+            typer.echo("\n⏳ Rebuilding daily performance time series...")
+            row_count = perf_repo.rebuild_performance_timeseries()
+            if row_count < 0:
+                typer.echo("  ⚠️  Warning: Failed to rebuild performance time series")
+            else:
+                typer.echo(f"  Rebuilt {row_count} daily performance rows")
+
         # Update performance summary if requested
         if update_summary:
             typer.echo("\n⏳ Updating performance summary...")
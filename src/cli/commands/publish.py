@@ -56,6 +56,11 @@ def publish(
     no_build: bool = typer.Option(
         False, "--no-build", help="Skip MkDocs build step (for testing content generation)"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Regenerate all ticker and tag pages, not only those changed since the last publish",
+    ),
     config: str = typer.Option(
         "config/local.yaml",
         "--config",
@@ -96,6 +101,9 @@ def publish(
 
         # Build site but don't deploy to GitHub Pages
         publish --session-id 123 --build-only
+
+        # Regenerate every page instead of only those with new signals
+        publish --date 2025-12-10 --full
     """
     try:
         # Validate inputs
@@ -162,13 +170,16 @@ def publish(
             output_dir=str(website_dir),
         )
 
+        # Tickers, dates and signal types with new signals since the last publish
+        changes = generator.get_changes(full=full)
+
         # Load signals from database
         repo = RecommendationsRepository(config_obj.database.db_path)
+        ticker_pages_generated = True
 
         if ticker:
             # Load signals for specific ticker
-            signals_data = repo.get_recommendations_by_ticker(ticker)
-            if not signals_data:
+            if repo.get_latest_recommendation(ticker) is None:
                 typer.echo(f"❌ No signals found for ticker: {ticker}", err=True)
                 raise typer.Exit(code=1)
 
@@ -230,22 +241,37 @@ def publish(
             )
             typer.echo(f"  ✓ Created: {report_path}")
 
-            # Generate ticker pages for all tickers in the report
+            # Generate ticker pages for the report's tickers; incrementally, only new pages
+            # and published pages of tickers with new signals
             typer.echo("  Generating ticker pages...")
-            unique_tickers = list(set(s.ticker for s in signal_objects))
-            for t in unique_tickers:
-                try:
-                    ticker_path = generator.generate_ticker_page(t)
+            report_tickers = set(s.ticker for s in signal_objects)
+            if full:
+                unique_tickers = report_tickers
+            else:
+                tickers_dir = website_dir / "tickers"
+                unique_tickers = {
+                    t for t in report_tickers if not (tickers_dir / f"{t}.md").exists()
+                } | {
+                    t
+                    for t in changes["tickers"]
+                    if t in report_tickers or (tickers_dir / f"{t}.md").exists()
+                }
+            try:
+                ticker_pages = generator.generate_ticker_pages(sorted(unique_tickers))
+                for t, ticker_path in ticker_pages.items():
                     typer.echo(f"    ✓ {t}: {ticker_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to generate page for {t}: {e}")
-                    typer.echo(f"    ⚠️  {t}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to generate ticker pages: {e}")
+                typer.echo(f"    ⚠️  Ticker pages failed: {e}")
+                ticker_pages_generated = False
 
         # Generate tag pages
         typer.echo("  Generating tag pages...")
+        tags_generated = False
         try:
-            tag_pages = generator.generate_tag_pages()
+            tag_pages = generator.generate_tag_pages(None if full else changes)
             typer.echo(f"  ✓ Generated {len(tag_pages)} tag pages")
+            tags_generated = True
         except Exception as e:
             logger.warning(f"Failed to generate tag pages: {e}")
             typer.echo(f"  ⚠️  Tag generation failed: {e}")
@@ -260,6 +286,14 @@ def publish(
         generator.update_navigation()
         typer.echo("  ✓ Navigation updated")
 
+        # Remember what was published; keep the old watermark if ticker or tag pages are
+        # incomplete, so the next incremental publish regenerates them
+        complete = ticker_pages_generated and tags_generated
+        generator.save_publish_state(changes["watermark"] if complete else None)
+        typer.echo(
+            f"  ✓ {generator.pages_written} file(s) written, {generator.pages_unchanged} unchanged"
+        )
+
         typer.echo(f"\n✓ Content generated successfully in {website_dir}")
 
         # Build site with MkDocs if requested
@@ -0,0 +1,240 @@
+"""Filtering strategy parameter sweep command."""
+
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import typer
+
+from src.cli.app import app
+from src.config import load_config
+from src.MARKET_TICKERS import get_tickers_for_analysis, get_tickers_for_markets
+from src.utils.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def _parse_param(spec: str) -> tuple[str, list[int | float]]:
+    """Parse a 'name=v1,v2,...' parameter specification."""
+    name, sep, values = spec.partition("=")
+    if not sep or not name.strip() or not values.strip():
+        raise typer.BadParameter(f"Expected name=value[,value...], got '{spec}'")
+
+    parsed = []
+    for value in values.split(","):
+        try:
+            parsed.append(int(value))
+        except ValueError:
+            try:
+                parsed.append(float(value))
+            except ValueError as e:
+                raise typer.BadParameter(f"Invalid number '{value}' for {name.strip()}") from e
+    return name.strip(), parsed
+
+
+@app.command()
+def sweep_strategy(
+    strategy: str = typer.Option(
+        "anomaly",
+        "--strategy",
+        "-s",
+        help="Filtering strategy to evaluate, or comma-separated strategies without --param",
+    ),
+    param: list[str] = typer.Option(  # noqa: B008
+        None,
+        "--param",
+        "-p",
+        help="Strategy parameter values as name=v1,v2,... (repeatable; all combinations)",
+    ),
+    start: str = typer.Option(
+        None,
+        "--start",
+        help="First evaluated date (YYYY-MM-DD, default: one year before --end)",
+    ),
+    end: str = typer.Option(
+        None,
+        "--end",
+        help="Last evaluated date (YYYY-MM-DD, default: today)",
+    ),
+    horizons: str = typer.Option(
+        "5,20",
+        "--horizons",
+        help="Comma-separated trading days ahead for forward returns",
+    ),
+    market: str = typer.Option(
+        None,
+        "--market",
+        "-m",
+        help=(
+            "Market to evaluate: 'global', 'us', 'eu', 'nordic', or comma-separated (e.g., 'us,eu')"
+        ),
+    ),
+    group: str = typer.Option(
+        None,
+        "--group",
+        "-g",
+        help="Ticker group: sector categories or portfolios. Comma-separated for multiple.",
+    ),
+    ticker: str = typer.Option(
+        None,
+        "--ticker",
+        "-t",
+        help="Comma-separated list of tickers to evaluate (e.g., 'AAPL,MSFT,GOOGL')",
+    ),
+    limit: int = typer.Option(
+        None,
+        "--limit",
+        "-l",
+        help="Maximum number of instruments per market or group",
+    ),
+    top: int = typer.Option(
+        20,
+        "--top",
+        help="Number of configurations to show, best forward return first",
+    ),
+    config: Path = typer.Option(  # noqa: B008
+        None,
+        "--config",
+        "-c",
+        help="Path to configuration file (default: config/local.yaml or config/default.yaml)",
+        exists=True,
+    ),
+) -> None:
+    """Sweep filtering strategy parameters over historical prices.
+
+    Evaluates each strategy configuration on every trading day in the date range for
+    all selected tickers, and reports how often it flags a ticker (hit rate) and the
+    average forward returns and win rates of flagged days, next to the baseline of
+    all ticker-days.
+
+    Examples:
+        # Compare all strategies with default parameters on the US market
+        sweep-strategy --market us --strategy anomaly,volume,momentum,breakout,gap
+
+        # Sweep 60 anomaly threshold combinations for a year
+        sweep-strategy --market us --start 2024-01-01 --end 2024-12-31 \\
+            -p daily_change_threshold=2,3,4,5,6 -p volume_spike_multiplier=1.5,2,2.5,3 \\
+            -p weekly_change_threshold=10,15,20
+    """
+    if not market and not group and not ticker:
+        typer.echo("❌ Error: Either --market, --group, or --ticker must be provided", err=True)
+        raise typer.Exit(code=1)
+
+    if (market or group) and ticker:
+        typer.echo("❌ Error: Cannot specify --ticker with --market or --group", err=True)
+        raise typer.Exit(code=1)
+
+    strategies = [s.strip().lower() for s in strategy.split(",")]
+    if param and len(strategies) > 1:
+        typer.echo("❌ Error: --param can only be used with a single --strategy", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        end_date = datetime.strptime(end, "%Y-%m-%d").date() if end else date.today()
+        start_date = (
+            datetime.strptime(start, "%Y-%m-%d").date() if start else end_date - timedelta(days=365)
+        )
+        horizon_days = tuple(int(h) for h in horizons.split(","))
+    except ValueError as e:
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    if end_date < start_date:
+        typer.echo("❌ Error: --end must not be before --start", err=True)
+        raise typer.Exit(code=1)
+
+    params = dict(_parse_param(spec) for spec in param or [])
+    start_time = time.time()
+
+    try:
+        from src.analysis.backtest import BacktestRunner
+        from src.analysis.strategy_sweep import StrategySweep, parameter_grid
+        from src.data.price_manager import PriceDataManager
+        from src.data.provider_manager import ProviderManager
+        from src.filtering.strategies import get_strategy
+
+        config_obj = load_config(config)
+        setup_logging(config_obj.logging)
+
+        # Validate strategy names before loading prices
+        for name in strategies:
+            get_strategy(name)
+
+        # Determine tickers to evaluate
+        if ticker:
+            tickers = [t.strip().upper() for t in ticker.split(",")]
+        elif group:
+            groups = [g.strip().lower() for g in group.split(",")]
+            tickers = get_tickers_for_analysis(categories=groups, limit_per_category=limit)
+        else:
+            markets = (
+                ["nordic", "eu", "us"]
+                if market.lower() == "global"
+                else [m.strip().lower() for m in market.split(",")]
+            )
+            tickers = get_tickers_for_markets(markets, limit=limit)
+
+        grid = parameter_grid(params)
+        typer.echo(f"📅 Strategy sweep {start_date} to {end_date}")
+        typer.echo(f"  Instruments: {len(tickers)}")
+        typer.echo(f"  Configurations: {len(grid) * len(strategies)}")
+
+        # Price history is loaded like a backtest, including indicator warm-up
+        provider_manager = ProviderManager(
+            primary_provider=config_obj.data.primary_provider,
+            backup_providers=config_obj.data.backup_providers,
+            historical_data_lookback_days=config_obj.analysis.historical_data_lookback_days,
+        )
+        loader = BacktestRunner(
+            config_obj,
+            price_manager=PriceDataManager(prices_dir=Path("data") / "cache" / "prices"),
+            provider_manager=provider_manager,
+        )
+
+        histories = {}
+        for symbol in tickers:
+            try:
+                histories[symbol] = loader.load_history(symbol, start_date, end_date)
+            except Exception as e:
+                logger.warning(f"Failed to load price history for {symbol}: {e}")
+                typer.echo(f"  ⚠️  {symbol}: {e}")
+
+        typer.echo("\n⏳ Evaluating configurations...")
+        sweep = StrategySweep(histories, start_date, end_date, horizons=horizon_days)
+        baseline = sweep.evaluate(get_strategy("all"))
+        results = [result for name in strategies for result in sweep.run(name, grid)]
+
+        # Rank by forward return over the first horizon
+        first = horizon_days[0]
+        results.sort(key=lambda r: r.avg_returns.get(first, float("-inf")), reverse=True)
+
+        typer.echo(f"\n📊 {baseline.evaluated} ticker-days on {len(sweep.tickers)} tickers")
+        header = f"  {'Strategy':<12} {'Hits':>8} {'Hit %':>7}"
+        for h in horizon_days:
+            header += f" {f'{h}d avg':>9} {f'{h}d win':>8}"
+        typer.echo(header + "  Parameters")
+
+        for result in [baseline, *results[:top]]:
+            line = f"  {result.strategy:<12} {result.hits:>8} {result.hit_rate:>6.1f}%"
+            for h in horizon_days:
+                if h in result.avg_returns:
+                    line += f" {result.avg_returns[h]:>+8.2f}% {result.win_rates[h]:>7.1f}%"
+                else:
+                    line += f" {'-':>9} {'-':>8}"
+            params_text = ", ".join(f"{k}={v}" for k, v in result.params.items())
+            typer.echo(f"{line}  {params_text or '(defaults)'}")
+
+        typer.echo(f"\n✓ Sweep completed in {time.time() - start_time:.2f}s")
+
+    except FileNotFoundError as e:
+        logger.error(f"Configuration error: {e}")
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    except ValueError as e:
+        logger.error(f"Configuration validation error: {e}")
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    except Exception as e:
+        logger.exception(f"Unexpected error during strategy sweep: {e}")
+        typer.echo(f"❌ Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
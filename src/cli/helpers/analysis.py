@@ -91,6 +91,14 @@ def run_llm_analysis(
         typer_instance.echo(f"  Temperature: {config_obj.llm.temperature}")
         typer_instance.echo("  Token tracking: enabled")
 
+        # Fetch news for all tickers up front so FinBERT scores them in one batch job
+        news_fetcher = getattr(getattr(orchestrator, "tool_adapter", None), "news_fetcher", None)
+        if news_fetcher is not None and len(tickers) > 1:
+            try:
+                news_fetcher.prefetch(tickers)
+            except Exception as e:
+                logger.warning(f"News prefetch failed, fetching per ticker: {e}")
+
         # Analyze each ticker with LLM
         signals = []
         stage_label = "Stage 2: Deep LLM analysis" if is_filtered else "Analyzing instruments"
@@ -157,6 +165,10 @@ def run_llm_analysis(
                     logger.error(f"Error analyzing {ticker} with LLM: {e}")
                     typer_instance.echo(f"  ⚠️  Error analyzing {ticker}: {e}")
 
+        # Drop prefetched news of tickers whose analysis failed before the sentiment step
+        if news_fetcher is not None:
+            news_fetcher.clear_prefetched()
+
         # Log token usage summary
         daily_stats = tracker.get_daily_stats()
         if daily_stats:
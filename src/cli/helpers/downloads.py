@@ -71,14 +71,12 @@ def download_price_data(
                     rate_limiter.wait_if_needed(tokens=1)
 
                     # Fetch prices using provider manager with period parameter
-                    prices = provider_manager.get_stock_prices(ticker, period=period)
+                    prices = provider_manager.get_price_frame(ticker, period=period)
 
-                    if prices:
+                    if not prices.empty:
                         # Store to CSV
                         stored = price_manager.store_prices(
-                            ticker,
-                            [p.model_dump() for p in prices],
-                            append=not force_refresh,
+                            ticker, prices, append=not force_refresh
                         )
                         if stored > 0:
                             success_count += 1
@@ -111,15 +109,11 @@ def download_price_data(
                 rate_limiter.wait_if_needed(tokens=1)
 
                 # Fetch prices using provider manager with period parameter
-                prices = provider_manager.get_stock_prices(ticker, period=period)
+                prices = provider_manager.get_price_frame(ticker, period=period)
 
-                if prices:
+                if not prices.empty:
                     # Store to CSV
-                    stored = price_manager.store_prices(
-                        ticker,
-                        [p.model_dump() for p in prices],
-                        append=not force_refresh,
-                    )
+                    stored = price_manager.store_prices(ticker, prices, append=not force_refresh)
                     if stored > 0:
                         success_count += 1
                         logger.debug(f"Downloaded {len(prices)} prices for {ticker}")
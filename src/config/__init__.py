@@ -1,27 +1,31 @@
 """Configuration management system."""
 
-from .loader import ConfigLoader, load_config
+from .loader import (
+    ConfigLoader,
+    ConfigSnapshot,
+    clear_config_cache,
+    load_config,
+    load_config_snapshot,
+)
 from .schemas import Config
 
-__all__ = ["Config", "ConfigLoader", "load_config", "get_config"]
-
-# Singleton config instance
-_config_instance: Config | None = None
+__all__ = [
+    "Config",
+    "ConfigLoader",
+    "ConfigSnapshot",
+    "load_config",
+    "load_config_snapshot",
+    "clear_config_cache",
+    "get_config",
+]
 
 
 def get_config() -> Config:
-    """Get the singleton configuration instance.
+    """Get the configuration from the default config file.
+
+    The file is loaded on first access and again whenever it changes.
 
     Returns:
         The loaded Config object
-
-    Raises:
-        RuntimeError: If config hasn't been loaded yet
     """
-    global _config_instance
-
-    if _config_instance is None:
-        # Lazy load on first access
-        _config_instance = load_config()
-
-    return _config_instance
+    return load_config()
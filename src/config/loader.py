@@ -1,6 +1,14 @@
-"""Configuration loading and management."""
+"""Configuration loading and management.
+
+load_config() keeps one validated configuration per config file for the whole process.
+A file is parsed and validated again only when its modification time or size changes,
+so repeated loads cost a stat() and a dictionary lookup. Environment variables are read
+when a file version is first loaded; changing them alone does not trigger a reload.
+"""
 
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
@@ -9,6 +17,28 @@ from dotenv import load_dotenv
 from .schemas import Config
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Validated configuration loaded from one version of a config file.
+
+    Attributes:
+        config: Immutable configuration
+        path: Resolved config file path
+        version: (modification time in ns, size in bytes) of the file when loaded
+        content_hash: Hash of the configuration values, for keying downstream caches
+    """
+
+    config: Config
+    path: Path
+    version: tuple[int, int]
+    content_hash: str
+
+
+# Resolved config path -> latest loaded snapshot
+_snapshots: dict[Path, ConfigSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
 class ConfigLoader:
     """Load and validate configuration from YAML files."""
 
@@ -22,7 +52,8 @@ class ConfigLoader:
         self.config_path = self._resolve_config_path(config_path)
         self._load_env()
 
-    def _resolve_config_path(self, provided_path: str | Path | None) -> Path:
+    @staticmethod
+    def _resolve_config_path(provided_path: str | Path | None) -> Path:
         """Resolve configuration file path.
 
         Args:
@@ -124,9 +155,44 @@ class ConfigLoader:
         return self.config_path
 
 
+def load_config_snapshot(config_path: str | Path | None = None) -> ConfigSnapshot:
+    """Load configuration, reusing the cached snapshot while the file is unchanged.
+
+    Args:
+        config_path: Path to config file. If None, tries config/local.yaml
+                    then config/default.yaml.
+
+    Returns:
+        ConfigSnapshot of the current file version
+
+    Raises:
+        FileNotFoundError: If no config file is found
+        ValueError: If configuration validation fails
+    """
+    path = ConfigLoader._resolve_config_path(config_path).resolve()
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _snapshots_lock:
+        cached = _snapshots.get(path)
+    if cached and cached.version == version:
+        return cached
+
+    config = ConfigLoader(path).load()
+    snapshot = ConfigSnapshot(
+        config=config, path=path, version=version, content_hash=config.content_hash()
+    )
+    with _snapshots_lock:
+        _snapshots[path] = snapshot
+    return snapshot
+
+
 def load_config(config_path: str | Path | None = None) -> Config:
     """Convenience function to load configuration.
 
+    The returned Config is shared by all callers loading the same file version and is
+    immutable; use model_copy(update=...) for a modified copy.
+
     Args:
         config_path: Path to config file. If None, tries config/local.yaml
                     then config/default.yaml.
@@ -138,5 +204,10 @@ def load_config(config_path: str | Path | None = None) -> Config:
         FileNotFoundError: If no config file is found
         ValueError: If configuration validation fails
     """
-    loader = ConfigLoader(config_path)
-    return loader.load()
+    return load_config_snapshot(config_path).config
+
+
+def clear_config_cache() -> None:
+    """Forget all loaded configurations so the next load reads the files again."""
+    with _snapshots_lock:
+        _snapshots.clear()
@@ -1,16 +1,29 @@
 """Pydantic schemas for configuration validation."""
 
-from pydantic import BaseModel, Field, field_validator
+import hashlib
+import json
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-class CapitalConfig(BaseModel):
+
+class ConfigModel(BaseModel):
+    """Base for configuration sections.
+
+    Sections are immutable so that one loaded configuration can be shared by all
+    callers; derive a changed copy with model_copy(update=...).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CapitalConfig(ConfigModel):
     """Capital settings for portfolio management."""
 
     starting_capital_eur: float = Field(gt=0, description="Initial capital in EUR")
     monthly_deposit_eur: float = Field(default=0, ge=0, description="Monthly deposit amount in EUR")
 
 
-class RiskConfig(BaseModel):
+class RiskConfig(ConfigModel):
     """Risk tolerance and position sizing settings."""
 
     tolerance: str = Field(
@@ -23,6 +36,13 @@ class RiskConfig(BaseModel):
     max_sector_concentration_percent: float = Field(
         default=20, ge=1, le=100, description="Max sector concentration as % of capital"
     )
+    max_market_concentration_percent: float = Field(
+        default=100, ge=1, le=100, description="Max market concentration as % of capital"
+    )
+    allocation_method: str = Field(
+        default="greedy",
+        description="Position sizing method: greedy (rank order) or optimize (all at once)",
+    )
 
     @field_validator("tolerance")
     @classmethod
@@ -33,8 +53,17 @@ class RiskConfig(BaseModel):
             raise ValueError(f"Risk tolerance must be one of {allowed}")
         return v.lower()
 
+    @field_validator("allocation_method")
+    @classmethod
+    def validate_allocation_method(cls, v: str) -> str:
+        """Validate allocation method is one of allowed values."""
+        allowed = {"greedy", "optimize"}
+        if v.lower() not in allowed:
+            raise ValueError(f"Allocation method must be one of {allowed}")
+        return v.lower()
+
 
-class MarketsConfig(BaseModel):
+class MarketsConfig(ConfigModel):
     """Market and instrument preferences."""
 
     included: list[str] = Field(
@@ -58,7 +87,7 @@ class MarketsConfig(BaseModel):
         return v
 
 
-class IndicatorConfig(BaseModel):
+class IndicatorConfig(ConfigModel):
     """Configuration for a single technical indicator."""
 
     name: str = Field(description="Indicator name (must match pandas-ta function name)")
@@ -66,7 +95,7 @@ class IndicatorConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether the indicator is enabled")
 
 
-class TechnicalIndicatorsConfig(BaseModel):
+class TechnicalIndicatorsConfig(ConfigModel):
     """Configuration for technical analysis indicators."""
 
     indicators: list[IndicatorConfig] = Field(
@@ -98,7 +127,7 @@ class TechnicalIndicatorsConfig(BaseModel):
     )
 
 
-class AnalysisConfig(BaseModel):
+class AnalysisConfig(ConfigModel):
     """Analysis and scoring preferences."""
 
     weight_fundamental: float = Field(
@@ -148,7 +177,7 @@ class AnalysisConfig(BaseModel):
         return v
 
 
-class OutputConfig(BaseModel):
+class OutputConfig(ConfigModel):
     """Output formatting preferences."""
 
     max_recommendations: int = Field(
@@ -174,7 +203,7 @@ class OutputConfig(BaseModel):
         return v.lower()
 
 
-class CacheTTLConfig(BaseModel):
+class CacheTTLConfig(ConfigModel):
     """Cache time-to-live settings."""
 
     price_data_market_hours: int = Field(
@@ -190,16 +219,19 @@ class CacheTTLConfig(BaseModel):
     )
 
 
-class NewsSourceConfig(BaseModel):
+class NewsSourceConfig(ConfigModel):
     """Configuration for a single news source."""
 
     name: str = Field(description="Provider name (e.g., 'alpha_vantage', 'finnhub')")
     priority: int = Field(default=1, ge=1, le=10, description="Priority order (lower = higher)")
     enabled: bool = Field(default=True, description="Whether this source is enabled")
     max_articles: int = Field(default=50, ge=1, le=200, description="Max articles from this source")
+    timeout_seconds: float = Field(
+        default=20.0, gt=0, le=300, description="Deadline for this source in concurrent mode"
+    )
 
 
-class NewsConfig(BaseModel):
+class NewsConfig(ConfigModel):
     """News fetching configuration."""
 
     max_articles: int = Field(
@@ -221,18 +253,66 @@ class NewsConfig(BaseModel):
     use_unified_aggregator: bool = Field(
         default=True, description="Use unified news aggregator with deduplication"
     )
+    concurrent_sources: bool = Field(
+        default=False,
+        description="Query all news sources in parallel instead of one after another",
+    )
+    stop_at_target: bool = Field(
+        default=False,
+        description="In concurrent mode, stop waiting for slower sources once the target is met",
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.6,
+        gt=0.0,
+        le=1.0,
+        description="Title/summary similarity (Jaccard) above which articles are duplicates",
+    )
+    persist_articles: bool = Field(
+        default=True,
+        description="Store fetched articles in the database and fetch only newer ones later",
+    )
 
 
-class LocalSentimentModelConfig(BaseModel):
+class LocalSentimentModelConfig(ConfigModel):
     """Configuration for local sentiment model."""
 
     name: str = Field(default="ProsusAI/finbert", description="Hugging Face model name")
     device: str = Field(default="auto", description="Device: 'auto', 'cpu', 'cuda', 'mps'")
     batch_size: int = Field(default=32, ge=1, le=128, description="Batch size for processing")
     max_length: int = Field(default=512, ge=64, le=1024, description="Maximum token length")
+    num_threads: int | None = Field(
+        default=None, ge=1, description="Torch CPU threads for inference (None = torch default)"
+    )
+    cache_scores: bool = Field(
+        default=True,
+        description="Cache per-article scores in the database so unchanged texts are not re-scored",
+    )
+    backend: str = Field(
+        default="transformers",
+        description="Inference backend: 'transformers' (torch) or 'onnx' (ONNX Runtime, CPU)",
+    )
+    onnx_dir: str = Field(
+        default="data/models/onnx", description="Directory the ONNX model export is cached in"
+    )
+    quantize: bool = Field(
+        default=True, description="Use dynamic int8 quantization for the ONNX backend"
+    )
+    parity_check: bool = Field(
+        default=True,
+        description="Check ONNX predictions against the transformers pipeline after export",
+    )
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        """Validate inference backend."""
+        allowed = {"transformers", "onnx"}
+        if v.lower() not in allowed:
+            raise ValueError(f"backend must be one of {allowed}, got {v}")
+        return v.lower()
 
 
-class SentimentConfig(BaseModel):
+class SentimentConfig(ConfigModel):
     """Sentiment analysis configuration."""
 
     scoring_method: str = Field(
@@ -261,7 +341,7 @@ class SentimentConfig(BaseModel):
         return v.lower()
 
 
-class DataConfig(BaseModel):
+class DataConfig(ConfigModel):
     """Data fetching and caching configuration."""
 
     cache_ttl: CacheTTLConfig = Field(
@@ -277,7 +357,7 @@ class DataConfig(BaseModel):
     )
 
 
-class APIConfig(BaseModel):
+class APIConfig(ConfigModel):
     """API settings and credentials."""
 
     max_retries: int = Field(default=3, ge=1, description="Maximum retry attempts")
@@ -287,7 +367,7 @@ class APIConfig(BaseModel):
     timeout_seconds: int = Field(default=30, ge=1, le=300, description="Request timeout in seconds")
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(ConfigModel):
     """Logging configuration."""
 
     level: str = Field(
@@ -309,7 +389,7 @@ class LoggingConfig(BaseModel):
         return v.upper()
 
 
-class LLMConfig(BaseModel):
+class LLMConfig(ConfigModel):
     """LLM provider and model configuration."""
 
     provider: str = Field(
@@ -346,7 +426,7 @@ class LLMConfig(BaseModel):
         return v.lower()
 
 
-class TokenTrackerConfig(BaseModel):
+class TokenTrackerConfig(ConfigModel):
     """Token usage tracking and cost monitoring configuration."""
 
     enabled: bool = Field(default=True, description="Enable token tracking")
@@ -363,7 +443,7 @@ class TokenTrackerConfig(BaseModel):
     )
 
 
-class DeploymentConfig(BaseModel):
+class DeploymentConfig(ConfigModel):
     """Deployment and scheduling settings."""
 
     run_time: str = Field(default="08:00", description="Daily run time in UTC (HH:MM format)")
@@ -376,7 +456,7 @@ class DeploymentConfig(BaseModel):
     )
 
 
-class TestModeConfig(BaseModel):
+class TestModeConfig(ConfigModel):
     """Test mode configuration for zero-cost testing."""
 
     enabled: bool = Field(default=False, description="Enable test mode (fixtures instead of APIs)")
@@ -392,7 +472,7 @@ class TestModeConfig(BaseModel):
     )
 
 
-class DatabaseConfig(BaseModel):
+class DatabaseConfig(ConfigModel):
     """Database configuration for historical data storage."""
 
     enabled: bool = Field(default=True, description="Enable database storage of historical data")
@@ -413,7 +493,7 @@ class DatabaseConfig(BaseModel):
     )
 
 
-class FilterStrategyConfig(BaseModel):
+class FilterStrategyConfig(ConfigModel):
     """Configuration for individual filtering strategies."""
 
     daily_change_threshold: float = Field(
@@ -439,7 +519,7 @@ class FilterStrategyConfig(BaseModel):
     )
 
 
-class FilteringConfig(BaseModel):
+class FilteringConfig(ConfigModel):
     """Filtering configuration for ticker pre-selection."""
 
     default_strategy: str = Field(
@@ -464,7 +544,7 @@ class FilteringConfig(BaseModel):
         return v.lower()
 
 
-class Config(BaseModel):
+class Config(ConfigModel):
     """Root configuration schema."""
 
     capital: CapitalConfig = Field(default_factory=CapitalConfig, description="Capital settings")
@@ -498,3 +578,12 @@ class Config(BaseModel):
         default_factory=FilteringConfig,
         description="Filtering configuration for ticker pre-selection",
     )
+
+    def content_hash(self) -> str:
+        """Get a hash of all configuration values, stable across processes.
+
+        Returns:
+            SHA-256 hex digest of the values serialized with sorted keys
+        """
+        values = json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        return hashlib.sha256(values.encode()).hexdigest()
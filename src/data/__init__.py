@@ -1,7 +1,21 @@
-"""Data fetching and processing modules."""
+"""Data fetching and processing modules.
 
-# Import providers to register them with the factory
-from src.data.alpha_vantage import AlphaVantageProvider  # noqa: F401
-from src.data.finnhub import FinnhubProvider  # noqa: F401
-from src.data.fixture import FixtureDataProvider  # noqa: F401
-from src.data.yahoo_finance import YahooFinanceProvider  # noqa: F401
+Providers register themselves with DataProviderFactory when their module is imported;
+the factory imports built-in providers on first use, so importing this package does
+not load yfinance or the HTTP clients.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "AlphaVantageProvider": "src.data.alpha_vantage",
+    "FinnhubProvider": "src.data.finnhub",
+    "FixtureDataProvider": "src.data.fixture",
+    "YahooFinanceProvider": "src.data.yahoo_finance",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
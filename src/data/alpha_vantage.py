@@ -7,9 +7,12 @@ from typing import Optional
 
 import requests
 
+from src.data.http_client import HTTPClient, get_shared_http_client
 from src.data.models import Market, NewsArticle, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
+from src.utils.errors import RateLimitException
 from src.utils.logging import get_logger
+from src.utils.resilience import AdaptiveRateLimiter, get_provider_rate_limiter, parse_retry_after
 
 logger = get_logger(__name__)
 
@@ -18,6 +21,10 @@ ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
 DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 2.0
 DEFAULT_TIMEOUT = 30
+# Longest Retry-After honored by waiting; longer ones fail fast so callers can fall back
+MAX_THROTTLE_WAIT = 60.0
+# Back-off reported when the daily request quota is exhausted
+QUOTA_EXHAUSTED_BACKOFF = 3600.0
 
 
 class AlphaVantageProvider(DataProvider):
@@ -37,6 +44,7 @@ class AlphaVantageProvider(DataProvider):
         max_retries: int = DEFAULT_RETRIES,
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         timeout: int = DEFAULT_TIMEOUT,
+        http_client: Optional[HTTPClient] = None,
     ):
         """Initialize Alpha Vantage provider.
 
@@ -45,12 +53,14 @@ class AlphaVantageProvider(DataProvider):
             max_retries: Maximum number of retry attempts
             backoff_factor: Exponential backoff factor for retries
             timeout: Request timeout in seconds
+            http_client: Pooled HTTP client (default: process-wide shared client)
         """
         super().__init__("alpha_vantage")
         self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.timeout = timeout
+        self.http = http_client or get_shared_http_client()
         self.is_available = bool(self.api_key)
 
         if self.is_available:
@@ -88,7 +98,12 @@ class AlphaVantageProvider(DataProvider):
         )
 
     def _api_call(self, params: dict) -> dict:
-        """Make API call with retry logic and exponential backoff.
+        """Make API call within the shared rate limit, with retries.
+
+        Calls wait on the process-wide Alpha Vantage rate limiter. Throttled responses
+        (HTTP 429 or a call-frequency note) reduce the limiter's rate and pause it for
+        the server's Retry-After before retrying; timeouts and connection errors pause
+        it with exponential backoff.
 
         Args:
             params: Query parameters
@@ -97,52 +112,112 @@ class AlphaVantageProvider(DataProvider):
             API response as dictionary
 
         Raises:
+            RateLimitException: If still throttled after retries, or the daily quota is used
             RuntimeError: If all retries fail
         """
         params["apikey"] = self.api_key
+        limiter = get_provider_rate_limiter(self.name)
 
         for attempt in range(self.max_retries):
+            if limiter:
+                limiter.wait_if_needed()
+            last_attempt = attempt == self.max_retries - 1
+
             try:
                 logger.debug(f"API call (attempt {attempt + 1}/{self.max_retries})")
 
-                response = requests.get(
+                response = self.http.get(
                     ALPHA_VANTAGE_BASE_URL,
                     params=params,
                     timeout=self.timeout,
                 )
+
+                if response.status_code == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    self._throttled(limiter, retry_after, last_attempt)
+                    continue
+
                 response.raise_for_status()
 
                 data = response.json()
 
-                # Check for rate limit messages
+                # Check for rate limit messages (returned with HTTP 200)
                 if "Note" in data and "call frequency" in data["Note"].lower():
-                    raise RuntimeError("Alpha Vantage API rate limit exceeded")
+                    self._throttled(limiter, None, last_attempt)
+                    continue
+                if "Information" in data and "rate limit" in data["Information"].lower():
+                    # Daily quota exhausted: retrying now cannot succeed
+                    raise RateLimitException(
+                        "Alpha Vantage API daily rate limit exceeded",
+                        provider=self.name,
+                        context={"retry_after": QUOTA_EXHAUSTED_BACKOFF},
+                    )
 
+                if limiter:
+                    limiter.record_success()
                 return data
 
             except requests.exceptions.Timeout:
                 logger.warning(f"Request timeout on attempt {attempt + 1}")
-                if attempt < self.max_retries - 1:
-                    wait_time = self.backoff_factor**attempt
-                    logger.debug(f"Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
+                if last_attempt:
                     raise RuntimeError("API call failed after retries (timeout)") from None
+                self._backoff(limiter, attempt)
 
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Request error on attempt {attempt + 1}: {e}")
-                if attempt < self.max_retries - 1:
-                    wait_time = self.backoff_factor**attempt
-                    logger.debug(f"Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
+                if last_attempt:
                     raise RuntimeError(f"API call failed after retries: {e}") from e
+                self._backoff(limiter, attempt)
+
+    def _throttled(
+        self,
+        limiter: AdaptiveRateLimiter | None,
+        retry_after: float | None,
+        last_attempt: bool,
+    ) -> None:
+        """Handle a throttled response.
+
+        Args:
+            limiter: Shared rate limiter (None if the provider has no budget)
+            retry_after: Server-requested wait in seconds, if given
+            last_attempt: Whether retries are exhausted
+
+        Raises:
+            RateLimitException: If retries are exhausted or the requested wait is too long
+        """
+        logger.warning(f"Alpha Vantage throttled request (Retry-After: {retry_after})")
+        if limiter:
+            limiter.record_throttle(retry_after)
+        if last_attempt or (retry_after or 0) > MAX_THROTTLE_WAIT:
+            raise RateLimitException(
+                "Alpha Vantage API rate limit exceeded",
+                provider=self.name,
+                context={"retry_after": retry_after},
+            )
+        if not limiter:
+            time.sleep(retry_after or self.backoff_factor)
+
+    def _backoff(self, limiter: AdaptiveRateLimiter | None, attempt: int) -> None:
+        """Back off before retrying a failed request.
+
+        Args:
+            limiter: Shared rate limiter (None if the provider has no budget)
+            attempt: Zero-based attempt number
+        """
+        wait_time = self.backoff_factor**attempt
+        logger.debug(f"Retrying in {wait_time}s...")
+        if limiter:
+            # The next wait_if_needed() sleeps; other callers back off too
+            limiter.pause(wait_time)
+        else:
+            time.sleep(wait_time)
 
     def get_news(
         self,
         ticker: str,
         limit: int = 50,
         as_of_date: datetime | None = None,
+        since: datetime | None = None,
     ) -> list[NewsArticle]:
         """Fetch news articles with sentiment analysis from Alpha Vantage.
 
@@ -159,6 +234,7 @@ class AlphaVantageProvider(DataProvider):
             ticker: Stock ticker symbol
             limit: Maximum number of articles to return (default: 50)
             as_of_date: Optional date for historical news (only fetch news before this date)
+            since: Optional date to fetch only articles published after it
 
         Returns:
             List of NewsArticle objects with sentiment data, sorted by date descending
@@ -166,6 +242,7 @@ class AlphaVantageProvider(DataProvider):
         Raises:
             ValueError: If API key is not configured
             RuntimeError: If API call fails
+            RateLimitException: If Alpha Vantage keeps throttling requests
         """
         if not self.api_key:
             raise ValueError("Alpha Vantage API key is not configured")
@@ -201,6 +278,14 @@ class AlphaVantageProvider(DataProvider):
                 params["time_to"] = time_to
                 logger.debug(f"Filtering news from {time_from_date.date()} to {as_of_date.date()}")
 
+            # Incremental fetch: only articles newer than the last one already stored
+            if since:
+                params["time_from"] = max(
+                    params.get("time_from", ""), since.strftime("%Y%m%dT%H%M")
+                )
+                if as_of_date is None:
+                    params["time_to"] = datetime.now().strftime("%Y%m%dT2359")
+
             logger.debug(f"Alpha Vantage NEWS_SENTIMENT params: {params}")
             data = self._api_call(params)
 
@@ -243,6 +328,9 @@ class AlphaVantageProvider(DataProvider):
                         )
                         continue
 
+                    if since and published_date <= since:
+                        continue
+
                     # Extract ticker-specific sentiment
                     ticker_sentiment_score = None
                     ticker_sentiment_label = None
@@ -301,7 +389,7 @@ class AlphaVantageProvider(DataProvider):
             logger.debug(f"Retrieved {len(articles)} news articles with sentiment for {ticker}")
             return articles
 
-        except ValueError:
+        except (ValueError, RateLimitException):
             raise
         except Exception as e:
             logger.error(f"Error fetching news for {ticker}: {e}")
@@ -324,6 +412,7 @@ class AlphaVantageProvider(DataProvider):
         Raises:
             ValueError: If API key is not configured
             RuntimeError: If API call fails
+            RateLimitException: If Alpha Vantage keeps throttling requests
         """
         if not self.api_key:
             raise ValueError("Alpha Vantage API key is not configured")
@@ -403,7 +492,7 @@ class AlphaVantageProvider(DataProvider):
                 "percent_institutions": self._safe_float(data.get("PercentInstitutions")),
             }
 
-        except ValueError:
+        except (ValueError, RateLimitException):
             raise
         except Exception as e:
             logger.error(f"Error fetching company info for {ticker}: {e}")
@@ -434,6 +523,7 @@ class AlphaVantageProvider(DataProvider):
         Raises:
             ValueError: If API key is not configured
             RuntimeError: If API call fails
+            RateLimitException: If Alpha Vantage keeps throttling requests
         """
         if not self.api_key:
             raise ValueError("Alpha Vantage API key is not configured")
@@ -517,7 +607,7 @@ class AlphaVantageProvider(DataProvider):
             logger.debug(f"Retrieved earnings estimates for {ticker}")
             return result
 
-        except ValueError:
+        except (ValueError, RateLimitException):
             raise
         except Exception as e:
             logger.error(f"Error fetching earnings estimates for {ticker}: {e}")
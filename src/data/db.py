@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Generator
 
 from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -15,6 +16,17 @@ from sqlmodel import Session, SQLModel, create_engine
 _initialized_databases = set()
 
 
+def _enable_wal_mode(dbapi_connection, _connection_record) -> None:
+    """Switch SQLite connections to write-ahead logging.
+
+    WAL lets streaming readers (the repositories' iter_* methods) keep a cursor open
+    while other sessions write, instead of failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manages database connections and initialization."""
 
@@ -45,6 +57,7 @@ class DatabaseManager:
                 echo=False,  # Set to True for SQL debugging
                 connect_args={"check_same_thread": False},  # Required for SQLite
             )
+            event.listen(self.engine, "connect", _enable_wal_mode)
 
             # Create all tables
             SQLModel.metadata.create_all(self.engine)
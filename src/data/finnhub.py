@@ -1,20 +1,28 @@
 """Finnhub data provider implementation."""
 
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
 import requests
 
+from src.data.http_client import HTTPClient, get_shared_http_client
 from src.data.models import AnalystRating, Market, NewsArticle, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
+from src.utils.errors import RateLimitException
 from src.utils.logging import get_logger
+from src.utils.resilience import get_provider_rate_limiter, parse_retry_after
 
 logger = get_logger(__name__)
 
 # Finnhub API constants
 FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
 DEFAULT_TIMEOUT = 30
+# Retries of a throttled (HTTP 429) request, and the longest Retry-After honored by
+# waiting; longer ones fail fast so callers can fall back
+THROTTLE_RETRIES = 2
+MAX_THROTTLE_WAIT = 60.0
 
 
 class FinnhubProvider(DataProvider):
@@ -29,16 +37,19 @@ class FinnhubProvider(DataProvider):
         self,
         api_key: Optional[str] = None,
         timeout: int = DEFAULT_TIMEOUT,
+        http_client: Optional[HTTPClient] = None,
     ):
         """Initialize Finnhub provider.
 
         Args:
             api_key: Finnhub API key. If None, uses FINNHUB_API_KEY env var
             timeout: Request timeout in seconds
+            http_client: Pooled HTTP client (default: process-wide shared client)
         """
         super().__init__("finnhub")
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
         self.timeout = timeout
+        self.http = http_client or get_shared_http_client()
         self.is_available = bool(self.api_key)
 
         if self.is_available:
@@ -46,6 +57,50 @@ class FinnhubProvider(DataProvider):
         else:
             logger.warning("Finnhub API key not found. Set FINNHUB_API_KEY env var.")
 
+    def _get(self, path: str, params: dict) -> requests.Response:
+        """GET a Finnhub endpoint within the shared rate limit.
+
+        Calls wait on the process-wide Finnhub rate limiter. Throttled (HTTP 429)
+        responses reduce the limiter's rate and pause it for the server's Retry-After
+        before retrying.
+
+        Args:
+            path: Endpoint path (e.g., '/company-news')
+            params: Query parameters including the API token
+
+        Returns:
+            HTTP response (status not checked, except for throttling)
+
+        Raises:
+            RateLimitException: If still throttled after retries
+        """
+        limiter = get_provider_rate_limiter(self.name)
+
+        for attempt in range(THROTTLE_RETRIES + 1):
+            if limiter:
+                limiter.wait_if_needed()
+
+            response = self.http.get(
+                f"{FINNHUB_BASE_URL}{path}", params=params, timeout=self.timeout
+            )
+            if response.status_code != 429:
+                if limiter:
+                    limiter.record_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning(f"Finnhub throttled request to {path} (Retry-After: {retry_after})")
+            if limiter:
+                limiter.record_throttle(retry_after)
+            if attempt == THROTTLE_RETRIES or (retry_after or 0) > MAX_THROTTLE_WAIT:
+                raise RateLimitException(
+                    "Finnhub API rate limit exceeded",
+                    provider=self.name,
+                    context={"retry_after": retry_after},
+                )
+            if not limiter:
+                time.sleep(retry_after or 1.0)
+
     def get_stock_prices(
         self,
         ticker: str,
@@ -98,6 +153,7 @@ class FinnhubProvider(DataProvider):
         ticker: str,
         limit: int = 50,
         as_of_date: datetime | None = None,
+        since: datetime | None = None,
     ) -> list[NewsArticle]:
         """Fetch news articles from Finnhub.
 
@@ -108,6 +164,7 @@ class FinnhubProvider(DataProvider):
             ticker: Stock ticker symbol
             limit: Maximum number of articles to return (default: 50)
             as_of_date: Optional date for historical news (only fetch news before this date)
+            since: Optional date to fetch only articles published after it
 
         Returns:
             List of NewsArticle objects sorted by date descending
@@ -133,15 +190,18 @@ class FinnhubProvider(DataProvider):
                 to_date = datetime.now()
                 from_date = to_date - timedelta(days=30)
 
-            response = requests.get(
-                f"{FINNHUB_BASE_URL}/company-news",
+            # Incremental fetch: only articles newer than the last one already stored
+            if since:
+                from_date = max(from_date, since)
+
+            response = self._get(
+                "/company-news",
                 params={
                     "symbol": ticker,
                     "from": from_date.strftime("%Y-%m-%d"),
                     "to": to_date.strftime("%Y-%m-%d"),
                     "token": self.api_key,
                 },
-                timeout=self.timeout,
             )
             response.raise_for_status()
 
@@ -166,6 +226,9 @@ class FinnhubProvider(DataProvider):
                         )
                         continue
 
+                    if since and published_date <= since:
+                        continue
+
                     article = NewsArticle(
                         ticker=ticker.upper(),
                         title=item.get("headline", "")[:200],
@@ -206,13 +269,12 @@ class FinnhubProvider(DataProvider):
         try:
             logger.debug(f"Fetching company info for {ticker}")
 
-            response = requests.get(
-                f"{FINNHUB_BASE_URL}/stock/profile2",
+            response = self._get(
+                "/stock/profile2",
                 params={
                     "symbol": ticker,
                     "token": self.api_key,
                 },
-                timeout=self.timeout,
             )
             response.raise_for_status()
 
@@ -259,13 +321,12 @@ class FinnhubProvider(DataProvider):
         try:
             logger.debug(f"Fetching recommendation trends for {ticker} (as_of_date={as_of_date})")
 
-            response = requests.get(
-                f"{FINNHUB_BASE_URL}/stock/recommendation",
+            response = self._get(
+                "/stock/recommendation",
                 params={
                     "symbol": ticker,
                     "token": self.api_key,
                 },
-                timeout=self.timeout,
             )
             response.raise_for_status()
 
@@ -149,6 +149,7 @@ class FixtureDataProvider(DataProvider):
         ticker: str,
         limit: int = 10,
         as_of_date: datetime | None = None,
+        since: datetime | None = None,
     ) -> list[NewsArticle]:
         """Get news articles from fixture data.
 
@@ -156,6 +157,7 @@ class FixtureDataProvider(DataProvider):
             ticker: Stock ticker symbol
             limit: Maximum number of articles
             as_of_date: Optional date for historical news (only fetch news before this date)
+            since: Optional date to fetch only articles published after it
 
         Returns:
             List of NewsArticle objects
@@ -169,6 +171,8 @@ class FixtureDataProvider(DataProvider):
             if article_dict.get("ticker", "").upper() == ticker.upper():
                 try:
                     article = NewsArticle(**article_dict)
+                    if since and article.published_date <= since:
+                        continue
                     articles.append(article)
                 except Exception as e:
                     logger.warning(f"Failed to parse news article: {e}")
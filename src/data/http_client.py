@@ -0,0 +1,146 @@
+"""Pooled HTTP client shared by API-based data providers.
+
+One requests Session per client keeps connections alive between calls, so repeated
+requests to the same host skip the TCP and TLS handshakes. Responses carrying an ETag
+or Last-Modified validator are kept in a small LRU cache and revalidated with
+conditional requests; a 304 Not Modified reply returns the cached response.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Connection pools (one per host) and connections kept alive per host
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = 30
+# Responses kept for conditional revalidation
+DEFAULT_CACHE_SIZE = 256
+
+
+class HTTPClient:
+    """Thread-safe pooled HTTP client with conditional-request caching.
+
+    Compression is negotiated by requests (Accept-Encoding: gzip, deflate). requests
+    speaks HTTP/1.1 only; keep-alive pooling removes the per-call handshake cost that
+    HTTP/2 multiplexing would otherwise address.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize HTTP client.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections per host (callers beyond it wait)
+            timeout: Default request timeout in seconds
+            cache_size: Maximum responses kept for ETag/Last-Modified revalidation
+                (0 disables conditional requests)
+        """
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._cache: OrderedDict[tuple, requests.Response] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send a GET request over the pooled session.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            timeout: Request timeout in seconds (default: client timeout)
+
+        Returns:
+            HTTP response (the cached one if the server answered 304 Not Modified)
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        headers = {}
+        cached = self._cached_response(key)
+        if cached is not None:
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        response = self.session.get(
+            url, params=params, headers=headers, timeout=timeout or self.timeout
+        )
+        not_modified = response.status_code == 304 and cached is not None
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["not_modified"] += not_modified
+
+        if not_modified:
+            logger.debug(f"Not modified, using cached response: {url}")
+            return cached
+
+        if response.ok and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self._store_response(key, response)
+
+        return response
+
+    def close(self) -> None:
+        """Close pooled connections and drop cached responses."""
+        self.session.close()
+        with self._lock:
+            self._cache.clear()
+
+    def _cached_response(self, key: tuple) -> Optional[requests.Response]:
+        """Get a cached response and mark it recently used."""
+        with self._lock:
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+            return response
+
+    def _store_response(self, key: tuple, response: requests.Response) -> None:
+        """Cache a response with validators, evicting the least recently used."""
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+_shared_client: Optional[HTTPClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> HTTPClient:
+    """Get the process-wide HTTP client for providers created without one.
+
+    Returns:
+        Shared HTTPClient
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient()
+        return _shared_client
@@ -0,0 +1,345 @@
+"""Vectorized analytics for the trading journal.
+
+Loads closed trades into columnar NumPy/pandas arrays with a single query and computes
+summary statistics, equity curve, drawdown, rolling win rate, per-ticker and per-month
+breakdowns and holding-period statistics without per-trade Python loops. Results are
+cached per filter together with a cheap watermark of the trading_journal table, so
+repeated calls are free until the next trade write.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlmodel import select
+
+from src.data.db import DatabaseManager
+from src.data.models import Ticker, TradingJournal
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.cache.manager import CacheManager
+
+logger = get_logger(__name__)
+
+# Columns loaded for every closed trade
+TRADE_COLUMNS = [
+    "id",
+    "ticker",
+    "entry_date",
+    "exit_date",
+    "profit_loss",
+    "profit_loss_pct",
+    "fees_entry",
+    "fees_exit",
+]
+
+
+class TradingJournalAnalytics:
+    """Columnar analytics engine for closed trades in the trading journal."""
+
+    def __init__(
+        self,
+        db_path: Path | str = "data/falconsignals.db",
+        cache_manager: "CacheManager | None" = None,
+        rolling_window: int = 20,
+        cache_ttl_hours: int = 24 * 30,
+    ):
+        """Initialize analytics engine.
+
+        Args:
+            db_path: Path to SQLite database file.
+            cache_manager: Optional cache manager to persist results across processes.
+            rolling_window: Number of trades in the rolling win rate window.
+            cache_ttl_hours: TTL for persisted results (they are also checked by watermark).
+        """
+        self.db_manager = DatabaseManager(db_path)
+        self.db_manager.initialize()
+        self.cache_manager = cache_manager
+        self.rolling_window = rolling_window
+        self.cache_ttl_hours = cache_ttl_hours
+        self._memory_cache: dict[str, dict] = {}
+
+    def get_watermark(self) -> str:
+        """Get a watermark that changes whenever a trade is created, updated or closed.
+
+        Returns:
+            Watermark string built from row count, max ID and max updated_at.
+        """
+        session = self.db_manager.get_session()
+        try:
+            count, max_id, max_updated = session.exec(
+                select(
+                    func.count(TradingJournal.id),
+                    func.max(TradingJournal.id),
+                    func.max(TradingJournal.updated_at),
+                )
+            ).one()
+        finally:
+            session.close()
+        return f"{count}:{max_id}:{max_updated}"
+
+    def load_trades(
+        self,
+        ticker_symbol: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> pd.DataFrame:
+        """Load closed trades as a columnar DataFrame in a single query.
+
+        Args:
+            ticker_symbol: Optional filter by ticker symbol.
+            start_date: Optional filter by exit date (inclusive).
+            end_date: Optional filter by exit date (inclusive).
+
+        Returns:
+            DataFrame with TRADE_COLUMNS, sorted by exit date then ID.
+        """
+        query = (
+            select(
+                TradingJournal.id,
+                Ticker.symbol,
+                TradingJournal.entry_date,
+                TradingJournal.exit_date,
+                TradingJournal.profit_loss,
+                TradingJournal.profit_loss_pct,
+                TradingJournal.fees_entry,
+                TradingJournal.fees_exit,
+            )
+            .join(Ticker, TradingJournal.ticker_id == Ticker.id)
+            .where(TradingJournal.status == "closed")
+        )
+        if ticker_symbol:
+            query = query.where(Ticker.symbol == ticker_symbol.upper())
+        if start_date:
+            query = query.where(TradingJournal.exit_date >= start_date)
+        if end_date:
+            query = query.where(TradingJournal.exit_date <= end_date)
+        query = query.order_by(TradingJournal.exit_date, TradingJournal.id)
+
+        session = self.db_manager.get_session()
+        try:
+            rows = session.exec(query).all()
+        finally:
+            session.close()
+
+        frame = pd.DataFrame.from_records(rows, columns=TRADE_COLUMNS)
+        frame["entry_date"] = pd.to_datetime(frame["entry_date"])
+        frame["exit_date"] = pd.to_datetime(frame["exit_date"])
+        for column in ["profit_loss", "profit_loss_pct", "fees_entry", "fees_exit"]:
+            frame[column] = frame[column].astype(float)
+        return frame
+
+    def get_analytics(
+        self,
+        ticker_symbol: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, Any]:
+        """Get journal analytics, served from cache unless trades changed.
+
+        Args:
+            ticker_symbol: Optional filter by ticker symbol.
+            start_date: Optional filter by exit date (inclusive).
+            end_date: Optional filter by exit date (inclusive).
+
+        Returns:
+            Dictionary with 'summary', 'equity_curve', 'by_ticker', 'by_month' and
+            'holding_period' sections (JSON-serializable).
+        """
+        watermark = self.get_watermark()
+        cache_key = (
+            f"journal_analytics:{ticker_symbol or 'all'}:{start_date or ''}:{end_date or ''}:"
+            f"{self.rolling_window}"
+        )
+
+        # The key is stable per filter; the watermark is stored with the result so a
+        # trade write invalidates it in place instead of leaving a stale cache entry
+        cached = self._memory_cache.get(cache_key)
+        if cached is None and self.cache_manager is not None:
+            cached = self.cache_manager.get(cache_key)
+        if cached is not None and cached.get("watermark") == watermark:
+            logger.debug(f"Journal analytics cache hit: {cache_key}")
+            self._memory_cache[cache_key] = cached
+            return cached["analytics"]
+
+        trades = self.load_trades(ticker_symbol, start_date, end_date)
+        result = self.compute(trades)
+
+        entry = {"watermark": watermark, "analytics": result}
+        self._memory_cache[cache_key] = entry
+        if self.cache_manager is not None:
+            self.cache_manager.set(cache_key, entry, ttl_hours=self.cache_ttl_hours)
+        return result
+
+    def compute(self, trades: pd.DataFrame) -> dict[str, Any]:
+        """Compute all analytics from a trade frame.
+
+        Args:
+            trades: DataFrame as returned by load_trades.
+
+        Returns:
+            Analytics dictionary (see get_analytics).
+        """
+        return {
+            "summary": self._summary(trades),
+            "equity_curve": self._equity_curve(trades),
+            "by_ticker": self._breakdown(trades, trades["ticker"]),
+            "by_month": self._breakdown(trades, trades["exit_date"].dt.strftime("%Y-%m")),
+            "holding_period": self._holding_period(trades),
+        }
+
+    def _summary(self, trades: pd.DataFrame) -> dict[str, Any]:
+        """Compute headline statistics.
+
+        Args:
+            trades: Trade frame.
+
+        Returns:
+            Summary dictionary (superset of TradingJournalRepository.get_performance_summary).
+        """
+        if trades.empty:
+            return {
+                "total_trades": 0,
+                "total_profit_loss": 0.0,
+                "win_rate": 0.0,
+                "avg_profit_loss": 0.0,
+                "avg_profit_loss_pct": 0.0,
+                "total_fees": 0.0,
+            }
+
+        pl = trades["profit_loss"].to_numpy()
+        pl = pl[~np.isnan(pl)]
+        pl_pct = trades["profit_loss_pct"].to_numpy()
+        pl_pct = pl_pct[~np.isnan(pl_pct)]
+
+        wins = pl[pl > 0]
+        losses = pl[pl < 0]
+        gross_profit = float(wins.sum())
+        gross_loss = float(losses.sum())
+        win_rate = len(wins) / len(pl) * 100 if len(pl) else 0.0
+        avg_win = float(wins.mean()) if len(wins) else 0.0
+        avg_loss = float(losses.mean()) if len(losses) else 0.0
+        total_fees = float(
+            trades["fees_entry"].fillna(0).to_numpy().sum()
+            + trades["fees_exit"].fillna(0).to_numpy().sum()
+        )
+
+        equity = np.cumsum(pl)
+        drawdown = equity - np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:]
+
+        return {
+            "total_trades": len(trades),
+            "winning_trades": len(wins),
+            "losing_trades": int((pl < 0).sum()),
+            "win_rate": win_rate,
+            "total_profit_loss": float(pl.sum()),
+            "avg_profit_loss": float(pl.mean()) if len(pl) else 0.0,
+            "avg_profit_loss_pct": float(pl_pct.mean()) if len(pl_pct) else 0.0,
+            "best_trade": float(pl.max()) if len(pl) else 0.0,
+            "worst_trade": float(pl.min()) if len(pl) else 0.0,
+            "total_fees": total_fees,
+            "avg_win": avg_win,
+            "avg_loss": avg_loss,
+            "profit_factor": gross_profit / abs(gross_loss) if gross_loss else None,
+            "expectancy": (win_rate / 100) * avg_win + (len(losses) / len(pl)) * avg_loss
+            if len(pl)
+            else 0.0,
+            "max_drawdown": float(drawdown.min()) if len(drawdown) else 0.0,
+        }
+
+    def _equity_curve(self, trades: pd.DataFrame) -> list[dict[str, Any]]:
+        """Compute cumulative P&L, drawdown and rolling win rate per closed trade.
+
+        Args:
+            trades: Trade frame sorted by exit date.
+
+        Returns:
+            List of points in exit order.
+        """
+        if trades.empty:
+            return []
+
+        pl = trades["profit_loss"].fillna(0.0)
+        equity = pl.cumsum()
+        peak = equity.cummax().clip(lower=0.0)
+        rolling_win_rate = (pl > 0).astype(float).rolling(
+            self.rolling_window, min_periods=1
+        ).mean() * 100
+
+        curve = pd.DataFrame(
+            {
+                "trade_id": trades["id"],
+                "ticker": trades["ticker"],
+                "exit_date": trades["exit_date"].dt.strftime("%Y-%m-%d"),
+                "profit_loss": pl,
+                "equity": equity,
+                "drawdown": equity - peak,
+                "rolling_win_rate": rolling_win_rate,
+            }
+        )
+        return curve.to_dict(orient="records")
+
+    def _breakdown(self, trades: pd.DataFrame, keys: pd.Series) -> list[dict[str, Any]]:
+        """Group trades by key and compute per-group statistics.
+
+        Args:
+            trades: Trade frame.
+            keys: Series aligned with trades giving the group key.
+
+        Returns:
+            List of per-group dictionaries sorted by key.
+        """
+        if trades.empty:
+            return []
+
+        frame = pd.DataFrame(
+            {
+                "key": keys,
+                "profit_loss": trades["profit_loss"],
+                "profit_loss_pct": trades["profit_loss_pct"],
+                "win": (trades["profit_loss"] > 0).astype(float),
+                "fees": trades["fees_entry"].fillna(0) + trades["fees_exit"].fillna(0),
+            }
+        )
+        grouped = frame.groupby("key", sort=True).agg(
+            trades=("profit_loss", "size"),
+            total_profit_loss=("profit_loss", "sum"),
+            avg_profit_loss_pct=("profit_loss_pct", "mean"),
+            win_rate=("win", "mean"),
+            total_fees=("fees", "sum"),
+        )
+        grouped["win_rate"] *= 100
+        grouped = grouped.reset_index()
+        grouped["trades"] = grouped["trades"].astype(int)
+        return grouped.to_dict(orient="records")
+
+    def _holding_period(self, trades: pd.DataFrame) -> dict[str, Any]:
+        """Compute holding-period statistics in calendar days.
+
+        Args:
+            trades: Trade frame.
+
+        Returns:
+            Dictionary with overall, winner and loser holding periods.
+        """
+        if trades.empty:
+            return {}
+
+        days = (trades["exit_date"] - trades["entry_date"]).dt.days.to_numpy(dtype=float)
+        pl = trades["profit_loss"].to_numpy()
+
+        def _mean(mask: np.ndarray) -> float | None:
+            return float(days[mask].mean()) if mask.any() else None
+
+        return {
+            "avg_days": float(days.mean()),
+            "median_days": float(np.median(days)),
+            "min_days": int(days.min()),
+            "max_days": int(days.max()),
+            "avg_days_winners": _mean(pl > 0),
+            "avg_days_losers": _mean(pl < 0),
+        }
@@ -4,6 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field as SQLField
 from sqlmodel import Relationship, SQLModel
 
@@ -256,7 +257,7 @@ class RunSession(SQLModel, table=True):
     )
 
     # Run context
-    analysis_mode: str = SQLField(description="Analysis mode: 'rule_based' or 'llm'")
+    analysis_mode: str = SQLField(description="Analysis mode: 'rule_based', 'llm' or 'backtest'")
     analyzed_category: str | None = SQLField(
         default=None, description="Category analyzed (e.g., 'us_tech_software')"
     )
@@ -296,6 +297,35 @@ class RunSession(SQLModel, table=True):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RunProfile(SQLModel, table=True):
+    """Timing profile of an analysis run.
+
+    Stored alongside its RunSession (one-to-one) so that existing run_sessions tables
+    do not need a schema migration.
+    """
+
+    __tablename__ = "run_profiles"
+
+    id: int | None = SQLField(default=None, primary_key=True)
+    run_session_id: int = SQLField(
+        foreign_key="run_sessions.id",
+        unique=True,
+        index=True,
+        description="Foreign key to run session",
+    )
+    total_seconds: float = SQLField(description="Wall-clock duration of the profiled run")
+    cache_hit_rate: float | None = SQLField(
+        default=None, description="Share of cache lookups served from cache (0-1)"
+    )
+    provider_calls: int = SQLField(default=0, description="Total external provider calls")
+    profile_json: str = SQLField(
+        description="JSON summary: per-phase and per-ticker timings, counters"
+    )
+    created_at: datetime = SQLField(
+        default_factory=datetime.now, description="Record creation timestamp"
+    )
+
+
 class Recommendation(SQLModel, table=True):
     """Investment recommendation/signal stored in database.
 
@@ -315,7 +345,7 @@ class Recommendation(SQLModel, table=True):
 
     # Analysis metadata
     analysis_date: date = SQLField(index=True, description="Date when analysis was performed")
-    analysis_mode: str = SQLField(description="Analysis mode: 'rule_based' or 'llm'")
+    analysis_mode: str = SQLField(description="Analysis mode: 'rule_based', 'llm' or 'backtest'")
     llm_model: str | None = SQLField(default=None, description="LLM model name if applicable")
 
     # Recommendation details
@@ -423,6 +453,94 @@ class PriceTracking(SQLModel, table=True):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PerformanceDaily(SQLModel, table=True):
+    """Denormalized daily performance per recommendation.
+
+    Materialized from PriceTracking writes so that date-range scans and charts do not
+    need to join recommendations and tickers. One row per recommendation per tracking date.
+    """
+
+    __tablename__ = "performance_daily"
+    __table_args__ = (
+        UniqueConstraint("recommendation_id", "tracking_date", name="uq_performance_daily"),
+        Index("ix_performance_daily_cohort", "analysis_date", "signal_type", "analysis_mode"),
+    )
+
+    id: int | None = SQLField(default=None, primary_key=True)
+    recommendation_id: int = SQLField(
+        foreign_key="recommendations.id", index=True, description="Foreign key to recommendation"
+    )
+    ticker_id: int = SQLField(
+        foreign_key="tickers.id", index=True, description="Foreign key to ticker"
+    )
+    tracking_date: date = SQLField(index=True, description="Date when price was tracked")
+    analysis_date: date = SQLField(description="Date of the recommendation (cohort key)")
+    signal_type: str = SQLField(description="Signal type of the recommendation")
+    analysis_mode: str = SQLField(description="Analysis mode of the recommendation")
+    confidence: float = SQLField(description="Recommendation confidence (0-100)")
+    days_since_recommendation: int = SQLField(
+        description="Number of days since recommendation was made"
+    )
+
+    return_pct: float | None = SQLField(
+        default=None, description="Price change % vs recommendation price"
+    )
+    benchmark_return_pct: float | None = SQLField(
+        default=None, description="Benchmark change % since recommendation"
+    )
+    alpha: float | None = SQLField(default=None, description="return_pct - benchmark_return_pct")
+
+    updated_at: datetime = SQLField(
+        default_factory=datetime.now, description="When row was last refreshed"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PerformanceCohortDaily(SQLModel, table=True):
+    """Daily performance rollup per recommendation cohort.
+
+    A cohort is every recommendation sharing analysis_date, signal_type and analysis_mode.
+    Stores additive sums rather than averages so cohorts can be combined exactly for any
+    date range or filter. Refreshed whenever a PerformanceDaily row in the cohort changes.
+    """
+
+    __tablename__ = "performance_cohort_daily"
+    __table_args__ = (
+        UniqueConstraint(
+            "tracking_date",
+            "analysis_date",
+            "signal_type",
+            "analysis_mode",
+            name="uq_performance_cohort_daily",
+        ),
+        Index(
+            "ix_performance_cohort_daily_cohort", "analysis_date", "signal_type", "analysis_mode"
+        ),
+    )
+
+    id: int | None = SQLField(default=None, primary_key=True)
+    tracking_date: date = SQLField(index=True, description="Date when prices were tracked")
+    analysis_date: date = SQLField(description="Recommendation date of the cohort")
+    signal_type: str = SQLField(description="Signal type of the cohort")
+    analysis_mode: str = SQLField(description="Analysis mode of the cohort")
+
+    count: int = SQLField(default=0, description="Recommendations with a return on this date")
+    sum_return: float = SQLField(default=0.0, description="Sum of return_pct")
+    sum_return_sq: float = SQLField(default=0.0, description="Sum of squared return_pct")
+    min_return: float | None = SQLField(default=None, description="Worst return_pct")
+    win_count: int = SQLField(default=0, description="Recommendations with positive return")
+    alpha_count: int = SQLField(default=0, description="Recommendations with an alpha value")
+    sum_alpha: float = SQLField(default=0.0, description="Sum of alpha")
+    sum_confidence: float = SQLField(default=0.0, description="Sum of confidence")
+
+    updated_at: datetime = SQLField(
+        default_factory=datetime.now, description="When rollup was last refreshed"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class PerformanceSummary(SQLModel, table=True):
     """Aggregated performance metrics.
 
@@ -618,3 +736,97 @@ class TradingJournal(SQLModel, table=True):
     ticker_obj: Ticker = Relationship()
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ArticleSentiment(SQLModel, table=True):
+    """Cached local model sentiment score for a news text.
+
+    Keyed by a hash of (model name, normalized text) so the same headline is only scored
+    once across runs, backtest dates and tickers that share an article.
+    """
+
+    __tablename__ = "article_sentiment"
+
+    text_hash: str = SQLField(
+        primary_key=True, description="SHA-256 of model name and normalized article text"
+    )
+    model_name: str = SQLField(index=True, description="Model that produced the score")
+    sentiment: str = SQLField(description="Sentiment label: 'positive', 'negative', 'neutral'")
+    score: float = SQLField(description="Model confidence for the label (0.0 to 1.0)")
+    created_at: datetime = SQLField(
+        default_factory=datetime.now, description="When the text was scored"
+    )
+
+
+class StoredNewsArticle(SQLModel, table=True):
+    """News article persisted for incremental fetching and point-in-time queries.
+
+    Keyed by a hash of the article URL (or title and publication time if the provider
+    gives no URL). Tickers an article mentions are linked via NewsArticleTicker.
+    """
+
+    __tablename__ = "news_articles"
+
+    article_id: str = SQLField(primary_key=True, description="SHA-256 of article URL")
+    url: str = SQLField(description="Article URL")
+    title: str = SQLField(description="Article title")
+    summary: str | None = SQLField(default=None, description="Article summary")
+    source: str = SQLField(description="News source name")
+    published_date: datetime = SQLField(index=True, description="Publication date")
+    sentiment: str | None = SQLField(default=None, description="Provider sentiment label")
+    sentiment_score: float | None = SQLField(default=None, description="Provider sentiment score")
+    importance: int | None = SQLField(default=None, description="Importance score 0-100")
+    fetched_at: datetime = SQLField(
+        default_factory=datetime.now, description="When the article was first stored"
+    )
+
+
+class NewsArticleTicker(SQLModel, table=True):
+    """Link between a stored news article and a ticker it was fetched for.
+
+    Holds a copy of the publication date so per-ticker date range queries are served by
+    a single index.
+    """
+
+    __tablename__ = "news_article_tickers"
+    __table_args__ = (
+        Index("ix_news_article_tickers_ticker_published", "ticker", "published_date"),
+    )
+
+    article_id: str = SQLField(
+        foreign_key="news_articles.article_id", primary_key=True, description="Article hash"
+    )
+    ticker: str = SQLField(primary_key=True, description="Ticker symbol")
+    published_date: datetime = SQLField(description="Publication date (copy of article's)")
+
+
+class NewsFetchState(SQLModel, table=True):
+    """News fetch watermark per ticker.
+
+    The article store holds every fetched article for a ticker published between
+    covered_from and last_fetched_at, so later requests only fetch articles newer than
+    the watermark and historical requests inside the window need no provider call.
+    """
+
+    __tablename__ = "news_fetch_state"
+
+    ticker: str = SQLField(primary_key=True, description="Ticker symbol")
+    covered_from: datetime = SQLField(description="Start of the continuously fetched window")
+    last_fetched_at: datetime = SQLField(description="When news was last fetched")
+    watermark: datetime | None = SQLField(
+        default=None, description="Publication date of the newest stored article"
+    )
+
+
+class NewsSourceWatermark(SQLModel, table=True):
+    """Newest article publication date fetched from one news source for a ticker.
+
+    Each source is only asked for articles after its own watermark, so a source that
+    failed, timed out or was skipped is not moved past articles it never returned.
+    """
+
+    __tablename__ = "news_source_watermarks"
+
+    ticker: str = SQLField(primary_key=True, description="Ticker symbol")
+    source: str = SQLField(primary_key=True, description="News provider name")
+    watermark: datetime = SQLField(description="Publication date of the newest fetched article")
@@ -1,18 +1,29 @@
 """Unified news collection with source prioritization and deduplication.
 
 Provides a single source of truth for news data per ticker with configurable
-source prioritization and article count targets.
+source prioritization and article count targets. With an article store, fetched
+articles are persisted and later requests ask each source only for articles newer than
+that source's watermark for the ticker.
 """
 
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from src.data.models import NewsArticle
+from src.data.news_dedup import NearDuplicateIndex, normalize_title
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.logging import get_logger
+from src.utils.profiling import record_provider_call
 
 logger = get_logger(__name__)
 
+# Incremental fetches re-request this much before each source's watermark, so articles
+# a provider publishes late (dated before the watermark) are still picked up; the
+# article store drops the re-fetched duplicates
+WATERMARK_OVERLAP = timedelta(hours=6)
+
 
 class NewsSourceConfig:
     """Configuration for a news source."""
@@ -23,6 +34,7 @@ class NewsSourceConfig:
         priority: int = 1,
         enabled: bool = True,
         max_articles: int = 50,
+        timeout_seconds: float = 20.0,
     ):
         """Initialize news source config.
 
@@ -31,11 +43,13 @@ class NewsSourceConfig:
             priority: Priority order (lower = higher priority)
             enabled: Whether this source is enabled
             max_articles: Maximum articles to fetch from this source
+            timeout_seconds: Deadline for this source in concurrent mode
         """
         self.name = name
         self.priority = priority
         self.enabled = enabled
         self.max_articles = max_articles
+        self.timeout_seconds = timeout_seconds
 
 
 class UnifiedNewsAggregator:
@@ -51,6 +65,10 @@ class UnifiedNewsAggregator:
         target_article_count: int = 50,
         max_age_days: int = 7,
         cache_manager=None,
+        concurrent: bool = False,
+        stop_at_target: bool = False,
+        near_duplicate_threshold: float = 0.6,
+        article_store=None,
     ):
         """Initialize news aggregator.
 
@@ -59,10 +77,22 @@ class UnifiedNewsAggregator:
             target_article_count: Target number of articles to fetch
             max_age_days: Maximum age of articles to include
             cache_manager: Optional cache manager for storing aggregated news
+            concurrent: If True, query all sources in parallel (each with its own deadline)
+                instead of one after another
+            stop_at_target: In concurrent mode, stop waiting for slower sources once the
+                sources that already answered reach the target article count
+            near_duplicate_threshold: Minimum Jaccard similarity of title/summary shingles
+                for two articles to count as the same story (1.0 = exact matches only)
+            article_store: Optional NewsArticleRepository. Fetched articles are stored and
+                later requests fetch only articles newer than each source's watermark
         """
         self.target_article_count = target_article_count
         self.max_age_days = max_age_days
         self.cache_manager = cache_manager
+        self.concurrent = concurrent
+        self.stop_at_target = stop_at_target
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.article_store = article_store
 
         # Default sources if not provided
         if sources is None:
@@ -98,8 +128,9 @@ class UnifiedNewsAggregator:
     ) -> list[NewsArticle]:
         """Fetch news articles from all enabled sources.
 
-        Fetches from sources in priority order until target article count is reached.
-        Deduplicates articles by URL and title similarity.
+        Fetches from sources in priority order until target article count is reached,
+        or from all sources in parallel in concurrent mode. Deduplicates articles by URL
+        and title similarity.
 
         Args:
             ticker: Stock ticker symbol
@@ -112,6 +143,7 @@ class UnifiedNewsAggregator:
         if lookback_days is None:
             lookback_days = self.max_age_days
 
+        historical = as_of_date is not None
         if as_of_date is None:
             as_of_date = datetime.now()
 
@@ -123,15 +155,180 @@ class UnifiedNewsAggregator:
                 logger.debug(f"Cache hit for news: {ticker}")
                 return [NewsArticle(**a) for a in cached.get("articles", [])]
 
-        # Fetch from sources in priority order
-        all_articles: list[NewsArticle] = []
-        sources_used = []
+        if self.article_store is not None:
+            all_articles, sources_used = self._fetch_with_store(
+                ticker, lookback_days, as_of_date, historical
+            )
+        else:
+            all_articles, sources_used = self._flatten(
+                self._fetch(ticker, lookback_days, as_of_date)
+            )
 
-        for source in self.sources:
-            if not source.enabled or source.name not in self._providers:
-                continue
+        # Deduplicate (articles are in source priority order, so the first copy of a
+        # duplicate comes from the higher-priority source)
+        unique_articles = self._deduplicate(all_articles)
+
+        if self.concurrent:
+            # All sources were queried, so trim in priority order (newest first within
+            # each source) before sorting the kept articles by date
+            unique_articles = unique_articles[: self.target_article_count]
+
+        # Sort by date (newest first)
+        unique_articles.sort(
+            key=lambda a: self._parse_date(a.published_date),
+            reverse=True,
+        )
+
+        # Trim to target count
+        result = unique_articles[: self.target_article_count]
+
+        # Cache the results
+        if self.cache_manager and result:
+            self._cache_articles(ticker, result, sources_used, as_of_date)
+
+        logger.debug(
+            f"Aggregated {len(result)} unique articles for {ticker} from sources: {sources_used}"
+        )
+
+        return result
+
+    def _fetch(
+        self,
+        ticker: str,
+        lookback_days: int,
+        as_of_date: datetime,
+        since: Optional[dict[str, datetime]] = None,
+    ) -> dict[str, list[NewsArticle]]:
+        """Fetch from the providers sequentially or concurrently, depending on the mode.
+
+        Args:
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to look back
+            as_of_date: Reference date
+            since: Source name -> only fetch articles published after this date
+
+        Returns:
+            Source name -> articles, in priority order, for sources that returned articles
+        """
+        if self.concurrent:
+            return self._fetch_concurrently(ticker, lookback_days, as_of_date, since)
+        return self._fetch_sequentially(ticker, lookback_days, as_of_date, since)
+
+    @staticmethod
+    def _flatten(
+        results: dict[str, list[NewsArticle]],
+    ) -> tuple[list[NewsArticle], list[str]]:
+        """Combine per-source results.
+
+        Args:
+            results: Source name -> articles, in priority order
+
+        Returns:
+            Tuple of (articles in priority order, names of sources that returned articles)
+        """
+        return [a for articles in results.values() for a in articles], list(results)
+
+    def _fetch_with_store(
+        self,
+        ticker: str,
+        lookback_days: int,
+        as_of_date: datetime,
+        historical: bool,
+    ) -> tuple[list[NewsArticle], list[str]]:
+        """Fetch articles using the article store.
+
+        Live requests ask each source only for articles newer than its watermark (less
+        WATERMARK_OVERLAP) once the store covers the lookback window, then read the
+        window from the store. Only sources that returned articles advance their
+        watermark, so a failed, timed out or skipped source is asked again next time. Historical
+        requests inside the covered window are served from the store without provider
+        calls; other historical requests are fetched as usual and their articles stored.
+        Only live requests move the fetch state, so it always describes one continuous
+        window ending at the last live fetch.
+
+        Args:
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to look back
+            as_of_date: Reference date
+            historical: Whether as_of_date was given (backtesting) rather than now
+
+        Returns:
+            Tuple of (articles, names of sources that returned articles)
+        """
+        cutoff_date = as_of_date - timedelta(days=lookback_days)
+        state = self.article_store.get_fetch_state(ticker)
+        covered = state is not None and state["covered_from"] <= cutoff_date
+
+        if historical:
+            if covered and state["last_fetched_at"] >= as_of_date:
+                logger.debug(f"Serving news for {ticker} as of {as_of_date} from article store")
+                stored = self.article_store.get_articles(ticker, cutoff_date, as_of_date)
+                return stored, ["article_store"] if stored else []
+
+            all_articles, sources_used = self._flatten(
+                self._fetch(ticker, lookback_days, as_of_date)
+            )
+            self.article_store.store_articles(ticker, all_articles)
+            return all_articles, sources_used
+
+        since = None
+        if covered:
+            since = {
+                source: watermark - WATERMARK_OVERLAP
+                for source, watermark in self.article_store.get_source_watermarks(ticker).items()
+            }
+        fetched_at = datetime.now()
+        results = self._fetch(ticker, lookback_days, as_of_date, since)
+        all_articles, sources_used = self._flatten(results)
+        if since is not None:
+            logger.debug(f"Fetched {len(all_articles)} new articles for {ticker} since {since}")
+
+        if sources_used:
+            self.article_store.store_articles(ticker, all_articles)
+            newest = {
+                source: max(self._parse_date(a.published_date) for a in articles)
+                for source, articles in results.items()
+            }
+            self.article_store.update_source_watermarks(ticker, newest)
+            watermark = max(
+                [*newest.values()]
+                + ([state["watermark"]] if covered and state["watermark"] else [])
+            )
+            self.article_store.update_fetch_state(
+                ticker,
+                covered_from=state["covered_from"] if covered else cutoff_date,
+                last_fetched_at=fetched_at,
+                watermark=watermark,
+            )
+        elif not covered:
+            return all_articles, sources_used
+
+        stored = self.article_store.get_articles(ticker, cutoff_date, as_of_date)
+        return stored or all_articles, sources_used or ["article_store"]
+
+    def _fetch_sequentially(
+        self,
+        ticker: str,
+        lookback_days: int,
+        as_of_date: datetime,
+        since: Optional[dict[str, datetime]] = None,
+    ) -> dict[str, list[NewsArticle]]:
+        """Fetch from sources in priority order until the target article count is reached.
 
-            if len(all_articles) >= self.target_article_count:
+        Args:
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to look back
+            as_of_date: Reference date
+            since: Source name -> only fetch articles published after this date
+
+        Returns:
+            Source name -> articles, in priority order, for sources that returned articles
+        """
+        results: dict[str, list[NewsArticle]] = {}
+        count = 0
+
+        for source in self._active_sources():
+            if count >= self.target_article_count:
                 logger.debug(
                     f"Reached target article count ({self.target_article_count}), "
                     f"skipping remaining sources"
@@ -139,53 +336,161 @@ class UnifiedNewsAggregator:
                 break
 
             try:
-                provider = self._providers[source.name]
-                remaining_needed = self.target_article_count - len(all_articles)
+                remaining_needed = self.target_article_count - count
                 limit = min(source.max_articles, remaining_needed + 20)  # Fetch extra for dedup
 
-                articles = provider.get_news(
-                    ticker,
-                    limit=limit,
-                    as_of_date=as_of_date,
+                filtered = self._fetch_from_source(
+                    source, ticker, limit, lookback_days, as_of_date, (since or {}).get(source.name)
                 )
-
-                if articles:
-                    # Filter by date range
-                    cutoff_date = as_of_date - timedelta(days=lookback_days)
-                    filtered = [
-                        a for a in articles if self._parse_date(a.published_date) >= cutoff_date
-                    ]
-
-                    all_articles.extend(filtered)
-                    sources_used.append(source.name)
-                    logger.debug(
-                        f"Fetched {len(filtered)} articles from {source.name} for {ticker}"
-                    )
+                if filtered:
+                    results[source.name] = filtered
+                    count += len(filtered)
 
             except Exception as e:
                 logger.warning(f"Error fetching news from {source.name} for {ticker}: {e}")
 
-        # Deduplicate
-        unique_articles = self._deduplicate(all_articles)
+        return results
 
-        # Sort by date (newest first)
-        unique_articles.sort(
-            key=lambda a: self._parse_date(a.published_date),
-            reverse=True,
-        )
+    def _fetch_concurrently(
+        self,
+        ticker: str,
+        lookback_days: int,
+        as_of_date: datetime,
+        since: Optional[dict[str, datetime]] = None,
+    ) -> dict[str, list[NewsArticle]]:
+        """Fetch from all sources in parallel, each bounded by its own deadline.
 
-        # Trim to target count
-        result = unique_articles[: self.target_article_count]
+        With stop_at_target, remaining sources are abandoned as soon as the sources that
+        already answered provide enough unique articles.
 
-        # Cache the results
-        if self.cache_manager and result:
-            self._cache_articles(ticker, result, sources_used, as_of_date)
+        Args:
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to look back
+            as_of_date: Reference date
+            since: Source name -> only fetch articles published after this date
 
-        logger.debug(
-            f"Aggregated {len(result)} unique articles for {ticker} from sources: {sources_used}"
+        Returns:
+            Source name -> articles, in priority order, for sources that returned articles
+        """
+        sources = self._active_sources()
+        if not sources:
+            return {}
+
+        limit = self.target_article_count + 20  # Fetch extra for dedup
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="news")
+        start = time.monotonic()
+        futures: dict[Future, NewsSourceConfig] = {
+            executor.submit(
+                self._fetch_from_source,
+                source,
+                ticker,
+                min(source.max_articles, limit),
+                lookback_days,
+                as_of_date,
+                (since or {}).get(source.name),
+            ): source
+            for source in sources
+        }
+        deadlines = {future: start + source.timeout_seconds for future, source in futures.items()}
+        results: dict[str, list[NewsArticle]] = {}
+        pending = set(futures)
+
+        try:
+            while pending:
+                now = time.monotonic()
+                for future in [f for f in pending if deadlines[f] <= now]:
+                    logger.warning(
+                        f"News source {futures[future].name} timed out for {ticker} "
+                        f"after {futures[future].timeout_seconds}s"
+                    )
+                    future.cancel()
+                    pending.discard(future)
+                if not pending:
+                    break
+
+                done, pending = wait(
+                    pending,
+                    timeout=min(deadlines[f] for f in pending) - now,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    source = futures[future]
+                    try:
+                        results[source.name] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Error fetching news from {source.name} for {ticker}: {e}")
+
+                if self.stop_at_target and pending:
+                    answered = [a for s in sources for a in results.get(s.name, [])]
+                    if len(self._deduplicate(answered)) >= self.target_article_count:
+                        logger.debug(
+                            f"Reached target article count ({self.target_article_count}) "
+                            f"for {ticker}, cancelling {len(pending)} slower sources"
+                        )
+                        for future in pending:
+                            future.cancel()
+                        break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        ordered: dict[str, list[NewsArticle]] = {}
+        for source in sources:
+            articles = results.get(source.name)
+            if articles:
+                articles.sort(key=lambda a: self._parse_date(a.published_date), reverse=True)
+                ordered[source.name] = articles
+
+        return ordered
+
+    def _active_sources(self) -> list[NewsSourceConfig]:
+        """Get enabled sources with an initialized provider, in priority order.
+
+        Returns:
+            List of source configurations
+        """
+        return [s for s in self.sources if s.enabled and s.name in self._providers]
+
+    def _fetch_from_source(
+        self,
+        source: NewsSourceConfig,
+        ticker: str,
+        limit: int,
+        lookback_days: int,
+        as_of_date: datetime,
+        since: Optional[datetime] = None,
+    ) -> list[NewsArticle]:
+        """Fetch articles from one source, filtered to the lookback window.
+
+        Args:
+            source: Source configuration
+            ticker: Stock ticker symbol
+            limit: Maximum articles to request
+            lookback_days: Number of days to look back
+            as_of_date: Reference date
+            since: Only fetch articles published after this date
+
+        Returns:
+            List of articles published within the lookback window (and after since)
+        """
+        record_provider_call(source.name)
+        # Only pass since when set, so providers without incremental support still work
+        extra = {"since": since} if since is not None else {}
+        articles = self._providers[source.name].get_news(
+            ticker,
+            limit=limit,
+            as_of_date=as_of_date,
+            **extra,
         )
+        if not articles:
+            return []
 
-        return result
+        # Filter by date range
+        cutoff_date = as_of_date - timedelta(days=lookback_days)
+        if since is not None:
+            cutoff_date = max(cutoff_date, since)
+        filtered = [a for a in articles if self._parse_date(a.published_date) >= cutoff_date]
+        logger.debug(f"Fetched {len(filtered)} articles from {source.name} for {ticker}")
+        return filtered
 
     def get_sentiment_summary(
         self,
@@ -239,7 +544,7 @@ class UnifiedNewsAggregator:
         }
 
     def _deduplicate(self, articles: list[NewsArticle]) -> list[NewsArticle]:
-        """Remove duplicate articles based on URL and title similarity.
+        """Remove duplicate articles based on URL, title and near-duplicate text.
 
         Args:
             articles: List of articles to deduplicate
@@ -247,23 +552,7 @@ class UnifiedNewsAggregator:
         Returns:
             List of unique articles
         """
-        seen_urls = set()
-        seen_titles = set()
-        unique = []
-
-        for article in articles:
-            # Check URL uniqueness
-            if article.url in seen_urls:
-                continue
-
-            # Check title similarity (normalize for comparison)
-            normalized_title = self._normalize_title(article.title)
-            if normalized_title in seen_titles:
-                continue
-
-            seen_urls.add(article.url)
-            seen_titles.add(normalized_title)
-            unique.append(article)
+        unique = NearDuplicateIndex(threshold=self.near_duplicate_threshold).filter(articles)
 
         if len(articles) != len(unique):
             logger.debug(f"Deduplicated {len(articles)} -> {len(unique)} articles")
@@ -279,20 +568,7 @@ class UnifiedNewsAggregator:
         Returns:
             Normalized title (lowercase, stripped, no extra spaces)
         """
-        import re
-
-        # Convert to lowercase and strip
-        normalized = title.lower().strip()
-
-        # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized)
-
-        # Remove common prefixes/suffixes that vary between sources
-        for prefix in ["breaking:", "update:", "exclusive:"]:
-            if normalized.startswith(prefix):
-                normalized = normalized[len(prefix) :].strip()
-
-        return normalized
+        return normalize_title(title)
 
     def _parse_date(self, date_value) -> datetime:
         """Parse date from various formats.
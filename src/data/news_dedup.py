@@ -0,0 +1,219 @@
+"""Near-duplicate detection for news articles.
+
+Syndicated stories reach us from several providers with slightly different titles,
+so exact URL/title matching misses them. Articles are compared by the Jaccard
+similarity of word shingles from title and summary. To avoid comparing every pair,
+each article gets a MinHash signature that is split into bands (locality-sensitive
+hashing): articles sharing a band are candidates, and only candidates are compared
+exactly.
+"""
+
+import hashlib
+import re
+from typing import Optional
+
+import numpy as np
+
+from src.data.models import NewsArticle
+
+# MinHash signature length and LSH banding. With 3 rows per band, a pair with
+# Jaccard similarity 0.6 becomes a candidate with ~99% probability, one with 0.2
+# with ~15%.
+NUM_PERMUTATIONS = 60
+ROWS_PER_BAND = 3
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(seed=1)
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PREFIX_RE = re.compile(r"^(?:(?:breaking|update|exclusive):\s*)+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_title(title: str) -> str:
+    """Normalize title for exact comparison.
+
+    Args:
+        title: Article title
+
+    Returns:
+        Normalized title (lowercase, stripped, no extra spaces, no 'breaking:'-style prefix)
+    """
+    normalized = _WHITESPACE_RE.sub(" ", title.lower().strip())
+    return _PREFIX_RE.sub("", normalized).strip()
+
+
+def shingles(text: str, size: int = 2) -> frozenset[str]:
+    """Get word shingles (n-grams) of a text.
+
+    Args:
+        text: Text to shingle
+        size: Words per shingle
+
+    Returns:
+        Set of shingles (single words if the text is shorter than one shingle)
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        return frozenset(tokens)
+    return frozenset(" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1))
+
+
+def minhash_signature(features: frozenset[str]) -> np.ndarray:
+    """Compute the MinHash signature of a feature set.
+
+    Args:
+        features: Non-empty set of features (e.g., shingles)
+
+    Returns:
+        Array of NUM_PERMUTATIONS minimum hash values
+    """
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(f.encode(), digest_size=4).digest(), "big")
+            for f in features
+        ],
+        dtype=np.uint64,
+    )
+    permuted = (_PERM_A[:, None] * (hashes[None, :] % _MERSENNE_PRIME) + _PERM_B[:, None]) % (
+        _MERSENNE_PRIME
+    )
+    return permuted.min(axis=1)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """Incremental index of seen articles for exact and near-duplicate detection.
+
+    An index can be used for one ticker's articles or kept for a whole run; articles
+    are checked and added one at a time, so the first copy of a story is kept.
+    """
+
+    def __init__(self, threshold: float = 0.6, min_features: int = 4, shingle_size: int = 2):
+        """Initialize index.
+
+        Args:
+            threshold: Minimum Jaccard similarity of shingles for near-duplicates
+                (1.0 disables near-duplicate matching; only URL and title are compared)
+            min_features: Minimum shingles an article needs for near-duplicate matching.
+                Very short texts are only matched exactly.
+            shingle_size: Words per shingle
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+
+        self.threshold = threshold
+        self.min_features = min_features
+        self.shingle_size = shingle_size
+
+        self._urls: set[str] = set()
+        self._titles: set[str] = set()
+        self._shingles: list[frozenset[str]] = []
+        self._buckets: dict[tuple[int, bytes], list[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of articles in the index."""
+        return len(self._titles)
+
+    def article_shingles(self, article: NewsArticle) -> frozenset[str]:
+        """Get shingles of an article's normalized title and summary.
+
+        Args:
+            article: News article
+
+        Returns:
+            Set of shingles
+        """
+        return shingles(
+            f"{normalize_title(article.title)} {article.summary or ''}", self.shingle_size
+        )
+
+    def is_duplicate(self, article: NewsArticle) -> bool:
+        """Check whether an article duplicates one already in the index.
+
+        Args:
+            article: News article
+
+        Returns:
+            True if the URL or normalized title was seen, or a near-duplicate exists
+        """
+        return self._check(article)[0]
+
+    def add(self, article: NewsArticle) -> bool:
+        """Add an article unless it duplicates one already in the index.
+
+        Args:
+            article: News article
+
+        Returns:
+            True if the article was added, False if it is a duplicate
+        """
+        duplicate, features, band_keys = self._check(article)
+        if duplicate:
+            return False
+
+        self._urls.add(article.url)
+        self._titles.add(normalize_title(article.title))
+        if band_keys:
+            position = len(self._shingles)
+            self._shingles.append(features)
+            for key in band_keys:
+                self._buckets.setdefault(key, []).append(position)
+        return True
+
+    def filter(self, articles: list[NewsArticle]) -> list[NewsArticle]:
+        """Add articles in order and return those that are not duplicates.
+
+        Args:
+            articles: Articles in order of preference (first copy is kept)
+
+        Returns:
+            Articles that were added
+        """
+        return [article for article in articles if self.add(article)]
+
+    def _check(
+        self, article: NewsArticle
+    ) -> tuple[bool, Optional[frozenset[str]], list[tuple[int, bytes]]]:
+        """Check for duplicates, returning shingles and band keys for reuse by add()."""
+        if article.url in self._urls or normalize_title(article.title) in self._titles:
+            return True, None, []
+        if self.threshold >= 1.0:
+            return False, None, []
+
+        features = self.article_shingles(article)
+        if len(features) < self.min_features:
+            return False, None, []
+
+        signature = minhash_signature(features)
+        band_keys = [
+            (band, signature[start : start + ROWS_PER_BAND].tobytes())
+            for band, start in enumerate(range(0, NUM_PERMUTATIONS, ROWS_PER_BAND))
+        ]
+
+        candidates = {p for key in band_keys for p in self._buckets.get(key, ())}
+        for position in sorted(candidates):
+            if jaccard(features, self._shingles[position]) >= self.threshold:
+                return True, features, band_keys
+        return False, features, band_keys
+
+
+def deduplicate(articles: list[NewsArticle], threshold: float = 0.6) -> list[NewsArticle]:
+    """Remove exact and near-duplicate articles, keeping the first copy.
+
+    Args:
+        articles: Articles in order of preference
+        threshold: Minimum Jaccard similarity of shingles for near-duplicates
+
+    Returns:
+        Unique articles in input order
+    """
+    return NearDuplicateIndex(threshold=threshold).filter(articles)
@@ -2,18 +2,99 @@
 
 Provides a single source of truth for price data per ticker, stored in efficient
 CSV format for fast loading and compatibility with pandas-ta for technical analysis.
+
+Decoded histories are kept in a small LRU cache as PriceIndex objects, revalidated
+against the CSV file's modification time on each read. Their sorted date arrays
+resolve as-of lookups (the last bar on or before a date) with a binary search.
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# StockPrice field names -> CSV column names
+PRICE_FIELD_MAPPING = {
+    "close_price": "close",
+    "open_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "adjusted_close": "adj_close",
+}
+
+# Decoded price histories kept in memory per PriceDataManager
+DEFAULT_FRAME_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class PriceIndex:
+    """Decoded price history of one ticker, sorted by date for as-of lookups.
+
+    Attributes:
+        frame: Price data sorted by date
+        dates: Dates of frame rows as a sorted datetime64 array
+    """
+
+    frame: pd.DataFrame
+    dates: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PriceIndex":
+        """Create an index from price data in any order.
+
+        Args:
+            df: Price data with a datetime "date" column
+
+        Returns:
+            PriceIndex over the sorted data
+        """
+        frame = df.sort_values("date", kind="stable").reset_index(drop=True)
+        return cls(frame=frame, dates=frame["date"].to_numpy(dtype="datetime64[ns]"))
+
+    def asof(self, target_dates: Iterable) -> np.ndarray:
+        """Find the last bar on or before each date.
+
+        Args:
+            target_dates: Dates to look up
+
+        Returns:
+            Row positions in frame, -1 where no bar is on or before the date
+        """
+        targets = pd.to_datetime(list(target_dates)).to_numpy(dtype="datetime64[ns]")
+        return np.searchsorted(self.dates, targets, side="right") - 1
+
+    def between(self, start_date: date | None, end_date: date | None) -> pd.DataFrame:
+        """Get the bars between two dates.
+
+        Args:
+            start_date: Start date (inclusive), None for the first bar
+            end_date: End date (inclusive), None for the last bar
+
+        Returns:
+            Copy of the matching rows
+        """
+        start = (
+            np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start_date)), side="left")
+            if start_date
+            else 0
+        )
+        end = (
+            np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end_date)), side="right")
+            if end_date
+            else len(self.dates)
+        )
+        return self.frame.iloc[start:end].reset_index(drop=True)
+
 
 class PriceDataManager:
     """Unified price data manager with CSV storage.
@@ -44,14 +125,24 @@ class PriceDataManager:
     # Minimal columns required for technical analysis
     REQUIRED_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
 
-    def __init__(self, prices_dir: str | Path = "data/cache/prices"):
+    def __init__(
+        self,
+        prices_dir: str | Path = "data/cache/prices",
+        frame_cache_size: int = DEFAULT_FRAME_CACHE_SIZE,
+    ):
         """Initialize price data manager.
 
         Args:
             prices_dir: Directory for storing CSV price files
+            frame_cache_size: Maximum decoded histories kept in memory (0 disables)
         """
         self.prices_dir = Path(prices_dir)
         self.prices_dir.mkdir(parents=True, exist_ok=True)
+        self.frame_cache_size = frame_cache_size
+
+        # Ticker -> ((mtime_ns, size) of the CSV file, decoded history)
+        self._frames: OrderedDict[str, tuple[tuple[int, int], PriceIndex]] = OrderedDict()
+        self._lock = threading.Lock()
         logger.debug(f"PriceDataManager initialized at {self.prices_dir}")
 
     def get_file_path(self, ticker: str) -> Path:
@@ -85,15 +176,12 @@ class PriceDataManager:
         Returns:
             Tuple of (start_date, end_date) or (None, None) if no data
         """
-        if not self.has_data(ticker):
-            return None, None
-
         try:
-            df = self._read_csv(ticker)
-            if df.empty:
+            index = self.get_price_index(ticker)
+            if index is None:
                 return None, None
 
-            return df["date"].min().date(), df["date"].max().date()
+            return index.frame["date"].iloc[0].date(), index.frame["date"].iloc[-1].date()
         except Exception as e:
             logger.warning(f"Error reading date range for {ticker}: {e}")
             return None, None
@@ -114,21 +202,12 @@ class PriceDataManager:
         Returns:
             DataFrame with price data sorted by date
         """
-        if not self.has_data(ticker):
+        index = self.get_price_index(ticker)
+        if index is None:
             logger.debug(f"No price data found for {ticker}")
             return pd.DataFrame()
 
-        df = self._read_csv(ticker)
-        if df.empty:
-            return df
-
-        # Filter by date range
-        if start_date:
-            df = df[df["date"] >= pd.Timestamp(start_date)]
-        if end_date:
-            df = df[df["date"] <= pd.Timestamp(end_date)]
-
-        return df.sort_values("date").reset_index(drop=True)
+        return index.between(start_date, end_date)
 
     def get_latest_price(self, ticker: str) -> Optional[dict]:
         """Get the most recent price data for a ticker.
@@ -139,14 +218,11 @@ class PriceDataManager:
         Returns:
             Dictionary with latest price data or None if no data
         """
-        if not self.has_data(ticker):
+        index = self.get_price_index(ticker)
+        if index is None:
             return None
 
-        df = self._read_csv(ticker)
-        if df.empty:
-            return None
-
-        latest = df.loc[df["date"].idxmax()]
+        latest = index.frame.iloc[-1]
         return {
             "date": latest["date"],
             "open": latest["open"],
@@ -168,7 +244,8 @@ class PriceDataManager:
 
         Args:
             ticker: Stock ticker symbol
-            prices: List of price dictionaries or DataFrame
+            prices: List of price dictionaries or DataFrame (with CSV column names,
+                e.g., from DataProvider.get_price_frame())
             append: If True, merge with existing data; if False, replace
 
         Returns:
@@ -206,6 +283,7 @@ class PriceDataManager:
         file_path = self.get_file_path(ticker)
         try:
             df_to_store.to_csv(file_path, index=False)
+            self._invalidate(ticker)
             logger.debug(f"Stored {len(df_to_store)} price records for {ticker}")
             return len(df_to_store)
         except Exception as e:
@@ -277,31 +355,60 @@ class PriceDataManager:
         Returns:
             Price data dictionary or None if not found
         """
-        df = self.get_prices(ticker)
-        if df.empty:
+        index = self.get_price_index(ticker)
+        if index is None:
             return None
 
-        target_ts = pd.Timestamp(target_date)
+        # Exact date, or the closest previous bar
+        position = index.asof([target_date])[0]
+        if position < 0:
+            return None
 
-        # Try exact date first
-        exact = df[df["date"] == target_ts]
-        if not exact.empty:
-            row = exact.iloc[0]
+        row = index.frame.iloc[position]
+        if (pd.Timestamp(target_date) - row["date"]).days <= tolerance_days:
             return self._row_to_dict(row)
 
-        # Look for closest previous date within tolerance
-        before_target = df[df["date"] <= target_ts]
-        if before_target.empty:
-            return None
+        logger.debug(f"No price found for {ticker} within {tolerance_days} days of {target_date}")
+        return None
 
-        latest_before = before_target.loc[before_target["date"].idxmax()]
-        days_diff = (target_ts - latest_before["date"]).days
+    def get_prices_at_dates(
+        self,
+        ticker_dates: Iterable[tuple[str, date]],
+        tolerance_days: int = 5,
+    ) -> pd.DataFrame:
+        """Get prices for many (ticker, date) pairs at once.
 
-        if days_diff <= tolerance_days:
-            return self._row_to_dict(latest_before)
+        Each ticker's history is decoded once and all of its dates are resolved with
+        one binary search, like get_price_at_date().
 
-        logger.debug(f"No price found for {ticker} within {tolerance_days} days of {target_date}")
-        return None
+        Args:
+            ticker_dates: (ticker, target date) pairs
+            tolerance_days: Number of days to look back if exact date not found
+
+        Returns:
+            DataFrame with one row per pair in input order: ticker, target_date and the
+            price columns of the bar used (NaN/NaT where no price was found)
+        """
+        requested = pd.DataFrame(list(ticker_dates), columns=["ticker", "target_date"])
+        price_columns = [column for column in self.COLUMNS if column != "ticker"]
+        tolerance = np.timedelta64(tolerance_days + 1, "D")
+
+        matches = []
+        for ticker, group in requested.groupby("ticker", sort=False):
+            index = self.get_price_index(ticker)
+            if index is None:
+                continue
+
+            targets = pd.to_datetime(group["target_date"]).to_numpy(dtype="datetime64[ns]")
+            positions = index.asof(targets)
+            found = positions >= 0
+            found[found] = targets[found] - index.dates[positions[found]] < tolerance
+
+            rows = index.frame.iloc[positions[found]].set_axis(group.index[found])
+            matches.append(rows.reindex(columns=price_columns))
+
+        prices = pd.concat(matches) if matches else pd.DataFrame(columns=price_columns)
+        return requested.join(prices)
 
     def cleanup_old_data(self, max_age_days: int = 730) -> int:
         """Remove price data older than specified age.
@@ -327,6 +434,7 @@ class PriceDataManager:
             if len(df) < original_len:
                 removed = original_len - len(df)
                 df.to_csv(file_path, index=False)
+                self._invalidate(ticker)
                 total_removed += removed
                 logger.info(f"Removed {removed} old records from {ticker}")
 
@@ -410,6 +518,47 @@ class PriceDataManager:
 
         return warnings
 
+    def get_price_index(self, ticker: str) -> PriceIndex | None:
+        """Get a ticker's decoded price history from the cache or its CSV file.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            PriceIndex, or None if there is no price data
+        """
+        file_path = self.get_file_path(ticker)
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+
+        key = ticker.upper()
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached and cached[0] == version:
+                self._frames.move_to_end(key)
+                return cached[1]
+
+        df = self._read_csv(ticker)
+        if df.empty:
+            return None
+
+        index = PriceIndex.from_frame(df)
+        if self.frame_cache_size > 0:
+            with self._lock:
+                self._frames[key] = (version, index)
+                self._frames.move_to_end(key)
+                while len(self._frames) > self.frame_cache_size:
+                    self._frames.popitem(last=False)
+        return index
+
+    def _invalidate(self, ticker: str) -> None:
+        """Drop a ticker's decoded history after its CSV file changed."""
+        with self._lock:
+            self._frames.pop(ticker.upper(), None)
+
     def _read_csv(self, ticker: str) -> pd.DataFrame:
         """Read CSV file for a ticker.
 
@@ -440,37 +589,20 @@ class PriceDataManager:
         Returns:
             Normalized DataFrame
         """
-        # Map common field name variations
-        field_mapping = {
-            "close_price": "close",
-            "open_price": "open",
-            "high_price": "high",
-            "low_price": "low",
-            "adjusted_close": "adj_close",
-        }
-
-        normalized = []
-        for p in prices:
-            row = {"ticker": ticker}
-
-            # Map fields
-            for orig_key, new_key in field_mapping.items():
-                if orig_key in p:
-                    row[new_key] = p[orig_key]
-
-            # Copy standard fields
-            for key in ["date", "open", "high", "low", "close", "volume", "currency"]:
-                if key in p and key not in row:
-                    row[key] = p[key]
-
-            # Copy metadata if present
-            for key in ["name", "market", "instrument_type"]:
-                if key in p:
-                    row[key] = p[key]
-
-            normalized.append(row)
-
-        return pd.DataFrame(normalized)
+        df = pd.DataFrame(prices)
+
+        # Map model field names (e.g., from StockPrice.model_dump()); a mapped field wins
+        # over the standard name in the same record
+        for orig_key, new_key in PRICE_FIELD_MAPPING.items():
+            if orig_key in df.columns:
+                df[new_key] = (
+                    df[orig_key].combine_first(df[new_key])
+                    if new_key in df.columns
+                    else df[orig_key]
+                )
+        df["ticker"] = ticker
+
+        return df[[column for column in self.COLUMNS if column in df.columns]]
 
     def _row_to_dict(self, row) -> dict:
         """Convert DataFrame row to dictionary.
@@ -1,16 +1,30 @@
 """Provider manager with automatic fallback logic."""
 
+from collections.abc import Callable
 from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
+import pandas as pd
+
+from src.data.http_client import HTTPClient
 from src.data.models import AnalystRating, NewsArticle, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
 from src.data.repository import AnalystRatingsRepository
+from src.utils.errors import RateLimitException
 from src.utils.logging import get_logger
+from src.utils.profiling import record_provider_call
+from src.utils.resilience import CircuitBreaker
 
 logger = get_logger(__name__)
 
+# Providers that make their own HTTP calls and accept an injected http_client
+HTTP_API_PROVIDERS = ("alpha_vantage", "finnhub")
+
+# Consecutive failures after which a provider is skipped, and for how long (seconds)
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 300.0
+
 
 class ProviderManager:
     """Manages multiple data providers with automatic fallback.
@@ -25,6 +39,7 @@ class ProviderManager:
         backup_providers: list[str] = None,
         db_path: Path | str | None = None,
         historical_data_lookback_days: int = 730,
+        http_client: Optional[HTTPClient] = None,
     ):
         """Initialize provider manager.
 
@@ -33,17 +48,23 @@ class ProviderManager:
             backup_providers: List of backup provider names (default: [alpha_vantage] for news/fundamentals)
             db_path: Optional path to database for storing analyst ratings
             historical_data_lookback_days: Default lookback period in days (default: 730)
+            http_client: Pooled HTTP client for API providers (default: a new one owned
+                by this manager)
         """
         self.primary_provider_name = primary_provider
         self.backup_provider_names = backup_providers or ["alpha_vantage"]
         self.historical_data_lookback_days = historical_data_lookback_days
 
+        # One pooled HTTP client shared by all API providers of this manager
+        self.http_client = http_client or HTTPClient()
+
         # Initialize providers
         self.primary_provider = self._create_provider(primary_provider)
         self.backup_providers = [self._create_provider(name) for name in self.backup_provider_names]
 
-        # Track provider health
+        # Track provider health; a provider's circuit opens after repeated failures
         self.provider_failures = {}
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
 
         # Initialize repository for historical data storage
         self.repository = None
@@ -69,7 +90,8 @@ class ProviderManager:
             Provider instance
         """
         try:
-            provider = DataProviderFactory.create(name)
+            kwargs = {"http_client": self.http_client} if name in HTTP_API_PROVIDERS else {}
+            provider = DataProviderFactory.create(name, **kwargs)
             logger.debug(f"Created provider: {name} (available={provider.is_available})")
             return provider
         except Exception as e:
@@ -103,6 +125,48 @@ class ProviderManager:
         Returns:
             List of StockPrice objects
 
+        Raises:
+            RuntimeError: If all providers fail
+        """
+        return self._fetch_price_history(
+            ticker, period, lambda provider, p: provider.get_stock_prices(ticker, period=p)
+        )
+
+    def get_price_frame(
+        self,
+        ticker: str,
+        period: str | None = None,
+    ) -> pd.DataFrame:
+        """Fetch stock prices as a DataFrame with automatic fallback.
+
+        The frame is ready for PriceDataManager.store_prices(), without building a
+        StockPrice object per bar.
+
+        Args:
+            ticker: Stock ticker symbol
+            period: Period string (e.g., '730d', '60d'). If None, uses historical_data_lookback_days
+
+        Returns:
+            DataFrame with PriceDataManager.COLUMNS sorted by date
+
+        Raises:
+            RuntimeError: If all providers fail
+        """
+        return self._fetch_price_history(
+            ticker, period, lambda provider, p: provider.get_price_frame(ticker, period=p)
+        )
+
+    def _fetch_price_history(self, ticker: str, period: str | None, fetch: Callable):
+        """Fetch price history from the first provider that returns data.
+
+        Args:
+            ticker: Stock ticker symbol
+            period: Period string, or None for historical_data_lookback_days
+            fetch: Function taking (provider, period) and returning prices (list or DataFrame)
+
+        Returns:
+            Prices as returned by fetch
+
         Raises:
             RuntimeError: If all providers fail
         """
@@ -114,8 +178,7 @@ class ProviderManager:
             period = f"{self.historical_data_lookback_days}d"
 
         for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
+            if not self._is_usable(provider):
                 continue
 
             try:
@@ -124,7 +187,7 @@ class ProviderManager:
                     logger.debug(
                         f"Fetching prices for {ticker} using {provider.name} (period={period})"
                     )
-                    prices = provider.get_stock_prices(ticker, period=period)
+                    prices = fetch(provider, period)
                 else:
                     # Other providers don't support period, skip them for price fetching
                     logger.debug(f"Provider {provider.name} doesn't support period-based fetching")
@@ -132,7 +195,7 @@ class ProviderManager:
                         f"{provider.name} requires date ranges, not supported"
                     )
 
-                if prices:
+                if len(prices) > 0:
                     logger.debug(f"Successfully fetched {len(prices)} prices from {provider.name}")
                     self._record_success(provider.name)
                     return prices
@@ -145,7 +208,7 @@ class ProviderManager:
                 continue
             except Exception as e:
                 logger.warning(f"Error fetching prices from {provider.name}: {e}")
-                self._record_failure(provider.name)
+                self._record_failure(provider.name, e)
                 errors.append(f"{provider.name}: {str(e)}")
                 continue
 
@@ -170,8 +233,7 @@ class ProviderManager:
         errors = []
 
         for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
+            if not self._is_usable(provider):
                 continue
 
             try:
@@ -189,7 +251,7 @@ class ProviderManager:
                 continue
             except Exception as e:
                 logger.warning(f"Error fetching latest price from {provider.name}: {e}")
-                self._record_failure(provider.name)
+                self._record_failure(provider.name, e)
                 errors.append(f"{provider.name}: {str(e)}")
                 continue
 
@@ -229,8 +291,7 @@ class ProviderManager:
         errors = []
 
         for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
+            if not self._is_usable(provider):
                 continue
 
             try:
@@ -252,7 +313,7 @@ class ProviderManager:
                 continue
             except Exception as e:
                 logger.warning(f"Error fetching news from {provider.name}: {e}")
-                self._record_failure(provider.name)
+                self._record_failure(provider.name, e)
                 errors.append(f"{provider.name}: {str(e)}")
                 continue
 
@@ -275,8 +336,7 @@ class ProviderManager:
         errors = []
 
         for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
+            if not self._is_usable(provider):
                 continue
 
             # Check if provider has get_company_info method
@@ -297,7 +357,7 @@ class ProviderManager:
 
             except Exception as e:
                 logger.warning(f"Error fetching company info from {provider.name}: {e}")
-                self._record_failure(provider.name)
+                self._record_failure(provider.name, e)
                 errors.append(f"{provider.name}: {str(e)}")
                 continue
 
@@ -359,8 +419,7 @@ class ProviderManager:
         errors = []
 
         for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
+            if not self._is_usable(provider):
                 continue
 
             # Check if provider has get_analyst_ratings method
@@ -390,7 +449,7 @@ class ProviderManager:
 
             except Exception as e:
                 logger.warning(f"Error fetching analyst ratings from {provider.name}: {e}")
-                self._record_failure(provider.name)
+                self._record_failure(provider.name, e)
                 errors.append(f"{provider.name}: {str(e)}")
                 continue
 
@@ -398,25 +457,74 @@ class ProviderManager:
         logger.warning(f"All providers failed for {ticker} analyst ratings")
         return None
 
+    def _circuit_breaker(self, provider_name: str) -> CircuitBreaker:
+        """Get the circuit breaker for a provider, creating it on first use.
+
+        Args:
+            provider_name: Provider name
+
+        Returns:
+            CircuitBreaker for the provider
+        """
+        breaker = self.circuit_breakers.get(provider_name)
+        if breaker is None:
+            breaker = self.circuit_breakers.setdefault(
+                provider_name,
+                CircuitBreaker(
+                    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                    recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT,
+                ),
+            )
+        return breaker
+
+    def _is_usable(self, provider: DataProvider) -> bool:
+        """Check whether a provider is available and its circuit allows a call.
+
+        Args:
+            provider: Provider instance
+
+        Returns:
+            True if the provider should be tried
+        """
+        if not provider.is_available:
+            logger.debug(f"Skipping unavailable provider: {provider.name}")
+            return False
+        if not self._circuit_breaker(provider.name).allow_request():
+            logger.debug(f"Skipping provider with open circuit: {provider.name}")
+            return False
+        return True
+
     def _record_success(self, provider_name: str) -> None:
         """Record successful provider call.
 
         Args:
             provider_name: Provider name
         """
+        record_provider_call(provider_name)
         if provider_name in self.provider_failures:
             del self.provider_failures[provider_name]
+        self._circuit_breaker(provider_name).record_success()
 
-    def _record_failure(self, provider_name: str) -> None:
+    def _record_failure(self, provider_name: str, error: Exception | None = None) -> None:
         """Record failed provider call.
 
+        Repeated failures open the provider's circuit; a rate limit error with a
+        Retry-After opens it for that long, so the provider is skipped until then.
+
         Args:
             provider_name: Provider name
+            error: Exception raised by the provider, if any
         """
+        record_provider_call(provider_name)
         if provider_name not in self.provider_failures:
             self.provider_failures[provider_name] = 0
         self.provider_failures[provider_name] += 1
 
+        breaker = self._circuit_breaker(provider_name)
+        breaker.record_failure()
+        if isinstance(error, RateLimitException) and error.context.get("retry_after"):
+            breaker.trip(error.context["retry_after"])
+
         if self.provider_failures[provider_name] >= 3:
             logger.warning(
                 f"Provider {provider_name} has failed {self.provider_failures[provider_name]} times"
@@ -433,12 +541,14 @@ class ProviderManager:
                 "name": self.primary_provider.name,
                 "available": self.primary_provider.is_available,
                 "failures": self.provider_failures.get(self.primary_provider.name, 0),
+                "circuit": self._circuit_breaker(self.primary_provider.name).state.value,
             },
             "backup_providers": [
                 {
                     "name": provider.name,
                     "available": provider.is_available,
                     "failures": self.provider_failures.get(provider.name, 0),
+                    "circuit": self._circuit_breaker(provider.name).state.value,
                 }
                 for provider in self.backup_providers
             ],
@@ -1,9 +1,12 @@
 """Abstract data provider interface and implementations."""
 
+import importlib
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional
 
+import pandas as pd
+
 from src.data.models import (
     AnalystRating,
     FinancialStatement,
@@ -11,10 +14,19 @@ from src.data.models import (
     NewsArticle,
     StockPrice,
 )
+from src.data.price_manager import PRICE_FIELD_MAPPING, PriceDataManager
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Built-in provider modules, imported (and so registered) on first use
+BUILTIN_PROVIDERS = {
+    "yahoo_finance": "src.data.yahoo_finance",
+    "alpha_vantage": "src.data.alpha_vantage",
+    "finnhub": "src.data.finnhub",
+    "fixture": "src.data.fixture",
+}
+
 
 class DataProvider(ABC):
     """Abstract base class for financial data providers."""
@@ -50,6 +62,43 @@ class DataProvider(ABC):
             RuntimeError: If API call fails
         """
 
+    def get_price_frame(
+        self,
+        ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Fetch stock price data as a DataFrame ready for PriceDataManager.store_prices().
+
+        The default converts the result of get_stock_prices(); providers that receive
+        tabular data override it to skip building a StockPrice object per bar.
+
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Start date for historical data (ignored if period is set)
+            end_date: End date for historical data (ignored if period is set)
+            period: Period string like '730d' (only supported by some providers)
+
+        Returns:
+            DataFrame with PriceDataManager.COLUMNS sorted by date (empty if no data)
+
+        Raises:
+            ValueError: If ticker is invalid
+            RuntimeError: If API call fails
+        """
+        if period:
+            prices = self.get_stock_prices(ticker, period=period)
+        else:
+            prices = self.get_stock_prices(ticker, start_date, end_date)
+
+        if not prices:
+            return pd.DataFrame(columns=PriceDataManager.COLUMNS)
+
+        frame = pd.DataFrame([p.model_dump() for p in prices]).rename(columns=PRICE_FIELD_MAPPING)
+        frame = frame.reindex(columns=PriceDataManager.COLUMNS)
+        return frame.sort_values("date").reset_index(drop=True)
+
     @abstractmethod
     def get_latest_price(self, ticker: str) -> StockPrice:
         """Fetch latest stock price.
@@ -91,6 +140,7 @@ class DataProvider(ABC):
         ticker: str,
         limit: int = 50,
         as_of_date: datetime | None = None,
+        since: datetime | None = None,
     ) -> list[NewsArticle]:
         """Fetch news articles.
 
@@ -98,6 +148,7 @@ class DataProvider(ABC):
             ticker: Stock ticker symbol
             limit: Maximum number of articles
             as_of_date: Optional date for historical news fetching (only fetch news before this date)
+            since: Optional date to fetch only articles published after it
 
         Returns:
             List of NewsArticle objects
@@ -186,8 +237,10 @@ class DataProviderFactory:
         Raises:
             ValueError: If provider not registered
         """
+        if name not in cls._providers and name in BUILTIN_PROVIDERS:
+            importlib.import_module(BUILTIN_PROVIDERS[name])
         if name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
+            available = ", ".join(cls.get_available())
             raise ValueError(f"Unknown provider: {name}. Available: {available}")
         provider_class = cls._providers[name]
         logger.debug(f"Creating provider instance: {name}")
@@ -200,7 +253,7 @@ class DataProviderFactory:
         Returns:
             List of provider names
         """
-        return list(cls._providers.keys())
+        return list(dict.fromkeys([*cls._providers, *BUILTIN_PROVIDERS]))
 
     @classmethod
     def reset(cls) -> None:
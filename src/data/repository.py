@@ -4,29 +4,56 @@ Provides high-level repository interfaces for storing and retrieving historical
 analyst ratings and other time-sensitive data from the SQLite database.
 """
 
+import hashlib
 import json
 import statistics
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
-import yfinance as yf
 from loguru import logger
-from sqlalchemy import func
+from sqlalchemy import DateTime, case, delete, func, insert, literal
+from sqlalchemy.orm import defer, selectinload
 from sqlmodel import and_, select
 
 from src.data.db import DatabaseManager
+from src.data.journal_analytics import TradingJournalAnalytics
 from src.data.models import (
     AnalystData,
     AnalystRating,
+    ArticleSentiment,
+    NewsArticle,
+    NewsArticleTicker,
+    NewsFetchState,
+    NewsSourceWatermark,
+    PerformanceCohortDaily,
+    PerformanceDaily,
     PerformanceSummary,
     PriceTracking,
     Recommendation,
+    RunProfile,
     RunSession,
+    StoredNewsArticle,
     Ticker,
     TradingJournal,
     Watchlist,
     WatchlistSignal,
 )
+from src.utils.profiling import profiled
+
+# Default number of ORM rows buffered per round trip by the streaming iter_* methods
+STREAM_BATCH_SIZE = 500
+
+# Maximum number of bound parameters per IN (...) lookup (SQLite limits host parameters)
+LOOKUP_CHUNK_SIZE = 500
+
+# Analysis mode of signals stored by the backtest command. Their fundamental and sentiment
+# scores are held neutral, so they are left out of live listings, duplicate checks,
+# performance tracking and publishing unless this mode is requested explicitly.
+BACKTEST_ANALYSIS_MODE = "backtest"
+
+# Condition selecting recommendations produced by real analysis runs
+LIVE_RECOMMENDATION = Recommendation.analysis_mode != BACKTEST_ANALYSIS_MODE
 
 
 def get_or_create_ticker(session, ticker_symbol: str, name: str = "") -> Ticker:
@@ -54,6 +81,8 @@ def get_or_create_ticker(session, ticker_symbol: str, name: str = "") -> Ticker:
     # Fetch company name if not provided or if it's just the ticker symbol
     if not name or name == ticker_symbol:
         try:
+            import yfinance as yf
+
             ticker_obj = yf.Ticker(ticker_symbol)
             info = ticker_obj.info
             name = info.get("longName") or info.get("shortName") or ticker_symbol
@@ -91,6 +120,7 @@ class AnalystRatingsRepository:
         self.db_manager = DatabaseManager(db_path)
         self.db_manager.initialize()
 
+    @profiled("db.store_ratings", ticker_arg="ratings")
     def store_ratings(self, ratings: AnalystRating, data_source: str = "unknown") -> bool:
         """Store analyst ratings for a specific month.
 
@@ -581,6 +611,70 @@ class RunSessionRepository:
             logger.error(f"Error retrieving run session {session_id}: {e}")
             return None
 
+    def store_profile(self, session_id: int, profile: dict) -> bool:
+        """Store (or replace) the timing profile of a session.
+
+        Args:
+            session_id: Session ID (integer).
+            profile: Profile summary from RunProfiler.summary().
+
+        Returns:
+            True if stored successfully, False otherwise.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                run_profile = session.exec(
+                    select(RunProfile).where(RunProfile.run_session_id == session_id)
+                ).first()
+                if run_profile is None:
+                    run_profile = RunProfile(run_session_id=session_id, total_seconds=0.0)
+
+                run_profile.total_seconds = profile.get("total_seconds", 0.0)
+                run_profile.cache_hit_rate = profile.get("cache_hit_rate")
+                run_profile.provider_calls = sum(profile.get("provider_calls", {}).values())
+                run_profile.profile_json = json.dumps(profile)
+                run_profile.created_at = datetime.now()
+
+                session.add(run_profile)
+                session.commit()
+                logger.debug(
+                    f"Stored profile for run session {session_id} "
+                    f"({run_profile.total_seconds:.2f}s)"
+                )
+                return True
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error storing profile for run session {session_id}: {e}")
+            return False
+
+    def get_profile(self, session_id: int) -> dict | None:
+        """Get the stored timing profile of a session.
+
+        Args:
+            session_id: Session ID (integer).
+
+        Returns:
+            Profile summary dictionary or None if the run was not profiled.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                run_profile = session.exec(
+                    select(RunProfile).where(RunProfile.run_session_id == session_id)
+                ).first()
+                return json.loads(run_profile.profile_json) if run_profile else None
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving profile for run session {session_id}: {e}")
+            return None
+
     def get_recent_sessions(self, limit: int = 10) -> list[dict]:
         """Get recent analysis sessions.
 
@@ -642,6 +736,7 @@ class RecommendationsRepository:
         self.db_manager = DatabaseManager(db_path)
         self.db_manager.initialize()
 
+    @profiled("db.store_recommendation", ticker_arg="signal")
     def store_recommendation(
         self,
         signal,  # InvestmentSignal type (imported dynamically to avoid circular import)
@@ -667,50 +762,8 @@ class RecommendationsRepository:
                 # Get or create ticker
                 ticker_obj = get_or_create_ticker(session, signal.ticker, signal.name)
 
-                # Convert analysis_date string to date object
-                if isinstance(signal.analysis_date, str):
-                    analysis_date = datetime.strptime(signal.analysis_date, "%Y-%m-%d").date()
-                else:
-                    analysis_date = signal.analysis_date
-
-                # Serialize complex fields to JSON
-                risk_flags_json = json.dumps(signal.risk.flags) if signal.risk.flags else None
-                key_reasons_json = json.dumps(signal.key_reasons) if signal.key_reasons else None
-                caveats_json = json.dumps(signal.caveats) if signal.caveats else None
-
-                # Serialize metadata to JSON
-                metadata_json = None
-                if signal.metadata:
-                    metadata_json = json.dumps(
-                        signal.metadata.model_dump(mode="json", exclude_none=True)
-                    )
-
-                # Create recommendation record
-                recommendation = Recommendation(
-                    ticker_id=ticker_obj.id,
-                    run_session_id=run_session_id,
-                    analysis_date=analysis_date,
-                    analysis_mode=analysis_mode,
-                    llm_model=llm_model,
-                    signal_type=signal.recommendation.value,
-                    final_score=signal.final_score,
-                    confidence=signal.confidence,
-                    technical_score=signal.scores.technical if signal.scores else None,
-                    fundamental_score=signal.scores.fundamental if signal.scores else None,
-                    sentiment_score=signal.scores.sentiment if signal.scores else None,
-                    current_price=signal.current_price,
-                    currency=signal.currency,
-                    expected_return_min=signal.expected_return_min,
-                    expected_return_max=signal.expected_return_max,
-                    time_horizon=signal.time_horizon,
-                    risk_level=signal.risk.level.value if signal.risk else None,
-                    risk_volatility=signal.risk.volatility if signal.risk else None,
-                    risk_volatility_pct=signal.risk.volatility_pct if signal.risk else None,
-                    risk_flags=risk_flags_json,
-                    key_reasons=key_reasons_json,
-                    rationale=signal.rationale,
-                    caveats=caveats_json,
-                    metadata_json=metadata_json,
+                recommendation = self._to_recommendation(
+                    signal, ticker_obj.id, run_session_id, analysis_mode, llm_model
                 )
 
                 session.add(recommendation)
@@ -728,11 +781,131 @@ class RecommendationsRepository:
             logger.error(f"Error storing recommendation for {signal.ticker}: {e}")
             raise
 
-    def _to_investment_signal(self, recommendation: Recommendation):
+    @profiled("db.store_recommendations")
+    def store_recommendations(
+        self,
+        signals: list,
+        run_session_id: int,
+        analysis_mode: str,
+        llm_model: str | None = None,
+    ) -> int:
+        """Store many recommendations in one transaction.
+
+        Args:
+            signals: InvestmentSignal Pydantic models.
+            run_session_id: Integer ID linking to run session.
+            analysis_mode: 'rule_based' or 'llm'.
+            llm_model: LLM model name (if applicable).
+
+        Returns:
+            Number of recommendations stored.
+        """
+        if not signals:
+            return 0
+
+        try:
+            session = self.db_manager.get_session()
+            try:
+                # Resolve each ticker once
+                ticker_ids = {}
+                for signal in signals:
+                    if signal.ticker.upper() not in ticker_ids:
+                        ticker_obj = get_or_create_ticker(session, signal.ticker, signal.name)
+                        ticker_ids[signal.ticker.upper()] = ticker_obj.id
+
+                session.add_all(
+                    self._to_recommendation(
+                        signal,
+                        ticker_ids[signal.ticker.upper()],
+                        run_session_id,
+                        analysis_mode,
+                        llm_model,
+                    )
+                    for signal in signals
+                )
+                session.commit()
+
+                logger.debug(f"Stored {len(signals)} recommendations for session {run_session_id}")
+                return len(signals)
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error storing {len(signals)} recommendations: {e}")
+            raise
+
+    @staticmethod
+    def _to_recommendation(
+        signal,
+        ticker_id: int,
+        run_session_id: int,
+        analysis_mode: str,
+        llm_model: str | None,
+    ) -> Recommendation:
+        """Convert an InvestmentSignal to a Recommendation database model.
+
+        Args:
+            signal: InvestmentSignal Pydantic model.
+            ticker_id: ID of the signal's ticker.
+            run_session_id: Integer ID linking to run session.
+            analysis_mode: 'rule_based' or 'llm'.
+            llm_model: LLM model name (if applicable).
+
+        Returns:
+            Unsaved Recommendation.
+        """
+        # Convert analysis_date string to date object
+        if isinstance(signal.analysis_date, str):
+            analysis_date = datetime.strptime(signal.analysis_date, "%Y-%m-%d").date()
+        else:
+            analysis_date = signal.analysis_date
+
+        # Serialize complex fields to JSON
+        risk_flags_json = json.dumps(signal.risk.flags) if signal.risk.flags else None
+        key_reasons_json = json.dumps(signal.key_reasons) if signal.key_reasons else None
+        caveats_json = json.dumps(signal.caveats) if signal.caveats else None
+
+        # Serialize metadata to JSON
+        metadata_json = None
+        if signal.metadata:
+            metadata_json = json.dumps(signal.metadata.model_dump(mode="json", exclude_none=True))
+
+        return Recommendation(
+            ticker_id=ticker_id,
+            run_session_id=run_session_id,
+            analysis_date=analysis_date,
+            analysis_mode=analysis_mode,
+            llm_model=llm_model,
+            signal_type=signal.recommendation.value,
+            final_score=signal.final_score,
+            confidence=signal.confidence,
+            technical_score=signal.scores.technical if signal.scores else None,
+            fundamental_score=signal.scores.fundamental if signal.scores else None,
+            sentiment_score=signal.scores.sentiment if signal.scores else None,
+            current_price=signal.current_price,
+            currency=signal.currency,
+            expected_return_min=signal.expected_return_min,
+            expected_return_max=signal.expected_return_max,
+            time_horizon=signal.time_horizon,
+            risk_level=signal.risk.level.value if signal.risk else None,
+            risk_volatility=signal.risk.volatility if signal.risk else None,
+            risk_volatility_pct=signal.risk.volatility_pct if signal.risk else None,
+            risk_flags=risk_flags_json,
+            key_reasons=key_reasons_json,
+            rationale=signal.rationale,
+            caveats=caveats_json,
+            metadata_json=metadata_json,
+        )
+
+    def _to_investment_signal(self, recommendation: Recommendation, include_details: bool = True):
         """Convert Recommendation database model to InvestmentSignal Pydantic model.
 
         Args:
             recommendation: Recommendation database object.
+            include_details: Whether to decode the heavy text columns (key_reasons, caveats,
+                rationale and metadata_json). When False these columns are expected to be
+                deferred by the query and are left empty on the returned signal.
 
         Returns:
             InvestmentSignal Pydantic model.
@@ -743,19 +916,28 @@ class RecommendationsRepository:
 
         # Deserialize JSON fields
         risk_flags = json.loads(recommendation.risk_flags) if recommendation.risk_flags else []
-        key_reasons = json.loads(recommendation.key_reasons) if recommendation.key_reasons else []
-        caveats = json.loads(recommendation.caveats) if recommendation.caveats else []
-
-        # Deserialize metadata
+        key_reasons = []
+        caveats = []
+        rationale = None
         metadata = None
-        if recommendation.metadata_json:
-            try:
-                metadata_dict = json.loads(recommendation.metadata_json)
-                metadata = AnalysisMetadata(**metadata_dict)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to deserialize metadata for recommendation {recommendation.id}: {e}"
-                )
+
+        if include_details:
+            key_reasons = (
+                json.loads(recommendation.key_reasons) if recommendation.key_reasons else []
+            )
+            caveats = json.loads(recommendation.caveats) if recommendation.caveats else []
+            rationale = recommendation.rationale
+
+            # Deserialize metadata
+            if recommendation.metadata_json:
+                try:
+                    metadata_dict = json.loads(recommendation.metadata_json)
+                    metadata = AnalysisMetadata(**metadata_dict)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to deserialize metadata for recommendation "
+                        f"{recommendation.id}: {e}"
+                    )
 
         # Create ComponentScores
         scores = ComponentScores(
@@ -797,7 +979,7 @@ class RecommendationsRepository:
             risk=risk,
             generated_at=recommendation.created_at,
             analysis_date=recommendation.analysis_date.strftime("%Y-%m-%d"),
-            rationale=recommendation.rationale,
+            rationale=rationale,
             caveats=caveats,
             metadata=metadata,
         )
@@ -809,6 +991,10 @@ class RecommendationsRepository:
         signal_type: str | None = None,
         confidence_threshold: float | None = None,
         final_score_threshold: float | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        top_n_per_signal_type: int | None = None,
+        include_details: bool = True,
     ) -> list:
         """Get all recommendations for a specific run session.
 
@@ -818,29 +1004,37 @@ class RecommendationsRepository:
             signal_type: Filter by signal type (e.g., 'strong_buy', 'buy', 'hold').
             confidence_threshold: Minimum confidence score (e.g., 70 means confidence > 70).
             final_score_threshold: Minimum final score (e.g., 70 means final_score > 70).
+            limit: Maximum number of signals to return (None for all).
+            offset: Number of ranked signals to skip (for pagination).
+            top_n_per_signal_type: Keep only the N best signals of each signal type.
+            include_details: Decode key reasons, caveats, rationale and metadata. Set to
+                False for score-only consumers to skip loading and parsing these columns.
 
         Returns:
-            List of InvestmentSignal Pydantic models (deduplicated by ticker+analysis_date).
+            List of InvestmentSignal Pydantic models (deduplicated by ticker+analysis_date),
+            sorted by final_score desc, confidence desc.
         """
         try:
             session = self.db_manager.get_session()
             try:
-                # Build query with filters
-                query = select(Recommendation).where(
-                    Recommendation.run_session_id == run_session_id
-                )
-                query = self._apply_filters(
-                    query, analysis_mode, signal_type, confidence_threshold, final_score_threshold
+                recommendations = self._select_best_recommendations(
+                    session,
+                    Recommendation.run_session_id == run_session_id,
+                    analysis_mode=analysis_mode,
+                    signal_type=signal_type,
+                    confidence_threshold=confidence_threshold,
+                    final_score_threshold=final_score_threshold,
+                    limit=limit,
+                    offset=offset,
+                    top_n_per_signal_type=top_n_per_signal_type,
+                    include_details=include_details,
                 )
-                query = query.order_by(Recommendation.created_at)
-
-                recommendations = session.exec(query).all()
-
-                # Deduplicate by ticker+analysis_date, keeping best recommendation
-                deduplicated = self._deduplicate_recommendations(recommendations)
 
                 # Convert to InvestmentSignal objects
-                return [self._to_investment_signal(rec) for rec in deduplicated]
+                return [
+                    self._to_investment_signal(rec, include_details=include_details)
+                    for rec in recommendations
+                ]
 
             finally:
                 session.close()
@@ -856,6 +1050,10 @@ class RecommendationsRepository:
         signal_type: str | None = None,
         confidence_threshold: float | None = None,
         final_score_threshold: float | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        top_n_per_signal_type: int | None = None,
+        include_details: bool = True,
     ) -> list:
         """Get all recommendations created on a specific date for report generation.
 
@@ -866,9 +1064,15 @@ class RecommendationsRepository:
             signal_type: Filter by signal type (e.g., 'strong_buy', 'buy', 'hold').
             confidence_threshold: Minimum confidence score (e.g., 70 means confidence > 70).
             final_score_threshold: Minimum final score (e.g., 70 means final_score > 70).
+            limit: Maximum number of signals to return (None for all).
+            offset: Number of ranked signals to skip (for pagination).
+            top_n_per_signal_type: Keep only the N best signals of each signal type.
+            include_details: Decode key reasons, caveats, rationale and metadata. Set to
+                False for score-only consumers to skip loading and parsing these columns.
 
         Returns:
-            List of InvestmentSignal Pydantic models (deduplicated by ticker+analysis_date).
+            List of InvestmentSignal Pydantic models (deduplicated by ticker+analysis_date),
+            sorted by final_score desc, confidence desc.
         """
         try:
             # Convert string to date if needed
@@ -877,20 +1081,24 @@ class RecommendationsRepository:
 
             session = self.db_manager.get_session()
             try:
-                # Build query with filters
-                query = select(Recommendation).where(Recommendation.analysis_date == report_date)
-                query = self._apply_filters(
-                    query, analysis_mode, signal_type, confidence_threshold, final_score_threshold
+                recommendations = self._select_best_recommendations(
+                    session,
+                    Recommendation.analysis_date == report_date,
+                    analysis_mode=analysis_mode,
+                    signal_type=signal_type,
+                    confidence_threshold=confidence_threshold,
+                    final_score_threshold=final_score_threshold,
+                    limit=limit,
+                    offset=offset,
+                    top_n_per_signal_type=top_n_per_signal_type,
+                    include_details=include_details,
                 )
-                query = query.order_by(Recommendation.created_at)
-
-                recommendations = session.exec(query).all()
-
-                # Deduplicate by ticker+analysis_date, keeping best recommendation
-                deduplicated = self._deduplicate_recommendations(recommendations)
 
                 # Convert to InvestmentSignal objects
-                return [self._to_investment_signal(rec) for rec in deduplicated]
+                return [
+                    self._to_investment_signal(rec, include_details=include_details)
+                    for rec in recommendations
+                ]
 
             finally:
                 session.close()
@@ -911,7 +1119,8 @@ class RecommendationsRepository:
 
         Args:
             query: SQLModel query to filter.
-            analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
+            analysis_mode: Filter by analysis mode ('llm', 'rule_based' or 'backtest');
+                backtest signals are excluded when None.
             signal_type: Filter by signal type (e.g., 'strong_buy', 'buy', 'hold').
             confidence_threshold: Minimum confidence score (e.g., 70 means confidence > 70).
             final_score_threshold: Minimum final score (e.g., 70 means final_score > 70).
@@ -921,6 +1130,8 @@ class RecommendationsRepository:
         """
         if analysis_mode:
             query = query.where(Recommendation.analysis_mode == analysis_mode)
+        else:
+            query = query.where(LIVE_RECOMMENDATION)
         if signal_type:
             query = query.where(Recommendation.signal_type == signal_type)
         if confidence_threshold is not None:
@@ -929,49 +1140,104 @@ class RecommendationsRepository:
             query = query.where(Recommendation.final_score > final_score_threshold)
         return query
 
-    def _deduplicate_recommendations(self, recommendations: list) -> list:
-        """Deduplicate recommendations by ticker+analysis_date, keeping the best one.
+    def _select_best_recommendations(
+        self,
+        session,
+        criterion,
+        analysis_mode: str | None = None,
+        signal_type: str | None = None,
+        confidence_threshold: float | None = None,
+        final_score_threshold: float | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        top_n_per_signal_type: int | None = None,
+        include_details: bool = True,
+    ) -> list[Recommendation]:
+        """Select the best recommendation per ticker+analysis_date in SQL.
 
         For each unique (ticker_id, analysis_date) combination, keeps only the recommendation
-        with the highest final_score. If final_scores are equal, uses highest confidence.
-        This ensures reports show only one recommendation per ticker per date.
+        with the highest final_score. If final_scores are equal, uses highest confidence and
+        then the earliest created row. Ranking is done with ROW_NUMBER() window functions so
+        duplicate rows from repeated runs never leave the database.
 
         Args:
-            recommendations: List of Recommendation database objects.
+            session: Database session.
+            criterion: Base WHERE clause (e.g., session or date match).
+            analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
+            signal_type: Filter by signal type (e.g., 'strong_buy', 'buy', 'hold').
+            confidence_threshold: Minimum confidence score.
+            final_score_threshold: Minimum final score.
+            limit: Maximum number of rows to return (None for all).
+            offset: Number of ranked rows to skip.
+            top_n_per_signal_type: Keep only the N best rows of each signal type.
+            include_details: Whether to load the heavy text columns.
 
         Returns:
-            List of deduplicated Recommendation objects sorted by final_score desc, confidence desc.
+            List of Recommendation objects sorted by final_score desc, confidence desc,
+            with ticker relationship loaded.
         """
-        if not recommendations:
-            return []
-
-        # Group by (ticker_id, analysis_date)
-        groups = {}
-        for rec in recommendations:
-            key = (rec.ticker_id, rec.analysis_date)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(rec)
-
-        # For each group, keep the best recommendation
-        deduplicated = []
-        for group_recs in groups.values():
-            # Sort by final_score desc, then confidence desc
-            best = sorted(group_recs, key=lambda r: (r.final_score, r.confidence), reverse=True)[0]
-            deduplicated.append(best)
-
-        # Sort final list by final_score and confidence for consistent ordering
-        deduplicated.sort(key=lambda r: (r.final_score, r.confidence), reverse=True)
-
-        initial_count = len(recommendations)
-        final_count = len(deduplicated)
-        if initial_count > final_count:
-            logger.info(
-                f"Deduplicated recommendations: {initial_count} -> {final_count} "
-                f"({initial_count - final_count} duplicates removed)"
+        ranked = select(
+            Recommendation.id.label("id"),
+            Recommendation.signal_type.label("signal_type"),
+            Recommendation.final_score.label("final_score"),
+            Recommendation.confidence.label("confidence"),
+            func.row_number()
+            .over(
+                partition_by=(Recommendation.ticker_id, Recommendation.analysis_date),
+                order_by=(
+                    Recommendation.final_score.desc(),
+                    Recommendation.confidence.desc(),
+                    Recommendation.created_at.asc(),
+                    Recommendation.id.asc(),
+                ),
+            )
+            .label("dedup_rank"),
+        ).where(criterion)
+        ranked = self._apply_filters(
+            ranked, analysis_mode, signal_type, confidence_threshold, final_score_threshold
+        ).subquery()
+
+        best = select(ranked.c.id).where(ranked.c.dedup_rank == 1)
+        if top_n_per_signal_type is not None:
+            per_type = select(
+                ranked.c.id,
+                func.row_number()
+                .over(
+                    partition_by=ranked.c.signal_type,
+                    order_by=(
+                        ranked.c.final_score.desc(),
+                        ranked.c.confidence.desc(),
+                        ranked.c.id.asc(),
+                    ),
+                )
+                .label("type_rank"),
+            ).where(ranked.c.dedup_rank == 1)
+            per_type = per_type.subquery()
+            best = select(per_type.c.id).where(per_type.c.type_rank <= top_n_per_signal_type)
+
+        query = (
+            select(Recommendation)
+            .where(Recommendation.id.in_(best))
+            .options(selectinload(Recommendation.ticker_obj))
+            .order_by(
+                Recommendation.final_score.desc(),
+                Recommendation.confidence.desc(),
+                Recommendation.id.asc(),
+            )
+        )
+        if not include_details:
+            query = query.options(
+                defer(Recommendation.metadata_json),
+                defer(Recommendation.key_reasons),
+                defer(Recommendation.caveats),
+                defer(Recommendation.rationale),
             )
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
 
-        return deduplicated
+        return list(session.exec(query).all())
 
     def get_existing_tickers_for_date(
         self, analysis_date: date | str, analysis_mode: str
@@ -1013,6 +1279,42 @@ class RecommendationsRepository:
             logger.error(f"Error checking existing recommendations: {e}")
             return set()
 
+    def get_existing_recommendation_keys(
+        self, start_date: date, end_date: date, analysis_mode: str
+    ) -> set[tuple[str, date]]:
+        """Get (ticker, analysis date) pairs that already have recommendations in a range.
+
+        Args:
+            start_date: First analysis date (inclusive).
+            end_date: Last analysis date (inclusive).
+            analysis_mode: Analysis mode ('llm' or 'rule_based').
+
+        Returns:
+            Set of (ticker symbol, analysis date) tuples.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                query = (
+                    select(Ticker.symbol, Recommendation.analysis_date)
+                    .join(Recommendation, Recommendation.ticker_id == Ticker.id)
+                    .where(
+                        Recommendation.analysis_date >= start_date,
+                        Recommendation.analysis_date <= end_date,
+                        Recommendation.analysis_mode == analysis_mode,
+                    )
+                    .distinct()
+                )
+
+                return {(symbol, analysis_date) for symbol, analysis_date in session.exec(query)}
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error checking existing recommendations: {e}")
+            return set()
+
     def get_latest_recommendation(self, ticker: str) -> Recommendation | None:
         """Get most recent recommendation for a ticker.
 
@@ -1034,7 +1336,7 @@ class RecommendationsRepository:
 
                 recommendation = session.exec(
                     select(Recommendation)
-                    .where(Recommendation.ticker_id == ticker_obj.id)
+                    .where(Recommendation.ticker_id == ticker_obj.id, LIVE_RECOMMENDATION)
                     .order_by(Recommendation.created_at.desc())
                 ).first()
 
@@ -1047,14 +1349,20 @@ class RecommendationsRepository:
             logger.error(f"Error retrieving latest recommendation for {ticker}: {e}")
             return None
 
-    def get_recommendations_by_ticker(self, ticker: str) -> list[dict]:
-        """Get all recommendations for a specific ticker.
+    def iter_recommendations_by_ticker(
+        self, ticker: str, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[dict]:
+        """Stream all recommendations for a specific ticker.
+
+        Rows are fetched in batches with ``yield_per`` so memory stays constant regardless
+        of history length. The session stays open until the iterator is exhausted or closed.
 
         Args:
             ticker: Stock ticker symbol.
+            batch_size: Number of rows buffered per fetch.
 
-        Returns:
-            List of recommendation dictionaries with relevant fields.
+        Yields:
+            Recommendation dictionaries with relevant fields, newest analysis date first.
         """
         try:
             ticker = ticker.upper()
@@ -1065,39 +1373,93 @@ class RecommendationsRepository:
 
                 if not ticker_obj:
                     logger.warning(f"Ticker not found: {ticker}")
-                    return []
+                    return
 
-                recommendations = session.exec(
+                query = (
                     select(Recommendation)
-                    .where(Recommendation.ticker_id == ticker_obj.id)
+                    .where(Recommendation.ticker_id == ticker_obj.id, LIVE_RECOMMENDATION)
                     .order_by(Recommendation.analysis_date.desc())
-                ).all()
-
-                # Convert to dicts with key fields
-                result = []
-                for rec in recommendations:
-                    result.append(
-                        {
-                            "id": rec.id,
-                            "ticker": ticker,
-                            "recommendation": rec.signal_type,
-                            "confidence": rec.confidence,
-                            "current_price": rec.current_price,
-                            "analysis_date": (
-                                rec.analysis_date.isoformat() if rec.analysis_date else None
-                            ),
-                            "analysis_mode": rec.analysis_mode,
-                            "reasoning": rec.rationale,
-                        }
-                    )
+                    .execution_options(yield_per=batch_size)
+                )
 
-                return result
+                for rec in session.exec(query):
+                    yield {
+                        "id": rec.id,
+                        "ticker": ticker,
+                        "recommendation": rec.signal_type,
+                        "confidence": rec.confidence,
+                        "current_price": rec.current_price,
+                        "analysis_date": (
+                            rec.analysis_date.isoformat() if rec.analysis_date else None
+                        ),
+                        "analysis_mode": rec.analysis_mode,
+                        "reasoning": rec.rationale,
+                    }
 
             finally:
                 session.close()
 
         except Exception as e:
             logger.error(f"Error retrieving recommendations for ticker {ticker}: {e}")
+
+    def get_recommendations_by_ticker(self, ticker: str) -> list[dict]:
+        """Get all recommendations for a specific ticker.
+
+        Args:
+            ticker: Stock ticker symbol.
+
+        Returns:
+            List of recommendation dictionaries with relevant fields.
+        """
+        return list(self.iter_recommendations_by_ticker(ticker))
+
+    def get_recommendation_summaries(self, tickers: list[str] | None = None) -> list:
+        """Get the listing columns of recommendations in a single pass.
+
+        Only the columns needed for listing pages are selected (no ORM objects or dicts),
+        so all recommendations can be loaded once and grouped in memory.
+
+        Args:
+            tickers: Only these ticker symbols (default: all recommendations).
+
+        Returns:
+            Rows with id, ticker, analysis_date, signal_type, confidence, current_price
+            and analysis_mode attributes, newest analysis date first, then by ticker.
+        """
+        columns = (
+            Recommendation.id,
+            Ticker.symbol.label("ticker"),
+            Recommendation.analysis_date,
+            Recommendation.signal_type,
+            Recommendation.confidence,
+            Recommendation.current_price,
+            Recommendation.analysis_mode,
+        )
+        order = (Recommendation.analysis_date.desc(), Ticker.symbol, Recommendation.id)
+        try:
+            session = self.db_manager.get_session()
+            try:
+                query = (
+                    select(*columns)
+                    .join(Ticker, Recommendation.ticker_id == Ticker.id)
+                    .where(LIVE_RECOMMENDATION)
+                )
+                if tickers is None:
+                    return list(session.exec(query.order_by(*order)).all())
+
+                symbols = sorted({ticker.upper() for ticker in tickers})
+                rows = []
+                for i in range(0, len(symbols), LOOKUP_CHUNK_SIZE):
+                    chunk = symbols[i : i + LOOKUP_CHUNK_SIZE]
+                    rows.extend(session.exec(query.where(Ticker.symbol.in_(chunk))).all())
+                rows.sort(key=lambda row: (-row.analysis_date.toordinal(), row.ticker, row.id))
+                return rows
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving recommendation summaries: {e}")
             return []
 
     def get_recommendation_by_id(self, recommendation_id: int) -> dict | None:
@@ -1165,6 +1527,7 @@ class RecommendationsRepository:
                         Recommendation.analysis_date,
                         func.count(Recommendation.id).label("count"),
                     )
+                    .where(LIVE_RECOMMENDATION)
                     .group_by(Recommendation.analysis_date)
                     .order_by(Recommendation.analysis_date.desc())
                     .limit(limit)
@@ -1184,6 +1547,57 @@ class RecommendationsRepository:
             logger.error(f"Error retrieving recent analysis dates: {e}")
             return []
 
+    def get_changes_since(self, since: datetime | None = None) -> dict:
+        """Get the tickers, dates and signal types with recommendations created after a time.
+
+        Used for incremental website publishing: only pages for these values need to be
+        regenerated.
+
+        Args:
+            since: Watermark (exclusive); None returns every value.
+
+        Returns:
+            Dict with 'tickers', 'dates' (ISO strings) and 'signal_types' sets, and
+            'watermark' (latest created_at among the changes, or None if there are none).
+        """
+        changes = {"tickers": set(), "dates": set(), "signal_types": set(), "watermark": None}
+        try:
+            session = self.db_manager.get_session()
+            try:
+                condition = and_(
+                    LIVE_RECOMMENDATION,
+                    Recommendation.created_at > since if since else literal(True),
+                )
+
+                watermark = session.exec(
+                    select(func.max(Recommendation.created_at)).where(condition)
+                ).one()
+                if watermark is None:
+                    return changes
+
+                rows = session.exec(
+                    select(Ticker.symbol, Recommendation.analysis_date, Recommendation.signal_type)
+                    .join(Ticker, Recommendation.ticker_id == Ticker.id)
+                    .where(condition)
+                    .distinct()
+                ).all()
+
+                for symbol, analysis_date, signal_type in rows:
+                    changes["tickers"].add(symbol)
+                    if analysis_date:
+                        changes["dates"].add(analysis_date.isoformat())
+                    if signal_type:
+                        changes["signal_types"].add(signal_type)
+                changes["watermark"] = watermark
+                return changes
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving recommendation changes since {since}: {e}")
+            return changes
+
 
 class PerformanceRepository:
     """Repository for tracking recommendation performance.
@@ -1201,6 +1615,7 @@ class PerformanceRepository:
         self.db_manager = DatabaseManager(db_path)
         self.db_manager.initialize()
 
+    @profiled("db.track_price")
     def track_price(
         self,
         recommendation_id: int,
@@ -1292,6 +1707,17 @@ class PerformanceRepository:
                     )
                     session.add(price_tracking)
 
+                # Keep the materialized daily performance tables in sync
+                self._upsert_daily_performance(
+                    session,
+                    recommendation,
+                    tracking_date,
+                    days_since,
+                    price_change_pct,
+                    benchmark_change_pct,
+                    alpha,
+                )
+
                 session.commit()
                 logger.debug(
                     f"Tracked price for recommendation {recommendation_id} on {tracking_date}"
@@ -1335,44 +1761,479 @@ class PerformanceRepository:
         # If no existing tracking or no benchmark price, use current as baseline
         return current_benchmark_price
 
-    def get_performance_data(self, recommendation_id: int) -> list[PriceTracking]:
-        """Get all price tracking data for a recommendation.
+    def _upsert_daily_performance(
+        self,
+        session,
+        recommendation: Recommendation,
+        tracking_date: date,
+        days_since: int,
+        return_pct: float | None,
+        benchmark_return_pct: float | None,
+        alpha: float | None,
+    ) -> None:
+        """Upsert the PerformanceDaily row for a tracking write and refresh its cohort rollup.
 
         Args:
-            recommendation_id: Integer ID of the recommendation.
-
-        Returns:
-            List of PriceTracking objects.
+            session: Database session (caller commits).
+            recommendation: Tracked Recommendation object.
+            tracking_date: Date when price was tracked.
+            days_since: Days since recommendation.
+            return_pct: Price change % vs recommendation price.
+            benchmark_return_pct: Benchmark change % since recommendation.
+            alpha: Return minus benchmark return.
         """
-        try:
-            session = self.db_manager.get_session()
-            try:
-                tracking_data = session.exec(
-                    select(PriceTracking)
-                    .where(PriceTracking.recommendation_id == recommendation_id)
-                    .order_by(PriceTracking.tracking_date.asc())
-                ).all()
-
-                return list(tracking_data)
+        daily = session.exec(
+            select(PerformanceDaily).where(
+                (PerformanceDaily.recommendation_id == recommendation.id)
+                & (PerformanceDaily.tracking_date == tracking_date)
+            )
+        ).first()
 
-            finally:
-                session.close()
+        if daily is None:
+            daily = PerformanceDaily(
+                recommendation_id=recommendation.id,
+                ticker_id=recommendation.ticker_id,
+                tracking_date=tracking_date,
+                analysis_date=recommendation.analysis_date,
+                signal_type=recommendation.signal_type,
+                analysis_mode=recommendation.analysis_mode,
+                confidence=recommendation.confidence,
+                days_since_recommendation=days_since,
+            )
 
-        except Exception as e:
-            logger.error(f"Error retrieving performance data for {recommendation_id}: {e}")
-            return []
+        daily.days_since_recommendation = days_since
+        daily.return_pct = return_pct
+        daily.benchmark_return_pct = benchmark_return_pct
+        daily.alpha = alpha
+        daily.updated_at = datetime.now()
+        session.add(daily)
+        session.flush()
+
+        self._refresh_cohort_rollup(
+            session,
+            tracking_date,
+            recommendation.analysis_date,
+            recommendation.signal_type,
+            recommendation.analysis_mode,
+        )
 
-    def get_active_recommendations(
-        self, max_age_days: int = 180, signal_types: list[str] | None = None
-    ) -> list[Recommendation]:
-        """Get active recommendations that should be tracked.
+    def _refresh_cohort_rollup(
+        self,
+        session,
+        tracking_date: date,
+        analysis_date: date,
+        signal_type: str,
+        analysis_mode: str,
+    ) -> None:
+        """Recompute one PerformanceCohortDaily row from its PerformanceDaily rows.
+
+        The cohort is bounded by the number of recommendations issued on one date, so this
+        stays cheap regardless of how much tracking history has accumulated.
+
+        Args:
+            session: Database session (caller commits).
+            tracking_date: Tracking date of the rollup.
+            analysis_date: Recommendation date of the cohort.
+            signal_type: Signal type of the cohort.
+            analysis_mode: Analysis mode of the cohort.
+        """
+        cohort_filter = and_(
+            PerformanceDaily.tracking_date == tracking_date,
+            PerformanceDaily.analysis_date == analysis_date,
+            PerformanceDaily.signal_type == signal_type,
+            PerformanceDaily.analysis_mode == analysis_mode,
+            PerformanceDaily.return_pct.is_not(None),
+        )
+        stats = session.exec(select(*self._cohort_aggregates()).where(cohort_filter)).one()
+
+        rollup = session.exec(
+            select(PerformanceCohortDaily).where(
+                (PerformanceCohortDaily.tracking_date == tracking_date)
+                & (PerformanceCohortDaily.analysis_date == analysis_date)
+                & (PerformanceCohortDaily.signal_type == signal_type)
+                & (PerformanceCohortDaily.analysis_mode == analysis_mode)
+            )
+        ).first()
+
+        if rollup is None:
+            rollup = PerformanceCohortDaily(
+                tracking_date=tracking_date,
+                analysis_date=analysis_date,
+                signal_type=signal_type,
+                analysis_mode=analysis_mode,
+            )
+
+        (
+            rollup.count,
+            rollup.sum_return,
+            rollup.sum_return_sq,
+            rollup.min_return,
+            rollup.win_count,
+            rollup.alpha_count,
+            rollup.sum_alpha,
+            rollup.sum_confidence,
+        ) = stats
+        rollup.updated_at = datetime.now()
+        session.add(rollup)
+
+    @staticmethod
+    def _cohort_aggregates() -> list:
+        """SQL aggregate expressions over PerformanceDaily matching PerformanceCohortDaily columns.
+
+        Returns:
+            List of labelled aggregate expressions.
+        """
+        return_pct = PerformanceDaily.return_pct
+        return [
+            func.count(return_pct).label("count"),
+            func.coalesce(func.sum(return_pct), 0.0).label("sum_return"),
+            func.coalesce(func.sum(return_pct * return_pct), 0.0).label("sum_return_sq"),
+            func.min(return_pct).label("min_return"),
+            func.coalesce(func.sum(case((return_pct > 0, 1), else_=0)), 0).label("win_count"),
+            func.count(PerformanceDaily.alpha).label("alpha_count"),
+            func.coalesce(func.sum(PerformanceDaily.alpha), 0.0).label("sum_alpha"),
+            func.coalesce(func.sum(PerformanceDaily.confidence), 0.0).label("sum_confidence"),
+        ]
+
+    @staticmethod
+    def _period_filters(
+        model,
+        cutoff_date: date,
+        ticker_id: int | None,
+        signal_type: str | None,
+        analysis_mode: str | None,
+    ) -> list:
+        """Filter conditions selecting recommendations issued within a report period.
+
+        Args:
+            model: Recommendation or PerformanceDaily, which share the filtered columns.
+            cutoff_date: Earliest analysis date included.
+            ticker_id: Ticker ID to filter by (None for all tickers).
+            signal_type: Signal type to filter by (None for all signals).
+            analysis_mode: Analysis mode to filter by (None for all live modes).
+
+        Returns:
+            List of SQL conditions.
+        """
+        conditions = [model.analysis_date >= cutoff_date]
+        if ticker_id is not None:
+            conditions.append(model.ticker_id == ticker_id)
+        if signal_type:
+            conditions.append(model.signal_type == signal_type)
+        if analysis_mode:
+            conditions.append(model.analysis_mode == analysis_mode)
+        else:
+            conditions.append(model.analysis_mode != BACKTEST_ANALYSIS_MODE)
+        return conditions
+
+    def rebuild_performance_timeseries(self) -> int:
+        """Rebuild the materialized daily performance tables from PriceTracking.
+
+        Used to backfill databases that have tracking history recorded before the
+        materialized tables existed. Runs as two set-based INSERT ... SELECT statements.
+
+        Returns:
+            Number of PerformanceDaily rows written, or -1 on error.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                session.exec(delete(PerformanceCohortDaily))
+                session.exec(delete(PerformanceDaily))
+
+                now = datetime.now()
+                daily_source = select(
+                    PriceTracking.recommendation_id,
+                    Recommendation.ticker_id,
+                    PriceTracking.tracking_date,
+                    Recommendation.analysis_date,
+                    Recommendation.signal_type,
+                    Recommendation.analysis_mode,
+                    Recommendation.confidence,
+                    PriceTracking.days_since_recommendation,
+                    PriceTracking.price_change_pct,
+                    PriceTracking.benchmark_change_pct,
+                    PriceTracking.alpha,
+                    literal(now, DateTime),
+                ).join(Recommendation, PriceTracking.recommendation_id == Recommendation.id)
+                daily_source = daily_source.where(LIVE_RECOMMENDATION)
+                session.exec(
+                    insert(PerformanceDaily).from_select(
+                        [
+                            "recommendation_id",
+                            "ticker_id",
+                            "tracking_date",
+                            "analysis_date",
+                            "signal_type",
+                            "analysis_mode",
+                            "confidence",
+                            "days_since_recommendation",
+                            "return_pct",
+                            "benchmark_return_pct",
+                            "alpha",
+                            "updated_at",
+                        ],
+                        daily_source,
+                    )
+                )
+
+                cohort_source = (
+                    select(
+                        PerformanceDaily.tracking_date,
+                        PerformanceDaily.analysis_date,
+                        PerformanceDaily.signal_type,
+                        PerformanceDaily.analysis_mode,
+                        *self._cohort_aggregates(),
+                        literal(now, DateTime),
+                    )
+                    .where(PerformanceDaily.return_pct.is_not(None))
+                    .group_by(
+                        PerformanceDaily.tracking_date,
+                        PerformanceDaily.analysis_date,
+                        PerformanceDaily.signal_type,
+                        PerformanceDaily.analysis_mode,
+                    )
+                )
+                session.exec(
+                    insert(PerformanceCohortDaily).from_select(
+                        [
+                            "tracking_date",
+                            "analysis_date",
+                            "signal_type",
+                            "analysis_mode",
+                            "count",
+                            "sum_return",
+                            "sum_return_sq",
+                            "min_return",
+                            "win_count",
+                            "alpha_count",
+                            "sum_alpha",
+                            "sum_confidence",
+                            "updated_at",
+                        ],
+                        cohort_source,
+                    )
+                )
+                session.commit()
+
+                row_count = session.exec(select(func.count(PerformanceDaily.id))).one()
+                logger.info(f"Rebuilt performance time series: {row_count} daily rows")
+                return row_count
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error rebuilding performance time series: {e}")
+            return -1
+
+    def needs_timeseries_backfill(self) -> bool:
+        """Check whether tracking history exists that the daily tables do not cover yet.
+
+        True for databases with PriceTracking rows recorded before the materialized
+        tables existed, even when later track_price calls have already added some
+        PerformanceDaily rows; the report would otherwise silently leave them out.
+
+        Returns:
+            True if any live PriceTracking row has no matching PerformanceDaily row.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                missing = session.exec(
+                    select(PriceTracking.id)
+                    .join(Recommendation, PriceTracking.recommendation_id == Recommendation.id)
+                    .outerjoin(
+                        PerformanceDaily,
+                        and_(
+                            PerformanceDaily.recommendation_id == PriceTracking.recommendation_id,
+                            PerformanceDaily.tracking_date == PriceTracking.tracking_date,
+                        ),
+                    )
+                    .where(LIVE_RECOMMENDATION, PerformanceDaily.id.is_(None))
+                    .limit(1)
+                ).first()
+                return missing is not None
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error checking performance time series: {e}")
+            return False
+
+    def get_performance_timeseries(
+        self,
+        start_date: date,
+        end_date: date | None = None,
+        ticker_symbol: str | None = None,
+        signal_type: str | None = None,
+        analysis_mode: str | None = None,
+    ) -> list[dict]:
+        """Get per-recommendation daily performance for a tracking date range.
+
+        Args:
+            start_date: First tracking date (inclusive).
+            end_date: Last tracking date (inclusive, None for open-ended).
+            ticker_symbol: Filter by ticker symbol.
+            signal_type: Filter by signal type.
+            analysis_mode: Filter by analysis mode.
+
+        Returns:
+            List of dicts ordered by tracking_date, recommendation_id.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                query = (
+                    select(PerformanceDaily, Ticker.symbol)
+                    .join(Ticker, PerformanceDaily.ticker_id == Ticker.id)
+                    .where(PerformanceDaily.tracking_date >= start_date)
+                )
+                if end_date:
+                    query = query.where(PerformanceDaily.tracking_date <= end_date)
+                if ticker_symbol:
+                    query = query.where(Ticker.symbol == ticker_symbol.upper())
+                if signal_type:
+                    query = query.where(PerformanceDaily.signal_type == signal_type)
+                if analysis_mode:
+                    query = query.where(PerformanceDaily.analysis_mode == analysis_mode)
+                query = query.order_by(
+                    PerformanceDaily.tracking_date, PerformanceDaily.recommendation_id
+                )
+
+                return [
+                    {
+                        "recommendation_id": row.recommendation_id,
+                        "ticker": symbol,
+                        "tracking_date": row.tracking_date.isoformat(),
+                        "analysis_date": row.analysis_date.isoformat(),
+                        "signal_type": row.signal_type,
+                        "analysis_mode": row.analysis_mode,
+                        "days_since_recommendation": row.days_since_recommendation,
+                        "return_pct": row.return_pct,
+                        "benchmark_return_pct": row.benchmark_return_pct,
+                        "alpha": row.alpha,
+                    }
+                    for row, symbol in session.exec(query).all()
+                ]
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving performance time series: {e}")
+            return []
+
+    def get_cohort_timeseries(
+        self,
+        start_date: date,
+        end_date: date | None = None,
+        signal_type: str | None = None,
+        analysis_mode: str | None = None,
+    ) -> list[dict]:
+        """Get daily aggregate performance across cohorts for a tracking date range.
+
+        Reads only the PerformanceCohortDaily rollups, so cost depends on the number of
+        days and cohorts in range, not on the number of tracking rows.
+
+        Args:
+            start_date: First tracking date (inclusive).
+            end_date: Last tracking date (inclusive, None for open-ended).
+            signal_type: Filter by signal type.
+            analysis_mode: Filter by analysis mode.
+
+        Returns:
+            List of dicts (one per tracking date) with count, avg_return, win_rate, avg_alpha.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                query = select(
+                    PerformanceCohortDaily.tracking_date,
+                    func.sum(PerformanceCohortDaily.count),
+                    func.sum(PerformanceCohortDaily.sum_return),
+                    func.sum(PerformanceCohortDaily.win_count),
+                    func.sum(PerformanceCohortDaily.alpha_count),
+                    func.sum(PerformanceCohortDaily.sum_alpha),
+                ).where(PerformanceCohortDaily.tracking_date >= start_date)
+                if end_date:
+                    query = query.where(PerformanceCohortDaily.tracking_date <= end_date)
+                if signal_type:
+                    query = query.where(PerformanceCohortDaily.signal_type == signal_type)
+                if analysis_mode:
+                    query = query.where(PerformanceCohortDaily.analysis_mode == analysis_mode)
+                query = query.group_by(PerformanceCohortDaily.tracking_date).order_by(
+                    PerformanceCohortDaily.tracking_date
+                )
+
+                series = []
+                for tracking_date, count, sum_return, wins, alpha_count, sum_alpha in session.exec(
+                    query
+                ).all():
+                    series.append(
+                        {
+                            "tracking_date": tracking_date.isoformat(),
+                            "count": count,
+                            "avg_return": sum_return / count if count else None,
+                            "win_rate": wins / count * 100 if count else None,
+                            "avg_alpha": sum_alpha / alpha_count if alpha_count else None,
+                        }
+                    )
+                return series
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving cohort time series: {e}")
+            return []
+
+    def get_performance_data(self, recommendation_id: int) -> list[PriceTracking]:
+        """Get all price tracking data for a recommendation.
+
+        Args:
+            recommendation_id: Integer ID of the recommendation.
+
+        Returns:
+            List of PriceTracking objects.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                tracking_data = session.exec(
+                    select(PriceTracking)
+                    .where(PriceTracking.recommendation_id == recommendation_id)
+                    .order_by(PriceTracking.tracking_date.asc())
+                ).all()
+
+                return list(tracking_data)
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving performance data for {recommendation_id}: {e}")
+            return []
+
+    def iter_active_recommendations(
+        self,
+        max_age_days: int = 180,
+        signal_types: list[str] | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Recommendation]:
+        """Stream active recommendations that should be tracked.
+
+        Rows are fetched in batches with ``yield_per`` and the ticker relationship is loaded
+        with one ``selectinload`` query per batch instead of one lazy load per row.
 
         Args:
             max_age_days: Maximum age of recommendations to track (default: 180 days).
             signal_types: Filter by signal types (e.g., ['buy', 'strong_buy']).
+            batch_size: Number of rows buffered per fetch.
 
-        Returns:
-            List of Recommendation objects.
+        Yields:
+            Recommendation objects with ticker_obj loaded.
         """
         try:
             session = self.db_manager.get_session()
@@ -1380,30 +2241,40 @@ class PerformanceRepository:
                 # Calculate cutoff date
                 cutoff_date = date.today() - timedelta(days=max_age_days)
 
-                # Build query with eager loading of ticker relationship
                 query = (
                     select(Recommendation)
-                    .join(Ticker)
-                    .where(Recommendation.analysis_date >= cutoff_date)
+                    .where(Recommendation.analysis_date >= cutoff_date, LIVE_RECOMMENDATION)
+                    .options(selectinload(Recommendation.ticker_obj))
+                    .order_by(Recommendation.id)
+                    .execution_options(yield_per=batch_size)
                 )
 
                 if signal_types:
                     query = query.where(Recommendation.signal_type.in_(signal_types))
 
-                recommendations = session.exec(query).all()
-
-                # Force load the ticker_obj relationship before closing session
-                for rec in recommendations:
-                    _ = rec.ticker_obj.symbol  # Access to force load
-
-                return list(recommendations)
+                yield from session.exec(query)
 
             finally:
                 session.close()
 
         except Exception as e:
             logger.error(f"Error retrieving active recommendations: {e}")
-            return []
+
+    def get_active_recommendations(
+        self, max_age_days: int = 180, signal_types: list[str] | None = None
+    ) -> list[Recommendation]:
+        """Get active recommendations that should be tracked.
+
+        Args:
+            max_age_days: Maximum age of recommendations to track (default: 180 days).
+            signal_types: Filter by signal types (e.g., ['buy', 'strong_buy']).
+
+        Returns:
+            List of Recommendation objects.
+        """
+        return list(
+            self.iter_active_recommendations(max_age_days=max_age_days, signal_types=signal_types)
+        )
 
     def update_performance_summary(
         self,
@@ -1438,6 +2309,8 @@ class PerformanceRepository:
                     query = query.where(Recommendation.signal_type == signal_type)
                 if analysis_mode:
                     query = query.where(Recommendation.analysis_mode == analysis_mode)
+                else:
+                    query = query.where(LIVE_RECOMMENDATION)
 
                 recommendations = session.exec(query).all()
 
@@ -1570,6 +2443,10 @@ class PerformanceRepository:
     ) -> dict:
         """Generate performance report with statistics.
 
+        Statistics are pooled exactly from the materialized PerformanceDaily table: each
+        recommendation issued within the period contributes its own most recent tracking
+        day. Counts and confidence cover all matching recommendations, tracked or not.
+
         Args:
             ticker_symbol: Filter by ticker symbol (None for all tickers).
             signal_type: Filter by signal type (None for all signals).
@@ -1582,6 +2459,14 @@ class PerformanceRepository:
         try:
             session = self.db_manager.get_session()
             try:
+                cutoff_date = date.today() - timedelta(days=period_days)
+                report = {
+                    "period_days": period_days,
+                    "ticker": ticker_symbol,
+                    "signal_type": signal_type,
+                    "analysis_mode": analysis_mode,
+                }
+
                 # Get ticker ID if symbol provided
                 ticker_id = None
                 if ticker_symbol:
@@ -1594,75 +2479,74 @@ class PerformanceRepository:
                         logger.warning(f"Ticker not found: {ticker_symbol}")
                         return {}
 
-                # Get performance summary
-                query = select(PerformanceSummary).where(
-                    PerformanceSummary.period_days == period_days
-                )
-
-                if ticker_id:
-                    query = query.where(PerformanceSummary.ticker_id == ticker_id)
-                if signal_type:
-                    query = query.where(PerformanceSummary.signal_type == signal_type)
-                if analysis_mode:
-                    query = query.where(PerformanceSummary.analysis_mode == analysis_mode)
-
-                summaries = session.exec(query).all()
-
-                if not summaries:
-                    return {
-                        "period_days": period_days,
-                        "ticker": ticker_symbol,
-                        "signal_type": signal_type,
-                        "analysis_mode": analysis_mode,
-                        "message": "No performance data available",
-                    }
-
-                # Aggregate if multiple summaries
-                report = {
-                    "period_days": period_days,
-                    "ticker": ticker_symbol,
-                    "signal_type": signal_type,
-                    "analysis_mode": analysis_mode,
-                    "total_recommendations": sum(s.total_recommendations for s in summaries),
-                }
+                filter_args = (cutoff_date, ticker_id, signal_type, analysis_mode)
+                total_recommendations, avg_confidence = session.exec(
+                    select(
+                        func.count(Recommendation.id), func.avg(Recommendation.confidence)
+                    ).where(*self._period_filters(Recommendation, *filter_args))
+                ).one()
 
-                # Safely aggregate metrics (handle None values)
-                avg_returns = [s.avg_return for s in summaries if s.avg_return is not None]
-                report["avg_return"] = sum(avg_returns) / len(avg_returns) if avg_returns else None
+                if not total_recommendations:
+                    report["message"] = "No performance data available"
+                    return report
 
-                median_returns = [s.median_return for s in summaries if s.median_return is not None]
-                report["median_return"] = (
-                    sum(median_returns) / len(median_returns) if median_returns else None
+                # Each recommendation contributes its own most recent tracking day
+                latest = (
+                    select(
+                        PerformanceDaily.recommendation_id,
+                        func.max(PerformanceDaily.tracking_date).label("tracking_date"),
+                    )
+                    .where(*self._period_filters(PerformanceDaily, *filter_args))
+                    .group_by(PerformanceDaily.recommendation_id)
+                    .subquery()
                 )
-
-                win_rates = [s.win_rate for s in summaries if s.win_rate is not None]
-                report["win_rate"] = sum(win_rates) / len(win_rates) if win_rates else None
-
-                alphas = [s.avg_alpha for s in summaries if s.avg_alpha is not None]
-                report["avg_alpha"] = sum(alphas) / len(alphas) if alphas else None
-
-                sharpe_ratios = [s.sharpe_ratio for s in summaries if s.sharpe_ratio is not None]
-                report["sharpe_ratio"] = (
-                    sum(sharpe_ratios) / len(sharpe_ratios) if sharpe_ratios else None
+                latest_rows = and_(
+                    PerformanceDaily.recommendation_id == latest.c.recommendation_id,
+                    PerformanceDaily.tracking_date == latest.c.tracking_date,
+                    PerformanceDaily.return_pct.is_not(None),
                 )
 
-                drawdowns = [s.max_drawdown for s in summaries if s.max_drawdown is not None]
-                report["max_drawdown"] = min(drawdowns) if drawdowns else None
+                (
+                    count,
+                    sum_return,
+                    sum_return_sq,
+                    min_return,
+                    win_count,
+                    alpha_count,
+                    sum_alpha,
+                    _,
+                ) = session.exec(select(*self._cohort_aggregates()).join(latest, latest_rows)).one()
+
+                # Median needs the individual returns of the selected rows
+                returns = session.exec(
+                    select(PerformanceDaily.return_pct).join(latest, latest_rows)
+                ).all()
 
-                confidences = [s.avg_confidence for s in summaries if s.avg_confidence is not None]
-                report["avg_confidence"] = (
-                    sum(confidences) / len(confidences) if confidences else None
-                )
+                avg_return = sum_return / count if count else None
+                win_rate = win_count / count * 100 if count else None
 
-                calibration_errors = [
-                    s.calibration_error for s in summaries if s.calibration_error is not None
-                ]
-                report["calibration_error"] = (
-                    sum(calibration_errors) / len(calibration_errors)
-                    if calibration_errors
-                    else None
-                )
+                # Sharpe ratio (simplified - assumes risk-free rate of 0)
+                sharpe_ratio = None
+                if count > 1:
+                    variance = max((sum_return_sq - sum_return**2 / count) / (count - 1), 0.0)
+                    std_dev = variance**0.5
+                    sharpe_ratio = (avg_return / std_dev) if std_dev > 0 else None
 
+                report.update(
+                    {
+                        "total_recommendations": total_recommendations,
+                        "avg_return": avg_return,
+                        "median_return": statistics.median(returns) if returns else None,
+                        "win_rate": win_rate,
+                        "avg_alpha": sum_alpha / alpha_count if alpha_count else None,
+                        "sharpe_ratio": sharpe_ratio,
+                        "max_drawdown": min_return,
+                        "avg_confidence": avg_confidence,
+                        "calibration_error": (
+                            abs(avg_confidence - win_rate) if avg_confidence and win_rate else None
+                        ),
+                    }
+                )
                 return report
 
             finally:
@@ -1868,6 +2752,7 @@ class WatchlistSignalRepository:
         self.db_manager = DatabaseManager(db_path)
         self.db_manager.initialize()
 
+    @profiled("db.store_watchlist_signal", ticker_arg="ticker_symbol")
     def store_signal(
         self,
         ticker_symbol: str,
@@ -2030,15 +2915,18 @@ class WatchlistSignalRepository:
             logger.error(f"Error getting latest signal for {ticker_symbol}: {e}")
             return None
 
-    def get_signal_history(self, ticker_symbol: str, days_back: int = 30) -> list[dict]:
-        """Get historical technical analysis signals for a ticker.
+    def iter_signal_history(
+        self, ticker_symbol: str, days_back: int = 30, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[dict]:
+        """Stream historical technical analysis signals for a ticker.
 
         Args:
             ticker_symbol: Ticker symbol.
             days_back: Number of days of history to retrieve (default: 30).
+            batch_size: Number of rows buffered per fetch.
 
-        Returns:
-            List of signal dictionaries, ordered by date descending.
+        Yields:
+            Signal dictionaries, ordered by date descending.
         """
         try:
             session = self.db_manager.get_session()
@@ -2050,23 +2938,23 @@ class WatchlistSignalRepository:
                 ticker = session.exec(select(Ticker).where(Ticker.symbol == ticker_symbol)).first()
 
                 if not ticker:
-                    return []
+                    return
 
                 # Calculate cutoff date
                 cutoff_date = date.today() - timedelta(days=days_back)
 
-                # Get signals
-                signals = session.exec(
+                query = (
                     select(WatchlistSignal)
                     .where(
                         (WatchlistSignal.ticker_id == ticker.id)
                         & (WatchlistSignal.analysis_date >= cutoff_date)
                     )
                     .order_by(WatchlistSignal.analysis_date.desc())
-                ).all()
+                    .execution_options(yield_per=batch_size)
+                )
 
-                return [
-                    {
+                for signal in session.exec(query):
+                    yield {
                         "id": signal.id,
                         "ticker": ticker_symbol,
                         "analysis_date": signal.analysis_date,
@@ -2082,15 +2970,24 @@ class WatchlistSignalRepository:
                         "wait_for_price": signal.wait_for_price,
                         "created_at": signal.created_at,
                     }
-                    for signal in signals
-                ]
 
             finally:
                 session.close()
 
         except Exception as e:
             logger.error(f"Error getting signal history for {ticker_symbol}: {e}")
-            return []
+
+    def get_signal_history(self, ticker_symbol: str, days_back: int = 30) -> list[dict]:
+        """Get historical technical analysis signals for a ticker.
+
+        Args:
+            ticker_symbol: Ticker symbol.
+            days_back: Number of days of history to retrieve (default: 30).
+
+        Returns:
+            List of signal dictionaries, ordered by date descending.
+        """
+        return list(self.iter_signal_history(ticker_symbol, days_back=days_back))
 
     def get_signals_for_watchlist_id(self, watchlist_id: int) -> list[dict]:
         """Get all signals associated with a specific watchlist entry.
@@ -2257,6 +3154,7 @@ class TradingJournalRepository:
         """
         self.db_manager = DatabaseManager(db_path)
         self.db_manager.initialize()
+        self._analytics: TradingJournalAnalytics | None = None
 
     def create_trade(
         self,
@@ -2569,14 +3467,17 @@ class TradingJournalRepository:
             logger.error(f"Failed to get closed trades: {e}")
             return []
 
-    def get_all_trades(self, ticker_symbol: str | None = None) -> list[dict]:
-        """Get all trades (both open and closed).
+    def iter_all_trades(
+        self, ticker_symbol: str | None = None, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[dict]:
+        """Stream all trades (both open and closed).
 
         Args:
             ticker_symbol: Optional filter by ticker symbol.
+            batch_size: Number of rows buffered per fetch.
 
-        Returns:
-            List of trade dictionaries ordered by ID ascending.
+        Yields:
+            Trade dictionaries ordered by ID ascending.
         """
         try:
             session = self.db_manager.get_session()
@@ -2589,21 +3490,29 @@ class TradingJournalRepository:
                     ticker_symbol = ticker_symbol.upper()
                     query = query.where(Ticker.symbol == ticker_symbol)
 
-                query = query.order_by(TradingJournal.id.asc())
-                results = session.exec(query).all()
-
-                trades = []
-                for trade, ticker in results:
-                    trades.append(self._trade_to_dict(trade, ticker))
+                query = query.order_by(TradingJournal.id.asc()).execution_options(
+                    yield_per=batch_size
+                )
 
-                return trades
+                for trade, ticker in session.exec(query):
+                    yield self._trade_to_dict(trade, ticker)
 
             finally:
                 session.close()
 
         except Exception as e:
             logger.error(f"Failed to get all trades: {e}")
-            return []
+
+    def get_all_trades(self, ticker_symbol: str | None = None) -> list[dict]:
+        """Get all trades (both open and closed).
+
+        Args:
+            ticker_symbol: Optional filter by ticker symbol.
+
+        Returns:
+            List of trade dictionaries ordered by ID ascending.
+        """
+        return list(self.iter_all_trades(ticker_symbol))
 
     def get_trade_by_id(self, trade_id: int) -> dict | None:
         """Get trade by ID.
@@ -2675,6 +3584,9 @@ class TradingJournalRepository:
     def get_performance_summary(self, ticker_symbol: str | None = None) -> dict:
         """Get performance summary for closed trades.
 
+        Delegates to the vectorized TradingJournalAnalytics engine, which caches results
+        until the next trade write.
+
         Args:
             ticker_symbol: Optional filter by ticker symbol.
 
@@ -2682,53 +3594,9 @@ class TradingJournalRepository:
             Dictionary with performance metrics.
         """
         try:
-            session = self.db_manager.get_session()
-            try:
-                query = select(TradingJournal).where(TradingJournal.status == "closed")
-
-                if ticker_symbol:
-                    ticker_symbol = ticker_symbol.upper()
-                    query = query.join(Ticker, TradingJournal.ticker_id == Ticker.id).where(
-                        Ticker.symbol == ticker_symbol
-                    )
-
-                trades = session.exec(query).all()
-
-                if not trades:
-                    return {
-                        "total_trades": 0,
-                        "total_profit_loss": 0.0,
-                        "win_rate": 0.0,
-                        "avg_profit_loss": 0.0,
-                        "avg_profit_loss_pct": 0.0,
-                        "total_fees": 0.0,
-                    }
-
-                profit_losses = [t.profit_loss for t in trades if t.profit_loss is not None]
-                winning_trades = [p for p in profit_losses if p > 0]
-                total_fees = sum((t.fees_entry or 0) + (t.fees_exit or 0) for t in trades)
-
-                return {
-                    "total_trades": len(trades),
-                    "winning_trades": len(winning_trades),
-                    "losing_trades": len(profit_losses) - len(winning_trades),
-                    "win_rate": (len(winning_trades) / len(profit_losses) * 100)
-                    if profit_losses
-                    else 0.0,
-                    "total_profit_loss": sum(profit_losses),
-                    "avg_profit_loss": statistics.mean(profit_losses) if profit_losses else 0.0,
-                    "avg_profit_loss_pct": statistics.mean(
-                        [t.profit_loss_pct for t in trades if t.profit_loss_pct is not None]
-                    )
-                    if trades
-                    else 0.0,
-                    "best_trade": max(profit_losses) if profit_losses else 0.0,
-                    "worst_trade": min(profit_losses) if profit_losses else 0.0,
-                    "total_fees": total_fees,
-                }
-
-            finally:
-                session.close()
+            if self._analytics is None:
+                self._analytics = TradingJournalAnalytics(self.db_manager.db_path)
+            return self._analytics.get_analytics(ticker_symbol=ticker_symbol)["summary"]
 
         except Exception as e:
             logger.error(f"Failed to get performance summary: {e}")
@@ -2769,3 +3637,400 @@ class TradingJournalRepository:
             "created_at": trade.created_at,
             "updated_at": trade.updated_at,
         }
+
+
+class ArticleSentimentRepository:
+    """Repository for cached local model sentiment scores of news texts.
+
+    Scores are keyed by a hash of (model name, backend variant, normalized text), see
+    src.sentiment.finbert.sentiment_cache_key.
+    """
+
+    def __init__(self, db_path: Path | str = "data/falconsignals.db"):
+        """Initialize repository with database manager.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_manager = DatabaseManager(db_path)
+        self.db_manager.initialize()
+
+    def get_scores(self, text_hashes: list[str]) -> dict[str, tuple[str, float]]:
+        """Look up cached scores.
+
+        Args:
+            text_hashes: Text hashes to look up.
+
+        Returns:
+            Dictionary mapping found hashes to (sentiment, score).
+        """
+        unique_hashes = list(dict.fromkeys(text_hashes))
+        if not unique_hashes:
+            return {}
+
+        try:
+            session = self.db_manager.get_session()
+            try:
+                found = {}
+                for i in range(0, len(unique_hashes), LOOKUP_CHUNK_SIZE):
+                    rows = session.exec(
+                        select(
+                            ArticleSentiment.text_hash,
+                            ArticleSentiment.sentiment,
+                            ArticleSentiment.score,
+                        ).where(
+                            ArticleSentiment.text_hash.in_(unique_hashes[i : i + LOOKUP_CHUNK_SIZE])
+                        )
+                    ).all()
+                    found.update(
+                        {text_hash: (sentiment, score) for text_hash, sentiment, score in rows}
+                    )
+                return found
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error reading cached sentiment scores: {e}")
+            return {}
+
+    def store_scores(self, model_name: str, scores: dict[str, tuple[str, float]]) -> int:
+        """Store scores for texts that are not cached yet.
+
+        Args:
+            model_name: Model that produced the scores.
+            scores: Dictionary mapping text hash to (sentiment, score).
+
+        Returns:
+            Number of new rows stored.
+        """
+        if not scores:
+            return 0
+
+        try:
+            session = self.db_manager.get_session()
+            try:
+                existing = set()
+                hashes = list(scores)
+                for i in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+                    existing.update(
+                        session.exec(
+                            select(ArticleSentiment.text_hash).where(
+                                ArticleSentiment.text_hash.in_(hashes[i : i + LOOKUP_CHUNK_SIZE])
+                            )
+                        ).all()
+                    )
+
+                new_rows = [
+                    ArticleSentiment(
+                        text_hash=text_hash,
+                        model_name=model_name,
+                        sentiment=sentiment,
+                        score=score,
+                    )
+                    for text_hash, (sentiment, score) in scores.items()
+                    if text_hash not in existing
+                ]
+                session.add_all(new_rows)
+                session.commit()
+                logger.debug(f"Cached {len(new_rows)} sentiment scores for {model_name}")
+                return len(new_rows)
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error caching sentiment scores: {e}")
+            return 0
+
+
+def news_article_id(url: str, title: str, published_date: datetime) -> str:
+    """Build the stored article key.
+
+    Args:
+        url: Article URL (may be empty for some providers).
+        title: Article title, used with published_date if there is no URL.
+        published_date: Publication date.
+
+    Returns:
+        SHA-256 hex digest identifying the article.
+    """
+    key = url.strip() if url and url.strip() else f"{title.strip()}\x00{published_date.isoformat()}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class NewsArticleRepository:
+    """Repository for persisted news articles and per-ticker fetch watermarks."""
+
+    def __init__(self, db_path: Path | str = "data/falconsignals.db"):
+        """Initialize repository with database manager.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_manager = DatabaseManager(db_path)
+        self.db_manager.initialize()
+
+    def store_articles(self, ticker: str, articles: list[NewsArticle]) -> int:
+        """Store articles and link them to a ticker.
+
+        Articles already stored (e.g., fetched for another ticker) are only linked.
+
+        Args:
+            ticker: Ticker the articles were fetched for.
+            articles: Articles to store.
+
+        Returns:
+            Number of new articles stored.
+        """
+        if not articles:
+            return 0
+
+        ticker = ticker.upper()
+        by_id = {news_article_id(a.url, a.title, a.published_date): a for a in reversed(articles)}
+
+        try:
+            session = self.db_manager.get_session()
+            try:
+                ids = list(by_id)
+                existing_articles = set()
+                existing_links = set()
+                for i in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+                    chunk = ids[i : i + LOOKUP_CHUNK_SIZE]
+                    existing_articles.update(
+                        session.exec(
+                            select(StoredNewsArticle.article_id).where(
+                                StoredNewsArticle.article_id.in_(chunk)
+                            )
+                        ).all()
+                    )
+                    existing_links.update(
+                        session.exec(
+                            select(NewsArticleTicker.article_id).where(
+                                NewsArticleTicker.ticker == ticker,
+                                NewsArticleTicker.article_id.in_(chunk),
+                            )
+                        ).all()
+                    )
+
+                new_articles = [
+                    StoredNewsArticle(
+                        article_id=article_id,
+                        url=a.url,
+                        title=a.title,
+                        summary=a.summary,
+                        source=a.source,
+                        published_date=a.published_date,
+                        sentiment=a.sentiment,
+                        sentiment_score=a.sentiment_score,
+                        importance=a.importance,
+                    )
+                    for article_id, a in by_id.items()
+                    if article_id not in existing_articles
+                ]
+                session.add_all(new_articles)
+                session.flush()
+                session.add_all(
+                    NewsArticleTicker(
+                        article_id=article_id, ticker=ticker, published_date=a.published_date
+                    )
+                    for article_id, a in by_id.items()
+                    if article_id not in existing_links
+                )
+                session.commit()
+                logger.debug(f"Stored {len(new_articles)} new news articles for {ticker}")
+                return len(new_articles)
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error storing news articles for {ticker}: {e}")
+            return 0
+
+    def get_articles(
+        self,
+        ticker: str,
+        start: datetime,
+        end: datetime,
+        limit: int | None = None,
+    ) -> list[NewsArticle]:
+        """Get stored articles for a ticker published within a date range.
+
+        Args:
+            ticker: Ticker symbol.
+            start: Earliest publication date (inclusive).
+            end: Latest publication date (inclusive).
+            limit: Optional maximum number of articles.
+
+        Returns:
+            Articles sorted by publication date (newest first).
+        """
+        ticker = ticker.upper()
+        try:
+            session = self.db_manager.get_session()
+            try:
+                query = (
+                    select(StoredNewsArticle)
+                    .join(
+                        NewsArticleTicker,
+                        NewsArticleTicker.article_id == StoredNewsArticle.article_id,
+                    )
+                    .where(
+                        NewsArticleTicker.ticker == ticker,
+                        NewsArticleTicker.published_date >= start,
+                        NewsArticleTicker.published_date <= end,
+                    )
+                    .order_by(NewsArticleTicker.published_date.desc())
+                )
+                if limit is not None:
+                    query = query.limit(limit)
+
+                return [
+                    NewsArticle(
+                        ticker=ticker,
+                        title=row.title,
+                        summary=row.summary,
+                        source=row.source,
+                        url=row.url,
+                        published_date=row.published_date,
+                        sentiment=row.sentiment,
+                        sentiment_score=row.sentiment_score,
+                        importance=row.importance,
+                    )
+                    for row in session.exec(query).all()
+                ]
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error reading news articles for {ticker}: {e}")
+            return []
+
+    def get_fetch_state(self, ticker: str) -> dict | None:
+        """Get the news fetch watermark for a ticker.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Returns:
+            Dictionary with covered_from, last_fetched_at and watermark, or None.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                state = session.get(NewsFetchState, ticker.upper())
+                if state is None:
+                    return None
+                return {
+                    "covered_from": state.covered_from,
+                    "last_fetched_at": state.last_fetched_at,
+                    "watermark": state.watermark,
+                }
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error reading news fetch state for {ticker}: {e}")
+            return None
+
+    def update_fetch_state(
+        self,
+        ticker: str,
+        covered_from: datetime,
+        last_fetched_at: datetime,
+        watermark: datetime | None,
+    ) -> bool:
+        """Create or replace the news fetch watermark for a ticker.
+
+        Args:
+            ticker: Ticker symbol.
+            covered_from: Start of the continuously fetched window.
+            last_fetched_at: When news was fetched.
+            watermark: Publication date of the newest stored article.
+
+        Returns:
+            True if stored successfully.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                state = session.get(NewsFetchState, ticker.upper())
+                if state is None:
+                    state = NewsFetchState(
+                        ticker=ticker.upper(),
+                        covered_from=covered_from,
+                        last_fetched_at=last_fetched_at,
+                    )
+                state.covered_from = covered_from
+                state.last_fetched_at = last_fetched_at
+                state.watermark = watermark
+                session.add(state)
+                session.commit()
+                return True
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error storing news fetch state for {ticker}: {e}")
+            return False
+
+    def get_source_watermarks(self, ticker: str) -> dict[str, datetime]:
+        """Get the per-source news fetch watermarks for a ticker.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Returns:
+            Dictionary of source name -> publication date of its newest fetched article.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                rows = session.exec(
+                    select(NewsSourceWatermark).where(NewsSourceWatermark.ticker == ticker.upper())
+                ).all()
+                return {row.source: row.watermark for row in rows}
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error reading news source watermarks for {ticker}: {e}")
+            return {}
+
+    def update_source_watermarks(self, ticker: str, watermarks: dict[str, datetime]) -> bool:
+        """Advance the per-source news fetch watermarks for a ticker.
+
+        A watermark only moves forward; older dates than the stored one are ignored.
+
+        Args:
+            ticker: Ticker symbol.
+            watermarks: Source name -> publication date of the newest fetched article.
+
+        Returns:
+            True if stored successfully.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                for source, watermark in watermarks.items():
+                    row = session.get(NewsSourceWatermark, (ticker.upper(), source))
+                    if row is None:
+                        row = NewsSourceWatermark(
+                            ticker=ticker.upper(), source=source, watermark=watermark
+                        )
+                    row.watermark = max(row.watermark, watermark)
+                    session.add(row)
+                session.commit()
+                return True
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error storing news source watermarks for {ticker}: {e}")
+            return False
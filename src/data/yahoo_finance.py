@@ -6,6 +6,7 @@ import pandas as pd
 import yfinance as yf
 
 from src.data.models import InstrumentType, Market, StockPrice
+from src.data.price_manager import PriceDataManager
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.errors import RateLimitException
 from src.utils.logging import get_logger
@@ -27,12 +28,6 @@ class YahooFinanceProvider(DataProvider):
         self.is_available = True
         logger.debug("Yahoo Finance provider initialized")
 
-    @retry(
-        max_attempts=5,
-        initial_delay=5.0,
-        max_delay=120.0,
-        exponential_base=2.5,
-    )
     def get_stock_prices(
         self,
         ticker: str,
@@ -53,6 +48,54 @@ class YahooFinanceProvider(DataProvider):
         Returns:
             List of StockPrice objects sorted by date
 
+        Raises:
+            ValueError: If ticker is invalid
+            RuntimeError: If API call fails
+            RateLimitException: If rate limited by API
+        """
+        frame = self.get_price_frame(ticker, start_date, end_date, period)
+        return [
+            StockPrice(
+                ticker=row.ticker,
+                name=row.name,
+                market=row.market,
+                instrument_type=row.instrument_type,
+                date=row.date.to_pydatetime(),
+                open_price=row.open,
+                high_price=row.high,
+                low_price=row.low,
+                close_price=row.close,
+                volume=row.volume,
+                adjusted_close=row.adj_close,
+                currency=row.currency,
+            )
+            for row in frame.itertuples(index=False)
+        ]
+
+    @retry(
+        max_attempts=5,
+        initial_delay=5.0,
+        max_delay=120.0,
+        exponential_base=2.5,
+    )
+    def get_price_frame(
+        self,
+        ticker: str,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        period: str = None,
+    ) -> pd.DataFrame:
+        """Fetch historical stock price data from Yahoo Finance as a DataFrame.
+
+        Args:
+            ticker: Stock ticker symbol
+            start_date: Start date for historical data (ignored if period is set)
+            end_date: End date for historical data (ignored if period is set)
+            period: Period string (see get_stock_prices). If set, overrides start_date/end_date.
+
+        Returns:
+            DataFrame with PriceDataManager.COLUMNS sorted by date
+
         Raises:
             ValueError: If ticker is invalid
             RuntimeError: If API call fails
@@ -78,76 +121,9 @@ class YahooFinanceProvider(DataProvider):
             if data.empty:
                 raise ValueError(f"No data found for ticker: {ticker}")
 
-            prices = []
-            for index, row in data.iterrows():
-                # Handle different column formats from yfinance
-                # yf.Ticker().history() returns flat columns: Open, High, Low, Close, Volume, etc.
-                # yf.download() can return MultiIndex columns: (PriceLevel, Ticker)
-                def get_price_value(row, key):
-                    """Extract scalar price value, handling both flat and MultiIndex columns."""
-                    try:
-                        # Try flat column first (from Ticker().history())
-                        val = row[key]
-                    except (KeyError, TypeError):
-                        try:
-                            # Try MultiIndex (from yf.download())
-                            val = row[(key, ticker.upper())]
-                        except (KeyError, TypeError):
-                            return None
-
-                    # Ensure we have a scalar value (handle Series case)
-                    if isinstance(val, pd.Series):
-                        val = val.iloc[0] if len(val) > 0 else None
-
-                    return float(val) if pd.notna(val) else None
-
-                # Extract price values
-                adjusted_close = get_price_value(row, "Adj Close")
-                if adjusted_close is None:
-                    adjusted_close = get_price_value(row, "Close")
-                if adjusted_close is None:
-                    logger.warning(f"No valid close price for {ticker} on {index}")
-                    continue
-
-                open_price = get_price_value(row, "Open")
-                high_price = get_price_value(row, "High")
-                low_price = get_price_value(row, "Low")
-                close_price = get_price_value(row, "Close")
-                volume = get_price_value(row, "Volume")
-
-                if any(v is None for v in [open_price, high_price, low_price, close_price, volume]):
-                    logger.warning(f"Missing price data for {ticker} on {index}")
-                    continue
-
-                market = self._infer_market(ticker)
-
-                # Convert index to naive datetime (remove timezone info)
-                if hasattr(index, "to_pydatetime"):
-                    dt = index.to_pydatetime()
-                    # Remove timezone if present
-                    if dt.tzinfo is not None:
-                        dt = dt.replace(tzinfo=None)
-                else:
-                    dt = index
-
-                price = StockPrice(
-                    ticker=ticker.upper(),
-                    name=self._get_ticker_name(ticker),
-                    market=market,
-                    instrument_type=InstrumentType.STOCK,
-                    date=dt,
-                    open_price=open_price,
-                    high_price=high_price,
-                    low_price=low_price,
-                    close_price=close_price,
-                    volume=int(volume),
-                    adjusted_close=adjusted_close,
-                    currency=self._get_currency_for_market(market),
-                )
-                prices.append(price)
-
-            logger.debug(f"Retrieved {len(prices)} price records for {ticker}")
-            return prices
+            frame = self._normalize_history(data, ticker)
+            logger.debug(f"Retrieved {len(frame)} price records for {ticker}")
+            return frame
 
         except ValueError:
             raise
@@ -165,6 +141,61 @@ class YahooFinanceProvider(DataProvider):
             logger.error(f"Error fetching prices for {ticker}: {e}")
             raise RuntimeError(f"Failed to fetch prices for {ticker}: {e}") from e
 
+    def _normalize_history(self, data: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        """Convert a yfinance history DataFrame to price store columns.
+
+        yf.Ticker().history() returns flat columns (Open, High, Low, Close, Volume, ...);
+        yf.download() can return MultiIndex columns (PriceLevel, Ticker). Bars missing
+        any OHLCV value are dropped; a missing adjusted close falls back to the close.
+
+        Args:
+            data: History DataFrame indexed by (possibly timezone-aware) date
+            ticker: Stock ticker symbol
+
+        Returns:
+            DataFrame with PriceDataManager.COLUMNS sorted by date
+        """
+        ticker = ticker.upper()
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker in data.columns.get_level_values(-1):
+                data = data.xs(ticker, axis=1, level=-1)
+            else:
+                data = data.droplevel(-1, axis=1)
+
+        dates = pd.DatetimeIndex(data.index)
+        if dates.tz is not None:
+            # Keep the exchange's local date, dropping the timezone
+            dates = dates.tz_localize(None)
+
+        columns = {
+            "Open": "open",
+            "High": "high",
+            "Low": "low",
+            "Close": "close",
+            "Volume": "volume",
+            "Adj Close": "adj_close",
+        }
+        frame = data.reindex(columns=list(columns)).apply(pd.to_numeric, errors="coerce")
+        frame.columns = list(columns.values())
+        frame.index = dates
+        frame["adj_close"] = frame["adj_close"].fillna(frame["close"])
+
+        complete = frame.notna().all(axis=1)
+        if not complete.all():
+            logger.warning(f"Dropped {int((~complete).sum())} bars with missing data for {ticker}")
+            frame = frame[complete]
+
+        market = self._infer_market(ticker)
+        frame = frame.rename_axis("date").reset_index()
+        frame["volume"] = frame["volume"].astype("int64")
+        frame["currency"] = self._get_currency_for_market(market)
+        frame["ticker"] = ticker
+        frame["name"] = self._get_ticker_name(ticker) if len(frame) else ticker
+        frame["market"] = market.value
+        frame["instrument_type"] = InstrumentType.STOCK.value
+
+        return frame[PriceDataManager.COLUMNS].sort_values("date").reset_index(drop=True)
+
     @retry(
         max_attempts=5,
         initial_delay=2.0,
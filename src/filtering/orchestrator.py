@@ -7,6 +7,7 @@ import typer
 from src.filtering.strategies import FilterStrategy, get_strategy
 from src.tools.fetchers import PriceFetcherTool
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled, span
 
 logger = get_logger(__name__)
 
@@ -50,6 +51,7 @@ class FilterOrchestrator:
         self.config = config
         logger.debug(f"FilterOrchestrator initialized with strategy: {self.strategy.name}")
 
+    @profiled("filtering")
     def filter_tickers(
         self,
         tickers: list[str],
@@ -112,7 +114,8 @@ class FilterOrchestrator:
                             continue
 
                         # Apply strategy filter
-                        should_include, reasons = self.strategy.filter(ticker, prices)
+                        with span("filter.strategy", ticker):
+                            should_include, reasons = self.strategy.filter(ticker, prices)
 
                         filter_details[ticker] = {
                             "included": should_include,
@@ -145,7 +148,8 @@ class FilterOrchestrator:
                         continue
 
                     # Apply strategy filter
-                    should_include, reasons = self.strategy.filter(ticker, prices)
+                    with span("filter.strategy", ticker):
+                        should_include, reasons = self.strategy.filter(ticker, prices)
 
                     filter_details[ticker] = {
                         "included": should_include,
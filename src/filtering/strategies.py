@@ -3,15 +3,72 @@
 This module provides different strategies for filtering tickers based on
 market data patterns. Strategies are used to reduce the number of tickers
 that undergo expensive analysis (especially LLM-based).
+
+Each strategy decides on the latest bar with filter(), and on every bar of a
+history at once with filter_series(), which uses rolling window operations so that
+thresholds can be evaluated over years of data.
 """
 
 from abc import ABC, abstractmethod
+from functools import reduce
+from operator import or_
 from typing import Any
 
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Boolean condition per bar: a Series, or a DataFrame with one column per ticker
+Mask = pd.Series | pd.DataFrame
+
+
+def _bar_count(close: Mask) -> Mask:
+    """Number of bars up to and including each row, zero for rows without data."""
+    return close.notna().cumsum().where(close.notna(), 0)
+
+
+def _rolling(values: Mask, window: int, how: str, min_periods: int | None = None) -> Mask:
+    """Reduce each row's trailing window of values, for all rows and columns at once.
+
+    Matches pandas rolling().sum()/mean()/max()/min(), but reduces a strided view of
+    the values instead of iterating over DataFrame columns.
+
+    Args:
+        values: Series or DataFrame of numbers
+        window: Number of rows in each window
+        how: Reduction ("sum", "mean", "max" or "min")
+        min_periods: Values required in a window (default: window)
+
+    Returns:
+        Reduced values shaped like the input, NaN where a window has too few values
+    """
+    data = values.to_numpy(dtype=float)
+    valid = ~np.isnan(data)
+    fill = {"max": -np.inf, "min": np.inf}.get(how, 0.0)
+
+    padding = np.full((window - 1, *data.shape[1:]), fill)
+    windows = sliding_window_view(
+        np.concatenate([padding, np.where(valid, data, fill)]), window, axis=0
+    )
+    counts = sliding_window_view(
+        np.concatenate([np.zeros_like(padding), valid]), window, axis=0
+    ).sum(axis=-1)
+
+    if how == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = windows.sum(axis=-1) / counts
+    else:
+        result = getattr(windows, how)(axis=-1)
+    result[counts < (min_periods or window)] = np.nan
+
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(result, index=values.index, columns=values.columns)
+    return pd.Series(result, index=values.index, name=values.name)
+
 
 class FilterStrategy(ABC):
     """Abstract base class for ticker filtering strategies."""
@@ -39,6 +96,49 @@ class FilterStrategy(ABC):
         """
         pass
 
+    def filter_series(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """Apply the filter on every bar of a price history.
+
+        Row i gives the decision filter() makes when passed the bars up to row i.
+
+        Args:
+            prices: Price history with the keys used by filter() as columns, one row
+                per bar (sorted oldest to newest). Several tickers can be evaluated at
+                once with (field, ticker) columns and each ticker's bars starting at
+                the first row.
+
+        Returns:
+            DataFrame of booleans with one column per condition and an "include"
+            column, or (condition, ticker) columns for a multi-ticker history
+        """
+        conditions = self._conditions(prices)
+        conditions["include"] = reduce(or_, conditions.values())
+        return pd.concat(conditions, axis=1)
+
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        """Evaluate each inclusion condition on every bar.
+
+        Strategies override this with rolling window operations. The default calls
+        filter() once per bar, so custom strategies work with filter_series().
+
+        Args:
+            prices: Price history as accepted by filter_series()
+
+        Returns:
+            Dictionary mapping condition name to a boolean mask per bar
+        """
+        if isinstance(prices.columns, pd.MultiIndex):
+            masks = {
+                ticker: self._conditions(prices.xs(ticker, axis=1, level=1).dropna(how="all"))
+                for ticker in prices.columns.unique(level=1)
+            }
+            frame = pd.concat({ticker: mask["filter"] for ticker, mask in masks.items()}, axis=1)
+            return {"filter": frame.reindex(prices.index).eq(True)}
+
+        records = prices.to_dict("records")
+        included = [self.filter("", records[: i + 1])[0] for i in range(len(records))]
+        return {"filter": pd.Series(included, index=prices.index, dtype=bool)}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -140,6 +240,24 @@ class AnomalyStrategy(FilterStrategy):
         has_anomalies = len(anomalies) > 0
         return has_anomalies, anomalies
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        close, high, low = prices["close_price"], prices["high_price"], prices["low_price"]
+        volume = prices["volume"]
+        enough = _bar_count(close) >= 5
+
+        daily_change = (close - close.shift(1)) / close.shift(1) * 100
+        weekly_change = (close - close.shift(4)) / close.shift(4) * 100
+        avg_volume = _rolling(volume, 5, "sum") / 5
+
+        return {
+            "daily_move": enough & (daily_change.abs() > self.daily_threshold),
+            "weekly_move": enough & (weekly_change.abs() > self.weekly_threshold),
+            "volume_spike": enough & (volume > avg_volume * self.volume_multiplier),
+            "period_high": enough
+            & (high >= _rolling(high, self.lookback_days, "max", min_periods=1)),
+            "period_low": enough & (low <= _rolling(low, self.lookback_days, "min", min_periods=1)),
+        }
+
 
 class VolumeStrategy(FilterStrategy):
     """Filter tickers based on volume patterns.
@@ -212,6 +330,24 @@ class VolumeStrategy(FilterStrategy):
         has_signal = len(reasons) > 0
         return has_signal, reasons
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        volume = prices["volume"]
+        enough = _bar_count(prices["close_price"]) >= 10
+
+        avg_volume = _rolling(volume, 20, "sum", min_periods=1) / 20
+        volume_ratio = (volume / avg_volume).where(avg_volume > 0, 0)
+
+        half = self.trend_days // 2
+        avg_early = _rolling(volume.shift(self.trend_days - half), half, "mean")
+        avg_late = _rolling(volume, self.trend_days - half, "mean")
+        trend_change = ((avg_late - avg_early) / avg_early * 100).where(avg_early > 0)
+
+        return {
+            "high_volume": enough & (volume_ratio >= self.min_volume_ratio),
+            "volume_increasing": enough & (trend_change >= self.min_trend_slope),
+            "volume_decreasing": enough & (trend_change <= -self.min_trend_slope),
+        }
+
 
 class MomentumStrategy(FilterStrategy):
     """Filter tickers based on price momentum.
@@ -298,6 +434,32 @@ class MomentumStrategy(FilterStrategy):
         has_momentum = len(reasons) > 0
         return has_momentum, reasons
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        close = prices["close_price"]
+        enough = _bar_count(close) >= self.lookback_days
+        change = close.diff()
+
+        # Replay the streak count over each window, for all windows at once
+        up_days = down_days = max_up_streak = max_down_streak = close.notna() * 0
+        for offset in range(self.lookback_days - 2, -1, -1):
+            step = change.shift(offset)
+            up_days = (up_days + 1).where(step > 0, up_days.where(~(step < 0), 0))
+            down_days = (down_days + 1).where(step < 0, down_days.where(~(step > 0), 0))
+            max_up_streak = max_up_streak.where(max_up_streak >= up_days, up_days)
+            max_down_streak = max_down_streak.where(max_down_streak >= down_days, down_days)
+
+        start_price = close.shift(self.lookback_days - 1)
+        total_change = (close - start_price) / start_price * 100
+
+        return {
+            "upward_momentum": enough
+            & (max_up_streak >= self.min_consecutive_days)
+            & (total_change >= self.min_total_change),
+            "downward_momentum": enough
+            & (max_down_streak >= self.min_consecutive_days)
+            & (total_change.abs() >= self.min_total_change),
+        }
+
 
 class VolatilityStrategy(FilterStrategy):
     """Filter tickers based on volatility patterns.
@@ -376,6 +538,24 @@ class VolatilityStrategy(FilterStrategy):
         has_signal = len(reasons) > 0
         return has_signal, reasons
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        close = prices["close_price"]
+        enough = _bar_count(close) >= self.lookback_days
+
+        daily_range = (prices["high_price"] - prices["low_price"]) / close * 100
+        avg_daily_range = _rolling(daily_range, self.lookback_days, "mean")
+
+        conditions = {
+            "high_volatility": enough & (avg_daily_range >= self.min_avg_daily_range),
+            "volatility_spike": enough
+            & (daily_range > avg_daily_range * self.volatility_multiplier),
+        }
+        if self.lookback_days >= 10:
+            early_avg = _rolling(daily_range.shift(self.lookback_days - 10), 10, "mean")
+            late_avg = _rolling(daily_range, 10, "mean")
+            conditions["increasing_volatility"] = enough & (late_avg > early_avg * 1.3)
+        return conditions
+
 
 class BreakoutStrategy(FilterStrategy):
     """Filter tickers showing breakout patterns.
@@ -455,6 +635,20 @@ class BreakoutStrategy(FilterStrategy):
         has_breakout = len(reasons) > 0
         return has_breakout, reasons
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        close = prices["close_price"]
+        enough = _bar_count(close) >= self.lookback_days
+
+        # Levels over the lookback window, excluding the latest bar
+        resistance = _rolling(prices["high_price"].shift(1), self.lookback_days - 1, "max")
+        support = _rolling(prices["low_price"].shift(1), self.lookback_days - 1, "min")
+
+        return {
+            "resistance_breakout": enough
+            & (close >= resistance * (1 + self.breakout_threshold / 100)),
+            "support_breakdown": enough & (close <= support * (1 - self.breakout_threshold / 100)),
+        }
+
 
 class GapStrategy(FilterStrategy):
     """Filter tickers with price gaps.
@@ -518,6 +712,22 @@ class GapStrategy(FilterStrategy):
         has_gap = len(reasons) > 0
         return has_gap, reasons
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        close = prices["close_price"]
+        enough = _bar_count(close) >= 2
+
+        previous_close = close.shift(1)
+        gap_percent = (prices["open_price"] - previous_close) / previous_close * 100
+
+        def within_window(gap: Mask) -> Mask:
+            recent = _rolling(gap, self.lookback_days, "max", min_periods=1)
+            return enough & (recent > 0)
+
+        return {
+            "gap_up": within_window(gap_percent >= self.min_gap_percent),
+            "gap_down": within_window(gap_percent <= -self.min_gap_percent),
+        }
+
 
 class AllStrategy(FilterStrategy):
     """Pass-through strategy that includes all tickers.
@@ -548,6 +758,9 @@ class AllStrategy(FilterStrategy):
         """
         return True, ["All tickers included"]
 
+    def _conditions(self, prices: pd.DataFrame) -> dict[str, Mask]:
+        return {"included": prices["close_price"].notna()}
+
 
 # Registry of available strategies
 STRATEGY_REGISTRY: dict[str, type[FilterStrategy]] = {
@@ -18,6 +18,7 @@ from src.config.schemas import LLMConfig
 from src.llm.token_tracker import TokenTracker
 from src.llm.tools import CrewAIToolAdapter
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled, span
 
 logger = get_logger(__name__)
 
@@ -150,6 +151,7 @@ class LLMAnalysisOrchestrator:
         except Exception as e:
             logger.warning(f"Failed to save debug data for {ticker} ({stage}): {e}")
 
+    @profiled("llm.analysis")
     def analyze_instrument(
         self,
         ticker: str,
@@ -217,7 +219,8 @@ class LLMAnalysisOrchestrator:
             "sentiment_analysis": sentiment_task,
         }
 
-        analysis_results = self.crew.execute_analysis(tasks, context, progress_callback)
+        with span("llm.agents"):
+            analysis_results = self.crew.execute_analysis(tasks, context, progress_callback)
 
         # Save debug: analysis outputs
         if self.debug_dir:
@@ -267,6 +270,7 @@ class LLMAnalysisOrchestrator:
             )
             return None
 
+    @profiled("llm.synthesis")
     def synthesize_signal(
         self,
         ticker: str,
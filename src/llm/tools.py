@@ -5,8 +5,6 @@ import time
 from datetime import date, datetime
 from functools import wraps
 
-from crewai.tools import tool
-
 from src.tools.analysis import TechnicalIndicatorTool
 from src.tools.fetchers import FinancialDataFetcherTool, NewsFetcherTool, PriceFetcherTool
 from src.utils.logging import get_logger
@@ -93,6 +91,7 @@ class CrewAIToolAdapter:
         Returns:
             List of CrewAI tool instances
         """
+        from crewai.tools import tool
 
         @tool("Fetch Price Data")
         @tool_with_timeout(timeout_seconds=15)
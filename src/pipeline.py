@@ -12,6 +12,7 @@ from src.analysis import (
     RiskAssessor,
 )
 from src.analysis.normalizer import AnalysisResultNormalizer
+from src.analysis.portfolio_risk import PortfolioRiskEngine
 from src.analysis.signal_creator import SignalCreator
 from src.cache.manager import CacheManager
 from src.config.schemas import Config
@@ -79,6 +80,9 @@ class AnalysisPipeline:
             monthly_deposit=config.capital.monthly_deposit_eur,
             max_position_size_pct=config.risk.max_position_size_percent,
             max_sector_concentration_pct=config.risk.max_sector_concentration_percent,
+            max_market_concentration_pct=config.risk.max_market_concentration_percent,
+            method=config.risk.allocation_method,
+            risk_engine=PortfolioRiskEngine(cache_manager.price_manager),
         )
         self.report_generator = ReportGenerator(include_disclaimers=True)
 
@@ -366,4 +370,5 @@ class AnalysisPipeline:
             "recommendation": signal.recommendation.value,
             "expected_return_min": signal.expected_return_min,
             "expected_return_max": signal.expected_return_max,
+            "analysis_date": signal.analysis_date,
         }
@@ -1,6 +1,18 @@
 """Sentiment analysis module with FinBERT and hybrid scoring."""
 
-from src.sentiment.analyzer import ConfigurableSentimentAnalyzer
-from src.sentiment.finbert import FinBERTSentimentScorer
+import importlib
+
+# Exports are imported on first access so that importing a submodule (or the CLI)
+# does not load the sentiment models.
+_EXPORTS = {
+    "FinBERTSentimentScorer": "src.sentiment.finbert",
+    "ConfigurableSentimentAnalyzer": "src.sentiment.analyzer",
+}
 
 __all__ = ["FinBERTSentimentScorer", "ConfigurableSentimentAnalyzer"]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,15 +22,18 @@ class ConfigurableSentimentAnalyzer:
     - 'hybrid': Local scoring + LLM theme extraction
     """
 
-    def __init__(self, config: Optional[SentimentConfig] = None):
+    def __init__(self, config: Optional[SentimentConfig] = None, db_path: Optional[str] = None):
         """Initialize configurable sentiment analyzer.
 
         Args:
             config: Sentiment configuration. Uses defaults if not provided.
+            db_path: Database path for the per-article FinBERT score cache. Scores are not
+                cached if None or if local_model.cache_scores is disabled.
         """
         if config is None:
             config = SentimentConfig()
         self.config = config
+        self.db_path = db_path
 
         # Lazy-load scorers
         self._finbert_scorer = None
@@ -51,11 +54,23 @@ class ConfigurableSentimentAnalyzer:
             model_config = self.config.local_model
             device = model_config.device if model_config.device != "auto" else None
 
+            score_store = None
+            if self.db_path and model_config.cache_scores:
+                from src.data.repository import ArticleSentimentRepository
+
+                score_store = ArticleSentimentRepository(self.db_path)
+
             self._finbert_scorer = FinBERTSentimentScorer(
                 model_name=model_config.name,
                 device=device,
                 batch_size=model_config.batch_size,
                 max_length=model_config.max_length,
+                score_store=score_store,
+                num_threads=model_config.num_threads,
+                backend=model_config.backend,
+                onnx_dir=model_config.onnx_dir,
+                quantize=model_config.quantize,
+                parity_check=model_config.parity_check,
             )
             return self._finbert_scorer
         except ImportError:
@@ -96,6 +111,51 @@ class ConfigurableSentimentAnalyzer:
             logger.warning(f"Unknown scoring method: {method}, falling back to api")
             return self._analyze_api(articles)
 
+    def analyze_sentiment_batch(
+        self,
+        articles_by_key: dict[str, list[NewsArticle]],
+    ) -> dict[str, dict[str, Any]]:
+        """Analyze sentiment for articles of many tickers with a single FinBERT job.
+
+        Articles from all keys are scored together (see SentimentScoringQueue) and the
+        results are dispatched back per key. Falls back to per-key analyze_sentiment
+        if FinBERT is not available or batch scoring fails.
+
+        Args:
+            articles_by_key: Articles grouped by key (usually ticker symbol)
+
+        Returns:
+            Dictionary mapping each key to its result (same format as analyze_sentiment
+            with method='local')
+        """
+        articles_by_key = {key: articles for key, articles in articles_by_key.items() if articles}
+        scorer = self._get_finbert_scorer()
+
+        if scorer is not None and articles_by_key:
+            from src.sentiment.batch import SentimentScoringQueue
+
+            try:
+                queue = SentimentScoringQueue(scorer)
+                for key, articles in articles_by_key.items():
+                    queue.submit(key, articles)
+                queue.flush()
+
+                return {
+                    key: {
+                        "articles": [a.model_dump() for a in articles],
+                        "summary": scorer.get_aggregate_sentiment(articles),
+                        "method": "local_finbert",
+                    }
+                    for key, articles in articles_by_key.items()
+                }
+            except Exception as e:
+                logger.error(f"Batch sentiment scoring failed, scoring per ticker: {e}")
+
+        return {
+            key: self.analyze_sentiment(articles, method="local")
+            for key, articles in articles_by_key.items()
+        }
+
     def _analyze_local(self, articles: list[NewsArticle]) -> dict[str, Any]:
         """Analyze sentiment using local FinBERT model.
 
@@ -0,0 +1,72 @@
+"""Cross-ticker FinBERT scoring queue.
+
+Collects article texts from many tickers and scores them as a single inference job, so
+a run pays pipeline overhead once and batches are filled with texts of similar token
+length instead of a few small, padding-heavy batches per ticker.
+"""
+
+from collections.abc import Hashable
+
+from src.data.models import NewsArticle
+from src.sentiment.finbert import FinBERTSentimentScorer, SentimentScore, article_text
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SentimentScoringQueue:
+    """Queue of articles grouped by key (usually ticker), scored in one job on flush."""
+
+    def __init__(self, scorer: FinBERTSentimentScorer, include_title: bool = False):
+        """Initialize scoring queue.
+
+        Args:
+            scorer: FinBERT scorer that runs the inference.
+            include_title: If True, prepend title to summary for analysis.
+        """
+        self.scorer = scorer
+        self.include_title = include_title
+        self._pending: dict[Hashable, list[NewsArticle]] = {}
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued articles."""
+        return sum(len(articles) for articles in self._pending.values())
+
+    def submit(self, key: Hashable, articles: list[NewsArticle]) -> None:
+        """Queue articles for scoring.
+
+        Args:
+            key: Group key results are dispatched to (e.g., ticker symbol).
+            articles: Articles to score.
+        """
+        self._pending.setdefault(key, []).extend(articles)
+
+    def flush(self) -> dict[Hashable, list[SentimentScore]]:
+        """Score all queued articles in one job and update them in-place.
+
+        Returns:
+            Dictionary mapping each submitted key to its scores (same order as submitted).
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return {}
+
+        texts = [
+            article_text(article, self.include_title)
+            for articles in pending.values()
+            for article in articles
+        ]
+        logger.debug(f"Scoring {len(texts)} articles for {len(pending)} keys in one batch job")
+        scores = self.scorer.score_texts(texts)
+
+        results = {}
+        offset = 0
+        for key, articles in pending.items():
+            key_scores = scores[offset : offset + len(articles)]
+            offset += len(articles)
+            for article, score in zip(articles, key_scores, strict=True):
+                article.sentiment = score.sentiment
+                article.sentiment_score = score.score
+            results[key] = key_scores
+        return results
@@ -4,24 +4,83 @@ Provides zero-cost sentiment analysis using the ProsusAI/finbert model,
 with optional LLM fallback for theme extraction.
 """
 
+import hashlib
+import importlib.util
+import re
+import unicodedata
 from dataclasses import dataclass
-from typing import Any, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from src.data.models import NewsArticle
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from src.data.repository import ArticleSentimentRepository
+
 logger = get_logger(__name__)
 
-# Try to import transformers
-try:
-    from transformers import pipeline
+_WHITESPACE_RE = re.compile(r"\s+")
 
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+# transformers is imported on first model load (importing it takes seconds)
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+if not TRANSFORMERS_AVAILABLE:
     logger.info("transformers not installed, FinBERT scoring not available")
 
 
+def pipeline(*args: Any, **kwargs: Any) -> Any:
+    """Create a transformers pipeline, importing transformers on first use."""
+    from transformers import pipeline as transformers_pipeline
+
+    return transformers_pipeline(*args, **kwargs)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for score caching (Unicode NFKC, collapsed whitespace).
+
+    Args:
+        text: Raw article text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def sentiment_cache_key(model_name: str, text: str, backend: str = "transformers") -> str:
+    """Build the score cache key for a text scored by a model.
+
+    Scores differ slightly between inference backends (e.g. int8-quantized ONNX
+    versus fp32 torch), so each backend variant gets its own keys. Transformers keys
+    do not include the backend and match keys cached before backends existed.
+
+    Args:
+        model_name: Hugging Face model name
+        text: Article text (normalized before hashing)
+        backend: Backend variant, see FinBERTSentimentScorer.cache_backend
+
+    Returns:
+        SHA-256 hex digest of model name, backend variant and normalized text
+    """
+    prefix = model_name if backend == "transformers" else f"{model_name}\x00{backend}"
+    return hashlib.sha256(f"{prefix}\x00{normalize_text(text)}".encode()).hexdigest()
+
+
+def article_text(article: NewsArticle, include_title: bool = False) -> str:
+    """Get the text scored for an article.
+
+    Args:
+        article: News article
+        include_title: If True, prepend title to summary
+
+    Returns:
+        Summary (optionally with title), or title if the article has no summary
+    """
+    if article.summary:
+        return f"{article.title}. {article.summary}" if include_title else article.summary
+    return article.title
+
+
 @dataclass
 class SentimentScore:
     """Sentiment score for a single article."""
@@ -48,6 +107,12 @@ class FinBERTSentimentScorer:
         device: Optional[str] = None,
         batch_size: int = 32,
         max_length: int = 512,
+        score_store: Optional["ArticleSentimentRepository"] = None,
+        num_threads: Optional[int] = None,
+        backend: str = "transformers",
+        onnx_dir: str | Path = "data/models/onnx",
+        quantize: bool = True,
+        parity_check: bool = True,
     ):
         """Initialize FinBERT sentiment scorer.
 
@@ -56,6 +121,16 @@ class FinBERTSentimentScorer:
             device: Device to use ('cpu', 'cuda', 'mps', or device number). Auto-detected if None.
             batch_size: Batch size for processing multiple texts.
             max_length: Maximum token length for texts.
+            score_store: Optional persistent score cache. score_articles only sends texts
+                without a cached score to the model.
+            num_threads: Number of intra-op CPU threads (torch or onnxruntime). Uses the
+                library default if None.
+            backend: Inference backend, 'transformers' or 'onnx'. The ONNX backend runs on
+                CPU with onnxruntime and falls back to transformers if unavailable.
+            onnx_dir: Directory the ONNX export is cached in (one subdirectory per model).
+            quantize: If True, the ONNX backend uses a dynamically int8-quantized model.
+            parity_check: If True, the ONNX model is checked against the transformers
+                pipeline once after export and is not used if predictions diverge.
         """
         if not TRANSFORMERS_AVAILABLE:
             raise ImportError(
@@ -66,6 +141,12 @@ class FinBERTSentimentScorer:
         self.batch_size = batch_size
         self.max_length = max_length
         self.device = device  # None = auto-detect, or specific device
+        self.score_store = score_store
+        self.num_threads = num_threads
+        self.backend = backend
+        self.onnx_dir = Path(onnx_dir) / self.model_name.replace("/", "--")
+        self.quantize = quantize
+        self.parity_check = parity_check
 
         logger.debug(
             f"Initializing FinBERT scorer with model={self.model_name}, device={device or 'auto'}"
@@ -74,17 +155,53 @@ class FinBERTSentimentScorer:
         # Lazy-load pipeline
         self._pipeline = None
         self._loaded = False
+        self._active_backend: Optional[str] = None
+
+    @property
+    def cache_backend(self) -> str:
+        """Backend variant that score cache keys are built for.
+
+        Before the model is loaded this is the configured backend; afterwards it is the
+        one actually in use, which differs if the ONNX backend fell back to transformers.
+
+        Returns:
+            'transformers', 'onnx-int8' or 'onnx-fp32'
+        """
+        if (self._active_backend or self.backend) != "onnx":
+            return "transformers"
+        return "onnx-int8" if self.quantize else "onnx-fp32"
 
     def _ensure_loaded(self) -> None:
         """Lazy-load the pipeline."""
         if self._loaded:
             return
 
-        logger.debug(f"Loading FinBERT model: {self.model_name}")
+        logger.debug(f"Loading FinBERT model: {self.model_name} (backend={self.backend})")
+
+        if self.backend == "onnx":
+            self._pipeline = self._load_onnx_pipeline()
+            self._active_backend = "onnx" if self._pipeline is not None else None
+        if self._pipeline is None:
+            self._pipeline = self._build_transformers_pipeline()
+            self._active_backend = "transformers"
+
+        self._loaded = True
+        logger.debug("FinBERT pipeline loaded successfully")
+
+    def _build_transformers_pipeline(self):
+        """Build the transformers text-classification pipeline."""
+        if self.num_threads:
+            try:
+                import torch
+
+                torch.set_num_threads(self.num_threads)
+                logger.debug(f"Set torch CPU threads to {self.num_threads}")
+            except ImportError:
+                logger.debug("torch not installed, ignoring num_threads")
 
         # Create pipeline with device auto-detection
         device_arg = self.device if self.device is not None else -1  # -1 = CPU, >=0 = GPU
-        self._pipeline = pipeline(
+        return pipeline(
             "text-classification",
             model=self.model_name,
             device=device_arg,
@@ -92,8 +209,47 @@ class FinBERTSentimentScorer:
             max_length=self.max_length,
         )
 
-        self._loaded = True
-        logger.debug("FinBERT pipeline loaded successfully")
+    def _load_onnx_pipeline(self):
+        """Load the ONNX Runtime pipeline, exporting the model on first use.
+
+        Returns:
+            ONNXSentimentPipeline, or None if the backend is unavailable or the parity
+            check failed or could not run (the transformers pipeline is used instead)
+        """
+        try:
+            from src.sentiment import onnx_backend
+
+            onnx_backend.export_onnx_model(
+                self.model_name, self.onnx_dir, quantize=self.quantize, max_length=self.max_length
+            )
+            onnx_pipeline = onnx_backend.ONNXSentimentPipeline(
+                self.onnx_dir,
+                quantize=self.quantize,
+                max_length=self.max_length,
+                num_threads=self.num_threads,
+            )
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable, using transformers: {e}")
+            return None
+
+        if self.parity_check:
+            parity = onnx_backend.load_parity_result(self.onnx_dir)
+            if parity is None:
+                try:
+                    parity = onnx_backend.check_parity(
+                        self._build_transformers_pipeline(), onnx_pipeline, onnx_dir=self.onnx_dir
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not run ONNX parity check, using transformers: {e}")
+                    return None
+            if parity is not None and not parity["passed"]:
+                logger.warning(
+                    f"ONNX model in {self.onnx_dir} failed the parity check, using transformers"
+                )
+                return None
+
+        logger.info(f"Using ONNX Runtime backend for {self.model_name}")
+        return onnx_pipeline
 
     def score_text(self, text: str) -> SentimentScore:
         """Score sentiment for a single text.
@@ -127,6 +283,9 @@ class FinBERTSentimentScorer:
     ) -> list[SentimentScore]:
         """Score sentiment for multiple articles.
 
+        Identical texts are scored once. When a score store is configured, cached
+        scores are reused and only unseen texts are sent to the model.
+
         Args:
             articles: List of news articles to analyze
             include_title: If True, prepend title to summary for analysis
@@ -137,25 +296,95 @@ class FinBERTSentimentScorer:
         if not articles:
             return []
 
-        self._ensure_loaded()
+        return self.score_texts([article_text(article, include_title) for article in articles])
 
-        # Prepare texts
-        texts = []
-        for article in articles:
-            if article.summary:
-                text = f"{article.title}. {article.summary}" if include_title else article.summary
-            else:
-                text = article.title
-            texts.append(text)
+    def score_texts(self, texts: list[str]) -> list[SentimentScore]:
+        """Score sentiment for multiple texts.
 
-        # Process in batches
-        results = []
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-            batch_results = self._score_batch(batch_texts)
-            results.extend(batch_results)
+        Identical texts are scored once, and cached scores are reused when a score
+        store is configured. Remaining texts are sorted by token length before
+        batching so that each batch pads to a similar length.
 
-        return results
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of SentimentScore objects (same order as input)
+        """
+        if not texts:
+            return []
+
+        keys = [sentiment_cache_key(self.model_name, text, self.cache_backend) for text in texts]
+        scores_by_key: dict[str, SentimentScore] = {}
+        if self.score_store is not None:
+            for key, (sentiment, score) in self.score_store.get_scores(keys).items():
+                scores_by_key[key] = SentimentScore(
+                    sentiment=sentiment, score=score, confidence=score, raw_probs=None
+                )
+
+        # Unique texts without a cached score, in input order
+        pending = {key: text for key, text in zip(keys, texts, strict=True)}
+        pending = {key: text for key, text in pending.items() if key not in scores_by_key}
+
+        if pending:
+            self._ensure_loaded()
+
+            pending_keys = list(pending)
+            pending_texts = list(pending.values())
+            lengths = self._token_lengths(pending_texts)
+            order = sorted(range(len(pending_texts)), key=lengths.__getitem__)
+
+            # Process in length-sorted batches
+            new_scores: dict[str, SentimentScore] = {}
+            for i in range(0, len(order), self.batch_size):
+                batch = order[i : i + self.batch_size]
+                batch_results = self._score_batch([pending_texts[j] for j in batch])
+                new_scores.update(
+                    (pending_keys[j], result)
+                    for j, result in zip(batch, batch_results, strict=False)
+                )
+
+            scores_by_key.update(new_scores)
+            if self.score_store is not None:
+                # Keyed by the backend that produced the scores (after a fallback on load)
+                store_keys = {
+                    key: sentiment_cache_key(self.model_name, text, self.cache_backend)
+                    for key, text in pending.items()
+                }
+                self.score_store.store_scores(
+                    self.model_name,
+                    {
+                        store_keys[key]: (result.sentiment, result.score)
+                        for key, result in new_scores.items()
+                    },
+                )
+
+        logger.debug(
+            f"Scored {len(texts)} texts ({len(texts) - len(pending)} from cache or duplicates)"
+        )
+        return [scores_by_key[key] for key in keys]
+
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        """Get token counts for texts, used to group similar lengths into batches.
+
+        Args:
+            texts: Texts to measure
+
+        Returns:
+            Token count per text (whitespace word count if no tokenizer is available)
+        """
+        tokenizer = getattr(self._pipeline, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                input_ids = tokenizer(texts, truncation=True, max_length=self.max_length)[
+                    "input_ids"
+                ]
+                lengths = [len(ids) for ids in input_ids]
+                if len(lengths) == len(texts):
+                    return lengths
+            except Exception as e:
+                logger.debug(f"Tokenizer length lookup failed, using word counts: {e}")
+        return [len(text.split()) for text in texts]
 
     def _score_batch(self, texts: list[str]) -> list[SentimentScore]:
         """Score a batch of texts.
@@ -0,0 +1,322 @@
+"""ONNX Runtime backend for FinBERT scoring on CPU.
+
+Exports the FinBERT model to ONNX once, applies dynamic int8 quantization and runs it
+with onnxruntime's CPU execution provider. The exported model, tokenizer and label map
+are cached in a local directory, so later runs need neither torch nor a model download.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import onnxruntime
+try:
+    import onnxruntime as ort
+
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    logger.debug("onnxruntime not installed, ONNX FinBERT backend not available")
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+LABELS_FILE = "labels.json"
+PARITY_FILE = "parity.json"
+
+# Short financial sentences covering all three labels, used for the parity check
+PARITY_SAMPLE_TEXTS = [
+    "The company reported record quarterly revenue and raised its full-year guidance.",
+    "Shares plunged after the firm missed earnings estimates and cut its dividend.",
+    "The board will hold its annual general meeting in Stockholm on May 5.",
+    "Operating margin improved to 18% as cost savings offset weaker volumes.",
+    "The regulator opened an investigation into the bank's lending practices.",
+    "Net sales were flat compared with the same period last year.",
+    "Analysts upgraded the stock to buy, citing strong order intake.",
+    "The company warned of a significant loss due to impairment charges.",
+    "The new CEO will take office on January 1.",
+    "Free cash flow turned negative as inventories increased sharply.",
+]
+
+# A text counts as agreeing if both backends give the same label and scores are close
+DEFAULT_SCORE_TOLERANCE = 0.05
+DEFAULT_MIN_LABEL_AGREEMENT = 0.9
+
+
+def model_path(onnx_dir: str | Path, quantize: bool = True) -> Path:
+    """Get the path of the exported ONNX model file.
+
+    Args:
+        onnx_dir: Directory holding the exported model
+        quantize: If True, return the int8-quantized model path
+
+    Returns:
+        Path to the model file
+    """
+    return Path(onnx_dir) / (QUANTIZED_MODEL_FILE if quantize else MODEL_FILE)
+
+
+def export_onnx_model(
+    model_name: str,
+    onnx_dir: str | Path,
+    quantize: bool = True,
+    max_length: int = 512,
+) -> Path:
+    """Export a Hugging Face sequence classification model to ONNX.
+
+    Skips the export if the model file already exists. Requires torch and onnxruntime.
+
+    Args:
+        model_name: Hugging Face model name
+        onnx_dir: Directory to write model, tokenizer and label map to
+        quantize: If True, also write a dynamically int8-quantized model
+        max_length: Maximum token length (used for the dummy export input)
+
+    Returns:
+        Path to the model file to load (quantized if requested)
+    """
+    onnx_dir = Path(onnx_dir)
+    target = model_path(onnx_dir, quantize)
+    if target.exists():
+        return target
+
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    onnx_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Exporting {model_name} to ONNX in {onnx_dir}")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    dummy = tokenizer(
+        "Export sample text", return_tensors="pt", truncation=True, max_length=max_length
+    )
+    input_names = list(dummy.keys())
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    fp32_path = model_path(onnx_dir, quantize=False)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            dynamo=False,
+        )
+
+    tokenizer.save_pretrained(onnx_dir)
+    labels = {int(i): label.lower() for i, label in model.config.id2label.items()}
+    (onnx_dir / LABELS_FILE).write_text(json.dumps({"model_name": model_name, "labels": labels}))
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(str(fp32_path), str(target), weight_type=QuantType.QInt8)
+        logger.info(f"Quantized ONNX model written to {target}")
+
+    return target
+
+
+class ONNXSentimentPipeline:
+    """Text classification pipeline backed by an ONNX Runtime CPU session.
+
+    Callable like a transformers text-classification pipeline: takes a text or list of
+    texts and returns a list of {'label', 'score'} dicts with the top label per text.
+    """
+
+    def __init__(
+        self,
+        onnx_dir: str | Path,
+        quantize: bool = True,
+        max_length: int = 512,
+        num_threads: Optional[int] = None,
+    ):
+        """Load an exported ONNX model.
+
+        Args:
+            onnx_dir: Directory holding the exported model (see export_onnx_model)
+            quantize: If True, load the int8-quantized model
+            max_length: Maximum token length for texts
+            num_threads: Intra-op CPU threads. Uses the onnxruntime default if None.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ImportError(
+                "onnxruntime is required for the ONNX backend. Install with: uv sync --extra onnx"
+            )
+
+        from transformers import AutoTokenizer
+
+        onnx_dir = Path(onnx_dir)
+        path = model_path(onnx_dir, quantize)
+        if not path.exists():
+            raise FileNotFoundError(f"ONNX model not found: {path}")
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            str(path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+        self.max_length = max_length
+
+        label_data = json.loads((onnx_dir / LABELS_FILE).read_text())
+        self.labels = {int(i): label for i, label in label_data["labels"].items()}
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+    def __call__(self, texts: str | list[str]) -> list[dict[str, Any]]:
+        """Classify texts.
+
+        Args:
+            texts: Text or list of texts
+
+        Returns:
+            List of {'label': str, 'score': float} dicts (same order as input)
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return []
+
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self._input_names}
+        logits = self.session.run(["logits"], feeds)[0]
+
+        probs = softmax(logits)
+        best = probs.argmax(axis=1)
+        return [
+            {"label": self.labels[int(label)], "score": float(probs[i, label])}
+            for i, label in enumerate(best)
+        ]
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Row-wise softmax.
+
+    Args:
+        logits: 2D array of logits (texts x labels)
+
+    Returns:
+        2D array of probabilities
+    """
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def compare_predictions(
+    reference: list[dict[str, Any]],
+    candidate: list[dict[str, Any]],
+    score_tolerance: float = DEFAULT_SCORE_TOLERANCE,
+    min_label_agreement: float = DEFAULT_MIN_LABEL_AGREEMENT,
+) -> dict[str, Any]:
+    """Compare predictions of two backends for the same texts.
+
+    Args:
+        reference: Predictions of the reference (torch) pipeline
+        candidate: Predictions of the candidate (ONNX) pipeline
+        score_tolerance: Maximum score difference for agreeing labels
+        min_label_agreement: Minimum fraction of matching labels to pass
+
+    Returns:
+        Dictionary with sample count, label agreement, mean/max score difference
+        (over texts with matching labels) and whether the check passed
+    """
+    if len(reference) != len(candidate):
+        raise ValueError(
+            f"Prediction count mismatch: {len(reference)} reference, {len(candidate)} candidate"
+        )
+    if not reference:
+        return {
+            "samples": 0,
+            "label_agreement": 1.0,
+            "mean_score_diff": 0.0,
+            "max_score_diff": 0.0,
+            "passed": True,
+        }
+
+    matches = [r["label"] == c["label"] for r, c in zip(reference, candidate, strict=True)]
+    diffs = [
+        abs(r["score"] - c["score"])
+        for r, c, match in zip(reference, candidate, matches, strict=True)
+        if match
+    ]
+    agreement = sum(matches) / len(matches)
+    max_diff = max(diffs) if diffs else 0.0
+
+    return {
+        "samples": len(reference),
+        "label_agreement": round(agreement, 4),
+        "mean_score_diff": round(sum(diffs) / len(diffs), 4) if diffs else 0.0,
+        "max_score_diff": round(max_diff, 4),
+        "passed": agreement >= min_label_agreement and max_diff <= score_tolerance,
+    }
+
+
+def check_parity(
+    reference: Callable[[list[str]], list[dict[str, Any]]],
+    candidate: Callable[[list[str]], list[dict[str, Any]]],
+    texts: Optional[list[str]] = None,
+    onnx_dir: Optional[str | Path] = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Run an accuracy parity check between two pipelines.
+
+    Args:
+        reference: Reference pipeline (transformers/torch)
+        candidate: Candidate pipeline (ONNX)
+        texts: Texts to compare on. Defaults to PARITY_SAMPLE_TEXTS.
+        onnx_dir: If given, the result is written to parity.json in this directory
+        **kwargs: Tolerances passed to compare_predictions
+
+    Returns:
+        Parity result (see compare_predictions)
+    """
+    texts = texts or PARITY_SAMPLE_TEXTS
+    result = compare_predictions(reference(texts), candidate(texts), **kwargs)
+
+    log = logger.info if result["passed"] else logger.warning
+    log(
+        f"ONNX parity check: {result['label_agreement']:.0%} label agreement, "
+        f"max score diff {result['max_score_diff']:.4f} over {result['samples']} texts"
+    )
+
+    if onnx_dir is not None:
+        (Path(onnx_dir) / PARITY_FILE).write_text(json.dumps(result, indent=2))
+    return result
+
+
+def load_parity_result(onnx_dir: str | Path) -> Optional[dict[str, Any]]:
+    """Load the stored parity check result for an exported model.
+
+    Args:
+        onnx_dir: Directory holding the exported model
+
+    Returns:
+        Parity result, or None if no check was recorded
+    """
+    path = Path(onnx_dir) / PARITY_FILE
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug(f"Could not read parity result {path}: {e}")
+        return None
@@ -1,9 +1,18 @@
 """Custom CrewAI tools for agent tasks."""
 
-from src.tools.analysis import SentimentAnalyzerTool, TechnicalIndicatorTool
-from src.tools.base import BaseTool, ToolRegistry
-from src.tools.fetchers import NewsFetcherTool, PriceFetcherTool
-from src.tools.reporting import ReportGeneratorTool
+import importlib
+
+# Exports are imported on first access so that importing one tool module does not
+# load the dependencies of all the others.
+_EXPORTS = {
+    "BaseTool": "src.tools.base",
+    "ToolRegistry": "src.tools.base",
+    "PriceFetcherTool": "src.tools.fetchers",
+    "NewsFetcherTool": "src.tools.fetchers",
+    "TechnicalIndicatorTool": "src.tools.analysis",
+    "SentimentAnalyzerTool": "src.tools.analysis",
+    "ReportGeneratorTool": "src.tools.reporting",
+}
 
 __all__ = [
     "BaseTool",
@@ -14,3 +23,9 @@ __all__ = [
     "SentimentAnalyzerTool",
     "ReportGeneratorTool",
 ]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,9 +11,12 @@ from src.data.news_aggregator import NewsSourceConfig, UnifiedNewsAggregator
 from src.data.price_manager import PriceDataManager
 from src.data.provider_manager import ProviderManager
 from src.data.providers import DataProviderFactory
+from src.data.repository import NewsArticleRepository
 from src.sentiment.analyzer import ConfigurableSentimentAnalyzer
 from src.tools.base import BaseTool
 from src.utils.logging import get_logger
+from src.utils.profiling import profiled, record_provider_call, span
+from src.utils.resilience import run_concurrently
 
 logger = get_logger(__name__)
 
@@ -80,6 +83,7 @@ class PriceFetcherTool(BaseTool):
         self.historical_date = historical_date
         logger.debug(f"Historical date set to {historical_date} for PriceFetcherTool")
 
+    @profiled("data.prices")
     def run(
         self,
         ticker: str,
@@ -304,20 +308,21 @@ class PriceFetcherTool(BaseTool):
                 if period is None:
                     period = f"{days_back}d" if days_back else "730d"
                 logger.info(f"Fetching {ticker} prices with period={period}")
-                prices = self.provider.get_stock_prices(ticker, period=period)
+                record_provider_call(self.provider.name)
+                prices = self.provider.get_price_frame(ticker, period=period)
             else:
                 # Date-range fetch (updating existing data)
                 logger.info(f"Fetching {ticker} prices: {fetch_start} to {fetch_end}")
-                prices = self.provider.get_stock_prices(
+                record_provider_call(self.provider.name)
+                prices = self.provider.get_price_frame(
                     ticker,
                     datetime.combine(fetch_start, datetime.min.time()),
                     datetime.combine(fetch_end, datetime.max.time()),
                 )
 
-            if prices:
+            if not prices.empty:
                 # Store in unified CSV
-                price_dicts = [p.model_dump() for p in prices]
-                pm.store_prices(ticker, price_dicts, append=True)
+                pm.store_prices(ticker, prices, append=True)
                 logger.info(f"Stored {len(prices)} prices for {ticker} in unified CSV")
                 fetched_successfully = True
             else:
@@ -433,6 +438,7 @@ class PriceFetcherTool(BaseTool):
 
         # Fetch from provider using period
         logger.debug(f"Fetching prices for {ticker} (period={period})")
+        record_provider_call(self.provider.name)
         prices = self.provider.get_stock_prices(ticker, period=period)
 
         if not prices:
@@ -471,6 +477,7 @@ class PriceFetcherTool(BaseTool):
             if cached:
                 return cached
 
+            record_provider_call(self.provider.name)
             price = self.provider.get_latest_price(ticker)
             result = {
                 "ticker": ticker,
@@ -495,12 +502,32 @@ class FinancialDataFetcherTool(BaseTool):
     - Finnhub: analyst recommendations only
     """
 
-    def __init__(self, cache_manager: CacheManager | None = None, db_path: str | None = None):
+    # Per-source deadlines (seconds) for the concurrent fundamental fetch
+    SOURCE_TIMEOUTS = {
+        "company_info": 45.0,
+        "earnings_estimates": 45.0,
+        "analyst_data": 30.0,
+        "price_context": 20.0,
+        "yfinance_metrics": 30.0,
+    }
+
+    # Price context window, and the largest gap (calendar days) tolerated at either end
+    # of the window before falling back from the local price store to the provider
+    PRICE_CONTEXT_DAYS = 30
+    PRICE_STORE_MAX_GAP_DAYS = 4
+
+    def __init__(
+        self,
+        cache_manager: CacheManager | None = None,
+        db_path: str | None = None,
+        source_timeouts: dict[str, float] | None = None,
+    ):
         """Initialize financial data fetcher.
 
         Args:
             cache_manager: Optional cache manager for caching data
             db_path: Optional path to database for storing analyst ratings
+            source_timeouts: Optional per-source timeout overrides (see SOURCE_TIMEOUTS)
         """
         super().__init__(
             name="FinancialDataFetcher",
@@ -525,6 +552,7 @@ class FinancialDataFetcherTool(BaseTool):
         self.finnhub_provider = DataProviderFactory.create("finnhub")
         self.price_provider = DataProviderFactory.create("yahoo_finance")
         self.historical_date = None  # Track historical date for backtesting
+        self.source_timeouts = {**self.SOURCE_TIMEOUTS, **(source_timeouts or {})}
 
     def set_historical_date(self, historical_date):
         """Set historical date for backtesting.
@@ -535,6 +563,7 @@ class FinancialDataFetcherTool(BaseTool):
         self.historical_date = historical_date
         logger.debug(f"Historical date set to {historical_date} for FinancialDataFetcherTool")
 
+    @profiled("data.fundamentals")
     def run(self, ticker: str) -> dict[str, Any]:
         """Fetch fundamental data for ticker using Alpha Vantage (primary) + fallbacks.
 
@@ -566,66 +595,36 @@ class FinancialDataFetcherTool(BaseTool):
 
             logger.debug(f"Fetching enriched fundamental data for {ticker}")
 
-            # Fetch company overview (Alpha Vantage Premium)
-            company_info = None
-            try:
-                company_info = self.provider_manager.get_company_info(ticker)
-            except Exception as e:
-                logger.warning(f"Could not fetch company info for {ticker}: {e}")
-
-            # Fetch earnings estimates (Alpha Vantage Premium) with historical date
-            earnings_estimates = None
-            try:
-                if self.alpha_vantage_provider.is_available:
-                    earnings_estimates = self.alpha_vantage_provider.get_earnings_estimates(
-                        ticker, as_of_date=as_of_date
-                    )
-            except Exception as e:
-                logger.warning(f"Could not fetch earnings estimates for {ticker}: {e}")
+            # Independent sources are fetched concurrently, each with its own deadline.
+            # yfinance metrics are fetched alongside as the fallback for incomplete
+            # Alpha Vantage metrics, so the fallback does not add another round-trip.
+            results = run_concurrently(
+                {
+                    "company_info": lambda: self._fetch_company_info(ticker),
+                    "earnings_estimates": lambda: self._fetch_earnings_estimates(
+                        ticker, as_of_date
+                    ),
+                    "analyst_data": lambda: self._fetch_analyst_data(ticker, as_of_date),
+                    "price_context": lambda: self._get_price_context(ticker),
+                    "yfinance_metrics": lambda: self._get_yfinance_metrics(ticker),
+                },
+                timeouts=self.source_timeouts,
+            )
+            company_info = results["company_info"]
+            earnings_estimates = results["earnings_estimates"]
+            analyst_data = results["analyst_data"]
+            price_context = results["price_context"]
 
             # Note: News sentiment is handled by SentimentAgent and NewsFetcherTool
             # No need to duplicate it in fundamental data
 
-            # Fetch analyst recommendations (Finnhub only) + store in database
-            analyst_data = None
-            try:
-                if self.finnhub_provider.is_available:
-                    # Get recommendation trends dict for immediate use (with historical date)
-                    analyst_data = self.finnhub_provider.get_recommendation_trends(
-                        ticker, as_of_date=as_of_date
-                    )
-
-                    # Also fetch as AnalystRating object and store in database
-                    if analyst_data and self.provider_manager.repository:
-                        try:
-                            analyst_rating_obj = self.finnhub_provider.get_analyst_ratings(
-                                ticker, as_of_date=as_of_date
-                            )
-                            if analyst_rating_obj:
-                                stored = self.provider_manager.repository.store_ratings(
-                                    analyst_rating_obj, data_source="finnhub"
-                                )
-                                logger.debug(
-                                    f"Stored analyst ratings for {ticker} in database: {stored}"
-                                )
-                        except Exception as store_error:
-                            logger.warning(
-                                f"Could not store analyst ratings in database: {store_error}"
-                            )
-            except Exception as e:
-                logger.warning(f"Could not fetch analyst data for {ticker}: {e}")
-
-            # Fetch price context for momentum
-            price_context = self._get_price_context(ticker)
-
             # Extract metrics from Alpha Vantage company_info (primary) with yfinance fallback
             metrics = self._extract_metrics_from_company_info(company_info)
             if not self._has_valid_metrics(metrics):
                 logger.debug(
                     f"Alpha Vantage metrics incomplete for {ticker}, using yfinance fallback"
                 )
-                yfinance_metrics = self._get_yfinance_metrics(ticker)
-                metrics = self._merge_metrics(metrics, yfinance_metrics)
+                metrics = self._merge_metrics(metrics, results["yfinance_metrics"] or {})
 
             # Determine data availability
             available_sources = []
@@ -696,9 +695,99 @@ class FinancialDataFetcherTool(BaseTool):
                 "error": str(e),
             }
 
+    def _fetch_company_info(self, ticker: str) -> Optional[dict[str, Any]]:
+        """Fetch company overview (Alpha Vantage Premium).
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Company overview dictionary or None
+        """
+        with span("fundamentals.company_info", ticker):
+            try:
+                return self.provider_manager.get_company_info(ticker)
+            except Exception as e:
+                logger.warning(f"Could not fetch company info for {ticker}: {e}")
+                return None
+
+    def _fetch_earnings_estimates(
+        self, ticker: str, as_of_date: Optional[datetime]
+    ) -> Optional[dict[str, Any]]:
+        """Fetch earnings estimates (Alpha Vantage Premium).
+
+        Args:
+            ticker: Stock ticker symbol
+            as_of_date: Optional historical cutoff
+
+        Returns:
+            Earnings estimates dictionary or None
+        """
+        with span("fundamentals.earnings_estimates", ticker):
+            try:
+                if not self.alpha_vantage_provider.is_available:
+                    return None
+                record_provider_call(self.alpha_vantage_provider.name)
+                return self.alpha_vantage_provider.get_earnings_estimates(
+                    ticker, as_of_date=as_of_date
+                )
+            except Exception as e:
+                logger.warning(f"Could not fetch earnings estimates for {ticker}: {e}")
+                return None
+
+    def _fetch_analyst_data(
+        self, ticker: str, as_of_date: Optional[datetime]
+    ) -> Optional[dict[str, Any]]:
+        """Fetch analyst recommendation trends (Finnhub) and store ratings in the database.
+
+        Args:
+            ticker: Stock ticker symbol
+            as_of_date: Optional historical cutoff
+
+        Returns:
+            Recommendation trends dictionary or None
+        """
+        with span("fundamentals.analyst_data", ticker):
+            try:
+                if not self.finnhub_provider.is_available:
+                    return None
+
+                # Get recommendation trends dict for immediate use (with historical date)
+                record_provider_call(self.finnhub_provider.name)
+                analyst_data = self.finnhub_provider.get_recommendation_trends(
+                    ticker, as_of_date=as_of_date
+                )
+
+                # Also fetch as AnalystRating object and store in database
+                if analyst_data and self.provider_manager.repository:
+                    try:
+                        analyst_rating_obj = self.finnhub_provider.get_analyst_ratings(
+                            ticker, as_of_date=as_of_date
+                        )
+                        if analyst_rating_obj:
+                            stored = self.provider_manager.repository.store_ratings(
+                                analyst_rating_obj, data_source="finnhub"
+                            )
+                            logger.debug(
+                                f"Stored analyst ratings for {ticker} in database: {stored}"
+                            )
+                    except Exception as store_error:
+                        logger.warning(
+                            f"Could not store analyst ratings in database: {store_error}"
+                        )
+
+                return analyst_data
+            except Exception as e:
+                logger.warning(f"Could not fetch analyst data for {ticker}: {e}")
+                return None
+
     def _get_price_context(self, ticker: str) -> dict[str, Any]:
         """Get price momentum context from price data.
 
+        Uses the local price store sliced to the 30 days up to the analysis date
+        (historical date in backtests, otherwise today), and only calls the price
+        provider if the store does not cover that window.
+
         Args:
             ticker: Stock ticker symbol
 
@@ -706,15 +795,31 @@ class FinancialDataFetcherTool(BaseTool):
             Dictionary with change_percent and trend
         """
         try:
-            # Get last 30 days of price data using period parameter
-            prices = self.price_provider.get_stock_prices(ticker, period="30d")
+            as_of = self.historical_date or date.today()
+            window_start = as_of - timedelta(days=self.PRICE_CONTEXT_DAYS)
 
-            if len(prices) < 2:
+            closes = self._get_stored_closes(ticker, window_start, as_of)
+            if closes is None:
+                logger.debug(f"Price store gap for {ticker} up to {as_of}, using provider")
+                record_provider_call(self.price_provider.name)
+                if self.historical_date:
+                    prices = self.price_provider.get_stock_prices(
+                        ticker,
+                        start_date=datetime.combine(window_start, datetime.min.time()),
+                        end_date=datetime.combine(as_of, datetime.max.time()),
+                    )
+                else:
+                    prices = self.price_provider.get_stock_prices(
+                        ticker, period=f"{self.PRICE_CONTEXT_DAYS}d"
+                    )
+                closes = [p.close_price for p in prices]
+
+            if len(closes) < 2:
                 return {"change_percent": 0, "trend": "neutral"}
 
             # Calculate recent change
-            earliest_price = prices[0].close_price
-            latest_price = prices[-1].close_price
+            earliest_price = closes[0]
+            latest_price = closes[-1]
             change_percent = (
                 (latest_price - earliest_price) / earliest_price if earliest_price > 0 else 0
             )
@@ -728,13 +833,41 @@ class FinancialDataFetcherTool(BaseTool):
                 "change_percent": change_percent,
                 "trend": trend,
                 "latest_price": latest_price,
-                "period_days": 30,
+                "period_days": self.PRICE_CONTEXT_DAYS,
             }
 
         except Exception as e:
             logger.debug(f"Error getting price context for {ticker}: {e}")
             return {"change_percent": 0, "trend": "neutral"}
 
+    def _get_stored_closes(self, ticker: str, start: date, end: date) -> Optional[list[float]]:
+        """Get closing prices for a window from the local price store.
+
+        Args:
+            ticker: Stock ticker symbol
+            start: Window start date (inclusive)
+            end: Window end date (inclusive)
+
+        Returns:
+            Closing prices sorted by date, or None if the store does not cover the window
+        """
+        price_manager = self.cache_manager.price_manager
+        if not price_manager.has_data(ticker):
+            return None
+
+        df = price_manager.get_prices(ticker, start_date=start, end_date=end)
+        if len(df) < 2:
+            return None
+
+        # Weekends and holidays leave a few days without bars at either end
+        first_date, last_date = df["date"].iloc[0].date(), df["date"].iloc[-1].date()
+        if (first_date - start).days > self.PRICE_STORE_MAX_GAP_DAYS:
+            return None
+        if (end - last_date).days > self.PRICE_STORE_MAX_GAP_DAYS:
+            return None
+
+        return df["close"].astype(float).tolist()
+
     def _get_yfinance_metrics(self, ticker: str) -> dict[str, Any]:
         """Get fundamental metrics from yfinance.
 
@@ -983,6 +1116,7 @@ class NewsFetcherTool(BaseTool):
                     priority=source.priority,
                     enabled=source.enabled,
                     max_articles=source.max_articles,
+                    timeout_seconds=source.timeout_seconds,
                 )
                 for source in news_config.sources
             ]
@@ -992,6 +1126,10 @@ class NewsFetcherTool(BaseTool):
                 target_article_count=news_config.target_article_count,
                 max_age_days=news_config.max_age_days,
                 cache_manager=None,  # Disable internal caching; NewsFetcherTool handles it
+                concurrent=news_config.concurrent_sources,
+                stop_at_target=news_config.stop_at_target,
+                near_duplicate_threshold=news_config.near_duplicate_threshold,
+                article_store=self._create_article_store(config, news_config),
             )
             logger.debug(
                 f"Initialized UnifiedNewsAggregator with {len(sources)} sources, "
@@ -1013,6 +1151,28 @@ class NewsFetcherTool(BaseTool):
         # Lazy-load sentiment analyzer
         self._sentiment_analyzer = None
 
+        # Results of prefetch(), keyed by (ticker, historical_date)
+        self._prefetched: dict[tuple, dict[str, Any]] = {}
+
+    @staticmethod
+    def _create_article_store(config, news_config) -> Optional[NewsArticleRepository]:
+        """Create the persistent article store if enabled in config.
+
+        Args:
+            config: Application config
+            news_config: News configuration
+
+        Returns:
+            NewsArticleRepository, or None if disabled or unavailable
+        """
+        if not (news_config.persist_articles and config.database.enabled):
+            return None
+        try:
+            return NewsArticleRepository(config.database.db_path)
+        except Exception as e:
+            logger.warning(f"Could not initialize news article store: {e}")
+            return None
+
     @property
     def sentiment_analyzer(self):
         """Get or create sentiment analyzer (lazy initialization)."""
@@ -1020,7 +1180,10 @@ class NewsFetcherTool(BaseTool):
             try:
                 config = get_config()
                 sentiment_config = config.data.sentiment if config.data.sentiment else None
-                self._sentiment_analyzer = ConfigurableSentimentAnalyzer(sentiment_config)
+                db_path = config.database.db_path if config.database.enabled else None
+                self._sentiment_analyzer = ConfigurableSentimentAnalyzer(
+                    sentiment_config, db_path=db_path
+                )
             except Exception as e:
                 logger.warning(f"Could not initialize sentiment analyzer: {e}")
                 self._sentiment_analyzer = None
@@ -1035,6 +1198,7 @@ class NewsFetcherTool(BaseTool):
         self.historical_date = historical_date
         logger.debug(f"Historical date set to {historical_date} for NewsFetcherTool")
 
+    @profiled("data.news")
     def run(
         self,
         ticker: str,
@@ -1054,61 +1218,29 @@ class NewsFetcherTool(BaseTool):
             if limit is None:
                 limit = get_config().data.news.max_articles
 
-            # Convert historical_date to datetime if needed
-            as_of_date = None
-            if self.historical_date:
-                as_of_date = datetime.combine(self.historical_date, datetime.max.time())
-                logger.debug(f"Fetching news as of {self.historical_date} for {ticker}")
-
-            # Try to find existing cache with matching date range
-            # Check for news cache files matching this ticker and date
-            if self.historical_date:
-                # Look for cache files with date range that includes our historical date
-                # The cache manager doesn't support pattern matching, so we'll fetch and check
-                # the date range after retrieval
-                pass
-
-            # Check for existing cached news data
-            # First try simple key for current requests, then look for any recent news cache
-            simple_cache_key = f"news_sentiment:{ticker}"
-            news_prefix = f"news:{ticker}"  # Matches any TICKER_news*.json files
-
-            cached = self.cache_manager.get(simple_cache_key)
-            if cached and not self.historical_date:
-                logger.debug(f"Cache hit for {ticker} news (simple key)")
-                return cached
+            # Served from a cross-ticker prefetch (see prefetch)
+            prefetched = self._prefetched.pop((ticker, self.historical_date), None)
+            if prefetched is not None:
+                logger.debug(f"Using prefetched news for {ticker}")
+                return prefetched
 
-            # Try to find any existing news cache (news-finbert, news-sentiment, etc.)
-            cached = self.cache_manager.find_latest_by_prefix(news_prefix)
-            if cached and not self.historical_date:
-                logger.debug(f"Cache hit for {ticker} news (pattern match)")
+            cached = self._get_cached_news(ticker)
+            if cached:
                 return cached
 
-            # Fetch news from multiple sources using UnifiedNewsAggregator
-            logger.debug(f"Fetching news for {ticker} from multiple sources")
-            articles = self.news_aggregator.fetch_news(
-                ticker,
-                lookback_days=None,  # Will use max_age_days from config
-                as_of_date=as_of_date,
-            )
-
+            articles = self._fetch_articles(ticker)
             if not articles:
-                return {
-                    "ticker": ticker,
-                    "articles": [],
-                    "count": 0,
-                    "sentiment_summary": None,
-                    "scoring_method": "none",
-                }
+                return self._empty_news_result(ticker)
 
             # Apply local FinBERT sentiment scoring (more accurate than API sentiment)
             scoring_method = "api_provider"
             if self.use_local_sentiment and self.sentiment_analyzer:
                 try:
                     logger.debug(f"Applying FinBERT sentiment to {len(articles)} articles")
-                    sentiment_result = self.sentiment_analyzer.analyze_sentiment(
-                        articles, method="local"
-                    )
+                    with span("sentiment.finbert", ticker, articles=len(articles)):
+                        sentiment_result = self.sentiment_analyzer.analyze_sentiment(
+                            articles, method="local"
+                        )
                     scoring_method = sentiment_result.get("method", "local_finbert")
                     # Articles are updated in-place by the analyzer
                     logger.debug(f"Sentiment scoring complete using {scoring_method}")
@@ -1116,68 +1248,7 @@ class NewsFetcherTool(BaseTool):
                     logger.warning(f"Local sentiment scoring failed, using API scores: {e}")
                     scoring_method = "api_provider_fallback"
 
-            # Calculate date range from articles for cache key
-            cache_key = simple_cache_key  # Default
-            article_dates = []
-            for article in articles:
-                pub_date_str = article.published_date
-                if isinstance(pub_date_str, str):
-                    # Extract date portion (YYYY-MM-DD)
-                    date_part = (
-                        pub_date_str.split()[0] if " " in pub_date_str else pub_date_str[:10]
-                    )
-                    article_dates.append(date_part)
-                elif isinstance(pub_date_str, datetime):
-                    article_dates.append(pub_date_str.strftime("%Y-%m-%d"))
-
-            if article_dates:
-                min_date = min(article_dates)
-                max_date = max(article_dates)
-                cache_key = f"news_finbert:{ticker}:{min_date}:{max_date}"
-                logger.debug(f"News date range for {ticker}: {min_date} to {max_date}")
-
-            # Calculate sentiment summary from (now FinBERT-scored) articles
-            positive = sum(1 for a in articles if a.sentiment == "positive")
-            negative = sum(1 for a in articles if a.sentiment == "negative")
-            neutral = sum(1 for a in articles if a.sentiment == "neutral")
-            total = len(articles)
-
-            sentiment_scores = [
-                a.sentiment_score for a in articles if a.sentiment_score is not None
-            ]
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-
-            sentiment_summary = {
-                "total": total,
-                "positive": positive,
-                "negative": negative,
-                "neutral": neutral,
-                "positive_pct": round(100 * positive / total, 1) if total > 0 else 0,
-                "negative_pct": round(100 * negative / total, 1) if total > 0 else 0,
-                "avg_sentiment_score": round(avg_sentiment, 3),
-                "overall_sentiment": (
-                    "positive"
-                    if avg_sentiment > 0.1
-                    else "negative"
-                    if avg_sentiment < -0.1
-                    else "neutral"
-                ),
-                "scoring_method": scoring_method,
-            }
-
-            result = {
-                "ticker": ticker,
-                "articles": [a.model_dump() for a in articles],
-                "count": len(articles),
-                "sentiment_summary": sentiment_summary,
-                "scoring_method": scoring_method,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            # Cache news for 4 hours
-            self.cache_manager.set(cache_key, result, ttl_hours=4)
-
-            return result
+            return self._build_news_result(ticker, articles, scoring_method)
 
         except Exception as e:
             logger.error(f"Error fetching news for {ticker}: {e}")
@@ -1187,3 +1258,201 @@ class NewsFetcherTool(BaseTool):
                 "count": 0,
                 "error": str(e),
             }
+
+    @profiled("data.news_prefetch")
+    def prefetch(self, tickers: list[str]) -> int:
+        """Fetch news for many tickers and score all articles in one FinBERT job.
+
+        Per-ticker scoring produces a few small, padding-heavy batches per ticker; this
+        collects the articles of every ticker first and scores them together. Results
+        are kept in memory and returned by the next run() call for each ticker, until
+        the next prefetch or clear_prefetched().
+
+        Args:
+            tickers: Ticker symbols to prefetch
+
+        Returns:
+            Number of tickers prefetched (tickers served by the news cache are skipped)
+        """
+        # Only the current batch is kept; results left over from earlier batches
+        # belong to tickers that were never analyzed and would not be requested again
+        batch = {(ticker, self.historical_date) for ticker in tickers}
+        self._prefetched = {key: result for key, result in self._prefetched.items() if key in batch}
+
+        articles_by_ticker = {}
+        for ticker in tickers:
+            if (ticker, self.historical_date) in self._prefetched or self._get_cached_news(ticker):
+                continue
+            try:
+                articles_by_ticker[ticker] = self._fetch_articles(ticker)
+            except Exception as e:
+                logger.warning(f"Error prefetching news for {ticker}: {e}")
+
+        to_score = {ticker: articles for ticker, articles in articles_by_ticker.items() if articles}
+        methods = {}
+        if to_score and self.use_local_sentiment and self.sentiment_analyzer:
+            total = sum(len(articles) for articles in to_score.values())
+            logger.debug(f"Scoring {total} articles for {len(to_score)} tickers in one job")
+            try:
+                with span("sentiment.finbert_batch", tickers=len(to_score), articles=total):
+                    results = self.sentiment_analyzer.analyze_sentiment_batch(to_score)
+                methods = {ticker: result.get("method") for ticker, result in results.items()}
+            except Exception as e:
+                logger.warning(f"Batch sentiment scoring failed, using API scores: {e}")
+                methods = dict.fromkeys(to_score, "api_provider_fallback")
+
+        for ticker, articles in articles_by_ticker.items():
+            if articles:
+                result = self._build_news_result(
+                    ticker, articles, methods.get(ticker) or "api_provider"
+                )
+            else:
+                result = self._empty_news_result(ticker)
+            self._prefetched[(ticker, self.historical_date)] = result
+
+        return len(articles_by_ticker)
+
+    def clear_prefetched(self) -> None:
+        """Drop prefetched results that were not consumed by run().
+
+        Called at the end of an analysis run, so results for tickers that failed or
+        were filtered out before their sentiment step are not kept in memory.
+        """
+        if self._prefetched:
+            logger.debug(f"Dropping {len(self._prefetched)} unused prefetched news results")
+        self._prefetched.clear()
+
+    def _get_cached_news(self, ticker: str) -> dict[str, Any] | None:
+        """Get cached news result for ticker (never used for historical dates).
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Cached result or None
+        """
+        if self.historical_date:
+            return None
+
+        # First try simple key for current requests, then look for any recent news cache
+        cached = self.cache_manager.get(f"news_sentiment:{ticker}")
+        if cached:
+            logger.debug(f"Cache hit for {ticker} news (simple key)")
+            return cached
+
+        # Try to find any existing news cache (news-finbert, news-sentiment, etc.)
+        cached = self.cache_manager.find_latest_by_prefix(f"news:{ticker}")
+        if cached:
+            logger.debug(f"Cache hit for {ticker} news (pattern match)")
+            return cached
+
+        return None
+
+    def _fetch_articles(self, ticker: str) -> list:
+        """Fetch articles for ticker from all configured sources.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            List of NewsArticle objects (as of historical_date if set)
+        """
+        # Convert historical_date to datetime if needed
+        as_of_date = None
+        if self.historical_date:
+            as_of_date = datetime.combine(self.historical_date, datetime.max.time())
+            logger.debug(f"Fetching news as of {self.historical_date} for {ticker}")
+
+        # Fetch news from multiple sources using UnifiedNewsAggregator
+        logger.debug(f"Fetching news for {ticker} from multiple sources")
+        return self.news_aggregator.fetch_news(
+            ticker,
+            lookback_days=None,  # Will use max_age_days from config
+            as_of_date=as_of_date,
+        )
+
+    @staticmethod
+    def _empty_news_result(ticker: str) -> dict[str, Any]:
+        """Result for a ticker without news articles."""
+        return {
+            "ticker": ticker,
+            "articles": [],
+            "count": 0,
+            "sentiment_summary": None,
+            "scoring_method": "none",
+        }
+
+    def _build_news_result(
+        self,
+        ticker: str,
+        articles: list,
+        scoring_method: str,
+    ) -> dict[str, Any]:
+        """Summarize scored articles and cache the result.
+
+        Args:
+            ticker: Stock ticker symbol
+            articles: Articles with sentiment fields set
+            scoring_method: Method that produced the sentiment fields
+
+        Returns:
+            Dictionary with articles and sentiment summary
+        """
+        # Calculate date range from articles for cache key
+        cache_key = f"news_sentiment:{ticker}"  # Default
+        article_dates = []
+        for article in articles:
+            pub_date_str = article.published_date
+            if isinstance(pub_date_str, str):
+                # Extract date portion (YYYY-MM-DD)
+                date_part = pub_date_str.split()[0] if " " in pub_date_str else pub_date_str[:10]
+                article_dates.append(date_part)
+            elif isinstance(pub_date_str, datetime):
+                article_dates.append(pub_date_str.strftime("%Y-%m-%d"))
+
+        if article_dates:
+            min_date = min(article_dates)
+            max_date = max(article_dates)
+            cache_key = f"news_finbert:{ticker}:{min_date}:{max_date}"
+            logger.debug(f"News date range for {ticker}: {min_date} to {max_date}")
+
+        # Calculate sentiment summary from (now FinBERT-scored) articles
+        positive = sum(1 for a in articles if a.sentiment == "positive")
+        negative = sum(1 for a in articles if a.sentiment == "negative")
+        neutral = sum(1 for a in articles if a.sentiment == "neutral")
+        total = len(articles)
+
+        sentiment_scores = [a.sentiment_score for a in articles if a.sentiment_score is not None]
+        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+
+        sentiment_summary = {
+            "total": total,
+            "positive": positive,
+            "negative": negative,
+            "neutral": neutral,
+            "positive_pct": round(100 * positive / total, 1) if total > 0 else 0,
+            "negative_pct": round(100 * negative / total, 1) if total > 0 else 0,
+            "avg_sentiment_score": round(avg_sentiment, 3),
+            "overall_sentiment": (
+                "positive"
+                if avg_sentiment > 0.1
+                else "negative"
+                if avg_sentiment < -0.1
+                else "neutral"
+            ),
+            "scoring_method": scoring_method,
+        }
+
+        result = {
+            "ticker": ticker,
+            "articles": [a.model_dump() for a in articles],
+            "count": len(articles),
+            "sentiment_summary": sentiment_summary,
+            "scoring_method": scoring_method,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        # Cache news for 4 hours
+        self.cache_manager.set(cache_key, result, ttl_hours=4)
+
+        return result
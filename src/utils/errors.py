@@ -60,7 +60,7 @@ class RateLimitException(RetryableException):
             provider: Name of the provider that was rate limited
             **kwargs: Additional context
         """
-        context = kwargs.get("context", {})
+        context = kwargs.pop("context", {})
         if provider:
             context["provider"] = provider
         super().__init__(message, error_code="API_RATE_LIMIT", context=context, **kwargs)
@@ -0,0 +1,310 @@
+"""Lightweight run profiling for analysis runs.
+
+Provides a span/timer API that pipeline components use to record where an analysis run
+spends its time (filtering, price I/O, news, sentiment, LLM calls, DB writes, report
+rendering), plus counters for cache hits and provider calls. Spans are only recorded
+while a RunProfiler is active, so instrumented code costs next to nothing otherwise.
+
+Usage:
+    profiler = start_run_profile()
+    with span("filtering"):
+        ...
+    stop_run_profile()
+    summary = profiler.summary()
+    profiler.write_trace("data/profiles/run.json")
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_HITS = "cache.hits"
+CACHE_MISSES = "cache.misses"
+PROVIDER_CALLS_PREFIX = "provider_calls."
+
+
+class RunProfiler:
+    """Collects timing spans and counters for a single analysis run (thread-safe)."""
+
+    def __init__(self):
+        """Initialize an empty profiler and start the run clock."""
+        self.started_at = time.perf_counter()
+        self._spans: list[dict[str, Any]] = []
+        self._counters: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[dict[str, Any]]:
+        """Get the open span stack of the current thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, ticker: str | None = None, **attrs: Any) -> Iterator[None]:
+        """Time a block of code.
+
+        Args:
+            name: Phase name (e.g., 'filtering', 'llm.synthesis', 'db.store_recommendation').
+            ticker: Ticker the work belongs to. Inherited from the enclosing span if omitted.
+            **attrs: Extra attributes stored with the span (exported to the trace file).
+        """
+        stack = self._stack()
+        if ticker is None and stack:
+            ticker = stack[-1]["ticker"]
+        record = {
+            "name": name,
+            "ticker": ticker,
+            "depth": len(stack),
+            "thread": threading.get_ident(),
+            "start": time.perf_counter() - self.started_at,
+            "attrs": attrs,
+        }
+        stack.append(record)
+        try:
+            yield
+        finally:
+            stack.pop()
+            record["duration"] = time.perf_counter() - self.started_at - record["start"]
+            with self._lock:
+                self._spans.append(record)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a named counter.
+
+        Args:
+            counter: Counter name.
+            amount: Amount to add.
+        """
+        with self._lock:
+            self._counters[counter] += amount
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate recorded spans and counters.
+
+        Returns:
+            Dictionary with total_seconds, per-phase stats, per-ticker phase totals,
+            counters, cache hit rate and provider call counts (JSON-serializable).
+        """
+        with self._lock:
+            spans = list(self._spans)
+            counters = dict(self._counters)
+
+        phases: dict[str, dict[str, float]] = {}
+        tickers: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for record in spans:
+            stats = phases.setdefault(
+                record["name"], {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_seconds"] += record["duration"]
+            stats["max_seconds"] = max(stats["max_seconds"], record["duration"])
+            if record["ticker"]:
+                tickers[record["ticker"]][record["name"]] += record["duration"]
+
+        for stats in phases.values():
+            stats["avg_seconds"] = stats["total_seconds"] / stats["count"]
+
+        hits = counters.get(CACHE_HITS, 0)
+        misses = counters.get(CACHE_MISSES, 0)
+        provider_calls = {
+            name[len(PROVIDER_CALLS_PREFIX) :]: count
+            for name, count in counters.items()
+            if name.startswith(PROVIDER_CALLS_PREFIX)
+        }
+
+        return {
+            "total_seconds": time.perf_counter() - self.started_at,
+            "phases": dict(sorted(phases.items(), key=lambda item: -item[1]["total_seconds"])),
+            "tickers": {ticker: dict(values) for ticker, values in sorted(tickers.items())},
+            "counters": counters,
+            "cache_hit_rate": hits / (hits + misses) if hits + misses else None,
+            "provider_calls": provider_calls,
+        }
+
+    def to_chrome_trace(self) -> list[dict[str, Any]]:
+        """Export spans as Chrome trace 'complete' events.
+
+        Returns:
+            List of trace events (timestamps in microseconds), loadable in
+            chrome://tracing or Perfetto.
+        """
+        with self._lock:
+            spans = sorted(self._spans, key=lambda record: record["start"])
+
+        pid = os.getpid()
+        events = []
+        for record in spans:
+            args = {key: str(value) for key, value in record["attrs"].items()}
+            if record["ticker"]:
+                args["ticker"] = record["ticker"]
+            events.append(
+                {
+                    "name": record["name"],
+                    "cat": record["name"].split(".")[0],
+                    "ph": "X",
+                    "ts": round(record["start"] * 1_000_000),
+                    "dur": round(record["duration"] * 1_000_000),
+                    "pid": pid,
+                    "tid": record["thread"],
+                    "args": args,
+                }
+            )
+        return events
+
+    def write_trace(self, path: str | Path) -> Path:
+        """Write the profile to a JSON file.
+
+        The file uses Chrome's JSON object trace format ('traceEvents') with the run
+        summary stored alongside, so it can be both read directly and opened in a
+        trace viewer.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            Path of the written file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": self.to_chrome_trace(),
+                    "displayTimeUnit": "ms",
+                    "summary": self.summary(),
+                },
+                f,
+                indent=2,
+            )
+        logger.debug(f"Run profile written to {path}")
+        return path
+
+
+# Profiler of the run in progress (None when profiling is inactive)
+_active_profiler: RunProfiler | None = None
+
+
+def start_run_profile() -> RunProfiler:
+    """Start profiling a run, replacing any active profiler.
+
+    Returns:
+        The new active RunProfiler.
+    """
+    global _active_profiler
+    _active_profiler = RunProfiler()
+    return _active_profiler
+
+
+def stop_run_profile() -> RunProfiler | None:
+    """Stop profiling.
+
+    Returns:
+        The profiler that was active, if any.
+    """
+    global _active_profiler
+    profiler, _active_profiler = _active_profiler, None
+    return profiler
+
+
+def get_profiler() -> RunProfiler | None:
+    """Get the active profiler.
+
+    Returns:
+        Active RunProfiler or None.
+    """
+    return _active_profiler
+
+
+@contextmanager
+def span(name: str, ticker: str | None = None, **attrs: Any) -> Iterator[None]:
+    """Time a block of code on the active profiler (no-op when inactive).
+
+    Args:
+        name: Phase name.
+        ticker: Optional ticker the work belongs to.
+        **attrs: Extra span attributes.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name, ticker, **attrs):
+        yield
+
+
+def profiled(name: str, ticker_arg: str = "ticker") -> Callable:
+    """Decorate a function so each call is recorded as a span.
+
+    Args:
+        name: Phase name.
+        ticker_arg: Name of the parameter holding the ticker, if the function has one.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        params = list(inspect.signature(func).parameters)
+        ticker_index = params.index(ticker_arg) if ticker_arg in params else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+
+            ticker = kwargs.get(ticker_arg)
+            if ticker is None and ticker_index is not None and ticker_index < len(args):
+                ticker = args[ticker_index]
+            # Accept objects carrying a ticker (e.g., UnifiedAnalysisResult, InvestmentSignal)
+            ticker = getattr(ticker, "ticker", ticker)
+            with profiler.span(name, ticker if isinstance(ticker, str) else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def increment(counter: str, amount: int = 1) -> None:
+    """Increment a counter on the active profiler (no-op when inactive).
+
+    Args:
+        counter: Counter name.
+        amount: Amount to add.
+    """
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.increment(counter, amount)
+
+
+def record_cache_access(hit: bool) -> None:
+    """Count a cache lookup as a hit or miss.
+
+    Args:
+        hit: Whether the lookup was served from cache.
+    """
+    increment(CACHE_HITS if hit else CACHE_MISSES)
+
+
+def record_provider_call(provider_name: str) -> None:
+    """Count a call to an external data provider.
+
+    Args:
+        provider_name: Provider name (e.g., 'yahoo_finance').
+    """
+    increment(f"{PROVIDER_CALLS_PREFIX}{provider_name}")
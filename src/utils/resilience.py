@@ -1,6 +1,12 @@
 """Resilience patterns for error handling, retries, and fallbacks."""
 
+import asyncio
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -107,9 +113,16 @@ def fallback(
 
 
 class RateLimiter:
-    """Simple rate limiter with token bucket algorithm."""
+    """Thread-safe token bucket rate limiter.
 
-    def __init__(self, rate: int, period: float = 1.0):
+    Blocking callers reserve their tokens up front: the reservation is deducted at once
+    (the balance may go negative) and the caller sleeps exactly until the bucket has
+    refilled past it. Later callers queue behind the debt, so waiters are served in
+    arrival order without polling. wait_if_needed() serves threads and wait_async()
+    asyncio tasks; both draw from the same bucket.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
         """Initialize rate limiter.
 
         Args:
@@ -119,12 +132,13 @@ class RateLimiter:
         self.rate = rate
         self.period = period
         self.tokens = rate
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
 
         logger.debug(f"Rate limiter initialized: {rate} ops per {period}s")
 
     def acquire(self, tokens: int = 1) -> bool:
-        """Attempt to acquire tokens.
+        """Attempt to acquire tokens without waiting.
 
         Args:
             tokens: Number of tokens to acquire
@@ -132,13 +146,28 @@ class RateLimiter:
         Returns:
             True if tokens acquired, False if rate limited
         """
-        self._refill()
+        with self._lock:
+            self._refill()
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
 
-        return False
+            return False
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Reserve tokens, queueing behind earlier reservations.
+
+        Args:
+            tokens: Number of tokens to reserve
+
+        Returns:
+            Seconds to wait before the reserved tokens may be used
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            return max(0.0, -self.tokens * self.period / self.rate)
 
     def wait_if_needed(self, tokens: int = 1) -> None:
         """Wait until tokens are available.
@@ -146,18 +175,247 @@ class RateLimiter:
         Args:
             tokens: Number of tokens needed
         """
-        while not self.acquire(tokens):
-            time.sleep(0.1)
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, tokens: int = 1) -> None:
+        """Wait until tokens are available without blocking the event loop.
+
+        Args:
+            tokens: Number of tokens needed
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Grant no tokens for the given time (e.g., a server's Retry-After).
+
+        Args:
+            seconds: Pause duration in seconds
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0) - seconds * self.rate / self.period
 
     def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = time.time()
+        """Refill tokens based on elapsed time (caller holds the lock)."""
+        now = time.monotonic()
         elapsed = now - self.last_update
         refill_amount = (elapsed / self.period) * self.rate
         self.tokens = min(self.rate, self.tokens + refill_amount)
         self.last_update = now
 
 
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that adapts its rate to observed throttling (AIMD).
+
+    The configured rate is the ceiling (the provider's documented quota). Each throttled
+    response multiplies the rate by decrease_factor and pauses for the server's
+    Retry-After; each successful call adds increase / rate, so the rate climbs back by
+    about `increase` operations per period once a full period of calls succeeds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        min_rate: float | None = None,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize adaptive rate limiter.
+
+        Args:
+            rate: Maximum operations per period
+            period: Time period in seconds
+            min_rate: Lowest rate throttling may reduce to (default: rate / 10)
+            increase: Operations per period added back per period of successful calls
+            decrease_factor: Factor applied to the rate on throttling
+        """
+        super().__init__(rate, period)
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+    def record_success(self) -> None:
+        """Additively increase the rate after a call that was not throttled."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicatively decrease the rate and pause after a throttled call.
+
+        Args:
+            retry_after: Server-requested wait in seconds (default: one token interval)
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            new_rate = self.rate
+        self.pause(retry_after if retry_after is not None else self.period / new_rate)
+        logger.warning(
+            f"Throttled; rate reduced to {new_rate:.2f} ops per {self.period}s"
+            + (f", pausing {retry_after:.1f}s" if retry_after else "")
+        )
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker with half-open probing.
+
+    After failure_threshold consecutive failures the circuit opens and calls are
+    refused. Once recovery_timeout has passed, one probe call is let through (half-open):
+    success closes the circuit, failure opens it again. A probe that never reports back
+    frees its slot after another recovery_timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self._state = CircuitState.CLOSED
+        self._open_until = 0.0
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit past its timeout reports half-open)."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and time.monotonic() >= self._open_until:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be made, claiming the probe slot when half-open.
+
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                if now < self._open_until:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started = None
+
+            if self._probe_started is None or now - self._probe_started >= self.recovery_timeout:
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info("Circuit closed after successful probe")
+            self.failures = 0
+            self._state = CircuitState.CLOSED
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self._state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._open(self.recovery_timeout)
+
+    def trip(self, seconds: float | None = None) -> None:
+        """Open the circuit immediately (e.g., the server asked us to back off).
+
+        Args:
+            seconds: How long to stay open (default: recovery_timeout)
+        """
+        with self._lock:
+            self._open(seconds if seconds is not None else self.recovery_timeout)
+
+    def _open(self, seconds: float) -> None:
+        """Open the circuit for the given time (caller holds the lock)."""
+        self._state = CircuitState.OPEN
+        self._open_until = time.monotonic() + seconds
+        self._probe_started = None
+        logger.warning(f"Circuit opened for {seconds:.0f}s after {self.failures} failures")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse an HTTP Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Documented request budgets per provider: (requests, period in seconds)
+PROVIDER_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "alpha_vantage": (5, 60.0),
+    "finnhub": (60, 60.0),
+}
+
+_provider_rate_limiters: dict[str, AdaptiveRateLimiter] = {}
+_provider_rate_limiters_lock = threading.Lock()
+
+
+def get_provider_rate_limiter(provider: str) -> AdaptiveRateLimiter | None:
+    """Get the process-wide rate limiter for a provider.
+
+    All clients of a provider share one limiter, so concurrent fetchers together stay
+    within the provider's budget.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        Shared AdaptiveRateLimiter, or None if the provider has no configured budget
+    """
+    with _provider_rate_limiters_lock:
+        limiter = _provider_rate_limiters.get(provider)
+        if limiter is None and provider in PROVIDER_RATE_LIMITS:
+            rate, period = PROVIDER_RATE_LIMITS[provider]
+            limiter = AdaptiveRateLimiter(rate, period)
+            _provider_rate_limiters[provider] = limiter
+        return limiter
+
+
+def reset_provider_rate_limiters() -> None:
+    """Discard shared provider rate limiters (e.g., after changing PROVIDER_RATE_LIMITS)."""
+    with _provider_rate_limiters_lock:
+        _provider_rate_limiters.clear()
+
+
 def timeout(seconds: float) -> Callable[[F], F]:
     """Decorator for operation timeout (basic implementation).
 
@@ -189,3 +447,56 @@ def timeout(seconds: float) -> Callable[[F], F]:
         return wrapper  # type: ignore
 
     return decorator
+
+
+def run_concurrently(
+    tasks: dict[str, Callable[[], Any]],
+    timeouts: dict[str, float] | None = None,
+    default_timeout: float = 30.0,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run independent tasks in parallel threads with per-task deadlines.
+
+    Deadlines are measured from the start of the call, so total latency is bounded by
+    the longest deadline rather than the sum of task latencies. A task that raises or
+    misses its deadline yields None; a timed-out task keeps running in its thread but
+    its result is discarded.
+
+    Args:
+        tasks: Mapping of task name to zero-argument callable
+        timeouts: Optional per-task timeouts in seconds
+        default_timeout: Timeout for tasks not in timeouts
+        max_workers: Maximum worker threads (default: one per task)
+
+    Returns:
+        Mapping of task name to result (None on error or timeout), in task order
+    """
+    if not tasks:
+        return {}
+
+    timeouts = timeouts or {}
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or len(tasks), thread_name_prefix="run_concurrently"
+    )
+    start = time.monotonic()
+    futures = {name: executor.submit(task) for name, task in tasks.items()}
+    results: dict[str, Any] = {}
+
+    try:
+        # Collect in deadline order so a short deadline is never checked late
+        for name in sorted(futures, key=lambda n: timeouts.get(n, default_timeout)):
+            task_timeout = timeouts.get(name, default_timeout)
+            remaining = max(start + task_timeout - time.monotonic(), 0)
+            try:
+                results[name] = futures[name].result(timeout=remaining)
+            except TimeoutError:
+                futures[name].cancel()
+                logger.warning(f"Task {name} timed out after {task_timeout}s")
+                results[name] = None
+            except Exception as e:
+                logger.warning(f"Task {name} failed: {e}")
+                results[name] = None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {name: results[name] for name in tasks}
@@ -1,8 +1,17 @@
 """Website content generator for static site publishing.
 
 Generates markdown pages from analysis data for MkDocs static site.
+
+Publishing is incremental: the generator remembers the newest recommendation
+(created_at watermark) and a content hash per page in a state file in the output
+directory. Only pages for tickers, dates and signal types with new recommendations
+are regenerated, and a page is written only when its content changed.
 """
 
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +22,13 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Publish state (watermark and page hashes), kept next to the generated pages.
+# MkDocs ignores dot files.
+PUBLISH_STATE_FILE = ".publish_state.json"
+
+# Threads writing pages in parallel
+WRITE_WORKERS = 8
+
 
 class WebsiteGenerator:
     """Generates static website content from analysis data."""
@@ -33,8 +49,97 @@ class WebsiteGenerator:
         self.recommendations_repo = RecommendationsRepository(db_path)
         self.sessions_repo = RunSessionRepository(db_path)
 
+        # Incremental publishing state
+        self._page_hashes, self.watermark = self._load_publish_state()
+        self.pages_written = 0
+        self.pages_unchanged = 0
+        self._state_lock = threading.Lock()
+
         logger.info(f"WebsiteGenerator initialized. Output: {self.output_dir}")
 
+    def get_changes(self, full: bool = False) -> dict:
+        """Get tickers, dates and signal types with recommendations since the last publish.
+
+        Args:
+            full: Ignore the watermark and return every value (full rebuild)
+
+        Returns:
+            Dict with 'tickers', 'dates' and 'signal_types' sets and the new 'watermark'
+            (see RecommendationsRepository.get_changes_since)
+        """
+        since = None if full else self.watermark
+        changes = self.recommendations_repo.get_changes_since(since)
+        logger.info(
+            f"Changes since {since or 'beginning'}: {len(changes['tickers'])} tickers, "
+            f"{len(changes['dates'])} dates, {len(changes['signal_types'])} signal types"
+        )
+        return changes
+
+    def save_publish_state(self, watermark: datetime | None = None) -> Path:
+        """Save the watermark and page hashes after a successful publish.
+
+        Args:
+            watermark: Newest recommendation created_at covered by this publish
+                (keeps the previous watermark if None)
+
+        Returns:
+            Path to the state file
+        """
+        if watermark is not None:
+            self.watermark = watermark
+        state = {
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "pages": dict(sorted(self._page_hashes.items())),
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        state_path = self.output_dir / PUBLISH_STATE_FILE
+        state_path.write_text(json.dumps(state, indent=2))
+        logger.debug(
+            f"Saved publish state: {self.pages_written} pages written, "
+            f"{self.pages_unchanged} unchanged"
+        )
+        return state_path
+
+    def _load_publish_state(self) -> tuple[dict[str, str], datetime | None]:
+        """Load page hashes and watermark from the state file, if present."""
+        state_path = self.output_dir / PUBLISH_STATE_FILE
+        if not state_path.exists():
+            return {}, None
+        try:
+            state = json.loads(state_path.read_text())
+            watermark = state.get("watermark")
+            return state.get("pages", {}), datetime.fromisoformat(watermark) if watermark else None
+        except (ValueError, OSError) as e:
+            logger.warning(f"Ignoring unreadable publish state {state_path}: {e}")
+            return {}, None
+
+    def _write_page(self, file_path: Path, content: str) -> bool:
+        """Write a page unless the file already has this content.
+
+        Args:
+            file_path: Page path inside the output directory
+            content: Page content
+
+        Returns:
+            True if the file was written
+        """
+        key = file_path.relative_to(self.output_dir).as_posix()
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        with self._state_lock:
+            unchanged = self._page_hashes.get(key) == digest
+        if unchanged and file_path.exists():
+            with self._state_lock:
+                self.pages_unchanged += 1
+            return False
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+        with self._state_lock:
+            self._page_hashes[key] = digest
+            self.pages_written += 1
+        return True
+
     def generate_report_page(
         self,
         signals: list[InvestmentSignal],
@@ -199,8 +304,7 @@ class WebsiteGenerator:
         report_dir.mkdir(parents=True, exist_ok=True)
 
         file_path = report_dir / f"{report_date}.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines) + "\n")
+        self._write_page(file_path, "\n".join(lines) + "\n")
 
         logger.info(f"Generated report page: {file_path}")
         return file_path
@@ -448,23 +552,59 @@ class WebsiteGenerator:
 
         return lines
 
-    def generate_ticker_page(self, ticker: str) -> Path:
+    def generate_ticker_page(self, ticker: str, recommendations: list | None = None) -> Path:
         """Generate ticker-specific page with all signals/analysis.
 
         Args:
             ticker: Ticker symbol
+            recommendations: The ticker's recommendation summaries, newest first
+                (loaded from the database if not given)
 
         Returns:
             Path to generated markdown file
         """
-        # Get all recommendations for this ticker
-        all_recs = self.recommendations_repo.get_recommendations_by_ticker(ticker)
+        if recommendations is None:
+            recommendations = self.recommendations_repo.get_recommendation_summaries([ticker])
 
-        if not all_recs:
+        if not recommendations:
             logger.warning(f"No recommendations found for ticker: {ticker}")
             return None
 
-        # Build markdown content
+        file_path = self.output_dir / "tickers" / f"{ticker}.md"
+        self._write_page(file_path, self._render_ticker_page(ticker, recommendations))
+
+        logger.info(f"Generated ticker page: {file_path}")
+        return file_path
+
+    def generate_ticker_pages(self, tickers: list[str]) -> dict[str, Path]:
+        """Generate pages for several tickers from one query.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Dictionary mapping ticker to generated file path (tickers without
+            recommendations are skipped)
+        """
+        groups = self._group_recommendations(
+            self.recommendations_repo.get_recommendation_summaries(tickers)
+        )["tickers"]
+
+        pages = {
+            ticker: (
+                self.output_dir / "tickers" / f"{ticker}.md",
+                self._render_ticker_page(ticker, groups[ticker]),
+            )
+            for ticker in tickers
+            if ticker in groups
+        }
+        self._write_pages(dict(pages.values()))
+
+        logger.info(f"Generated {len(pages)} ticker pages")
+        return {ticker: path for ticker, (path, _) in pages.items()}
+
+    def _render_ticker_page(self, ticker: str, recommendations: list) -> str:
+        """Render ticker page content from recommendation summaries (newest first)."""
         lines = [
             "---",
             "tags:",
@@ -479,15 +619,12 @@ class WebsiteGenerator:
             "|------|---------------|------------|-------|---------------|",
         ]
 
-        # Sort by date (most recent first)
-        sorted_recs = sorted(all_recs, key=lambda x: x.get("analysis_date", ""), reverse=True)
-
-        for rec in sorted_recs[:20]:  # Show last 20 signals
-            date = rec.get("analysis_date", "N/A")
-            recommendation = rec.get("recommendation", "unknown").replace("_", " ").title()
-            confidence = rec.get("confidence", 0)
-            price = rec.get("current_price", 0)
-            mode = rec.get("analysis_mode", "unknown").replace("_", "-").title()
+        for rec in recommendations[:20]:  # Show last 20 signals
+            date = rec.analysis_date.isoformat() if rec.analysis_date else "N/A"
+            recommendation = (rec.signal_type or "unknown").replace("_", " ").title()
+            confidence = rec.confidence or 0
+            price = rec.current_price or 0
+            mode = (rec.analysis_mode or "unknown").replace("_", "-").title()
 
             lines.append(f"| {date} | {recommendation} | {confidence}% | ${price:.2f} | {mode} |")
 
@@ -496,7 +633,7 @@ class WebsiteGenerator:
                 "",
                 "## Analysis Details",
                 "",
-                f"Total signals recorded: {len(all_recs)}",
+                f"Total signals recorded: {len(recommendations)}",
                 "",
                 "---",
                 "",
@@ -505,16 +642,7 @@ class WebsiteGenerator:
             ]
         )
 
-        # Write to file
-        ticker_dir = self.output_dir / "tickers"
-        ticker_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path = ticker_dir / f"{ticker}.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines))
-
-        logger.info(f"Generated ticker page: {file_path}")
-        return file_path
+        return "\n".join(lines)
 
     def generate_index_page(self, recent_reports: list[dict] | None = None) -> Path:
         """Generate homepage with recent reports.
@@ -574,13 +702,12 @@ class WebsiteGenerator:
 
         # Write to file
         file_path = self.output_dir / "index.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines))
+        self._write_page(file_path, "\n".join(lines))
 
         logger.info(f"Updated index page: {file_path}")
         return file_path
 
-    def generate_tag_pages(self) -> dict[str, Path]:
+    def generate_tag_pages(self, changes: dict | None = None) -> dict[str, Path]:
         """Generate tag index pages for filtering content.
 
         Creates pages for:
@@ -588,6 +715,13 @@ class WebsiteGenerator:
         - Signal type tags (e.g., tags/buy.md, tags/strong_buy.md)
         - Date tags (e.g., tags/2025-12-10.md)
 
+        All recommendations are loaded in one query and grouped in memory; pages are
+        written in parallel.
+
+        Args:
+            changes: Only regenerate tags in these 'tickers', 'signal_types' and 'dates'
+                sets (see get_changes); None regenerates every tag
+
         Returns:
             Dictionary mapping tag name to generated file path
         """
@@ -596,63 +730,79 @@ class WebsiteGenerator:
         tag_dir = self.output_dir / "tags"
         tag_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_tags = {}
-
-        # Get all recommendations from database
-        from sqlmodel import Session, select
-
-        from src.data.models import Recommendation, Ticker
-
-        with Session(self.recommendations_repo.db_manager.engine) as session:
-            # Get all unique tickers
-            tickers_stmt = select(Ticker.symbol).distinct()
-            tickers = session.exec(tickers_stmt).all()
+        groups = self._group_recommendations(
+            self.recommendations_repo.get_recommendation_summaries()
+        )
 
-            for ticker_symbol in tickers:
-                tag_path = self._generate_ticker_tag_page(ticker_symbol, session)
-                generated_tags[ticker_symbol] = tag_path
+        if changes is not None:
+            tickers = sorted(changes["tickers"])
+            signal_types = sorted(changes["signal_types"])
+            dates = sorted(changes["dates"])
+        else:
+            # Every known ticker gets a page, with or without recommendations
+            from sqlmodel import Session, select
+
+            from src.data.models import Ticker
+
+            with Session(self.recommendations_repo.db_manager.engine) as session:
+                tickers = session.exec(select(Ticker.symbol).distinct()).all()
+            signal_types = list(groups["signal_types"])
+            dates = list(groups["dates"])
+
+        pages = {}
+        for ticker in tickers:
+            pages[ticker] = self._render_ticker_tag_page(ticker, groups["tickers"].get(ticker, []))
+        for signal_type in signal_types:
+            if signal_type:  # Skip null values
+                pages[signal_type] = self._render_signal_type_tag_page(
+                    signal_type, groups["signal_types"].get(signal_type, [])
+                )
+        for date_str in dates:
+            pages[date_str] = self._render_date_tag_page(
+                date_str, groups["dates"].get(date_str, [])
+            )
 
-            # Get all unique recommendation types
-            rec_types_stmt = select(Recommendation.signal_type).distinct()
-            rec_types = session.exec(rec_types_stmt).all()
+        generated_tags = {tag: tag_dir / f"{tag}.md" for tag in pages}
+        self._write_pages({generated_tags[tag]: content for tag, content in pages.items()})
 
-            for rec_type in rec_types:
-                if rec_type:  # Skip null values
-                    tag_path = self._generate_signal_type_tag_page(rec_type, session)
-                    generated_tags[rec_type] = tag_path
+        logger.info(f"Generated {len(generated_tags)} tag pages")
+        return generated_tags
 
-            # Get all unique dates
-            dates_stmt = select(Recommendation.analysis_date).distinct()
-            dates = session.exec(dates_stmt).all()
+    @staticmethod
+    def _group_recommendations(recommendations: list) -> dict[str, dict[str, list]]:
+        """Partition recommendation summaries by ticker, signal type and date.
 
-            for analysis_date in dates:
-                if analysis_date:
-                    date_str = (
-                        analysis_date.strftime("%Y-%m-%d")
-                        if hasattr(analysis_date, "strftime")
-                        else str(analysis_date)
-                    )
-                    tag_path = self._generate_date_tag_page(date_str, session)
-                    generated_tags[date_str] = tag_path
+        Args:
+            recommendations: Summaries sorted newest analysis date first, then by ticker
+                (see RecommendationsRepository.get_recommendation_summaries)
 
-        logger.info(f"Generated {len(generated_tags)} tag pages")
-        return generated_tags
+        Returns:
+            Dict with 'tickers', 'signal_types' and 'dates' (ISO string) groups; each
+            group keeps the input order
+        """
+        groups = {"tickers": {}, "signal_types": {}, "dates": {}}
+        for rec in recommendations:
+            groups["tickers"].setdefault(rec.ticker, []).append(rec)
+            groups["signal_types"].setdefault(rec.signal_type, []).append(rec)
+            groups["dates"].setdefault(rec.analysis_date.isoformat(), []).append(rec)
+        return groups
 
-    def _generate_ticker_tag_page(self, ticker: str, session) -> Path:
-        """Generate tag page for a specific ticker."""
-        from sqlmodel import select
+    def _write_pages(self, pages: dict[Path, str]) -> None:
+        """Write pages in parallel, skipping unchanged ones.
 
-        from src.data.models import Recommendation, Ticker
+        Args:
+            pages: Mapping of file path to content
+        """
+        if len(pages) <= 1:
+            for file_path, content in pages.items():
+                self._write_page(file_path, content)
+            return
 
-        # Get all recommendations for this ticker
-        stmt = (
-            select(Recommendation)
-            .join(Ticker)
-            .where(Ticker.symbol == ticker)
-            .order_by(Recommendation.analysis_date.desc())
-        )
-        recommendations = session.exec(stmt).all()
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="website") as pool:
+            list(pool.map(lambda page: self._write_page(*page), pages.items()))
 
+    def _render_ticker_tag_page(self, ticker: str, recommendations: list) -> str:
+        """Render tag page for a specific ticker (recommendations newest first)."""
         lines = [
             f"# {ticker} - All Analysis",
             "",
@@ -685,40 +835,21 @@ class WebsiteGenerator:
             ]
         )
 
-        file_path = self.output_dir / "tags" / f"{ticker}.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines))
-
-        return file_path
+        return "\n".join(lines)
 
-    def _generate_signal_type_tag_page(self, signal_type: str, session) -> Path:
-        """Generate tag page for a specific signal type (buy, sell, etc)."""
-        from sqlmodel import select
-
-        from src.data.models import Recommendation, Ticker
-
-        # Get all recommendations of this type
-        stmt = (
-            select(Recommendation, Ticker)
-            .join(Ticker)
-            .where(Recommendation.signal_type == signal_type)
-            .order_by(Recommendation.analysis_date.desc())
-        )
-        results = session.exec(stmt).all()
-
-        # Group by ticker
+    def _render_signal_type_tag_page(self, signal_type: str, recommendations: list) -> str:
+        """Render tag page for a specific signal type (buy, sell, etc)."""
+        # Group by ticker (newest first within each ticker)
         ticker_groups = {}
-        for rec, ticker in results:
-            if ticker.symbol not in ticker_groups:
-                ticker_groups[ticker.symbol] = []
-            ticker_groups[ticker.symbol].append(rec)
+        for rec in recommendations:
+            ticker_groups.setdefault(rec.ticker, []).append(rec)
 
         lines = [
             f"# {signal_type.upper()} Signals",
             "",
             f"All **{signal_type}** recommendations across all tickers.",
             "",
-            f"Total signals: {len(results)}",
+            f"Total signals: {len(recommendations)}",
             f"Unique tickers: {len(ticker_groups)}",
             "",
             "## By Ticker",
@@ -739,40 +870,21 @@ class WebsiteGenerator:
                 ]
             )
 
-        file_path = self.output_dir / "tags" / f"{signal_type}.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines))
-
-        return file_path
-
-    def _generate_date_tag_page(self, date_str: str, session) -> Path:
-        """Generate tag page for a specific analysis date."""
-        from sqlmodel import select
-
-        from src.data.models import Recommendation, Ticker
-
-        # Get all recommendations for this date
-        stmt = (
-            select(Recommendation, Ticker)
-            .join(Ticker)
-            .where(Recommendation.analysis_date == date_str)
-            .order_by(Ticker.symbol)
-        )
-        results = session.exec(stmt).all()
+        return "\n".join(lines)
 
+    def _render_date_tag_page(self, date_str: str, recommendations: list) -> str:
+        """Render tag page for a specific analysis date (recommendations sorted by ticker)."""
         # Group by recommendation type
         type_groups = {}
-        for rec, ticker in results:
-            if rec.signal_type not in type_groups:
-                type_groups[rec.signal_type] = []
-            type_groups[rec.signal_type].append((ticker.symbol, rec))
+        for rec in recommendations:
+            type_groups.setdefault(rec.signal_type, []).append(rec)
 
         lines = [
             f"# Analysis - {date_str}",
             "",
             f"All analysis signals from **{date_str}**.",
             "",
-            f"Total signals: {len(results)}",
+            f"Total signals: {len(recommendations)}",
             "",
             "## Summary by Signal Type",
             "",
@@ -783,11 +895,11 @@ class WebsiteGenerator:
             lines.append(f"### {sig_type.upper()} ({len(items)})")
             lines.append("")
 
-            for ticker_symbol, rec in items:
+            for rec in items:
                 lines.append(
-                    f"- **{ticker_symbol}**: {rec.confidence}% confidence, "
+                    f"- **{rec.ticker}**: {rec.confidence}% confidence, "
                     f"${rec.current_price:.2f} "
-                    f"([details](../tickers/{ticker_symbol}.md))"
+                    f"([details](../tickers/{rec.ticker}.md))"
                 )
 
             lines.append("")
@@ -801,11 +913,7 @@ class WebsiteGenerator:
             ]
         )
 
-        file_path = self.output_dir / "tags" / f"{date_str}.md"
-        with open(file_path, "w") as f:
-            f.write("\n".join(lines))
-
-        return file_path
+        return "\n".join(lines)
 
     def generate_section_indexes(self):
         """Generate index pages for Reports, Tickers, and Tags sections."""
@@ -851,8 +959,7 @@ class WebsiteGenerator:
             )
 
         index_path = reports_dir / "index.md"
-        with open(index_path, "w") as f:
-            f.write("\n".join(lines))
+        self._write_page(index_path, "\n".join(lines))
 
     def _generate_tickers_index(self):
         """Generate index page for Tickers section."""
@@ -891,8 +998,7 @@ class WebsiteGenerator:
             )
 
         index_path = tickers_dir / "index.md"
-        with open(index_path, "w") as f:
-            f.write("\n".join(lines))
+        self._write_page(index_path, "\n".join(lines))
 
     def _generate_tags_index(self):
         """Generate index page for Tags section."""
@@ -970,39 +1076,18 @@ class WebsiteGenerator:
             )
 
         index_path = tags_dir / "index.md"
-        with open(index_path, "w") as f:
-            f.write("\n".join(lines))
+        self._write_page(index_path, "\n".join(lines))
 
     def update_navigation(self):
         """Update .pages files for navigation."""
         # Generate section index pages first
         self.generate_section_indexes()
 
-        # Create reports/.pages
-        reports_pages = self.output_dir / "reports" / ".pages"
-        reports_pages.parent.mkdir(parents=True, exist_ok=True)
-        with open(reports_pages, "w") as f:
-            f.write("title: Reports\n")
-            f.write("nav:\n")
-            f.write("  - index.md\n")
-            f.write("  - ...\n")  # Auto-discover all markdown files
-
-        # Create tickers/.pages
-        tickers_pages = self.output_dir / "tickers" / ".pages"
-        tickers_pages.parent.mkdir(parents=True, exist_ok=True)
-        with open(tickers_pages, "w") as f:
-            f.write("title: Tickers\n")
-            f.write("nav:\n")
-            f.write("  - index.md\n")
-            f.write("  - ...\n")
-
-        # Create tags/.pages
-        tags_pages = self.output_dir / "tags" / ".pages"
-        tags_pages.parent.mkdir(parents=True, exist_ok=True)
-        with open(tags_pages, "w") as f:
-            f.write("title: Tags\n")
-            f.write("nav:\n")
-            f.write("  - index.md\n")
-            f.write("  - ...\n")
+        # Create .pages for each section; "..." auto-discovers all markdown files
+        for section, title in [("reports", "Reports"), ("tickers", "Tickers"), ("tags", "Tags")]:
+            self._write_page(
+                self.output_dir / section / ".pages",
+                f"title: {title}\nnav:\n  - index.md\n  - ...\n",
+            )
 
         logger.info("Updated navigation files")
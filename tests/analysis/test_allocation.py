@@ -325,3 +325,135 @@ class TestAllocationEngine:
 
         # Sell signals should result in zero or negative allocation
         assert allocation.total_allocated == 0
+
+    def test_market_concentration_limits(self):
+        """Test that greedy allocation respects market concentration limits."""
+        engine = AllocationEngine(
+            total_capital=100000,
+            monthly_deposit=500,
+            max_sector_concentration_pct=100.0,
+            max_market_concentration_pct=5.0,
+        )
+        signals = make_signals(20)
+        allocation = engine.allocate_signals(signals)
+
+        market_totals = position_totals(signals, allocation, "market")
+        assert market_totals
+        assert all(total <= 5000 + 0.01 for total in market_totals.values())
+
+    def test_invalid_method(self):
+        """Test that an unknown allocation method is rejected."""
+        with pytest.raises(ValueError, match="Unknown allocation method"):
+            AllocationEngine(total_capital=10000, monthly_deposit=500, method="random")
+
+
+def make_signals(count: int) -> list[dict]:
+    """Create buy signals spread over sectors and markets."""
+    sectors = ["Technology", "Healthcare", "Financials", "Energy", "Industrials"]
+    markets = ["us", "eu", "nordic"]
+    return [
+        {
+            "ticker": f"T{i:03d}",
+            "market": markets[i % len(markets)],
+            "sector": sectors[i % len(sectors)],
+            "current_price": 50.0 + i,
+            "confidence": 55 + (i * 7) % 40,
+            "final_score": 60 + (i * 3) % 30,
+            "recommendation": "buy",
+            "expected_return_min": 2.0 + i % 5,
+            "expected_return_max": 10.0 + (i * 11) % 20,
+        }
+        for i in range(count)
+    ]
+
+
+def position_totals(signals: list[dict], allocation, key: str) -> dict[str, float]:
+    """Sum allocated EUR by a signal field."""
+    values = {signal["ticker"]: signal[key] for signal in signals}
+    totals: dict[str, float] = {}
+    for position in allocation.suggested_positions:
+        totals[values[position.ticker]] = totals.get(values[position.ticker], 0) + position.eur
+    return totals
+
+
+@pytest.mark.unit
+class TestAllocationOptimizer:
+    """Test the optimize allocation method."""
+
+    def test_matches_kelly_sizes_when_limits_are_slack(self):
+        """Test that every position gets its Kelly size when no limit binds."""
+        signals = make_signals(3)
+        greedy = AllocationEngine(total_capital=100000, monthly_deposit=500)
+        optimized = AllocationEngine(total_capital=100000, monthly_deposit=500, method="optimize")
+
+        greedy_sizes = {
+            p.ticker: p.eur for p in greedy.allocate_signals(signals).suggested_positions
+        }
+        optimized_sizes = {
+            p.ticker: p.eur for p in optimized.allocate_signals(signals).suggested_positions
+        }
+
+        assert optimized_sizes.keys() == greedy_sizes.keys()
+        for ticker, eur in greedy_sizes.items():
+            assert optimized_sizes[ticker] == pytest.approx(eur, abs=0.01)
+
+    def test_respects_all_limits(self):
+        """Test position, sector, market and capital limits on many signals."""
+        signals = make_signals(300)
+        engine = AllocationEngine(
+            total_capital=50000,
+            monthly_deposit=500,
+            max_position_size_pct=5.0,
+            max_sector_concentration_pct=15.0,
+            max_market_concentration_pct=30.0,
+            method="optimize",
+        )
+        allocation = engine.allocate_signals(signals)
+
+        assert allocation.suggested_positions
+        assert all(50 <= p.eur <= 2500 + 0.01 for p in allocation.suggested_positions)
+        assert all(
+            total <= 7500 + 0.05
+            for total in position_totals(signals, allocation, "sector").values()
+        )
+        assert all(
+            total <= 15000 + 0.05
+            for total in position_totals(signals, allocation, "market").values()
+        )
+        assert allocation.total_allocated <= 50000 * 0.95 + 0.05
+
+    def test_stronger_signals_keep_more(self):
+        """Test that a binding limit cuts higher-edge positions back less."""
+        signals = make_signals(30)
+        engine = AllocationEngine(
+            total_capital=20000,
+            monthly_deposit=500,
+            max_sector_concentration_pct=5.0,
+            method="optimize",
+        )
+        allocation = engine.allocate_signals(signals)
+        sizes = {p.ticker: p.eur for p in allocation.suggested_positions}
+
+        technology = [s for s in signals if s["sector"] == "Technology" and s["ticker"] in sizes]
+        technology.sort(key=engine._kelly_position_size)
+        shortfall = [engine._kelly_position_size(s) - sizes[s["ticker"]] for s in technology]
+        assert sum(sizes[s["ticker"]] for s in technology) == pytest.approx(1000, abs=0.05)
+        assert shortfall == sorted(shortfall, reverse=True)
+
+    def test_existing_positions_reduce_capital(self):
+        """Test that the optimizer only allocates capital not already invested."""
+        engine = AllocationEngine(total_capital=10000, monthly_deposit=500, method="optimize")
+        allocation = engine.allocate_signals(
+            make_signals(50), existing_positions={"OLD": {"value": 8000}}
+        )
+
+        assert allocation.total_allocated <= 2000 * 0.95 + 0.05
+
+    def test_no_eligible_signals(self):
+        """Test that low-confidence signals leave everything unallocated."""
+        signals = [dict(s, confidence=40) for s in make_signals(5)]
+        engine = AllocationEngine(total_capital=10000, monthly_deposit=500, method="optimize")
+        allocation = engine.allocate_signals(signals)
+
+        assert allocation.suggested_positions == []
+        assert allocation.total_allocated == 0
@@ -0,0 +1,157 @@
+"""Tests for the multi-date backtest runner."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.backtest import FILTER_FIELD_MAPPING, BacktestRunner
+from src.config.loader import load_config
+from src.config.schemas import TechnicalIndicatorsConfig
+from src.data.price_manager import PriceDataManager
+from src.filtering.strategies import FilterStrategy
+
+
+def make_history(ticker: str, start: str = "2023-01-02", periods: int = 400) -> pd.DataFrame:
+    """Create a business-day price history in PriceDataManager columns."""
+    rng = np.random.default_rng(sum(map(ord, ticker)))
+    close = 100 * np.cumprod(1 + rng.normal(0.001, 0.02, periods))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range(start, periods=periods),
+            "open": close * (1 + rng.normal(0, 0.01, periods)),
+            "high": close * 1.02,
+            "low": close * 0.98,
+            "close": close,
+            "volume": rng.integers(100_000, 500_000, periods),
+            "adj_close": close,
+            "currency": "USD",
+            "ticker": ticker,
+            "name": f"{ticker} Inc.",
+            "market": "us",
+            "instrument_type": "stock",
+        }
+    )
+
+
+@pytest.fixture
+def config():
+    """Create a configuration with a short warm-up requirement."""
+    config = load_config()
+    analysis = config.analysis.model_copy(
+        update={"technical_indicators": TechnicalIndicatorsConfig(min_periods_required=30)}
+    )
+    return config.model_copy(update={"analysis": analysis})
+
+
+@pytest.fixture
+def price_manager():
+    """Create a PriceDataManager with stored history for two tickers."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = PriceDataManager(prices_dir=Path(tmpdir))
+        for ticker in ("AAA", "BBB"):
+            manager.store_prices(ticker, make_history(ticker), append=False)
+        yield manager
+
+
+class TestBacktestRunner:
+    """Test suite for BacktestRunner."""
+
+    def test_signal_per_ticker_and_trading_day(self, config, price_manager):
+        """Test that every trading day in range gets a signal per ticker."""
+        runner = BacktestRunner(config, strategy="all", price_manager=price_manager)
+
+        result = runner.run(["AAA", "BBB", "MISSING"], date(2024, 1, 1), date(2024, 1, 31))
+
+        assert result.trading_days == 23
+        assert len(result.signals) == 46
+        assert result.skipped == {"MISSING": "No price data"}
+        assert [s.analysis_date for s in result.signals[:2]] == ["2024-01-01", "2024-01-01"]
+        assert [s.ticker for s in result.signals[:2]] == ["AAA", "BBB"]
+        assert result.signals[-1].analysis_date == "2024-01-31"
+
+    def test_no_future_data(self, config, price_manager):
+        """Test that a signal does not change when later bars are removed."""
+        runner = BacktestRunner(config, strategy="all", price_manager=price_manager)
+        full = runner.run(["AAA"], date(2024, 1, 1), date(2024, 3, 29)).signals
+
+        truncated = make_history("AAA")
+        truncated = truncated[truncated["date"] <= "2024-02-15"]
+        price_manager.store_prices("AAA", truncated, append=False)
+        cut = runner.run(["AAA"], date(2024, 1, 1), date(2024, 3, 29)).signals
+
+        expected = next(s for s in full if s.analysis_date == "2024-02-15")
+        assert cut[-1].analysis_date == "2024-02-15"
+        assert cut[-1].current_price == expected.current_price
+        assert cut[-1].final_score == expected.final_score
+        assert cut[-1].metadata == expected.metadata
+
+    def test_filter_strategy_applied_per_day(self, config, price_manager):
+        """Test that only ticker-days passing the strategy produce signals."""
+
+        class OddDayStrategy(FilterStrategy):
+            name = "odd"
+            description = "Odd calendar days"
+
+            def filter(self, ticker, prices):
+                return prices[-1]["date"].day % 2 == 1, [f"Window {len(prices)} bars"]
+
+        runner = BacktestRunner(config, strategy=OddDayStrategy(), price_manager=price_manager)
+
+        result = runner.run(["AAA"], date(2024, 1, 1), date(2024, 1, 12))
+
+        assert result.evaluated == 10
+        assert result.filtered == 5
+        assert [s.analysis_date for s in result.signals] == [
+            "2024-01-01",
+            "2024-01-03",
+            "2024-01-05",
+            "2024-01-09",
+            "2024-01-11",
+        ]
+        assert result.signals[0].key_reasons == ["Window 60 bars"]
+
+    def test_vectorized_filter_matches_per_day_filter(self, config, price_manager):
+        """Test that days selected with filter_series() are those filter() accepts."""
+        runner = BacktestRunner(
+            config,
+            strategy="anomaly",
+            strategy_config={"daily_change_threshold": 2.0},
+            price_manager=price_manager,
+        )
+
+        result = runner.run(["AAA"], date(2024, 1, 1), date(2024, 6, 28))
+
+        history = price_manager.get_prices("AAA").rename(columns=FILTER_FIELD_MAPPING)
+        records = history.to_dict("records")
+        expected = [
+            record["date"].strftime("%Y-%m-%d")
+            for i, record in enumerate(records)
+            if record["date"] >= pd.Timestamp("2024-01-01")
+            and record["date"] <= pd.Timestamp("2024-06-28")
+            and runner.strategy.filter("AAA", records[: i + 1])[0]
+        ]
+        assert expected
+        assert [s.analysis_date for s in result.signals] == expected
+
+    def test_missing_history_fetched_once(self, config, price_manager):
+        """Test that history not covering the range is fetched and stored."""
+        provider_manager = MagicMock()
+        provider_manager.get_price_frame.return_value = make_history("NEW")
+        runner = BacktestRunner(
+            config,
+            strategy="all",
+            price_manager=price_manager,
+            provider_manager=provider_manager,
+        )
+
+        result = runner.run(["NEW", "AAA"], date(2024, 1, 1), date(2024, 1, 5))
+
+        provider_manager.get_price_frame.assert_called_once()
+        assert provider_manager.get_price_frame.call_args.args == ("NEW",)
+        assert price_manager.has_data("NEW")
+        assert {s.ticker for s in result.signals} == {"AAA", "NEW"}
@@ -0,0 +1,182 @@
+"""Tests for covariance-based portfolio risk."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.allocation import AllocationEngine
+from src.analysis.portfolio_risk import PortfolioRiskEngine, PortfolioRiskModel, ledoit_wolf
+from src.data.price_manager import PriceDataManager
+
+AS_OF = date(2024, 12, 31)
+
+
+def make_prices(ticker: str, returns: np.ndarray) -> pd.DataFrame:
+    """Create a price frame for business days ending at AS_OF from daily log returns."""
+    dates = pd.bdate_range(end=AS_OF, periods=len(returns))
+    close = 100 * np.exp(np.cumsum(returns))
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "adj_close": close,
+            "volume": 1000,
+            "ticker": ticker,
+        }
+    )
+
+
+@pytest.fixture
+def price_manager():
+    """Create a price store with two correlated tech tickers and one independent ticker."""
+    rng = np.random.default_rng(42)
+    market = rng.normal(0, 0.01, 250)
+    series = {
+        "AAA": market + rng.normal(0, 0.002, 250),
+        "BBB": market + rng.normal(0, 0.002, 250),
+        "CCC": rng.normal(0, 0.01, 250),
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pm = PriceDataManager(prices_dir=Path(tmpdir))
+        for ticker, returns in series.items():
+            pm.store_prices(ticker, make_prices(ticker, returns), append=False)
+        yield pm
+
+
+@pytest.mark.unit
+class TestLedoitWolf:
+    """Test the shrinkage covariance estimate."""
+
+    def test_shrinkage_in_unit_interval(self):
+        """Test that noisy estimates are shrunk more than well-determined ones."""
+        rng = np.random.default_rng(0)
+        few = ledoit_wolf(rng.normal(size=(40, 30)))[1]
+        many = ledoit_wolf(
+            rng.normal(size=(4000, 3)) @ np.array([[1, 0.8, 0], [0, 0.6, 0], [0, 0, 1]])
+        )[1]
+
+        assert 0 <= many < few <= 1
+
+    def test_covariance_is_symmetric_positive_definite(self):
+        """Test that the estimate is usable with more tickers than observations."""
+        covariance, _ = ledoit_wolf(np.random.default_rng(1).normal(size=(20, 50)))
+
+        np.testing.assert_allclose(covariance, covariance.T)
+        assert np.linalg.eigvalsh(covariance).min() > 0
+
+
+@pytest.mark.unit
+class TestPortfolioRiskModel:
+    """Test risk measures derived from a model."""
+
+    @pytest.fixture
+    def model(self, price_manager):
+        """Build a model over the fixture tickers."""
+        return PortfolioRiskEngine(price_manager).get_model(["AAA", "BBB", "CCC"], AS_OF)
+
+    def test_correlation_clusters(self, model):
+        """Test that correlated tickers share a cluster."""
+        assert model.correlation_clusters() == [("AAA", "BBB"), ("CCC",)]
+        assert model.correlation_clusters(threshold=1.01) == [("AAA",), ("BBB",), ("CCC",)]
+
+    def test_marginal_var_sums_to_portfolio_var(self, model):
+        """Test that position contributions add up to the portfolio VaR."""
+        weights = {"AAA": 1000.0, "BBB": 500.0, "CCC": 2000.0}
+        marginal = model.marginal_var(weights)
+
+        contributions = sum(weights[t] * marginal[t] for t in weights)
+        assert contributions == pytest.approx(model.value_at_risk(weights))
+        assert model.value_at_risk(weights) > 0
+
+    def test_diversification_prefers_uncorrelated_positions(self, model):
+        """Test that spreading over clusters scores higher than doubling up."""
+        correlated = {"AAA": 1000.0, "BBB": 1000.0}
+        uncorrelated = {"AAA": 1000.0, "CCC": 1000.0}
+
+        assert model.diversification_score(correlated) == 0
+        assert model.diversification_score(uncorrelated) == pytest.approx(50)
+        assert model.diversification_ratio(uncorrelated) > model.diversification_ratio(correlated)
+
+    def test_unknown_tickers_ignored(self, model):
+        """Test that positions outside the model do not count."""
+        assert model.value_at_risk({"ZZZ": 1000.0}) == 0
+        assert model.diversification_score({"ZZZ": 1000.0}) == 0
+
+
+@pytest.mark.unit
+class TestPortfolioRiskEngine:
+    """Test building and caching models from stored prices."""
+
+    def test_model_cached_by_universe_and_date(self, price_manager):
+        """Test that a universe is modeled once per as-of date, in any order."""
+        engine = PortfolioRiskEngine(price_manager)
+
+        with patch.object(engine, "build_returns", wraps=engine.build_returns) as build:
+            first = engine.get_model(["AAA", "CCC"], AS_OF)
+            assert engine.get_model(["ccc", "AAA", "AAA"], AS_OF) is first
+            engine.get_model(["AAA", "CCC"], date(2024, 12, 30))
+
+        assert build.call_count == 2
+
+    def test_returns_end_at_as_of(self, price_manager):
+        """Test that prices after the as-of date are not used."""
+        engine = PortfolioRiskEngine(price_manager)
+        returns = engine.build_returns(["AAA", "BBB"], date(2024, 10, 31))
+
+        assert returns.index.max() <= pd.Timestamp("2024-10-31")
+        assert list(returns.columns) == ["AAA", "BBB"]
+        assert not returns.isna().any().any()
+
+    def test_insufficient_history(self, price_manager):
+        """Test that tickers without enough history are dropped."""
+        engine = PortfolioRiskEngine(price_manager)
+
+        assert engine.get_model(["AAA", "MISSING"], AS_OF) is None
+        assert engine.get_model(["AAA", "BBB"], date(2024, 1, 31)) is None
+
+    def test_model_from_returns(self):
+        """Test that correlation has a unit diagonal."""
+        returns = pd.DataFrame(np.random.default_rng(3).normal(size=(100, 4)), columns=list("WXYZ"))
+        model = PortfolioRiskModel.from_returns(returns, AS_OF)
+
+        assert model.tickers == ("W", "X", "Y", "Z")
+        assert model.observations == 100
+        np.testing.assert_allclose(np.diag(model.correlation), 1.0)
+
+
+@pytest.mark.unit
+class TestAllocationDiversification:
+    """Test correlation-aware diversification scores in AllocationEngine."""
+
+    def test_correlated_positions_lower_score(self, price_manager):
+        """Test that correlated tickers in different sectors score lower than uncorrelated."""
+        engine = AllocationEngine(
+            total_capital=10000,
+            monthly_deposit=500,
+            risk_engine=PortfolioRiskEngine(price_manager),
+        )
+        sectors = {"Technology": 1000.0, "Healthcare": 1000.0}
+        markets = {"us": 2000.0}
+
+        correlated = engine._calculate_diversification_score(
+            sectors, markets, 2000.0, {"AAA": 1000.0, "BBB": 1000.0}, AS_OF
+        )
+        uncorrelated = engine._calculate_diversification_score(
+            sectors, markets, 2000.0, {"AAA": 1000.0, "CCC": 1000.0}, AS_OF
+        )
+        without_prices = engine._calculate_diversification_score(
+            sectors, markets, 2000.0, {"AAA": 1000.0, "MISSING": 1000.0}, AS_OF
+        )
+
+        assert correlated == pytest.approx(25)
+        assert uncorrelated == pytest.approx(40)
+        # Falls back to sector and market concentration only
+        assert without_prices == pytest.approx(35)
@@ -1,6 +1,6 @@
 """Tests for signal synthesis and scoring."""
 
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import patch
 
 import pytest
@@ -105,6 +105,38 @@ class TestSignalSynthesis:
         assert signal.risk is not None
         assert signal.current_price == 100.0
 
+    def test_historical_price_from_shared_price_manager(self, cache_manager):
+        """Test that historical prices are looked up in the cache manager's price store."""
+        cache_manager.price_manager.store_prices(
+            "TEST",
+            [
+                {
+                    "date": "2024-01-04",
+                    "open": 9.0,
+                    "high": 11.0,
+                    "low": 8.0,
+                    "close": 10.0,
+                    "volume": 100,
+                    "currency": "EUR",
+                },
+                {
+                    "date": "2024-01-05",
+                    "open": 10.0,
+                    "high": 12.0,
+                    "low": 9.0,
+                    "close": 11.0,
+                    "volume": 100,
+                    "currency": "EUR",
+                },
+            ],
+        )
+        signal_creator = SignalCreator(cache_manager=cache_manager)
+
+        assert signal_creator.price_manager is cache_manager.price_manager
+        assert signal_creator._fetch_price("TEST", date(2024, 1, 5)) == (11.0, "EUR")
+        # Weekend falls back to the previous trading day
+        assert signal_creator._fetch_price("TEST", date(2024, 1, 7)) == (11.0, "EUR")
+
     def test_signal_to_dict_conversion(self):
         """Test conversion of signal to dictionary."""
         signal = InvestmentSignal(
@@ -0,0 +1,115 @@
+"""Tests for filtering strategy parameter sweeps."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.backtest import FILTER_FIELD_MAPPING
+from src.analysis.strategy_sweep import StrategySweep, build_price_panel, parameter_grid
+from src.filtering.strategies import get_strategy
+
+
+def make_history(periods: int, start: str = "2024-01-01", seed: int = 0) -> pd.DataFrame:
+    """Create a business-day price history in PriceDataManager columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.03, periods))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range(start, periods=periods),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1, 10, periods) * 1000,
+        }
+    )
+
+
+@pytest.fixture
+def histories():
+    """Create histories of two tickers with different lengths."""
+    return {"BBB": make_history(80, seed=2), "AAA": make_history(100, seed=1)}
+
+
+class TestParameterGrid:
+    """Test parameter_grid."""
+
+    def test_all_combinations(self):
+        """Test that every combination of values is produced."""
+        grid = parameter_grid({"a": [1, 2], "b": [0.5, 1.0, 1.5]})
+
+        assert len(grid) == 6
+        assert grid[0] == {"a": 1, "b": 0.5}
+        assert grid[-1] == {"a": 2, "b": 1.5}
+
+    def test_no_parameters(self):
+        """Test that no parameters give the default configuration."""
+        assert parameter_grid({}) == [{}]
+
+
+class TestStrategySweep:
+    """Test suite for StrategySweep."""
+
+    def test_panel_aligns_bars_by_position(self, histories):
+        """Test that each ticker's bars start at the first row."""
+        panel = build_price_panel(histories)
+
+        assert list(panel["close_price"].columns) == ["AAA", "BBB"]
+        assert len(panel) == 100
+        assert panel["close_price"]["BBB"].iloc[80:].isna().all()
+        assert panel["date"]["BBB"].iloc[0] == pd.Timestamp("2024-01-01")
+
+    def test_baseline_counts_ticker_days_in_range(self, histories):
+        """Test that the pass-through strategy flags every ticker-day in range."""
+        sweep = StrategySweep(histories, date(2024, 2, 1), date(2024, 12, 31))
+
+        result = sweep.evaluate(get_strategy("all"))
+
+        # AAA trades 2024-02-01..2024-05-17, BBB 2024-02-01..2024-04-18
+        assert result.evaluated == 77 + 57
+        assert result.hits == result.evaluated
+        assert result.hit_rate == 100.0
+
+    def test_forward_returns_of_hits(self, histories):
+        """Test forward returns against a per-ticker computation."""
+        start, end = date(2024, 2, 1), date(2024, 3, 29)
+        sweep = StrategySweep(histories, start, end, horizons=(5,))
+        strategy = get_strategy("anomaly", {"daily_change_threshold": 2.0})
+
+        result = sweep.evaluate(strategy, {"daily_change_threshold": 2.0})
+
+        returns = []
+        for history in histories.values():
+            prices = history.rename(columns=FILTER_FIELD_MAPPING)
+            include = strategy.filter_series(prices)["include"]
+            in_range = history["date"].between(pd.Timestamp(start), pd.Timestamp(end))
+            close = prices["close_price"]
+            forward = (close.shift(-5) - close) / close * 100
+            returns.extend(forward[include & in_range].dropna())
+
+        assert result.params == {"daily_change_threshold": 2.0}
+        assert result.hits == len(returns)
+        assert result.avg_returns[5] == pytest.approx(np.mean(returns))
+        assert result.win_rates[5] == pytest.approx(np.mean(np.array(returns) > 0) * 100)
+
+    def test_run_grid(self, histories):
+        """Test that a grid yields one result per configuration."""
+        sweep = StrategySweep(histories, date(2024, 2, 1), date(2024, 3, 29))
+
+        results = sweep.run("anomaly", parameter_grid({"daily_change_threshold": [1.0, 5.0]}))
+
+        assert [r.params for r in results] == [
+            {"daily_change_threshold": 1.0},
+            {"daily_change_threshold": 5.0},
+        ]
+        assert results[0].hits >= results[1].hits
+
+    def test_no_histories(self):
+        """Test that an empty sweep reports no ticker-days."""
+        sweep = StrategySweep({"AAA": make_history(0)}, date(2024, 1, 1), date(2024, 2, 1))
+
+        result = sweep.evaluate(get_strategy("anomaly"))
+
+        assert (result.evaluated, result.hits, result.avg_returns) == (0, 0, {})
@@ -249,13 +249,10 @@ class TestConfigurableTechnicalAnalyzer:
         config = IndicatorConfig(name="sma", enabled=True, params={"length": 20})
 
         # Force fallback by disabling pandas_ta
-        original_setting = analyzer.config.use_pandas_ta
-        analyzer.config.use_pandas_ta = False
+        analyzer.config = analyzer.config.model_copy(update={"use_pandas_ta": False})
 
         result = analyzer._calculate_fallback(sample_price_df, config)
 
-        analyzer.config.use_pandas_ta = original_setting
-
         assert result is not None
         assert "value" in result
 
@@ -263,9 +260,8 @@ class TestConfigurableTechnicalAnalyzer:
         """Test fallback EMA calculation."""
         config = IndicatorConfig(name="ema", enabled=True, params={"length": 20})
 
-        analyzer.config.use_pandas_ta = False
+        analyzer.config = analyzer.config.model_copy(update={"use_pandas_ta": False})
         result = analyzer._calculate_fallback(sample_price_df, config)
-        analyzer.config.use_pandas_ta = True
 
         assert result is not None
         assert "value" in result
@@ -274,9 +270,8 @@ class TestConfigurableTechnicalAnalyzer:
         """Test fallback with unsupported indicator."""
         config = IndicatorConfig(name="unsupported_indicator", enabled=True, params={})
 
-        analyzer.config.use_pandas_ta = False
+        analyzer.config = analyzer.config.model_copy(update={"use_pandas_ta": False})
         result = analyzer._calculate_fallback(sample_price_df, config)
-        analyzer.config.use_pandas_ta = True
 
         assert result is None
 
@@ -386,3 +381,34 @@ class TestTechnicalIndicatorsConfig:
         config = TechnicalIndicatorsConfig(indicators=indicators)
 
         assert len(config.indicators) == 2
+
+
+class TestIndicatorSeries:
+    """Test suite for ConfigurableTechnicalAnalyzer.calculate_indicator_series."""
+
+    @pytest.mark.parametrize("use_pandas_ta", [True, False])
+    def test_rows_match_truncated_history(self, sample_price_df, use_pandas_ta):
+        """Test that each row equals the scalar indicators for history ending on that bar."""
+        analyzer = ConfigurableTechnicalAnalyzer(
+            TechnicalIndicatorsConfig(use_pandas_ta=use_pandas_ta)
+        )
+        series = analyzer.calculate_indicator_series(sample_price_df)
+
+        for end in (210, len(sample_price_df)):
+            results = analyzer.calculate_indicators(sample_price_df.iloc[:end])
+            indicators = results["indicators"]
+            row = series.iloc[end - 1]
+
+            assert row["rsi"] == pytest.approx(indicators["rsi_14"]["value"])
+            assert row["macd_histogram"] == pytest.approx(indicators["macd"]["histogram"])
+            assert row["atr"] == pytest.approx(indicators["atr_14"]["value"])
+            assert row["sma_200"] == pytest.approx(indicators["sma_200"]["value"])
+            assert row["trend"] == results["trend"]["direction"]
+            assert row["volume_ratio"] == results["volume_analysis"]["ratio"]
+
+    def test_trend_neutral_during_warmup(self, analyzer, sample_price_df):
+        """Test that trend is neutral before both moving averages are available."""
+        series = analyzer.calculate_indicator_series(sample_price_df)
+
+        assert set(series["trend"].iloc[:199]) == {"neutral"}
+        assert series["trend"].iloc[-1] in ("bullish", "bearish")
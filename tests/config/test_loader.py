@@ -1,11 +1,19 @@
 """Tests for configuration loading and management."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 import yaml
-
-from src.config.loader import ConfigLoader
+from pydantic import ValidationError
+
+from src.config import get_config
+from src.config.loader import (
+    ConfigLoader,
+    clear_config_cache,
+    load_config,
+    load_config_snapshot,
+)
 from src.config.schemas import Config
 
 
@@ -150,6 +158,91 @@ class TestConfigLoader:
             loader.load()
 
 
+def write_config(path, starting_capital: float, mtime_ns: int) -> None:
+    """Write a minimal config file with a fixed modification time."""
+    path.write_text(yaml.dump({"capital": {"starting_capital_eur": starting_capital}}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Test memoized config loading."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty config cache."""
+        clear_config_cache()
+        yield
+        clear_config_cache()
+
+    def test_repeated_loads_reuse_snapshot(self, tmp_path):
+        """Test that an unchanged file is parsed and validated once."""
+        config_file = tmp_path / "config.yaml"
+        write_config(config_file, 2000, 1_700_000_000_000_000_000)
+
+        with patch.object(ConfigLoader, "load", autospec=True, wraps=ConfigLoader.load) as load:
+            first = load_config(config_file)
+            second = load_config(str(config_file))
+
+        assert second is first
+        assert load.call_count == 1
+
+    def test_changed_file_reloaded(self, tmp_path):
+        """Test that a new modification time gives a new snapshot."""
+        config_file = tmp_path / "config.yaml"
+        write_config(config_file, 2000, 1_700_000_000_000_000_000)
+        first = load_config_snapshot(config_file)
+
+        write_config(config_file, 3000, 1_700_000_001_000_000_000)
+        second = load_config_snapshot(config_file)
+
+        assert second.config.capital.starting_capital_eur == 3000
+        assert second.version != first.version
+        assert second.content_hash != first.content_hash
+
+    def test_content_hash_stable(self, tmp_path):
+        """Test that equal values hash equally regardless of file version."""
+        config_file = tmp_path / "config.yaml"
+        write_config(config_file, 2000, 1_700_000_000_000_000_000)
+        first = load_config_snapshot(config_file)
+
+        write_config(config_file, 2000, 1_700_000_001_000_000_000)
+        second = load_config_snapshot(config_file)
+
+        assert second.config is not first.config
+        assert second.content_hash == first.content_hash
+        assert first.content_hash == Config(capital={"starting_capital_eur": 2000}).content_hash()
+
+    def test_snapshot_is_immutable(self, tmp_path):
+        """Test that the shared config cannot be modified in place."""
+        config_file = tmp_path / "config.yaml"
+        write_config(config_file, 2000, 1_700_000_000_000_000_000)
+        config = load_config(config_file)
+
+        with pytest.raises(ValidationError):
+            config.capital.starting_capital_eur = 5000
+
+        changed = config.model_copy(
+            update={"capital": config.capital.model_copy(update={"starting_capital_eur": 5000})}
+        )
+        assert changed.capital.starting_capital_eur == 5000
+        assert load_config(config_file).capital.starting_capital_eur == 2000
+
+    def test_invalid_file_not_cached(self, tmp_path):
+        """Test that a failed load is retried once the file is fixed."""
+        config_file = tmp_path / "config.yaml"
+        write_config(config_file, -100, 1_700_000_000_000_000_000)
+        with pytest.raises(ValueError):
+            load_config(config_file)
+
+        write_config(config_file, 100, 1_700_000_001_000_000_000)
+        assert load_config(config_file).capital.starting_capital_eur == 100
+
+    def test_get_config_uses_cache(self):
+        """Test that get_config returns the cached default configuration."""
+        assert get_config() is load_config()
+
+
 @pytest.mark.unit
 class TestConfigSchemas:
     """Test configuration schema validation."""
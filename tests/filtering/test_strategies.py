@@ -0,0 +1,108 @@
+"""Tests for vectorized filtering strategy evaluation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.filtering.strategies import FilterStrategy, get_strategy
+
+
+def make_prices(periods: int = 120, seed: int = 7) -> pd.DataFrame:
+    """Create a volatile price history with the keys used by filter()."""
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.cumprod(1 + rng.normal(0, 0.03, periods)), 1)
+    return pd.DataFrame(
+        {
+            "open_price": close * (1 + rng.normal(0, 0.03, periods)),
+            "high_price": close * 1.02 + rng.random(periods),
+            "low_price": close * 0.98 - rng.random(periods),
+            "close_price": close,
+            "volume": rng.integers(1, 10, periods) * 1000,
+        }
+    )
+
+
+def per_bar_decisions(strategy: FilterStrategy, prices: pd.DataFrame) -> list[bool]:
+    """Call filter() with the bars up to each row."""
+    records = prices.to_dict("records")
+    return [strategy.filter("TEST", records[: i + 1])[0] for i in range(len(records))]
+
+
+class OddBarStrategy(FilterStrategy):
+    """Custom strategy without a vectorized implementation."""
+
+    name = "odd"
+    description = "Odd number of bars"
+
+    def filter(self, ticker, prices):
+        return len(prices) % 2 == 1, []
+
+
+STRATEGY_CONFIGS = [
+    ("anomaly", None),
+    ("anomaly", {"daily_change_threshold": 2.0, "lookback_days_high_low": 7}),
+    ("volume", None),
+    ("volume", {"volume_trend_days": 7, "min_trend_slope": 5.0}),
+    ("momentum", None),
+    ("momentum", {"lookback_days": 5, "min_total_change": 2.0, "min_consecutive_days": 2}),
+    ("volatility", None),
+    ("volatility", {"lookback_days": 8}),
+    ("breakout", {"lookback_days": 5, "breakout_threshold": 0.5}),
+    ("gap", {"min_gap_percent": 1.0}),
+    ("all", None),
+]
+
+
+class TestFilterSeries:
+    """Test FilterStrategy.filter_series."""
+
+    @pytest.mark.parametrize("name,config", STRATEGY_CONFIGS)
+    def test_matches_filter_on_every_bar(self, name, config):
+        """Test that each row gives the decision filter() makes on that day."""
+        strategy = get_strategy(name, config)
+        prices = make_prices()
+
+        mask = strategy.filter_series(prices)
+
+        assert mask["include"].tolist() == per_bar_decisions(strategy, prices)
+        assert mask.dtypes.eq(bool).all()
+
+    @pytest.mark.parametrize("name,config", STRATEGY_CONFIGS[::2])
+    def test_multi_ticker_history(self, name, config):
+        """Test that tickers of different lengths are evaluated independently."""
+        strategy = get_strategy(name, config)
+        long, short = make_prices(120, seed=1), make_prices(90, seed=2)
+        panel = pd.concat({"LONG": long, "SHORT": short}, axis=1).swaplevel(axis=1)
+
+        include = strategy.filter_series(panel)["include"]
+
+        assert include["LONG"].tolist() == per_bar_decisions(strategy, long)
+        assert include["SHORT"].tolist() == per_bar_decisions(strategy, short) + [False] * 30
+
+    def test_condition_columns(self):
+        """Test that each condition is reported as its own column."""
+        prices = make_prices()
+        prices.loc[100, "volume"] = 1_000_000
+
+        mask = get_strategy("anomaly").filter_series(prices)
+
+        assert list(mask.columns) == [
+            "daily_move",
+            "weekly_move",
+            "volume_spike",
+            "period_high",
+            "period_low",
+            "include",
+        ]
+        assert mask.loc[100, "volume_spike"]
+        assert not mask.loc[:3].any().any()
+
+    def test_custom_strategy_falls_back_to_filter(self):
+        """Test that strategies without vectorized conditions replay filter()."""
+        prices = make_prices(10)
+        panel = pd.concat({"A": prices, "B": prices.head(5)}, axis=1).swaplevel(axis=1)
+
+        mask = OddBarStrategy().filter_series(panel)
+
+        assert mask["filter"]["A"].tolist() == [True, False] * 5
+        assert mask["include"]["B"].tolist() == [True, False, True, False, True] + [False] * 5
@@ -0,0 +1,81 @@
+"""Import-time regression tests for CLI startup.
+
+Each check runs in a fresh interpreter so that modules imported by other tests do not
+hide a slow import chain.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from src.cli.commands import COMMAND_MODULES, command_help
+from src.main import app
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Libraries that must not be imported before a command that needs them is invoked
+HEAVY_MODULES = ["crewai", "transformers", "torch", "yfinance", "pandas_ta", "litellm"]
+
+# Generous bound for `--help` in a fresh interpreter; eager imports took 10s+
+MAX_HELP_SECONDS = 5.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from src.main import app
+try:
+    app(sys.argv[1:])
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def run_probe(*args: str) -> dict:
+    """Run the CLI in a fresh interpreter and report elapsed time and heavy imports."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(heavy=HEAVY_MODULES), *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestCLIStartup:
+    """Test that CLI startup does not import heavy dependencies."""
+
+    def test_help_skips_heavy_imports(self):
+        """Test that `--help` imports no heavy library and stays fast."""
+        probe = run_probe("--help")
+
+        assert probe["heavy"] == []
+        assert probe["elapsed"] < MAX_HELP_SECONDS
+
+    def test_light_command_skips_heavy_imports(self):
+        """Test that a command without analysis needs loads no ML or LLM stack."""
+        probe = run_probe("list-categories", "--help")
+
+        assert probe["heavy"] == []
+
+    def test_help_lists_all_commands(self):
+        """Test that unloaded commands are listed with their docstring summary."""
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in COMMAND_MODULES:
+            assert name in result.output
+        assert command_help("watchlist-scan")
+
+    def test_invoked_command_is_loaded(self):
+        """Test that invoking a command imports its module and runs it."""
+        result = CliRunner().invoke(app, ["list-strategies"])
+
+        assert result.exit_code == 0
+        assert "Available Filtering Strategies" in result.output
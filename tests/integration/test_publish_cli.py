@@ -0,0 +1,113 @@
+"""Integration tests for the publish CLI command."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from src.main import app
+
+
+@pytest.fixture
+def runner():
+    """Create CLI runner for testing."""
+    return CliRunner()
+
+
+@pytest.fixture
+def website_root(tmp_path, monkeypatch):
+    """Run in a temporary directory with a database holding one recommendation."""
+    from src.analysis import InvestmentSignal
+    from src.analysis.models import ComponentScores, RiskAssessment
+    from src.data.repository import RecommendationsRepository
+
+    monkeypatch.chdir(tmp_path)
+    db_path = tmp_path / "test.db"
+    signal = InvestmentSignal(
+        ticker="AAPL",
+        name="Apple Inc.",
+        market="US",
+        current_price=100.0,
+        currency="USD",
+        scores=ComponentScores(technical=75.0, fundamental=75.0, sentiment=75.0),
+        final_score=75.0,
+        recommendation="buy",
+        confidence=80.0,
+        expected_return_min=5.0,
+        expected_return_max=15.0,
+        key_reasons=["Test"],
+        risk=RiskAssessment(
+            level="medium",
+            volatility="moderate",
+            volatility_pct=15.0,
+            liquidity="normal",
+            concentration_risk=False,
+        ),
+        generated_at=datetime.now(),
+        analysis_date="2025-01-15",
+        rationale="Test",
+        caveats=[],
+    )
+    RecommendationsRepository(db_path).store_recommendation(
+        signal, run_session_id=1, analysis_mode="rule_based"
+    )
+    (tmp_path / "config.yaml").write_text(
+        f"""
+capital:
+  starting_capital_eur: 2000
+  monthly_deposit_eur: 500
+
+markets:
+  included: [us]
+  included_instruments: [stocks]
+
+logging:
+  level: WARNING
+
+database:
+  enabled: true
+  db_path: {db_path}
+"""
+    )
+    return tmp_path
+
+
+@pytest.mark.integration
+class TestPublishWatermark:
+    """Test when an incremental publish advances its watermark."""
+
+    def publish(self, runner, website_root, fail_ticker_pages: bool):
+        """Publish the stored date and return the watermark passed to save_publish_state."""
+        with (
+            patch("src.website.generator.WebsiteGenerator.update_navigation"),
+            patch("src.website.generator.WebsiteGenerator.save_publish_state") as save_state,
+            patch(
+                "src.website.generator.WebsiteGenerator.generate_ticker_pages",
+                side_effect=RuntimeError("disk full") if fail_ticker_pages else None,
+                return_value={},
+            ),
+        ):
+            result = runner.invoke(
+                app,
+                [
+                    "publish",
+                    "--date",
+                    "2025-01-15",
+                    "--no-build",
+                    "--config",
+                    str(website_root / "config.yaml"),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        save_state.assert_called_once()
+        return save_state.call_args[0][0]
+
+    def test_watermark_advanced_after_complete_publish(self, runner, website_root):
+        """Test that a publish with every page generated moves the watermark."""
+        assert self.publish(runner, website_root, fail_ticker_pages=False) is not None
+
+    def test_watermark_kept_when_ticker_pages_fail(self, runner, website_root):
+        """Test that failed ticker pages keep the old watermark for the next publish."""
+        assert self.publish(runner, website_root, fail_ticker_pages=True) is None
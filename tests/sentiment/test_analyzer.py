@@ -295,7 +295,7 @@ class TestConfigurableSentimentAnalyzer:
 
     def test_method_override(self, analyzer):
         """Test that method parameter overrides config."""
-        analyzer.config.scoring_method = "local"
+        analyzer.config = analyzer.config.model_copy(update={"scoring_method": "local"})
 
         articles = [
             make_article("News", sentiment="positive", sentiment_score=0.5),
@@ -0,0 +1,101 @@
+"""Unit tests for the cross-ticker sentiment scoring queue."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data.models import NewsArticle
+
+
+def make_article(ticker: str, summary: str) -> NewsArticle:
+    """Create a test NewsArticle."""
+    return NewsArticle(
+        ticker=ticker,
+        title=f"{ticker} headline",
+        summary=summary,
+        source="Test Source",
+        published_date=datetime(2024, 1, 15),
+        url="https://example.com/news",
+    )
+
+
+class TestSentimentScoringQueue:
+    """Test suite for SentimentScoringQueue."""
+
+    @pytest.fixture
+    def mock_pipeline(self):
+        """Mock pipeline labelling texts containing 'loss' negative."""
+        return MagicMock(
+            side_effect=lambda texts: [
+                {"label": "negative" if "loss" in text else "positive", "score": 0.9}
+                for text in texts
+            ]
+        )
+
+    @pytest.fixture
+    def scorer(self, mock_pipeline):
+        """Create scorer with mocked pipeline and batch size 4."""
+        with patch("src.sentiment.finbert.TRANSFORMERS_AVAILABLE", True):
+            from src.sentiment.finbert import FinBERTSentimentScorer
+
+            scorer = FinBERTSentimentScorer(batch_size=4)
+            scorer._pipeline = mock_pipeline
+            scorer._loaded = True
+            return scorer
+
+    def test_flush_scores_all_tickers_in_full_batches(self, scorer, mock_pipeline):
+        """Test that articles from many tickers share batches and are dispatched back."""
+        from src.sentiment.batch import SentimentScoringQueue
+
+        queue = SentimentScoringQueue(scorer)
+        articles = {
+            "AAPL": [make_article("AAPL", "record profit"), make_article("AAPL", "net loss")],
+            "MSFT": [make_article("MSFT", f"cloud growth {i}") for i in range(3)],
+            "NVDA": [make_article("NVDA", "quarterly loss widens")],
+        }
+        for ticker, ticker_articles in articles.items():
+            queue.submit(ticker, ticker_articles)
+        assert queue.pending_count == 6
+
+        results = queue.flush()
+
+        # 6 texts with batch size 4: two batches for the whole run
+        assert mock_pipeline.call_count == 2
+        assert [len(call[0][0]) for call in mock_pipeline.call_args_list] == [4, 2]
+        assert [s.sentiment for s in results["AAPL"]] == ["positive", "negative"]
+        assert len(results["MSFT"]) == 3
+        assert results["NVDA"][0].sentiment == "negative"
+        # Articles are updated in-place
+        assert articles["AAPL"][1].sentiment == "negative"
+        assert articles["AAPL"][1].sentiment_score == pytest.approx(0.9)
+        assert queue.pending_count == 0
+        assert queue.flush() == {}
+
+    def test_batches_are_sorted_by_token_length(self, scorer, mock_pipeline):
+        """Test that texts are grouped by length to minimize padding."""
+        from src.sentiment.batch import SentimentScoringQueue
+
+        queue = SentimentScoringQueue(scorer)
+        long_text = "shares " * 50
+        queue.submit("A", [make_article("A", long_text), make_article("A", "short")])
+        queue.submit("B", [make_article("B", long_text + "x"), make_article("B", "tiny one")])
+        queue.submit("C", [make_article("C", "a b c"), make_article("C", long_text + "y")])
+
+        queue.flush()
+
+        first_batch = mock_pipeline.call_args_list[0][0][0]
+        assert all(len(text.split()) <= 3 for text in first_batch[:3])
+        assert set(mock_pipeline.call_args_list[1][0][0]) == {long_text + "x", long_text + "y"}
+
+    def test_num_threads_applied_on_load(self):
+        """Test that the configured torch thread count is set when loading."""
+        from src.sentiment.finbert import FinBERTSentimentScorer
+
+        torch = MagicMock()
+        with patch("src.sentiment.finbert.TRANSFORMERS_AVAILABLE", True):
+            with patch("src.sentiment.finbert.pipeline", MagicMock()):
+                with patch.dict("sys.modules", {"torch": torch}):
+                    FinBERTSentimentScorer(num_threads=3)._ensure_loaded()
+
+        torch.set_num_threads.assert_called_once_with(3)
@@ -1,6 +1,8 @@
 """Unit tests for the FinBERT sentiment module."""
 
+import tempfile
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -455,3 +457,304 @@ class TestFinBERTSentimentScorer:
 
         assert result["avg_score"] == -0.06
         assert result["overall_sentiment"] == "negative"
+
+
+class TestSentimentScoreCache:
+    """Test suite for the per-article FinBERT score cache."""
+
+    @pytest.fixture
+    def score_store(self):
+        """Create an ArticleSentimentRepository on a temporary database."""
+        from src.data.repository import ArticleSentimentRepository
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield ArticleSentimentRepository(Path(tmpdir) / "test.db")
+
+    @pytest.fixture
+    def mock_pipeline(self):
+        """Create mock pipeline returning one positive result per text."""
+        return MagicMock(
+            side_effect=lambda texts: [{"label": "positive", "score": 0.9}] * len(texts)
+        )
+
+    def make_scorer(self, mock_pipeline, score_store, model_name=None):
+        """Create scorer with mocked pipeline and the given store."""
+        with patch("src.sentiment.finbert.TRANSFORMERS_AVAILABLE", True):
+            with patch("src.sentiment.finbert.pipeline", mock_pipeline):
+                from src.sentiment.finbert import FinBERTSentimentScorer
+
+                scorer = FinBERTSentimentScorer(model_name=model_name, score_store=score_store)
+                scorer._pipeline = mock_pipeline
+                scorer._loaded = True
+                return scorer
+
+    def test_cache_key_normalizes_whitespace_and_includes_model(self):
+        """Test that keys ignore whitespace differences but not model names."""
+        from src.sentiment.finbert import sentiment_cache_key
+
+        key = sentiment_cache_key("ProsusAI/finbert", "Shares  rise\n on earnings ")
+        assert key == sentiment_cache_key("ProsusAI/finbert", "Shares rise on earnings")
+        assert key != sentiment_cache_key("other/model", "Shares rise on earnings")
+        assert key != sentiment_cache_key("ProsusAI/finbert", "shares rise on earnings")
+        assert key != sentiment_cache_key(
+            "ProsusAI/finbert", "Shares rise on earnings", "onnx-int8"
+        )
+
+    def test_only_unseen_texts_are_scored(self, mock_pipeline, score_store):
+        """Test that cached texts skip the model on later calls and across scorers."""
+        scorer = self.make_scorer(mock_pipeline, score_store)
+        first = [
+            make_article("A", summary="Revenue beats"),
+            make_article("B", summary="Guidance cut"),
+        ]
+
+        scorer.score_articles(first)
+        assert mock_pipeline.call_args[0][0] == ["Revenue beats", "Guidance cut"]
+
+        # A new scorer (e.g., next run) reuses the persisted scores
+        mock_pipeline.reset_mock()
+        scorer = self.make_scorer(mock_pipeline, score_store)
+        second = first + [make_article("C", summary="New product launch")]
+        results = scorer.score_articles(second)
+
+        assert len(results) == 3
+        assert mock_pipeline.call_count == 1
+        assert mock_pipeline.call_args[0][0] == ["New product launch"]
+        assert [r.sentiment for r in results] == ["positive"] * 3
+
+    def test_fully_cached_call_does_not_load_model(self, mock_pipeline, score_store):
+        """Test that the model is not loaded when every text is cached."""
+        scorer = self.make_scorer(mock_pipeline, score_store)
+        articles = [make_article("A", summary="Revenue beats")]
+        scorer.score_articles(articles)
+
+        scorer._loaded = False
+        with patch.object(scorer, "_ensure_loaded") as ensure_loaded:
+            results = scorer.score_articles(articles)
+
+        ensure_loaded.assert_not_called()
+        assert results[0].score == pytest.approx(0.9)
+
+    def test_duplicate_texts_scored_once(self, mock_pipeline):
+        """Test that identical texts within one call are scored once without a store."""
+        scorer = self.make_scorer(mock_pipeline, None)
+        articles = [make_article("Same", summary="Same text") for _ in range(3)]
+
+        results = scorer.score_articles(articles)
+
+        assert len(results) == 3
+        assert mock_pipeline.call_args[0][0] == ["Same text"]
+
+    def test_model_name_separates_cache_entries(self, mock_pipeline, score_store):
+        """Test that a different model does not reuse another model's scores."""
+        articles = [make_article("A", summary="Revenue beats")]
+        self.make_scorer(mock_pipeline, score_store).score_articles(articles)
+
+        mock_pipeline.reset_mock()
+        self.make_scorer(mock_pipeline, score_store, model_name="other/model").score_articles(
+            articles
+        )
+
+        assert mock_pipeline.call_count == 1
+
+    def test_backend_separates_cache_entries(self, mock_pipeline, score_store):
+        """Test that ONNX int8, ONNX fp32 and torch scores are cached separately."""
+        articles = [make_article("A", summary="Revenue beats")]
+        for backend, quantize in [("transformers", True), ("onnx", True), ("onnx", False)]:
+            scorer = self.make_scorer(mock_pipeline, score_store)
+            scorer.backend, scorer.quantize, scorer._active_backend = backend, quantize, backend
+            mock_pipeline.reset_mock()
+            scorer.score_articles(articles)
+            assert mock_pipeline.call_count == 1
+
+    def test_onnx_fallback_stores_transformers_keys(self, mock_pipeline, score_store):
+        """Test that scores from a transformers fallback are cached as transformers scores."""
+        from src.sentiment.finbert import sentiment_cache_key
+
+        scorer = self.make_scorer(mock_pipeline, score_store)
+        scorer.backend, scorer._loaded = "onnx", False
+        with (
+            patch.object(scorer, "_load_onnx_pipeline", return_value=None),
+            patch.object(scorer, "_build_transformers_pipeline", return_value=mock_pipeline),
+        ):
+            scorer.score_articles([make_article("A", summary="Revenue beats")])
+
+        assert scorer.cache_backend == "transformers"
+        key = sentiment_cache_key(scorer.model_name, "Revenue beats")
+        assert score_store.get_scores([key]) == {key: ("positive", pytest.approx(0.9))}
+
+
+class TestONNXBackend:
+    """Test suite for the ONNX Runtime FinBERT backend."""
+
+    @pytest.fixture
+    def mock_pipeline(self):
+        """Create mock transformers pipeline."""
+        return MagicMock(return_value=[{"label": "positive", "score": 0.9}])
+
+    def make_scorer(self, mock_pipeline, tmpdir: str):
+        """Create an ONNX-backend scorer with a mocked transformers pipeline."""
+        with patch("src.sentiment.finbert.TRANSFORMERS_AVAILABLE", True):
+            from src.sentiment.finbert import FinBERTSentimentScorer
+
+            return FinBERTSentimentScorer(backend="onnx", onnx_dir=tmpdir)
+
+    def test_compare_predictions(self):
+        """Test label agreement and score tolerance in the parity comparison."""
+        from src.sentiment.onnx_backend import compare_predictions
+
+        reference = [
+            {"label": "positive", "score": 0.90},
+            {"label": "negative", "score": 0.80},
+            {"label": "neutral", "score": 0.70},
+        ]
+        close = [
+            {"label": "positive", "score": 0.88},
+            {"label": "negative", "score": 0.81},
+            {"label": "neutral", "score": 0.70},
+        ]
+        flipped = [dict(close[0]), dict(close[1]), {"label": "positive", "score": 0.5}]
+
+        passed = compare_predictions(reference, close)
+        failed = compare_predictions(reference, flipped)
+
+        assert passed["passed"]
+        assert passed["label_agreement"] == 1.0
+        assert passed["max_score_diff"] == pytest.approx(0.02)
+        assert not failed["passed"]
+        assert failed["label_agreement"] == pytest.approx(0.6667)
+        assert not compare_predictions(reference, close, score_tolerance=0.01)["passed"]
+        with pytest.raises(ValueError):
+            compare_predictions(reference, close[:2])
+
+    def test_onnx_pipeline_output_format(self):
+        """Test that the ONNX pipeline returns top label and softmax score per text."""
+        import numpy as np
+
+        from src.sentiment import onnx_backend
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, onnx_backend.QUANTIZED_MODEL_FILE).touch()
+            Path(tmpdir, onnx_backend.LABELS_FILE).write_text(
+                '{"model_name": "m", "labels": {"0": "positive", "1": "negative", "2": "neutral"}}'
+            )
+            session = MagicMock()
+            session.get_inputs.return_value = [MagicMock(), MagicMock()]
+            session.get_inputs.return_value[0].name = "input_ids"
+            session.get_inputs.return_value[1].name = "attention_mask"
+            session.run.return_value = [np.array([[3.0, 0.0, 0.0], [0.0, 0.0, 5.0]])]
+            tokenizer = MagicMock(
+                return_value={
+                    "input_ids": np.ones((2, 4), dtype=np.int32),
+                    "attention_mask": np.ones((2, 4), dtype=np.int32),
+                    "token_type_ids": np.zeros((2, 4), dtype=np.int32),
+                }
+            )
+            ort = MagicMock()
+            ort.InferenceSession.return_value = session
+
+            with (
+                patch.object(onnx_backend, "ONNXRUNTIME_AVAILABLE", True),
+                patch.object(onnx_backend, "ort", ort, create=True),
+                patch("transformers.AutoTokenizer.from_pretrained", return_value=tokenizer),
+            ):
+                onnx_pipeline = onnx_backend.ONNXSentimentPipeline(tmpdir, num_threads=2)
+                results = onnx_pipeline(["good", "meh"])
+
+        assert [r["label"] for r in results] == ["positive", "neutral"]
+        assert results[0]["score"] == pytest.approx(np.exp(3) / (np.exp(3) + 2))
+        # Only inputs the model declares are fed, as int64
+        feeds = session.run.call_args[0][1]
+        assert set(feeds) == {"input_ids", "attention_mask"}
+        assert feeds["input_ids"].dtype == np.int64
+        assert ort.SessionOptions.return_value.intra_op_num_threads == 2
+
+    def test_falls_back_to_transformers_when_onnx_unavailable(self, mock_pipeline):
+        """Test that a failing ONNX export or load falls back to transformers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scorer = self.make_scorer(mock_pipeline, tmpdir)
+            with (
+                patch("src.sentiment.finbert.pipeline", return_value=mock_pipeline),
+                patch(
+                    "src.sentiment.onnx_backend.export_onnx_model",
+                    side_effect=ImportError("onnxruntime"),
+                ),
+            ):
+                result = scorer.score_text("Revenue beats")
+
+        assert result.sentiment == "positive"
+        mock_pipeline.assert_called()
+
+    def test_uses_onnx_pipeline_and_records_parity(self, mock_pipeline):
+        """Test that the ONNX pipeline is used after a passing parity check."""
+        onnx_pipeline = MagicMock()
+        mock_pipeline.side_effect = lambda texts: [{"label": "positive", "score": 0.9}] * len(texts)
+        onnx_pipeline.side_effect = lambda texts: [{"label": "positive", "score": 0.91}] * len(
+            texts if isinstance(texts, list) else [texts]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scorer = self.make_scorer(mock_pipeline, tmpdir)
+            scorer.onnx_dir.mkdir(parents=True)
+            with (
+                patch("src.sentiment.finbert.pipeline", return_value=mock_pipeline),
+                patch("src.sentiment.onnx_backend.export_onnx_model"),
+                patch(
+                    "src.sentiment.onnx_backend.ONNXSentimentPipeline", return_value=onnx_pipeline
+                ),
+            ):
+                result = scorer.score_text("Revenue beats")
+                parity_written = (scorer.onnx_dir / "parity.json").exists()
+
+        assert scorer._pipeline is onnx_pipeline
+        assert result.score == pytest.approx(0.91)
+        assert parity_written
+
+    def test_failed_parity_uses_transformers(self, mock_pipeline):
+        """Test that an ONNX model with a failed parity result is not used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scorer = self.make_scorer(mock_pipeline, tmpdir)
+            with (
+                patch("src.sentiment.finbert.pipeline", return_value=mock_pipeline),
+                patch("src.sentiment.onnx_backend.export_onnx_model"),
+                patch("src.sentiment.onnx_backend.ONNXSentimentPipeline"),
+                patch(
+                    "src.sentiment.onnx_backend.load_parity_result",
+                    return_value={"passed": False},
+                ),
+            ):
+                scorer._ensure_loaded()
+
+        assert scorer._pipeline is mock_pipeline
+
+    def test_parity_check_error_uses_transformers(self, mock_pipeline):
+        """Test that an ONNX model is not used when the parity check cannot run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scorer = self.make_scorer(mock_pipeline, tmpdir)
+            with (
+                patch("src.sentiment.finbert.pipeline", return_value=mock_pipeline),
+                patch("src.sentiment.onnx_backend.export_onnx_model"),
+                patch("src.sentiment.onnx_backend.ONNXSentimentPipeline"),
+                patch("src.sentiment.onnx_backend.load_parity_result", return_value=None),
+                patch(
+                    "src.sentiment.onnx_backend.check_parity",
+                    side_effect=RuntimeError("tokenizer mismatch"),
+                ),
+            ):
+                scorer._ensure_loaded()
+
+        assert scorer._pipeline is mock_pipeline
+
+    def test_onnx_dir_is_per_model(self, mock_pipeline):
+        """Test that exports of different models do not share a directory."""
+        scorer = self.make_scorer(mock_pipeline, "data/models/onnx")
+
+        assert scorer.onnx_dir == Path("data/models/onnx/ProsusAI--finbert")
+
+    def test_backend_config_validation(self):
+        """Test that only known backends are accepted."""
+        from src.config.schemas import LocalSentimentModelConfig
+
+        assert LocalSentimentModelConfig(backend="ONNX").backend == "onnx"
+        with pytest.raises(ValueError):
+            LocalSentimentModelConfig(backend="tensorrt")
@@ -5,6 +5,7 @@ from datetime import date, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import pandas as pd
 import pytest
 from typer.testing import CliRunner
 
@@ -574,14 +575,11 @@ class TestDownloadPriceData:
         mock_price_manager.prices_dir = Path("/tmp/prices")
         mock_price_manager.has_data.return_value = False
 
-        # Mock price objects
-        mock_price1 = MagicMock()
-        mock_price1.model_dump.return_value = {"date": "2024-01-01", "close": 100.0}
-        mock_price2 = MagicMock()
-        mock_price2.model_dump.return_value = {"date": "2024-01-02", "close": 101.0}
-
+        # Mock price frame
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.return_value = [mock_price1, mock_price2]
+        mock_provider_manager.get_price_frame.return_value = pd.DataFrame(
+            {"date": pd.to_datetime(["2024-01-01", "2024-01-02"]), "close": [100.0, 101.0]}
+        )
 
         mock_price_manager.store_prices.return_value = 2
 
@@ -600,7 +598,7 @@ class TestDownloadPriceData:
         assert success == 2
         assert skipped == 0
         assert errors == 0
-        assert mock_provider_manager.get_stock_prices.call_count == 2
+        assert mock_provider_manager.get_price_frame.call_count == 2
 
     @patch("src.cli.helpers.downloads.time.sleep")
     @patch("src.cli.helpers.downloads.RateLimiter")
@@ -669,12 +667,11 @@ class TestDownloadPriceData:
         mock_price_manager.prices_dir = Path("/tmp/prices")
         mock_price_manager.has_data.return_value = True
 
-        # Mock price objects
-        mock_price = MagicMock()
-        mock_price.model_dump.return_value = {"date": "2024-01-01", "close": 100.0}
-
+        # Mock price frame
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.return_value = [mock_price]
+        mock_provider_manager.get_price_frame.return_value = pd.DataFrame(
+            {"date": pd.to_datetime(["2024-01-01"]), "close": [100.0]}
+        )
 
         mock_price_manager.store_prices.return_value = 1
 
@@ -693,7 +690,7 @@ class TestDownloadPriceData:
         # Assert - should download even with existing file
         assert success == 1
         assert skipped == 0
-        mock_provider_manager.get_stock_prices.assert_called_once()
+        mock_provider_manager.get_price_frame.assert_called_once()
 
     @patch("src.cli.helpers.downloads.time.sleep")
     @patch("src.cli.helpers.downloads.RateLimiter")
@@ -719,7 +716,7 @@ class TestDownloadPriceData:
         mock_price_manager.has_data.return_value = False
 
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.side_effect = Exception("API error")
+        mock_provider_manager.get_price_frame.side_effect = Exception("API error")
 
         # Execute
         with patch("src.cli.helpers.downloads.typer.progressbar") as mock_progressbar:
@@ -275,25 +275,17 @@ class TestPriceFetcherTool:
         mock_pm_class.return_value = mock_pm
         tool_with_unified_storage._price_manager = mock_pm
 
-        # Mock provider to return prices
-        price = MagicMock(spec=StockPrice)
-        price.model_dump.return_value = {
-            "date": datetime(2024, 1, 1),
-            "close": 150.0,
-            "open": 148.0,
-            "high": 151.0,
-            "low": 147.0,
-            "volume": 1000000,
-        }
-        mock_provider.get_stock_prices.return_value = [price]
+        # Mock provider to return a price frame
+        frame = mock_pm.get_prices.return_value.copy()
+        mock_provider.get_price_frame.return_value = frame
 
         result = tool_with_unified_storage.run("AAPL", days_back=30)
 
         assert result["ticker"] == "AAPL"
         assert result["storage"] == "unified_csv"
         assert result["count"] == 1
-        mock_provider.get_stock_prices.assert_called_once()
-        mock_pm.store_prices.assert_called_once()
+        mock_provider.get_price_frame.assert_called_once()
+        mock_pm.store_prices.assert_called_once_with("AAPL", frame, append=True)
 
     @patch("src.tools.fetchers.PriceDataManager")
     def test_fetch_with_unified_storage_existing_sufficient_data(
@@ -324,7 +316,7 @@ class TestPriceFetcherTool:
         assert result["ticker"] == "AAPL"
         assert result["count"] == 100
         # Should NOT fetch new data - existing is sufficient
-        mock_provider.get_stock_prices.assert_not_called()
+        mock_provider.get_price_frame.assert_not_called()
 
     @patch("src.tools.fetchers.PriceDataManager")
     def test_fetch_with_unified_storage_insufficient_data(
@@ -350,22 +342,22 @@ class TestPriceFetcherTool:
         tool_with_unified_storage._price_manager = mock_pm
 
         # Mock provider to return additional prices
-        price = MagicMock(spec=StockPrice)
-        price.model_dump.return_value = {
-            "date": datetime(2024, 1, 20),
-            "close": 155.0,
-            "open": 153.0,
-            "high": 156.0,
-            "low": 152.0,
-            "volume": 1200000,
-        }
-        mock_provider.get_stock_prices.return_value = [price]
+        mock_provider.get_price_frame.return_value = pd.DataFrame(
+            {
+                "date": [datetime(2024, 1, 20)],
+                "close": [155.0],
+                "open": [153.0],
+                "high": [156.0],
+                "low": [152.0],
+                "volume": [1200000],
+            }
+        )
 
         result = tool_with_unified_storage.run("AAPL", days_back=30)
 
         assert result["ticker"] == "AAPL"
         # Should fetch additional data since existing is insufficient
-        mock_provider.get_stock_prices.assert_called_once()
+        mock_provider.get_price_frame.assert_called_once()
         mock_pm.store_prices.assert_called_once()
 
 
@@ -449,6 +441,7 @@ class TestNewsFetcherTool:
             mock_news_config.use_unified_aggregator = True
             mock_news_config.target_article_count = 50
             mock_news_config.max_age_days = 7
+            mock_news_config.persist_articles = False
 
             # Mock source configuration
             mock_source = MagicMock()
@@ -686,3 +679,64 @@ class TestNewsFetcherTool:
         cache_key = mock_cache_manager.set.call_args[0][0]
         assert "AAPL" in cache_key
         assert "news_finbert" in cache_key or "news_sentiment" in cache_key
+
+    def test_prefetch_scores_all_tickers_in_one_job(self, tool, sample_articles):
+        """Test that prefetch scores every ticker's articles with one batch call."""
+        tool.use_local_sentiment = True
+        tool.news_aggregator.fetch_news = MagicMock(
+            side_effect=lambda ticker, **kwargs: [] if ticker == "EMPTY" else sample_articles
+        )
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze_sentiment_batch.side_effect = lambda by_ticker: {
+            ticker: {"method": "local_finbert"} for ticker in by_ticker
+        }
+        tool._sentiment_analyzer = mock_analyzer
+
+        assert tool.prefetch(["AAPL", "MSFT", "EMPTY"]) == 3
+
+        mock_analyzer.analyze_sentiment_batch.assert_called_once()
+        assert set(mock_analyzer.analyze_sentiment_batch.call_args[0][0]) == {"AAPL", "MSFT"}
+
+        # run() is served from the prefetch without fetching or scoring again
+        tool.news_aggregator.fetch_news.reset_mock()
+        result = tool.run("MSFT")
+        empty = tool.run("EMPTY")
+
+        tool.news_aggregator.fetch_news.assert_not_called()
+        mock_analyzer.analyze_sentiment.assert_not_called()
+        assert result["count"] == 3
+        assert result["scoring_method"] == "local_finbert"
+        assert empty["count"] == 0
+
+        # Prefetched results are used once
+        tool.run("MSFT")
+        tool.news_aggregator.fetch_news.assert_called_once()
+
+    def test_prefetch_keeps_only_current_batch(self, tool, sample_articles):
+        """Test that unconsumed prefetches are dropped by the next batch or a clear."""
+        tool.news_aggregator.fetch_news = MagicMock(return_value=sample_articles)
+
+        tool.prefetch(["AAPL", "MSFT"])
+        tool.prefetch(["MSFT", "NVDA"])
+        assert set(tool._prefetched) == {("MSFT", None), ("NVDA", None)}
+        # MSFT was still pending, so it is not fetched again
+        assert tool.news_aggregator.fetch_news.call_count == 3
+
+        tool.clear_prefetched()
+        assert tool._prefetched == {}
+
+    def test_prefetch_skips_cached_tickers_and_respects_historical_date(
+        self, tool, sample_articles
+    ):
+        """Test that cached tickers are skipped and prefetches are keyed by date."""
+        tool.news_aggregator.fetch_news = MagicMock(return_value=sample_articles)
+        tool.cache_manager.get.side_effect = lambda key: (
+            {"ticker": "AAPL", "count": 1} if key == "news_sentiment:AAPL" else None
+        )
+
+        assert tool.prefetch(["AAPL", "MSFT"]) == 1
+
+        tool.set_historical_date(date(2024, 6, 15))
+        tool.run("MSFT")
+        # Prefetch was for the current date, so the historical run fetches again
+        assert tool.news_aggregator.fetch_news.call_count == 2
@@ -1,5 +1,8 @@
 """Tests for FinancialDataFetcherTool using Alpha Vantage Premium."""
 
+import tempfile
+import time
+from datetime import date, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -192,3 +195,112 @@ class TestFinancialDataFetcherTool:
         assert "earnings_estimates" in result
         assert "company_info" in result
         assert "analyst_data" in result
+
+    def test_sources_fetched_concurrently_with_timeouts(self):
+        """Test that a slow source is cut off without delaying the others."""
+        tool = FinancialDataFetcherTool(
+            cache_manager=MagicMock(get=MagicMock(return_value=None)),
+            source_timeouts={"earnings_estimates": 0.2},
+        )
+
+        def slow_estimates(ticker, as_of_date=None):
+            time.sleep(1.0)
+            return {"eps": 1.0}
+
+        def slow_trends(ticker, as_of_date=None):
+            time.sleep(0.1)
+            return {"buy": 5, "total_analysts": 5}
+
+        tool.provider_manager = MagicMock(repository=None)
+        tool.provider_manager.get_company_info.side_effect = lambda t: time.sleep(0.1) or {
+            "name": "Test Corp"
+        }
+        tool.alpha_vantage_provider = MagicMock(is_available=True)
+        tool.alpha_vantage_provider.get_earnings_estimates.side_effect = slow_estimates
+        tool.finnhub_provider = MagicMock(is_available=True)
+        tool.finnhub_provider.get_recommendation_trends.side_effect = slow_trends
+        tool.price_provider = MagicMock()
+        tool.price_provider.get_stock_prices.side_effect = lambda *a, **k: time.sleep(0.1) or [
+            MagicMock(close_price=95.0),
+            MagicMock(close_price=100.0),
+        ]
+        tool._get_yfinance_metrics = MagicMock(
+            side_effect=lambda t: time.sleep(0.1) or {"valuation": {"trailing_pe": 12.0}}
+        )
+
+        start = time.monotonic()
+        result = tool.run("SLOW_TEST")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.8
+        assert result["company_info"]["name"] == "Test Corp"
+        assert result["earnings_estimates"] == {}
+        assert result["analyst_data"]["buy"] == 5
+        assert result["price_context"]["trend"] == "bullish"
+        assert result["metrics"]["valuation"]["trailing_pe"] == 12.0
+        assert "earnings_estimates" not in result["data_availability"]
+
+
+class TestPriceContextFromStore:
+    """Test price context served from the local price store."""
+
+    @pytest.fixture
+    def tool(self):
+        """Create tool with a temporary cache (and price store) and a mock provider."""
+        from src.cache.manager import CacheManager
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tool = FinancialDataFetcherTool(cache_manager=CacheManager(tmpdir))
+            tool.price_provider = MagicMock()
+            tool.price_provider.get_stock_prices.return_value = [
+                MagicMock(close_price=50.0),
+                MagicMock(close_price=40.0),
+            ]
+            yield tool
+
+    @staticmethod
+    def store_daily_closes(tool, ticker: str, end: date, days: int) -> None:
+        """Store one bar per calendar day up to end, with close rising by 1 per day."""
+        start = end - timedelta(days=days - 1)
+        tool.cache_manager.price_manager.store_prices(
+            ticker,
+            [
+                {"date": start + timedelta(days=i), "close": 100.0 + i, "volume": 1000}
+                for i in range(days)
+            ],
+        )
+
+    def test_uses_store_without_network(self, tool):
+        """Test that a covered window is served from the store."""
+        self.store_daily_closes(tool, "STORED", date.today(), 60)
+
+        context = tool._get_price_context("STORED")
+
+        tool.price_provider.get_stock_prices.assert_not_called()
+        assert context["latest_price"] == 159.0
+        assert context["change_percent"] == pytest.approx((159.0 - 129.0) / 129.0)
+        assert context["trend"] == "bullish"
+
+    def test_historical_date_slices_store(self, tool):
+        """Test that backtests only see prices up to the historical date."""
+        self.store_daily_closes(tool, "STORED", date.today(), 60)
+        tool.set_historical_date(date.today() - timedelta(days=20))
+
+        context = tool._get_price_context("STORED")
+
+        tool.price_provider.get_stock_prices.assert_not_called()
+        assert context["latest_price"] == 139.0
+
+    def test_gap_falls_back_to_provider(self, tool):
+        """Test that a stale store falls back to a date-bounded provider request."""
+        self.store_daily_closes(tool, "STALE", date.today() - timedelta(days=10), 60)
+        historical = date.today() - timedelta(days=2)
+        tool.set_historical_date(historical)
+
+        context = tool._get_price_context("STALE")
+
+        kwargs = tool.price_provider.get_stock_prices.call_args.kwargs
+        assert kwargs["end_date"].date() == historical
+        assert kwargs["start_date"].date() == historical - timedelta(days=30)
+        assert context["latest_price"] == 40.0
+        assert context["trend"] == "bearish"
@@ -0,0 +1,86 @@
+"""Tests for the pooled HTTP client."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data.finnhub import FinnhubProvider
+from src.data.http_client import HTTPClient
+from src.data.provider_manager import ProviderManager
+
+
+def make_response(status_code: int = 200, headers: dict | None = None, body: str = "") -> MagicMock:
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = headers or {}
+    response.text = body
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create an HTTPClient with a mocked session."""
+    client = HTTPClient(cache_size=2)
+    client.session = MagicMock()
+    return client
+
+
+class TestHTTPClient:
+    """Test suite for HTTPClient."""
+
+    def test_adapter_pool_bounded_per_host(self):
+        """Test that the session pools connections with a bounded size."""
+        client = HTTPClient(pool_maxsize=3)
+        adapter = client.session.get_adapter("https://finnhub.io/api/v1/quote")
+
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is True
+        client.close()
+
+    def test_not_modified_returns_cached_response(self, client):
+        """Test ETag revalidation and reuse of the cached body on 304."""
+        first = make_response(headers={"ETag": '"abc"'}, body="payload")
+        client.session.get.side_effect = [first, make_response(304)]
+
+        assert client.get("https://api.test/x", params={"a": 1}) is first
+        assert client.get("https://api.test/x", params={"a": 1}) is first
+
+        second_headers = client.session.get.call_args_list[1].kwargs["headers"]
+        assert second_headers == {"If-None-Match": '"abc"'}
+        assert client.stats == {"requests": 2, "not_modified": 1}
+
+    def test_responses_without_validators_not_cached(self, client):
+        """Test that plain responses are not revalidated."""
+        client.session.get.return_value = make_response()
+
+        client.get("https://api.test/x")
+        client.get("https://api.test/x")
+
+        assert client.session.get.call_args_list[1].kwargs["headers"] == {}
+
+    def test_cache_evicts_least_recently_used(self, client):
+        """Test that the validator cache is bounded."""
+        client.session.get.side_effect = lambda url, **kwargs: make_response(
+            headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+
+        for path in ["a", "b", "a", "c"]:
+            client.get(f"https://api.test/{path}")
+
+        assert [key[0] for key in client._cache] == ["https://api.test/a", "https://api.test/c"]
+
+
+class TestClientInjection:
+    """Test that providers share the manager's client."""
+
+    def test_provider_manager_injects_client(self):
+        """Test that API providers created by the manager use its HTTP client."""
+        with patch.dict("os.environ", {"FINNHUB_API_KEY": "test"}):
+            manager = ProviderManager(
+                primary_provider="yahoo_finance", backup_providers=["finnhub"]
+            )
+
+        assert isinstance(manager.backup_providers[0], FinnhubProvider)
+        assert manager.backup_providers[0].http is manager.http_client
@@ -0,0 +1,186 @@
+"""Unit tests for TradingJournalAnalytics."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.cache.manager import CacheManager
+from src.data.journal_analytics import TradingJournalAnalytics
+from src.data.repository import TradingJournalRepository
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for the database and cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def journal_repo(temp_dir):
+    """Create a TradingJournalRepository instance with a temporary database."""
+    return TradingJournalRepository(temp_dir / "test.db")
+
+
+@pytest.fixture
+def analytics(temp_dir):
+    """Create an analytics engine over the same database."""
+    return TradingJournalAnalytics(temp_dir / "test.db", rolling_window=2)
+
+
+def close_trade(repo, ticker, entry_date, exit_date, exit_price, entry_price=100.0):
+    """Create and close a 10-share long trade with 1.0 fees on each side."""
+    _, _, trade_id = repo.create_trade(
+        ticker_symbol=ticker,
+        entry_date=entry_date,
+        entry_price=entry_price,
+        position_size=10,
+        fees_entry=1.0,
+    )
+    repo.close_trade(trade_id=trade_id, exit_date=exit_date, exit_price=exit_price, fees_exit=1.0)
+    return trade_id
+
+
+@pytest.fixture
+def populated_repo(journal_repo):
+    """Journal with winners and losers across two tickers and two months."""
+    close_trade(journal_repo, "AAPL", date(2025, 1, 2), date(2025, 1, 12), 112.0)  # +118
+    close_trade(journal_repo, "MSFT", date(2025, 1, 5), date(2025, 1, 20), 90.0)  # -102
+    close_trade(journal_repo, "AAPL", date(2025, 2, 1), date(2025, 2, 3), 95.0)  # -52
+    close_trade(journal_repo, "MSFT", date(2025, 2, 10), date(2025, 2, 24), 120.0)  # +198
+    return journal_repo
+
+
+class TestTradingJournalAnalytics:
+    """Test suite for TradingJournalAnalytics."""
+
+    def test_empty_journal(self, analytics):
+        """Test analytics with no closed trades."""
+        result = analytics.get_analytics()
+
+        assert result["summary"]["total_trades"] == 0
+        assert result["equity_curve"] == []
+        assert result["by_ticker"] == []
+        assert result["holding_period"] == {}
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_summary(self, analytics):
+        """Test headline statistics."""
+        summary = analytics.get_analytics()["summary"]
+
+        assert summary["total_trades"] == 4
+        assert summary["winning_trades"] == 2
+        assert summary["losing_trades"] == 2
+        assert summary["win_rate"] == pytest.approx(50.0)
+        assert summary["total_profit_loss"] == pytest.approx(162.0)
+        assert summary["total_fees"] == pytest.approx(8.0)
+        assert summary["avg_win"] == pytest.approx(158.0)
+        assert summary["avg_loss"] == pytest.approx(-77.0)
+        assert summary["profit_factor"] == pytest.approx(316.0 / 154.0)
+        assert summary["expectancy"] == pytest.approx(40.5)
+        assert summary["max_drawdown"] == pytest.approx(-154.0)
+
+    def test_breakeven_trade_neither_win_nor_loss(self, journal_repo, analytics):
+        """Test a trade closed at zero P&L is not counted as a loss."""
+        close_trade(journal_repo, "AAPL", date(2025, 1, 2), date(2025, 1, 12), 100.2)  # 0.0
+        close_trade(journal_repo, "MSFT", date(2025, 1, 5), date(2025, 1, 20), 90.0)  # -102
+
+        summary = analytics.get_analytics()["summary"]
+
+        assert summary["winning_trades"] == 0
+        assert summary["losing_trades"] == 1
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_equity_curve(self, analytics):
+        """Test cumulative P&L, drawdown and rolling win rate per exit."""
+        curve = analytics.get_analytics()["equity_curve"]
+
+        assert [p["equity"] for p in curve] == pytest.approx([118.0, 16.0, -36.0, 162.0])
+        assert [p["drawdown"] for p in curve] == pytest.approx([0.0, -102.0, -154.0, 0.0])
+        assert [p["rolling_win_rate"] for p in curve] == pytest.approx([100.0, 50.0, 0.0, 50.0])
+        assert curve[0]["exit_date"] == "2025-01-12"
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_breakdowns(self, analytics):
+        """Test per-ticker and per-month groupings."""
+        result = analytics.get_analytics()
+
+        by_ticker = {row["key"]: row for row in result["by_ticker"]}
+        assert by_ticker["AAPL"]["trades"] == 2
+        assert by_ticker["AAPL"]["total_profit_loss"] == pytest.approx(66.0)
+        assert by_ticker["MSFT"]["win_rate"] == pytest.approx(50.0)
+
+        by_month = {row["key"]: row for row in result["by_month"]}
+        assert by_month["2025-01"]["total_profit_loss"] == pytest.approx(16.0)
+        assert by_month["2025-02"]["total_profit_loss"] == pytest.approx(146.0)
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_holding_period(self, analytics):
+        """Test holding period statistics."""
+        holding = analytics.get_analytics()["holding_period"]
+
+        assert holding["avg_days"] == pytest.approx((10 + 15 + 2 + 14) / 4)
+        assert holding["min_days"] == 2
+        assert holding["max_days"] == 15
+        assert holding["avg_days_winners"] == pytest.approx(12.0)
+        assert holding["avg_days_losers"] == pytest.approx(8.5)
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_filters(self, analytics):
+        """Test ticker and exit date filters."""
+        assert analytics.get_analytics(ticker_symbol="aapl")["summary"]["total_trades"] == 2
+        february = analytics.get_analytics(start_date=date(2025, 2, 1))
+        assert february["summary"]["total_trades"] == 2
+
+    def test_cache_until_next_write(self, populated_repo, analytics):
+        """Test results are cached until a trade is written."""
+        load_spy = MagicMock(wraps=analytics.load_trades)
+        analytics.load_trades = load_spy
+
+        analytics.get_analytics()
+        analytics.get_analytics()
+        assert load_spy.call_count == 1
+
+        close_trade(populated_repo, "NVDA", date(2025, 3, 1), date(2025, 3, 5), 110.0)
+        result = analytics.get_analytics()
+        assert load_spy.call_count == 2
+        assert result["summary"]["total_trades"] == 5
+
+    @pytest.mark.usefixtures("populated_repo")
+    def test_persistent_cache(self, temp_dir):
+        """Test results are shared across engine instances through the cache manager."""
+        cache_manager = CacheManager(temp_dir / "cache")
+        first = TradingJournalAnalytics(temp_dir / "test.db", cache_manager=cache_manager)
+        expected = first.get_analytics()
+
+        second = TradingJournalAnalytics(
+            temp_dir / "test.db", cache_manager=CacheManager(temp_dir / "cache")
+        )
+        assert second.get_analytics() == expected
+
+    def test_persistent_cache_replaced_on_write(self, populated_repo, temp_dir):
+        """Test a trade write replaces the persisted entry instead of adding one."""
+        cache_dir = temp_dir / "cache"
+        engine = TradingJournalAnalytics(
+            temp_dir / "test.db", cache_manager=CacheManager(cache_dir)
+        )
+        engine.get_analytics()
+        cache_files = sorted(cache_dir.rglob("*.json"))
+        assert len(cache_files) == 1
+
+        close_trade(populated_repo, "NVDA", date(2025, 3, 1), date(2025, 3, 5), 110.0)
+        fresh = TradingJournalAnalytics(temp_dir / "test.db", cache_manager=CacheManager(cache_dir))
+
+        assert fresh.get_analytics()["summary"]["total_trades"] == 5
+        assert sorted(cache_dir.rglob("*.json")) == cache_files
+
+    def test_repository_summary_delegates(self, populated_repo):
+        """Test repository summary keeps its keys while using the engine."""
+        summary = populated_repo.get_performance_summary()
+
+        assert summary["total_trades"] == 4
+        assert summary["best_trade"] == pytest.approx(198.0)
+        assert summary["worst_trade"] == pytest.approx(-102.0)
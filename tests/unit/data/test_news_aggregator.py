@@ -0,0 +1,202 @@
+"""Tests for UnifiedNewsAggregator source fetching modes."""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.models import NewsArticle
+from src.data.news_aggregator import NewsSourceConfig, UnifiedNewsAggregator
+
+AS_OF = datetime(2024, 6, 15, 12, 0)
+
+
+def make_articles(prefix: str, count: int, hours_offset: int = 0) -> list[NewsArticle]:
+    """Create distinct articles, newest first."""
+    return [
+        NewsArticle(
+            ticker="AAPL",
+            title=f"{prefix} headline {i}",
+            summary=f"{prefix} summary {i}",
+            source=prefix,
+            published_date=AS_OF - timedelta(hours=i + hours_offset),
+            url=f"https://example.com/{prefix}/{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def make_provider(articles: list[NewsArticle], delay: float = 0.0) -> MagicMock:
+    """Create a mock news provider that returns articles after a delay."""
+
+    def get_news(ticker, limit=50, as_of_date=None):
+        time.sleep(delay)
+        return list(articles[:limit])
+
+    provider = MagicMock()
+    provider.get_news.side_effect = get_news
+    return provider
+
+
+def make_aggregator(providers: dict, timeouts: dict | None = None, **kwargs):
+    """Create an aggregator with mock providers in the given priority order."""
+    aggregator = UnifiedNewsAggregator(sources=[], **kwargs)
+    aggregator.sources = [
+        NewsSourceConfig(
+            name=name,
+            priority=i + 1,
+            timeout_seconds=(timeouts or {}).get(name, 5.0),
+        )
+        for i, name in enumerate(providers)
+    ]
+    aggregator._providers = dict(providers)
+    return aggregator
+
+
+class TestSequentialFetch:
+    """Test the default priority-ordered fetching."""
+
+    def test_stops_after_target_reached(self):
+        """Test that lower-priority sources are skipped once the target is met."""
+        primary = make_provider(make_articles("primary", 10))
+        backup = make_provider(make_articles("backup", 10))
+        aggregator = make_aggregator({"primary": primary, "backup": backup}, target_article_count=5)
+
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert len(result) == 5
+        backup.get_news.assert_not_called()
+
+
+class TestConcurrentFetch:
+    """Test concurrent multi-source fetching."""
+
+    def test_sources_queried_in_parallel(self):
+        """Test that latency is bounded by the slowest source, not the sum."""
+        providers = {
+            name: make_provider(make_articles(name, 3), delay=0.2) for name in ["a", "b", "c"]
+        }
+        aggregator = make_aggregator(providers, target_article_count=50, concurrent=True)
+
+        start = time.monotonic()
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert time.monotonic() - start < 0.5
+        assert len(result) == 9
+        # Newest first
+        dates = [a.published_date for a in result]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_prefers_higher_priority_when_over_budget(self):
+        """Test that trimming keeps higher-priority sources even if their news is older."""
+        primary = make_provider(make_articles("primary", 4, hours_offset=100))
+        backup = make_provider(make_articles("backup", 4))
+        aggregator = make_aggregator(
+            {"primary": primary, "backup": backup}, target_article_count=6, concurrent=True
+        )
+
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        sources = [a.source for a in result]
+        assert sources.count("primary") == 4
+        assert sources.count("backup") == 2
+        # The two newest backup articles are kept
+        assert {a.title for a in result if a.source == "backup"} == {
+            "backup headline 0",
+            "backup headline 1",
+        }
+
+    def test_duplicates_keep_higher_priority_copy(self):
+        """Test that a story from both sources is kept once, from the primary source."""
+        shared = make_articles("shared", 1)[0]
+        primary = make_provider([shared.model_copy(update={"source": "primary"})], delay=0.1)
+        backup = make_provider([shared.model_copy(update={"source": "backup"})])
+        aggregator = make_aggregator(
+            {"primary": primary, "backup": backup}, target_article_count=10, concurrent=True
+        )
+
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert [a.source for a in result] == ["primary"]
+
+    def test_slow_source_times_out(self):
+        """Test that a source missing its deadline does not hold up the others."""
+        fast = make_provider(make_articles("fast", 3))
+        slow = make_provider(make_articles("slow", 3), delay=1.0)
+        failing = MagicMock()
+        failing.get_news.side_effect = RuntimeError("API down")
+        aggregator = make_aggregator(
+            {"slow": slow, "fast": fast, "failing": failing},
+            timeouts={"slow": 0.1},
+            target_article_count=50,
+            concurrent=True,
+        )
+
+        start = time.monotonic()
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert time.monotonic() - start < 0.5
+        assert {a.source for a in result} == {"fast"}
+
+    @pytest.mark.parametrize("stop_at_target, expect_slow", [(True, False), (False, True)])
+    def test_stop_at_target(self, stop_at_target, expect_slow):
+        """Test that racing stops waiting for slower sources once the target is met."""
+        fast = make_provider(make_articles("fast", 5))
+        slow = make_provider(make_articles("slow", 5), delay=0.3)
+        aggregator = make_aggregator(
+            {"slow": slow, "fast": fast},
+            target_article_count=5,
+            concurrent=True,
+            stop_at_target=stop_at_target,
+        )
+
+        start = time.monotonic()
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+        elapsed = time.monotonic() - start
+
+        assert len(result) == 5
+        assert ("slow" in {a.source for a in result}) == expect_slow
+        assert (elapsed >= 0.3) == expect_slow
+
+    def test_lookback_window_applied(self):
+        """Test that articles older than the lookback window are dropped."""
+        articles = make_articles("src", 3) + make_articles("old", 2, hours_offset=24 * 10)
+        aggregator = make_aggregator(
+            {"src": make_provider(articles)}, max_age_days=7, concurrent=True
+        )
+
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert {a.source for a in result} == {"src"}
+
+
+class TestDeduplication:
+    """Test deduplication in the aggregator."""
+
+    def test_near_duplicates_from_other_source_removed(self):
+        """Test that a syndicated story with a different title is kept once."""
+        summary = (
+            "Apple Inc reported quarterly revenue above Wall Street expectations on "
+            "Thursday, driven by strong iPhone demand in China and services growth."
+        )
+        primary_article = make_articles("primary", 1)[0].model_copy(
+            update={"title": "Apple beats estimates as iPhone sales surge", "summary": summary}
+        )
+        backup_article = make_articles("backup", 1)[0].model_copy(
+            update={"title": "Apple Beats Estimates As iPhone Sales Surge - Reuters"}
+        )
+        backup_article.summary = summary
+        aggregator = make_aggregator(
+            {
+                "primary": make_provider([primary_article]),
+                "backup": make_provider([backup_article] + make_articles("backup", 3)[1:]),
+            },
+            target_article_count=10,
+        )
+
+        result = aggregator.fetch_news("AAPL", as_of_date=AS_OF)
+
+        assert len(result) == 3
+        assert primary_article in result
+        assert backup_article not in result
@@ -0,0 +1,210 @@
+"""Tests for the persistent news article store and incremental fetching."""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.models import NewsArticle
+from src.data.news_aggregator import (
+    WATERMARK_OVERLAP,
+    NewsSourceConfig,
+    UnifiedNewsAggregator,
+)
+from src.data.repository import NewsArticleRepository
+
+NOW = datetime.now().replace(microsecond=0)
+
+
+def make_article(i: int, hours_ago: float, ticker: str = "AAPL") -> NewsArticle:
+    """Create a test article published some hours before now."""
+    return NewsArticle(
+        ticker=ticker,
+        title=f"Headline number {i} about quarterly results",
+        summary=f"Summary {i}",
+        source="Test",
+        url=f"https://example.com/{i}",
+        published_date=NOW - timedelta(hours=hours_ago),
+    )
+
+
+@pytest.fixture
+def store():
+    """Create a NewsArticleRepository on a temporary database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield NewsArticleRepository(Path(tmpdir) / "test.db")
+
+
+class FakeProvider:
+    """News provider serving a fixed article list, honoring as_of_date and since."""
+
+    def __init__(self, articles: list[NewsArticle]):
+        self.articles = articles
+        self.calls: list[dict] = []
+
+    def get_news(self, ticker, limit=50, as_of_date=None, since=None):
+        self.calls.append({"as_of_date": as_of_date, "since": since})
+        result = [
+            a
+            for a in self.articles
+            if (as_of_date is None or a.published_date <= as_of_date)
+            and (since is None or a.published_date > since)
+        ]
+        return sorted(result, key=lambda a: a.published_date, reverse=True)[:limit]
+
+
+def make_aggregator(provider, store) -> UnifiedNewsAggregator:
+    """Create an aggregator with a single fake provider and the given store."""
+    aggregator = UnifiedNewsAggregator(
+        sources=[], target_article_count=50, max_age_days=7, article_store=store
+    )
+    aggregator.sources = [NewsSourceConfig(name="fake", priority=1)]
+    aggregator._providers = {"fake": provider}
+    return aggregator
+
+
+class TestNewsArticleRepository:
+    """Test suite for NewsArticleRepository."""
+
+    def test_store_and_query_range(self, store):
+        """Test that articles are stored once and queried by ticker and date range."""
+        articles = [make_article(i, hours_ago=i * 24) for i in range(5)]
+
+        assert store.store_articles("AAPL", articles) == 5
+        assert store.store_articles("AAPL", articles) == 0
+
+        result = store.get_articles("AAPL", NOW - timedelta(days=2, hours=1), NOW)
+        assert [a.url for a in result] == [f"https://example.com/{i}" for i in range(3)]
+        assert store.get_articles("MSFT", NOW - timedelta(days=10), NOW) == []
+        assert len(store.get_articles("AAPL", NOW - timedelta(days=10), NOW, limit=2)) == 2
+
+    def test_shared_article_linked_to_each_ticker(self, store):
+        """Test that an article fetched for two tickers is stored once and linked twice."""
+        article = make_article(1, hours_ago=1)
+
+        assert store.store_articles("AAPL", [article]) == 1
+        assert store.store_articles("MSFT", [article.model_copy(update={"ticker": "MSFT"})]) == 0
+
+        window = (NOW - timedelta(days=1), NOW)
+        assert store.get_articles("MSFT", *window)[0].ticker == "MSFT"
+        assert len(store.get_articles("AAPL", *window)) == 1
+
+    def test_fetch_state_roundtrip(self, store):
+        """Test creating and updating the fetch watermark."""
+        assert store.get_fetch_state("AAPL") is None
+
+        store.update_fetch_state("aapl", NOW - timedelta(days=7), NOW, None)
+        store.update_fetch_state("AAPL", NOW - timedelta(days=7), NOW, NOW - timedelta(hours=1))
+
+        assert store.get_fetch_state("AAPL") == {
+            "covered_from": NOW - timedelta(days=7),
+            "last_fetched_at": NOW,
+            "watermark": NOW - timedelta(hours=1),
+        }
+
+    def test_source_watermarks_only_advance(self, store):
+        """Test that per-source watermarks are kept per source and never move back."""
+        assert store.get_source_watermarks("AAPL") == {}
+
+        store.update_source_watermarks("aapl", {"a": NOW - timedelta(hours=2), "b": NOW})
+        store.update_source_watermarks(
+            "AAPL", {"a": NOW - timedelta(hours=1), "b": NOW - timedelta(days=1)}
+        )
+
+        assert store.get_source_watermarks("AAPL") == {"a": NOW - timedelta(hours=1), "b": NOW}
+
+
+class TestIncrementalFetch:
+    """Test watermark-based incremental fetching in UnifiedNewsAggregator."""
+
+    def test_second_fetch_only_requests_newer_articles(self, store):
+        """Test that a repeat live fetch asks providers only for articles after the watermark."""
+        provider = FakeProvider([make_article(i, hours_ago=2 + i * 10) for i in range(5)])
+        aggregator = make_aggregator(provider, store)
+
+        first = aggregator.fetch_news("AAPL")
+        assert len(first) == 5
+        assert provider.calls[0]["since"] is None
+
+        provider.articles.append(make_article(99, hours_ago=1))
+        second = aggregator.fetch_news("AAPL")
+
+        assert provider.calls[1]["since"] == NOW - timedelta(hours=2) - WATERMARK_OVERLAP
+        assert len(second) == 6
+        assert second[0].url == "https://example.com/99"
+        assert store.get_fetch_state("AAPL")["watermark"] == NOW - timedelta(hours=1)
+
+    def test_historical_fetch_inside_window_uses_store(self, store):
+        """Test that a backtest date inside the covered window makes no provider call."""
+        provider = FakeProvider([make_article(i, hours_ago=i * 12) for i in range(10)])
+        aggregator = make_aggregator(provider, store)
+        aggregator.fetch_news("AAPL")
+
+        as_of = NOW - timedelta(hours=30)
+        # The store covers [now - 7d, now]; a 2-day lookback from as_of is inside it
+        result = aggregator.fetch_news("AAPL", lookback_days=2, as_of_date=as_of)
+
+        assert len(provider.calls) == 1
+        assert all(as_of - timedelta(days=2) <= a.published_date <= as_of for a in result)
+        assert [a.url for a in result] == [f"https://example.com/{i}" for i in range(3, 7)]
+
+    def test_historical_fetch_outside_window_fetches_and_stores(self, store):
+        """Test that an uncovered backtest date is fetched and stored without moving the state."""
+        provider = FakeProvider([make_article(i, hours_ago=24 * 30 + i) for i in range(3)])
+        aggregator = make_aggregator(provider, store)
+
+        result = aggregator.fetch_news("AAPL", as_of_date=NOW - timedelta(days=29))
+
+        assert len(result) == 3
+        assert provider.calls[0]["since"] is None
+        assert len(store.get_articles("AAPL", NOW - timedelta(days=40), NOW)) == 3
+        assert store.get_fetch_state("AAPL") is None
+
+    def test_failed_source_fetched_from_own_watermark(self, store):
+        """Test that a source failing during an incremental fetch catches up afterwards."""
+        primary = FakeProvider([make_article(1, hours_ago=20)])
+        secondary = FakeProvider([make_article(2, hours_ago=30)])
+        aggregator = make_aggregator(primary, store)
+        aggregator.sources.append(NewsSourceConfig(name="secondary", priority=2))
+        aggregator._providers["secondary"] = secondary
+        aggregator.fetch_news("AAPL")
+
+        # Secondary is down while both publish, then recovers
+        primary.articles.append(make_article(3, hours_ago=1))
+        secondary.articles.append(make_article(4, hours_ago=10))
+        get_news = secondary.get_news
+        secondary.get_news = MagicMock(side_effect=RuntimeError("API down"))
+        assert "https://example.com/4" not in [a.url for a in aggregator.fetch_news("AAPL")]
+
+        secondary.get_news = get_news
+        result = aggregator.fetch_news("AAPL")
+
+        assert secondary.calls[-1]["since"] == NOW - timedelta(hours=30) - WATERMARK_OVERLAP
+        assert primary.calls[-1]["since"] == NOW - timedelta(hours=1) - WATERMARK_OVERLAP
+        assert "https://example.com/4" in [a.url for a in result]
+        assert store.get_source_watermarks("AAPL") == {
+            "fake": NOW - timedelta(hours=1),
+            "secondary": NOW - timedelta(hours=10),
+        }
+
+    def test_late_article_inside_overlap_picked_up(self, store):
+        """Test that an article published late, dated just before the watermark, is fetched."""
+        provider = FakeProvider([make_article(1, hours_ago=2)])
+        aggregator = make_aggregator(provider, store)
+        aggregator.fetch_news("AAPL")
+
+        provider.articles.append(make_article(2, hours_ago=3))
+        result = aggregator.fetch_news("AAPL")
+
+        assert [a.url for a in result] == ["https://example.com/1", "https://example.com/2"]
+
+    def test_failed_fetch_does_not_advance_state(self, store):
+        """Test that a fetch where every source fails leaves the watermark alone."""
+        provider = MagicMock()
+        provider.get_news.side_effect = RuntimeError("API down")
+        aggregator = make_aggregator(provider, store)
+
+        assert aggregator.fetch_news("AAPL") == []
+        assert store.get_fetch_state("AAPL") is None
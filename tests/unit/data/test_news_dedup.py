@@ -0,0 +1,127 @@
+"""Tests for near-duplicate news detection."""
+
+from datetime import datetime
+
+import pytest
+
+from src.data.models import NewsArticle
+from src.data.news_dedup import NearDuplicateIndex, deduplicate, normalize_title, shingles
+
+SUMMARY = (
+    "Apple Inc reported quarterly revenue above Wall Street expectations on Thursday, "
+    "driven by strong iPhone demand in China and services growth."
+)
+
+
+def make_article(title: str, summary: str | None = SUMMARY, url: str | None = None) -> NewsArticle:
+    """Create a test NewsArticle."""
+    return NewsArticle(
+        ticker="AAPL",
+        title=title,
+        summary=summary,
+        source="Test Source",
+        published_date=datetime(2024, 1, 15),
+        url=url or f"https://example.com/{abs(hash((title, summary)))}",
+    )
+
+
+class TestNormalization:
+    """Test title normalization and shingling."""
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            ("  Apple   Beats Estimates ", "apple beats estimates"),
+            ("BREAKING: Apple beats estimates", "apple beats estimates"),
+            ("Update: Exclusive: Apple beats", "apple beats"),
+        ],
+    )
+    def test_normalize_title(self, title, expected):
+        """Test case, whitespace and prefix normalization."""
+        assert normalize_title(title) == expected
+
+    def test_shingles(self):
+        """Test word bigram shingles ignore punctuation and case."""
+        assert shingles("Apple, beats estimates!") == {"apple beats", "beats estimates"}
+        assert shingles("Apple") == {"apple"}
+
+
+class TestNearDuplicateIndex:
+    """Test suite for NearDuplicateIndex."""
+
+    def test_syndicated_variants_are_duplicates(self):
+        """Test that reworded titles of the same story are detected."""
+        original = make_article("Apple beats estimates as iPhone sales surge - Reuters")
+        variants = [
+            make_article("Apple Beats Estimates As iPhone Sales Surge"),
+            make_article(
+                "Apple tops estimates as iPhone sales surge",
+                SUMMARY.replace("services growth", "growth in services"),
+            ),
+        ]
+        index = NearDuplicateIndex()
+
+        assert index.add(original)
+        assert all(index.is_duplicate(v) for v in variants)
+        assert not any(index.add(v) for v in variants)
+        assert len(index) == 1
+
+    def test_different_stories_are_kept(self):
+        """Test that related but different stories are not merged."""
+        articles = [
+            make_article("Apple beats estimates as iPhone sales surge"),
+            make_article(
+                "Apple misses estimates as iPhone sales slump",
+                "Apple Inc reported quarterly revenue below Wall Street expectations on "
+                "Thursday, hurt by weak iPhone demand in China and lower services.",
+            ),
+            make_article(
+                "Microsoft falls on cloud outlook",
+                "Microsoft shares fell after the company said cloud growth would slow.",
+            ),
+        ]
+
+        assert deduplicate(articles) == articles
+
+    def test_exact_url_and_title_matches(self):
+        """Test exact matching, including for texts too short to fingerprint."""
+        index = NearDuplicateIndex()
+        index.add(make_article("Apple", summary=None, url="https://example.com/a"))
+
+        assert index.is_duplicate(make_article("Other", summary=None, url="https://example.com/a"))
+        assert index.is_duplicate(make_article("BREAKING: apple", summary=None))
+        assert not index.is_duplicate(make_article("Apple up", summary=None))
+
+    def test_first_copy_kept_and_order_preserved(self):
+        """Test that deduplicate keeps the first copy in input order."""
+        first = make_article("Apple beats estimates as iPhone sales surge")
+        other = make_article("Nokia wins 5G contract", "Nokia signed a network deal in India.")
+        copy = make_article("Apple beats estimates as iPhone sales surge (update)")
+
+        assert deduplicate([first, other, copy]) == [first, other]
+
+    def test_threshold_one_disables_near_duplicates(self):
+        """Test that a threshold of 1.0 only matches URL and title exactly."""
+        articles = [
+            make_article("Apple beats estimates as iPhone sales surge - Reuters"),
+            make_article("Apple Beats Estimates As iPhone Sales Surge"),
+        ]
+
+        assert len(deduplicate(articles, threshold=1.0)) == 2
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(threshold=0.0)
+
+    def test_index_scales_to_many_articles(self):
+        """Test that a run-sized index only flags true duplicates."""
+        index = NearDuplicateIndex()
+        articles = [
+            make_article(
+                f"Company {i} reports results for quarter {i % 4}",
+                f"Company {i} said revenue reached {i * 7} million with margin of {i % 13} "
+                f"percent while guidance for segment {i * 3} was unchanged.",
+            )
+            for i in range(500)
+        ]
+
+        assert len(index.filter(articles)) == 500
+        assert index.is_duplicate(articles[123].model_copy(update={"url": "https://x.com/1"}))
@@ -310,6 +310,19 @@ class TestPerformanceRepository:
         )
         assert len(active) == 2
 
+    def test_iter_active_recommendations_allows_writes(self, perf_repo, rec_repo):
+        """Test tracking prices while streaming active recommendations."""
+        rec_ids = [_store_buy_signal(rec_repo, f"TICK{i}", days_ago=10) for i in range(3)]
+
+        streamed = []
+        for rec in perf_repo.iter_active_recommendations(max_age_days=30, batch_size=1):
+            streamed.append(rec.ticker_obj.symbol)
+            assert perf_repo.track_price(rec.id, date.today(), 105.0) is True
+
+        assert streamed == ["TICK0", "TICK1", "TICK2"]
+        for rec_id in rec_ids:
+            assert len(perf_repo.get_performance_data(rec_id)) == 1
+
     def test_update_performance_summary(self, perf_repo, rec_repo):
         """Test updating performance summary."""
         from src.analysis import InvestmentSignal
@@ -414,3 +427,222 @@ class TestPerformanceRepository:
         assert report is not None
         assert "message" in report
         assert report["message"] == "No performance data available"
+
+
+def _store_buy_signal(
+    rec_repo,
+    ticker: str,
+    days_ago: int,
+    confidence: float = 80.0,
+    analysis_mode: str = "rule_based",
+) -> int:
+    """Store a buy recommendation priced at 100.0 and return its ID."""
+    from src.analysis import InvestmentSignal
+    from src.analysis.models import ComponentScores, RiskAssessment
+
+    signal = InvestmentSignal(
+        ticker=ticker,
+        name=f"Test {ticker}",
+        market="US",
+        current_price=100.0,
+        currency="USD",
+        scores=ComponentScores(technical=75.0, fundamental=75.0, sentiment=75.0),
+        final_score=75.0,
+        recommendation="buy",
+        confidence=confidence,
+        expected_return_min=5.0,
+        expected_return_max=15.0,
+        key_reasons=["Test"],
+        risk=RiskAssessment(
+            level="medium",
+            volatility="moderate",
+            volatility_pct=15.0,
+            liquidity="normal",
+            concentration_risk=False,
+        ),
+        generated_at=datetime.now(),
+        analysis_date=(date.today() - timedelta(days=days_ago)).isoformat(),
+        rationale="Test",
+        caveats=[],
+    )
+    return rec_repo.store_recommendation(signal, run_session_id=1, analysis_mode=analysis_mode)
+
+
+class TestPerformanceTimeSeries:
+    """Test suite for the materialized daily performance tables."""
+
+    def test_track_price_materializes_daily_row(self, perf_repo, rec_repo):
+        """Test that track_price writes the denormalized daily row."""
+        rec_id = _store_buy_signal(rec_repo, "AAPL", days_ago=10)
+        perf_repo.track_price(rec_id, date.today() - timedelta(days=1), 104.0, 400.0)
+        perf_repo.track_price(rec_id, date.today(), 110.0, 404.0)
+
+        series = perf_repo.get_performance_timeseries(date.today() - timedelta(days=5))
+
+        assert [row["tracking_date"] for row in series] == [
+            (date.today() - timedelta(days=1)).isoformat(),
+            date.today().isoformat(),
+        ]
+        latest = series[-1]
+        assert latest["ticker"] == "AAPL"
+        assert latest["return_pct"] == pytest.approx(10.0)
+        assert latest["benchmark_return_pct"] == pytest.approx(1.0)
+        assert latest["alpha"] == pytest.approx(9.0)
+
+    def test_track_price_update_refreshes_rollup(self, perf_repo, rec_repo):
+        """Test that re-tracking the same day replaces the cohort contribution."""
+        rec_id = _store_buy_signal(rec_repo, "AAPL", days_ago=10)
+        perf_repo.track_price(rec_id, date.today(), 90.0)
+        perf_repo.track_price(rec_id, date.today(), 120.0)
+
+        series = perf_repo.get_cohort_timeseries(date.today())
+
+        assert len(series) == 1
+        assert series[0]["count"] == 1
+        assert series[0]["avg_return"] == pytest.approx(20.0)
+        assert series[0]["win_rate"] == pytest.approx(100.0)
+
+    def test_cohort_timeseries_pools_recommendations(self, perf_repo, rec_repo):
+        """Test daily rollups combine every tracked recommendation."""
+        for i, price in enumerate([110.0, 95.0, 105.0]):
+            rec_id = _store_buy_signal(rec_repo, f"TICK{i}", days_ago=10 + i)
+            perf_repo.track_price(rec_id, date.today(), price)
+
+        series = perf_repo.get_cohort_timeseries(date.today() - timedelta(days=1))
+
+        assert len(series) == 1
+        assert series[0]["count"] == 3
+        assert series[0]["avg_return"] == pytest.approx(10.0 / 3)
+        assert series[0]["win_rate"] == pytest.approx(200.0 / 3)
+
+    def test_report_pools_returns_exactly(self, perf_repo, rec_repo):
+        """Test report statistics are pooled from individual returns."""
+        for i, price in enumerate([110.0, 95.0, 105.0]):
+            rec_id = _store_buy_signal(rec_repo, f"TICK{i}", days_ago=10 + i)
+            perf_repo.track_price(rec_id, date.today() - timedelta(days=1), 100.0)
+            perf_repo.track_price(rec_id, date.today(), price)
+
+        report = perf_repo.get_performance_report(period_days=30)
+
+        assert report["total_recommendations"] == 3
+        assert report["avg_return"] == pytest.approx(10.0 / 3)
+        assert report["median_return"] == pytest.approx(5.0)
+        assert report["win_rate"] == pytest.approx(200.0 / 3)
+        assert report["max_drawdown"] == pytest.approx(-5.0)
+        assert report["avg_confidence"] == pytest.approx(80.0)
+        assert report["sharpe_ratio"] is not None
+
+    def test_report_uses_each_recommendation_latest_day(self, perf_repo, rec_repo):
+        """Test recommendations tracked on different days all count in the same cohort."""
+        early_id = _store_buy_signal(rec_repo, "EARLY", days_ago=10)
+        late_id = _store_buy_signal(rec_repo, "LATE", days_ago=10)
+        _store_buy_signal(rec_repo, "UNTRACKED", days_ago=10, confidence=50.0)
+        perf_repo.track_price(early_id, date.today() - timedelta(days=3), 110.0)
+        perf_repo.track_price(late_id, date.today() - timedelta(days=3), 90.0)
+        perf_repo.track_price(late_id, date.today(), 96.0)
+
+        report = perf_repo.get_performance_report(period_days=30)
+        assert report["total_recommendations"] == 3
+        assert report["avg_return"] == pytest.approx(3.0)
+        assert report["win_rate"] == pytest.approx(50.0)
+        assert report["avg_confidence"] == pytest.approx(70.0)
+
+        report = perf_repo.get_performance_report(ticker_symbol="EARLY", period_days=30)
+        assert report["total_recommendations"] == 1
+        assert report["avg_return"] == pytest.approx(10.0)
+
+    def test_report_filters_by_ticker(self, perf_repo, rec_repo):
+        """Test ticker filter reads only that ticker's daily rows."""
+        for i, price in enumerate([110.0, 95.0]):
+            rec_id = _store_buy_signal(rec_repo, f"TICK{i}", days_ago=10)
+            perf_repo.track_price(rec_id, date.today(), price)
+
+        report = perf_repo.get_performance_report(ticker_symbol="TICK1", period_days=30)
+
+        assert report["total_recommendations"] == 1
+        assert report["avg_return"] == pytest.approx(-5.0)
+
+    def test_report_excludes_cohorts_outside_period(self, perf_repo, rec_repo):
+        """Test recommendations older than the period are excluded."""
+        old_id = _store_buy_signal(rec_repo, "OLD", days_ago=60)
+        new_id = _store_buy_signal(rec_repo, "NEW", days_ago=5)
+        perf_repo.track_price(old_id, date.today(), 150.0)
+        perf_repo.track_price(new_id, date.today(), 102.0)
+
+        report = perf_repo.get_performance_report(period_days=30)
+
+        assert report["total_recommendations"] == 1
+        assert report["avg_return"] == pytest.approx(2.0)
+
+    def test_rebuild_performance_timeseries(self, perf_repo, rec_repo):
+        """Test backfilling the materialized tables from price tracking."""
+        rec_id = _store_buy_signal(rec_repo, "AAPL", days_ago=10)
+        perf_repo.track_price(rec_id, date.today() - timedelta(days=1), 104.0)
+        perf_repo.track_price(rec_id, date.today(), 108.0)
+
+        assert perf_repo.rebuild_performance_timeseries() == 2
+
+        series = perf_repo.get_cohort_timeseries(date.today() - timedelta(days=5))
+        assert [row["avg_return"] for row in series] == [
+            pytest.approx(4.0),
+            pytest.approx(8.0),
+        ]
+        report = perf_repo.get_performance_report(period_days=30)
+        assert report["avg_return"] == pytest.approx(8.0)
+
+    def test_needs_timeseries_backfill(self, perf_repo, rec_repo):
+        """Test that tracking history without daily rows is detected."""
+        from sqlmodel import delete
+
+        from src.data.models import PerformanceCohortDaily, PerformanceDaily
+
+        assert perf_repo.needs_timeseries_backfill() is False
+
+        rec_id = _store_buy_signal(rec_repo, "AAPL", days_ago=10)
+        perf_repo.track_price(rec_id, date.today(), 108.0)
+        assert perf_repo.needs_timeseries_backfill() is False
+
+        # Simulate a database tracked before the materialized tables existed
+        session = perf_repo.db_manager.get_session()
+        session.exec(delete(PerformanceCohortDaily))
+        session.exec(delete(PerformanceDaily))
+        session.commit()
+        session.close()
+        assert perf_repo.needs_timeseries_backfill() is True
+
+        perf_repo.rebuild_performance_timeseries()
+        assert perf_repo.needs_timeseries_backfill() is False
+
+    def test_needs_timeseries_backfill_after_partial_tracking(self, perf_repo, rec_repo):
+        """Test that older history is detected after new tracking added daily rows."""
+        from sqlmodel import delete
+
+        from src.data.models import PerformanceCohortDaily, PerformanceDaily
+
+        old_id = _store_buy_signal(rec_repo, "AAPL", days_ago=20)
+        perf_repo.track_price(old_id, date.today() - timedelta(days=5), 104.0)
+        session = perf_repo.db_manager.get_session()
+        session.exec(delete(PerformanceCohortDaily))
+        session.exec(delete(PerformanceDaily))
+        session.commit()
+        session.close()
+
+        # First tracking run after the upgrade writes only the new day
+        new_id = _store_buy_signal(rec_repo, "MSFT", days_ago=10)
+        perf_repo.track_price(new_id, date.today(), 102.0)
+
+        assert perf_repo.needs_timeseries_backfill() is True
+        perf_repo.rebuild_performance_timeseries()
+        assert perf_repo.needs_timeseries_backfill() is False
+        assert perf_repo.get_performance_report(period_days=30)["avg_return"] == pytest.approx(3.0)
+
+    def test_backtest_signals_not_tracked(self, perf_repo, rec_repo):
+        """Test backtest recommendations are left out of tracking and reports."""
+        from src.data.repository import BACKTEST_ANALYSIS_MODE
+
+        live_id = _store_buy_signal(rec_repo, "AAPL", days_ago=10)
+        perf_repo.track_price(live_id, date.today(), 104.0)
+        _store_buy_signal(rec_repo, "MSFT", days_ago=10, analysis_mode=BACKTEST_ANALYSIS_MODE)
+
+        assert [r.id for r in perf_repo.iter_active_recommendations()] == [live_id]
+        assert perf_repo.get_performance_report(period_days=30)["total_recommendations"] == 1
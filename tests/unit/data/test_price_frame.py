@@ -0,0 +1,144 @@
+"""Tests for frame-based price ingestion."""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.fixture import FixtureDataProvider
+from src.data.models import InstrumentType, Market, StockPrice
+from src.data.price_manager import PriceDataManager
+from src.data.yahoo_finance import YahooFinanceProvider
+
+
+def make_history(tz: str | None = "America/New_York") -> pd.DataFrame:
+    """Create a yfinance-style history frame with one incomplete bar."""
+    index = pd.date_range("2024-01-02", periods=4, freq="D", tz=tz, name="Date")
+    return pd.DataFrame(
+        {
+            "Open": [10.0, 11.0, np.nan, 13.0],
+            "High": [10.5, 11.5, 12.5, 13.5],
+            "Low": [9.5, 10.5, 11.5, 12.5],
+            "Close": [10.2, 11.2, 12.2, 13.2],
+            "Adj Close": [10.1, np.nan, 12.1, 13.1],
+            "Volume": [1000, 2000, 3000, 4000],
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def provider():
+    """Create a YahooFinanceProvider that does not look up company names."""
+    with patch.object(YahooFinanceProvider, "_get_ticker_name", return_value="Apple Inc."):
+        yield YahooFinanceProvider()
+
+
+class TestYahooPriceFrame:
+    """Test YahooFinanceProvider.get_price_frame."""
+
+    def test_history_normalized_to_store_columns(self, provider):
+        """Test column mapping, timezone removal and dropping incomplete bars."""
+        with patch("src.data.yahoo_finance.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = make_history()
+            frame = provider.get_price_frame("aapl", period="5d")
+
+        assert list(frame.columns) == PriceDataManager.COLUMNS
+        assert frame["date"].dt.tz is None
+        assert list(frame["date"]) == [pd.Timestamp(f"2024-01-0{d}") for d in (2, 3, 5)]
+        # Missing adjusted close falls back to close
+        assert list(frame["adj_close"]) == [10.1, 11.2, 13.1]
+        assert frame["volume"].dtype == "int64"
+        assert set(frame["ticker"]) == {"AAPL"}
+        assert set(frame["market"]) == {"us"}
+        assert set(frame["currency"]) == {"USD"}
+
+    def test_download_multiindex_columns(self, provider):
+        """Test that (PriceLevel, Ticker) columns from yf.download() are flattened."""
+        history = make_history(tz=None)
+        history.columns = pd.MultiIndex.from_product([history.columns, ["NOVO-B.CO"]])
+
+        with patch("src.data.yahoo_finance.yf.download", return_value=history):
+            frame = provider.get_price_frame(
+                "novo-b.co", datetime(2024, 1, 1), datetime(2024, 1, 6)
+            )
+
+        assert len(frame) == 3
+        assert list(frame["close"]) == [10.2, 11.2, 13.2]
+        assert set(frame["currency"]) == {"EUR"}
+
+    def test_stock_prices_built_from_frame(self, provider):
+        """Test that get_stock_prices returns the same bars as StockPrice objects."""
+        with patch("src.data.yahoo_finance.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = make_history()
+            prices = provider.get_stock_prices("AAPL", period="5d")
+
+        assert [p.date for p in prices] == [datetime(2024, 1, d) for d in (2, 3, 5)]
+        assert prices[0].name == "Apple Inc."
+        assert prices[0].market == "us"
+        assert prices[0].volume == 1000
+        assert isinstance(prices[0].volume, int)
+
+    def test_frame_round_trips_through_store(self, provider):
+        """Test that a frame stored directly reads back like model-based storage."""
+        with patch("src.data.yahoo_finance.yf.Ticker") as mock_ticker:
+            mock_ticker.return_value.history.return_value = make_history()
+            frame = provider.get_price_frame("AAPL", period="5d")
+            prices = provider.get_stock_prices("AAPL", period="5d")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pm = PriceDataManager(prices_dir=Path(tmpdir))
+            pm.store_prices("AAPL", frame, append=False)
+            pm.store_prices("MSFT", [p.model_dump() for p in prices], append=False)
+
+            from_frame = pm.get_prices("AAPL")
+            from_models = pm.get_prices("MSFT").drop(columns=["ticker"])
+
+        pd.testing.assert_frame_equal(from_frame.drop(columns=["ticker"]), from_models)
+
+
+class TestDefaultPriceFrame:
+    """Test the DataProvider.get_price_frame default implementation."""
+
+    def test_converts_stock_prices(self):
+        """Test that providers without a frame API convert their StockPrice list."""
+        provider = FixtureDataProvider.__new__(FixtureDataProvider)
+        provider.get_stock_prices = MagicMock(
+            return_value=[
+                StockPrice(
+                    ticker="AAPL",
+                    name="Apple",
+                    market=Market.US,
+                    instrument_type=InstrumentType.STOCK,
+                    date=datetime(2024, 1, day),
+                    open_price=1.0,
+                    high_price=2.0,
+                    low_price=0.5,
+                    close_price=1.5,
+                    volume=100,
+                    currency="USD",
+                )
+                for day in (3, 2)
+            ]
+        )
+
+        frame = provider.get_price_frame("AAPL", datetime(2024, 1, 1), datetime(2024, 1, 5))
+
+        assert list(frame.columns) == PriceDataManager.COLUMNS
+        assert list(frame["date"]) == [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+        assert list(frame["close"]) == [1.5, 1.5]
+
+    def test_empty_result(self):
+        """Test that no prices give an empty frame with the store columns."""
+        provider = FixtureDataProvider.__new__(FixtureDataProvider)
+        provider.get_stock_prices = MagicMock(return_value=[])
+
+        frame = provider.get_price_frame("AAPL", period="5d")
+
+        assert frame.empty
+        assert list(frame.columns) == PriceDataManager.COLUMNS
+        provider.get_stock_prices.assert_called_once_with("AAPL", period="5d")
@@ -0,0 +1,115 @@
+"""Tests for cached point-in-time price lookups."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.data.price_manager import PriceDataManager
+
+
+def make_frame(dates: list[str], ticker: str = "AAPL") -> pd.DataFrame:
+    """Create stored price rows with the close equal to the day of month."""
+    timestamps = pd.to_datetime(dates)
+    return pd.DataFrame(
+        {
+            "date": timestamps,
+            "open": timestamps.day.astype(float),
+            "high": timestamps.day.astype(float),
+            "low": timestamps.day.astype(float),
+            "close": timestamps.day.astype(float),
+            "volume": 1000,
+            "currency": "USD",
+            "ticker": ticker,
+        }
+    )
+
+
+@pytest.fixture
+def price_manager():
+    """Create a PriceDataManager with AAPL prices around a weekend."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = PriceDataManager(prices_dir=Path(tmpdir), frame_cache_size=2)
+        # Stored out of order; Jan 6-7 is a weekend
+        manager.store_prices(
+            "AAPL", make_frame(["2024-01-08", "2024-01-02", "2024-01-03", "2024-01-05"])
+        )
+        yield manager
+
+
+class TestPriceIndex:
+    """Test as-of lookups through the decoded-frame cache."""
+
+    def test_history_decoded_once(self, price_manager):
+        """Test that repeated reads of an unchanged file reuse the decoded frame."""
+        with patch.object(price_manager, "_read_csv", wraps=price_manager._read_csv) as read:
+            price_manager.get_price_at_date("AAPL", date(2024, 1, 3))
+            price_manager.get_prices("AAPL", start_date=date(2024, 1, 3))
+            price_manager.get_data_range("AAPL")
+
+        assert read.call_count == 1
+
+    def test_store_invalidates_cache(self, price_manager):
+        """Test that stored prices are visible to the next lookup."""
+        assert price_manager.get_latest_price("AAPL")["close"] == 8.0
+
+        price_manager.store_prices("AAPL", make_frame(["2024-01-09"]))
+
+        assert price_manager.get_latest_price("AAPL")["close"] == 9.0
+        assert price_manager.get_data_range("AAPL") == (date(2024, 1, 2), date(2024, 1, 9))
+
+    def test_cache_bounded(self, price_manager):
+        """Test that the least recently used history is evicted."""
+        for ticker in ["MSFT", "NVDA"]:
+            price_manager.store_prices(ticker, make_frame(["2024-01-02"], ticker))
+
+        for ticker in ["AAPL", "MSFT", "NVDA"]:
+            price_manager.get_price_index(ticker)
+
+        assert list(price_manager._frames) == ["MSFT", "NVDA"]
+
+    def test_price_at_date(self, price_manager):
+        """Test exact dates, weekend fallback and tolerance."""
+        assert price_manager.get_price_at_date("AAPL", date(2024, 1, 3))["close"] == 3.0
+        assert price_manager.get_price_at_date("AAPL", date(2024, 1, 7))["close"] == 5.0
+        assert price_manager.get_price_at_date("AAPL", date(2024, 1, 7), tolerance_days=1) is None
+        assert price_manager.get_price_at_date("AAPL", date(2024, 1, 1)) is None
+        assert price_manager.get_price_at_date("MISSING", date(2024, 1, 3)) is None
+
+    def test_prices_between_dates(self, price_manager):
+        """Test that date ranges are sliced from the sorted history."""
+        prices = price_manager.get_prices(
+            "AAPL", start_date=date(2024, 1, 3), end_date=date(2024, 1, 7)
+        )
+
+        assert list(prices["close"]) == [3.0, 5.0]
+        assert list(prices.index) == [0, 1]
+
+    def test_batch_lookup(self, price_manager):
+        """Test that batch lookups match single lookups in input order."""
+        pairs = [
+            ("AAPL", date(2024, 1, 7)),
+            ("MISSING", date(2024, 1, 3)),
+            ("AAPL", date(2024, 1, 2)),
+            ("AAPL", date(2024, 1, 1)),
+            ("AAPL", date(2024, 1, 20)),
+        ]
+
+        prices = price_manager.get_prices_at_dates(pairs)
+
+        assert list(prices["ticker"]) == [ticker for ticker, _ in pairs]
+        assert list(prices["target_date"]) == [target for _, target in pairs]
+        assert prices["close"].tolist()[:3:2] == [5.0, 2.0]
+        assert prices["close"].isna().tolist() == [False, True, False, True, True]
+        assert prices.loc[0, "date"] == pd.Timestamp("2024-01-05")
+        assert prices.loc[0, "currency"] == "USD"
+
+    def test_batch_lookup_without_data(self, price_manager):
+        """Test that pairs without stored prices give rows without prices."""
+        prices = price_manager.get_prices_at_dates([("MISSING", date(2024, 1, 3))])
+
+        assert len(prices) == 1
+        assert pd.isna(prices.loc[0, "close"])
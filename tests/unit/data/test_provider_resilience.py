@@ -0,0 +1,127 @@
+"""Tests for provider rate limiting, throttling and circuit breaking."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data.alpha_vantage import AlphaVantageProvider
+from src.data.finnhub import FinnhubProvider
+from src.data.provider_manager import ProviderManager
+from src.utils.errors import RateLimitException
+from src.utils.resilience import (
+    CircuitState,
+    get_provider_rate_limiter,
+    reset_provider_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def fast_rate_limits():
+    """Use generous budgets and fresh shared limiters for each test."""
+    limits = {"alpha_vantage": (1000, 1.0), "finnhub": (1000, 1.0)}
+    with patch.dict("src.utils.resilience.PROVIDER_RATE_LIMITS", limits):
+        reset_provider_rate_limiters()
+        yield
+    reset_provider_rate_limiters()
+
+
+def make_response(status_code: int = 200, json_data=None, headers=None) -> MagicMock:
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_data if json_data is not None else []
+    return response
+
+
+class TestFinnhubThrottling:
+    """Test Finnhub handling of HTTP 429."""
+
+    def test_retries_after_429_and_adapts_rate(self):
+        """Test that a throttled request is retried and the shared rate reduced."""
+        http = MagicMock()
+        http.get.side_effect = [make_response(429, headers={"Retry-After": "0"}), make_response()]
+        provider = FinnhubProvider(api_key="test", http_client=http)
+
+        assert provider.get_news("AAPL") == []
+        assert http.get.call_count == 2
+        assert get_provider_rate_limiter("finnhub").rate < 1000
+
+    def test_long_retry_after_fails_fast(self):
+        """Test that a Retry-After beyond the wait limit raises with the requested delay."""
+        http = MagicMock()
+        http.get.return_value = make_response(429, headers={"Retry-After": "3600"})
+        provider = FinnhubProvider(api_key="test", http_client=http)
+
+        with pytest.raises(RateLimitException) as exc_info:
+            provider.get_company_info("AAPL")
+
+        assert http.get.call_count == 1
+        assert exc_info.value.context["retry_after"] == 3600
+
+
+class TestAlphaVantageThrottling:
+    """Test Alpha Vantage handling of throttled responses."""
+
+    def test_call_frequency_note_retried(self):
+        """Test that a call-frequency note is retried through the limiter."""
+        http = MagicMock()
+        http.get.side_effect = [
+            make_response(200, {"Note": "Please consider our call frequency limits"}),
+            make_response(200, {"feed": []}),
+        ]
+        provider = AlphaVantageProvider(api_key="test", max_retries=3, http_client=http)
+
+        with patch.object(get_provider_rate_limiter("alpha_vantage"), "period", 0.001):
+            assert provider._api_call({"function": "NEWS_SENTIMENT"}) == {"feed": []}
+
+    def test_daily_quota_raises_rate_limit(self):
+        """Test that an exhausted daily quota is not retried."""
+        http = MagicMock()
+        http.get.return_value = make_response(
+            200, {"Information": "Our standard API rate limit is 25/day"}
+        )
+        provider = AlphaVantageProvider(api_key="test", http_client=http)
+
+        with pytest.raises(RateLimitException):
+            provider.get_news("AAPL")
+
+        assert http.get.call_count == 1
+
+
+class TestProviderManagerCircuit:
+    """Test circuit breaking in ProviderManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a ProviderManager with mock providers."""
+        with patch.object(ProviderManager, "_create_provider") as mock_create:
+            mock_create.side_effect = lambda name: MagicMock(name=name, is_available=True)
+            manager = ProviderManager(primary_provider="primary", backup_providers=["backup"])
+        manager.primary_provider.name = "primary"
+        manager.backup_providers[0].name = "backup"
+        return manager
+
+    def test_failing_provider_skipped_after_threshold(self, manager):
+        """Test that a provider with an open circuit is not called."""
+        manager.primary_provider.get_news.side_effect = RuntimeError("down")
+        manager.backup_providers[0].get_news.return_value = ["article"]
+
+        for _ in range(5):
+            assert manager.get_news("AAPL") == ["article"]
+        assert manager.get_news("AAPL") == ["article"]
+
+        assert manager.primary_provider.get_news.call_count == 5
+        assert manager.get_health_status()["primary_provider"]["circuit"] == "open"
+
+    def test_rate_limit_retry_after_opens_circuit(self, manager):
+        """Test that a rate limit error with Retry-After opens the circuit at once."""
+        manager.primary_provider.get_news.side_effect = RateLimitException(
+            "throttled", provider="primary", context={"retry_after": 120}
+        )
+        manager.backup_providers[0].get_news.return_value = ["article"]
+
+        manager.get_news("AAPL")
+
+        assert manager.circuit_breakers["primary"].state == CircuitState.OPEN
+        assert manager.circuit_breakers["backup"].state == CircuitState.CLOSED
@@ -0,0 +1,234 @@
+"""Unit tests for RecommendationsRepository."""
+
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.data.repository import RecommendationsRepository
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        yield db_path
+
+
+@pytest.fixture
+def rec_repo(temp_db):
+    """Create a RecommendationsRepository instance with a temporary database."""
+    return RecommendationsRepository(temp_db)
+
+
+def make_signal(
+    ticker: str,
+    final_score: float,
+    confidence: float = 70.0,
+    recommendation: str = "buy",
+    analysis_date: str = "2025-01-15",
+):
+    """Build an InvestmentSignal for storage tests."""
+    from src.analysis import InvestmentSignal
+    from src.analysis.models import AnalysisMetadata, ComponentScores, RiskAssessment
+
+    return InvestmentSignal(
+        ticker=ticker,
+        name=f"{ticker} Inc.",
+        market="US",
+        current_price=100.0,
+        currency="USD",
+        scores=ComponentScores(technical=70.0, fundamental=60.0, sentiment=65.0),
+        final_score=final_score,
+        recommendation=recommendation,
+        confidence=confidence,
+        expected_return_min=5.0,
+        expected_return_max=15.0,
+        time_horizon="3M",
+        key_reasons=["Bullish trend"],
+        risk=RiskAssessment(
+            level="medium",
+            volatility="moderate",
+            volatility_pct=15.0,
+            liquidity="normal",
+            concentration_risk=False,
+            flags=["earnings_soon"],
+        ),
+        generated_at=datetime.now(),
+        analysis_date=analysis_date,
+        rationale="Strong indicators",
+        caveats=["Market volatility"],
+        metadata=AnalysisMetadata(),
+    )
+
+
+@pytest.fixture
+def populated_repo(rec_repo):
+    """Store repeated runs with duplicate tickers for the same analysis date."""
+    rows = [
+        (1, make_signal("AAPL", 70.0, 60.0)),
+        (1, make_signal("MSFT", 80.0, 75.0)),
+        (1, make_signal("TSLA", 40.0, 50.0, recommendation="sell")),
+        (2, make_signal("AAPL", 85.0, 70.0)),
+        (2, make_signal("MSFT", 80.0, 65.0)),
+        (2, make_signal("NVDA", 90.0, 85.0)),
+        (2, make_signal("INTC", 35.0, 55.0, recommendation="sell")),
+        (2, make_signal("AAPL", 60.0, 90.0, analysis_date="2025-01-14")),
+    ]
+    for session_id, signal in rows:
+        rec_repo.store_recommendation(signal, run_session_id=session_id, analysis_mode="llm")
+    return rec_repo
+
+
+class TestGetRecommendationsByDate:
+    """Test SQL-side deduplication and pagination for date queries."""
+
+    def test_keeps_best_per_ticker(self, populated_repo):
+        """Test only the highest scoring row per ticker is returned."""
+        signals = populated_repo.get_recommendations_by_date("2025-01-15")
+
+        assert [s.ticker for s in signals] == ["NVDA", "AAPL", "MSFT", "TSLA", "INTC"]
+        aapl = next(s for s in signals if s.ticker == "AAPL")
+        assert aapl.final_score == 85.0
+
+    def test_tie_broken_by_confidence(self, populated_repo):
+        """Test equal final scores keep the higher confidence row."""
+        signals = populated_repo.get_recommendations_by_date("2025-01-15")
+
+        msft = next(s for s in signals if s.ticker == "MSFT")
+        assert msft.confidence == 75.0
+
+    def test_filters_applied_before_dedup(self, populated_repo):
+        """Test filters restrict candidates before best-row selection."""
+        signals = populated_repo.get_recommendations_by_date(
+            "2025-01-15", confidence_threshold=72.0
+        )
+
+        assert [s.ticker for s in signals] == ["NVDA", "MSFT"]
+
+    def test_limit_and_offset(self, populated_repo):
+        """Test pagination over the ranked result."""
+        first_page = populated_repo.get_recommendations_by_date("2025-01-15", limit=2)
+        second_page = populated_repo.get_recommendations_by_date("2025-01-15", limit=2, offset=2)
+
+        assert [s.ticker for s in first_page] == ["NVDA", "AAPL"]
+        assert [s.ticker for s in second_page] == ["MSFT", "TSLA"]
+
+    def test_top_n_per_signal_type(self, populated_repo):
+        """Test keeping the N best signals of each signal type."""
+        signals = populated_repo.get_recommendations_by_date("2025-01-15", top_n_per_signal_type=1)
+
+        assert [s.ticker for s in signals] == ["NVDA", "TSLA"]
+
+    def test_without_details_skips_heavy_columns(self, populated_repo):
+        """Test score-only loading leaves text and metadata fields empty."""
+        signals = populated_repo.get_recommendations_by_date("2025-01-15", include_details=False)
+
+        assert len(signals) == 5
+        assert all(s.metadata is None for s in signals)
+        assert all(s.key_reasons == [] and s.caveats == [] for s in signals)
+        assert all(s.rationale is None for s in signals)
+        assert signals[0].risk.flags == ["earnings_soon"]
+
+    def test_with_details_decodes_json(self, populated_repo):
+        """Test default loading decodes JSON columns."""
+        signals = populated_repo.get_recommendations_by_date("2025-01-15")
+
+        assert signals[0].key_reasons == ["Bullish trend"]
+        assert signals[0].caveats == ["Market volatility"]
+        assert signals[0].metadata is not None
+
+
+class TestGetRecommendationsBySession:
+    """Test SQL-side deduplication for session queries."""
+
+    def test_session_dedup_across_dates(self, populated_repo):
+        """Test rows for different analysis dates are kept separately."""
+        signals = populated_repo.get_recommendations_by_session(2)
+
+        assert len(signals) == 5
+        assert sorted(s.analysis_date for s in signals if s.ticker == "AAPL") == [
+            "2025-01-14",
+            "2025-01-15",
+        ]
+
+    def test_session_limit(self, populated_repo):
+        """Test limit applies to session queries."""
+        signals = populated_repo.get_recommendations_by_session(1, limit=1)
+
+        assert [s.ticker for s in signals] == ["MSFT"]
+
+
+class TestStoreRecommendations:
+    """Test bulk recommendation storage."""
+
+    def test_store_many_in_one_session(self, rec_repo):
+        """Test that signals across tickers and dates are stored together."""
+        signals = [
+            make_signal("AAPL", 70.0, analysis_date="2025-01-14"),
+            make_signal("AAPL", 75.0, analysis_date="2025-01-15"),
+            make_signal("MSFT", 80.0, analysis_date="2025-01-15"),
+        ]
+
+        assert rec_repo.store_recommendations(signals, 7, "rule_based") == 3
+
+        stored = rec_repo.get_recommendations_by_session(7)
+        assert sorted((s.ticker, s.analysis_date) for s in stored) == [
+            ("AAPL", "2025-01-14"),
+            ("AAPL", "2025-01-15"),
+            ("MSFT", "2025-01-15"),
+        ]
+
+    def test_existing_recommendation_keys(self, rec_repo):
+        """Test that stored (ticker, date) pairs are found by range and mode."""
+        rec_repo.store_recommendations(
+            [
+                make_signal("AAPL", 70.0, analysis_date="2025-01-14"),
+                make_signal("MSFT", 80.0, analysis_date="2025-01-20"),
+            ],
+            1,
+            "rule_based",
+        )
+
+        keys = rec_repo.get_existing_recommendation_keys(
+            date(2025, 1, 1), date(2025, 1, 15), "rule_based"
+        )
+
+        assert keys == {("AAPL", date(2025, 1, 14))}
+        assert (
+            rec_repo.get_existing_recommendation_keys(date(2025, 1, 1), date(2025, 1, 31), "llm")
+            == set()
+        )
+
+
+class TestBacktestRecommendations:
+    """Test that stored backtest signals stay out of live queries."""
+
+    @pytest.fixture
+    def mixed_repo(self, rec_repo):
+        """Store one live and one backtest signal for the same day."""
+        from src.data.repository import BACKTEST_ANALYSIS_MODE
+
+        rec_repo.store_recommendations([make_signal("AAPL", 70.0)], 1, "rule_based")
+        rec_repo.store_recommendations([make_signal("MSFT", 90.0)], 2, BACKTEST_ANALYSIS_MODE)
+        return rec_repo
+
+    def test_live_queries_exclude_backtest(self, mixed_repo):
+        """Test listing, publishing and duplicate checks see only live signals."""
+        assert [s.ticker for s in mixed_repo.get_recommendations_by_date("2025-01-15")] == ["AAPL"]
+        assert [row.ticker for row in mixed_repo.get_recommendation_summaries()] == ["AAPL"]
+        assert mixed_repo.get_changes_since()["tickers"] == {"AAPL"}
+        assert mixed_repo.get_latest_recommendation("MSFT") is None
+        assert mixed_repo.get_existing_tickers_for_date("2025-01-15", "rule_based") == {"AAPL"}
+
+    def test_backtest_mode_requested_explicitly(self, mixed_repo):
+        """Test backtest signals remain available under their own mode."""
+        from src.data.repository import BACKTEST_ANALYSIS_MODE
+
+        signals = mixed_repo.get_recommendations_by_date(
+            "2025-01-15", analysis_mode=BACKTEST_ANALYSIS_MODE
+        )
+
+        assert [s.ticker for s in signals] == ["MSFT"]
@@ -604,6 +604,21 @@ class TestTradingJournalRepository:
         closed_trades = journal_repo.get_closed_trades()
         assert len(closed_trades) == 0
 
+    def test_iter_all_trades_streams_in_batches(self, journal_repo):
+        """Test streaming trades across several fetch batches."""
+        for ticker in ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"]:
+            journal_repo.create_trade(
+                ticker_symbol=ticker,
+                entry_date=date.today(),
+                entry_price=100.0,
+                position_size=1,
+            )
+
+        streamed = list(journal_repo.iter_all_trades(batch_size=2))
+
+        assert [t["ticker_symbol"] for t in streamed] == ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"]
+        assert streamed == journal_repo.get_all_trades()
+
     def test_get_trade_by_id_exists(self, journal_repo):
         """Test getting a trade by ID when it exists."""
         success, _, trade_id = journal_repo.create_trade(
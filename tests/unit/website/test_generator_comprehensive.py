@@ -3,6 +3,7 @@
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -485,8 +486,6 @@ class TestTagPagesGeneration:
 
     def test_ticker_tag_page_content(self, generator, test_db_path):
         """Test ticker-specific tag page content."""
-        from sqlmodel import Session
-
         from src.data.repository import RunSessionRepository
 
         # Create session and store recommendation
@@ -503,17 +502,11 @@ class TestTagPagesGeneration:
             analysis_mode="test",
         )
 
-        # Ensure tag directory exists
-        tag_dir = Path(generator.output_dir) / "tags"
-        tag_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate tag page using database session
-        with Session(generator.recommendations_repo.db_manager.engine) as session:
-            tag_path = generator._generate_ticker_tag_page("AAPL", session)
-
-        assert tag_path.exists()
-
-        content = tag_path.read_text()
+        # Render tag page from the grouped summaries
+        groups = generator._group_recommendations(
+            generator.recommendations_repo.get_recommendation_summaries()
+        )
+        content = generator._render_ticker_tag_page("AAPL", groups["tickers"]["AAPL"])
 
         # Check content
         assert "AAPL" in content
@@ -521,8 +514,6 @@ class TestTagPagesGeneration:
 
     def test_signal_type_tag_page_content(self, generator, test_db_path):
         """Test signal type tag page content."""
-        from sqlmodel import Session
-
         from src.data.repository import RunSessionRepository
 
         # Create session and store recommendation
@@ -539,17 +530,11 @@ class TestTagPagesGeneration:
             analysis_mode="test",
         )
 
-        # Ensure tag directory exists
-        tag_dir = Path(generator.output_dir) / "tags"
-        tag_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate signal type tag page
-        with Session(generator.recommendations_repo.db_manager.engine) as session:
-            tag_path = generator._generate_signal_type_tag_page("buy", session)
-
-        assert tag_path.exists()
-
-        content = tag_path.read_text()
+        # Render signal type tag page
+        groups = generator._group_recommendations(
+            generator.recommendations_repo.get_recommendation_summaries()
+        )
+        content = generator._render_signal_type_tag_page("buy", groups["signal_types"]["buy"])
 
         # Check content
         assert "BUY" in content or "buy" in content
@@ -557,8 +542,6 @@ class TestTagPagesGeneration:
 
     def test_date_tag_page_content(self, generator, test_db_path):
         """Test date tag page content."""
-        from sqlmodel import Session
-
         from src.data.repository import RunSessionRepository
 
         # Create session and store recommendation
@@ -575,17 +558,11 @@ class TestTagPagesGeneration:
             analysis_mode="test",
         )
 
-        # Ensure tag directory exists
-        tag_dir = Path(generator.output_dir) / "tags"
-        tag_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate date tag page
-        with Session(generator.recommendations_repo.db_manager.engine) as session:
-            tag_path = generator._generate_date_tag_page("2025-12-15", session)
-
-        assert tag_path.exists()
-
-        content = tag_path.read_text()
+        # Render date tag page
+        groups = generator._group_recommendations(
+            generator.recommendations_repo.get_recommendation_summaries()
+        )
+        content = generator._render_date_tag_page("2025-12-15", groups["dates"]["2025-12-15"])
 
         # Check content
         assert "2025-12-15" in content
@@ -792,3 +769,146 @@ class TestEdgeCases:
         else:
             # Alternative formatting
             assert "0.35" in formatted_text or "35" in formatted_text
+
+
+class TestIncrementalPublishing:
+    """Test watermark-based incremental generation and content-hashed writes."""
+
+    @staticmethod
+    def store_signals(generator, test_db_path, signals):
+        """Store signals in a new run session."""
+        from src.data.repository import RunSessionRepository
+
+        session_id = RunSessionRepository(test_db_path).create_session(
+            analysis_mode="test", analyzed_category="test"
+        )
+        for signal in signals:
+            generator.recommendations_repo.store_recommendation(
+                signal=signal, run_session_id=session_id, analysis_mode="test"
+            )
+
+    def test_unchanged_page_not_rewritten(self, generator, temp_output_dir):
+        """Test that a page with identical content is not written again."""
+        signals = [create_detailed_signal(ticker="AAPL")]
+        path = generator.generate_report_page(signals, "2025-12-15")
+        path.write_text("edited")  # Detect a rewrite
+        generator._page_hashes.clear()
+
+        generator.generate_report_page(signals, "2025-12-15")
+        generator.generate_report_page(signals, "2025-12-15")
+
+        assert generator.pages_written == 2
+        assert generator.pages_unchanged == 1
+        assert "AAPL" in path.read_text()
+
+    def test_state_persists_between_generators(
+        self, generator, test_config, test_db_path, temp_output_dir
+    ):
+        """Test that the watermark and page hashes survive a new generator instance."""
+        signals = [create_detailed_signal(ticker="AAPL")]
+        generator.generate_report_page(signals, "2025-12-15")
+        watermark = datetime(2025, 12, 15, 18, 30)
+        generator.save_publish_state(watermark)
+
+        reloaded = WebsiteGenerator(test_config, test_db_path, temp_output_dir)
+        reloaded.generate_report_page(signals, "2025-12-15")
+
+        assert reloaded.watermark == watermark
+        assert reloaded.pages_written == 0
+        assert reloaded.pages_unchanged == 1
+
+    def test_changes_since_watermark(self, generator, test_db_path):
+        """Test that only values with recommendations after the watermark are changes."""
+        self.store_signals(
+            generator, test_db_path, [create_detailed_signal("AAPL", Recommendation.BUY)]
+        )
+        first = generator.get_changes()
+        assert first["tickers"] == {"AAPL"}
+        generator.save_publish_state(first["watermark"])
+
+        assert generator.get_changes()["watermark"] is None
+
+        self.store_signals(
+            generator, test_db_path, [create_detailed_signal("MSFT", Recommendation.SELL)]
+        )
+        second = generator.get_changes()
+
+        assert second["tickers"] == {"MSFT"}
+        assert second["signal_types"] == {"sell"}
+        assert second["dates"] == {"2025-12-15"}
+        assert second["watermark"] > first["watermark"]
+        assert generator.get_changes(full=True)["tickers"] == {"AAPL", "MSFT"}
+
+    def test_tag_pages_limited_to_changes(self, generator, test_db_path, temp_output_dir):
+        """Test that incremental tag generation only renders changed tags."""
+        self.store_signals(
+            generator,
+            test_db_path,
+            [
+                create_detailed_signal("AAPL", Recommendation.BUY),
+                create_detailed_signal("MSFT", Recommendation.SELL),
+            ],
+        )
+
+        tags = generator.generate_tag_pages(
+            {"tickers": {"MSFT"}, "signal_types": {"sell"}, "dates": set()}
+        )
+
+        assert set(tags) == {"MSFT", "sell"}
+        assert not (temp_output_dir / "tags" / "AAPL.md").exists()
+
+
+class TestGroupedGeneration:
+    """Test tag and ticker pages rendered from a single summary query."""
+
+    def test_group_recommendations(self, generator, test_db_path):
+        """Test that summaries are partitioned by ticker, signal type and date."""
+        TestIncrementalPublishing.store_signals(
+            generator,
+            test_db_path,
+            [
+                create_detailed_signal("MSFT", Recommendation.BUY),
+                create_detailed_signal("AAPL", Recommendation.BUY),
+                create_detailed_signal("NVDA", Recommendation.SELL),
+            ],
+        )
+
+        groups = generator._group_recommendations(
+            generator.recommendations_repo.get_recommendation_summaries()
+        )
+
+        assert set(groups["tickers"]) == {"AAPL", "MSFT", "NVDA"}
+        assert [r.ticker for r in groups["signal_types"]["buy"]] == ["AAPL", "MSFT"]
+        assert [r.ticker for r in groups["dates"]["2025-12-15"]] == ["AAPL", "MSFT", "NVDA"]
+
+    def test_tag_pages_use_one_summary_query(self, generator, test_db_path, temp_output_dir):
+        """Test that all tag pages are rendered from one result set."""
+        TestIncrementalPublishing.store_signals(
+            generator,
+            test_db_path,
+            [
+                create_detailed_signal("AAPL", Recommendation.BUY),
+                create_detailed_signal("MSFT", Recommendation.SELL),
+            ],
+        )
+        repo = generator.recommendations_repo
+
+        with patch.object(
+            repo, "get_recommendation_summaries", wraps=repo.get_recommendation_summaries
+        ) as summaries:
+            tags = generator.generate_tag_pages()
+
+        summaries.assert_called_once_with()
+        assert set(tags) == {"AAPL", "MSFT", "buy", "sell", "2025-12-15"}
+        assert "**MSFT**" in (temp_output_dir / "tags" / "2025-12-15.md").read_text()
+
+    def test_generate_ticker_pages(self, generator, test_db_path, temp_output_dir):
+        """Test that ticker pages are written for tickers with recommendations only."""
+        TestIncrementalPublishing.store_signals(
+            generator, test_db_path, [create_detailed_signal("AAPL", Recommendation.BUY)]
+        )
+
+        pages = generator.generate_ticker_pages(["AAPL", "NONE"])
+
+        assert list(pages) == ["AAPL"]
+        assert "| 2025-12-15 | Buy |" in pages["AAPL"].read_text()
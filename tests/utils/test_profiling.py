@@ -0,0 +1,183 @@
+"""Unit tests for the profiling module."""
+
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.cache.manager import CacheManager
+from src.data.repository import RunSessionRepository
+from src.utils.profiling import (
+    get_profiler,
+    increment,
+    profiled,
+    record_cache_access,
+    record_provider_call,
+    span,
+    start_run_profile,
+    stop_run_profile,
+)
+
+
+class _Result:
+    """Object carrying a ticker attribute, like UnifiedAnalysisResult."""
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+
+
+@profiled("test.fetch")
+def _fetch(ticker: str, days: int = 1) -> str:
+    return f"{ticker}:{days}"
+
+
+@profiled("test.create", ticker_arg="result")
+def _create(result: _Result) -> str:
+    return result.ticker
+
+
+class TestRunProfiler:
+    """Test suite for RunProfiler and the module-level span API."""
+
+    @pytest.fixture
+    def profiler(self):
+        """Start a run profile and stop it after the test."""
+        profiler = start_run_profile()
+        yield profiler
+        stop_run_profile()
+
+    def test_inactive_profiler_is_noop(self):
+        """Test that spans and counters do nothing without an active profiler."""
+        stop_run_profile()
+
+        with span("ignored", "AAPL"):
+            increment("ignored")
+        assert _fetch("AAPL") == "AAPL:1"
+        assert get_profiler() is None
+
+    def test_phase_and_ticker_aggregation(self, profiler):
+        """Test per-phase stats and per-ticker totals, with ticker inheritance."""
+        with span("analysis", "AAPL"):
+            with span("news"):
+                pass
+        with span("analysis", "MSFT"):
+            pass
+
+        summary = profiler.summary()
+
+        assert summary["phases"]["analysis"]["count"] == 2
+        assert summary["phases"]["news"]["count"] == 1
+        assert set(summary["tickers"]) == {"AAPL", "MSFT"}
+        # Nested span inherits the enclosing ticker
+        assert "news" in summary["tickers"]["AAPL"]
+        assert "news" not in summary["tickers"]["MSFT"]
+        analysis = summary["phases"]["analysis"]
+        assert analysis["avg_seconds"] == pytest.approx(analysis["total_seconds"] / 2)
+
+    def test_profiled_decorator_resolves_ticker(self, profiler):
+        """Test that the decorator reads tickers from args, kwargs and objects."""
+        assert _fetch("AAPL", days=5) == "AAPL:5"
+        _fetch(ticker="MSFT")
+        assert _create(_Result("NVDA")) == "NVDA"
+
+        summary = profiler.summary()
+
+        assert summary["phases"]["test.fetch"]["count"] == 2
+        assert set(summary["tickers"]) == {"AAPL", "MSFT", "NVDA"}
+        assert "test.create" in summary["tickers"]["NVDA"]
+
+    def test_span_recorded_when_exception_raised(self, profiler):
+        """Test that a failing block is still timed."""
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("boom")
+
+        assert profiler.summary()["phases"]["failing"]["count"] == 1
+
+    def test_counters_cache_hit_rate_and_provider_calls(self, profiler):
+        """Test cache hit rate and provider call counting."""
+        record_cache_access(hit=True)
+        record_cache_access(hit=True)
+        record_cache_access(hit=False)
+        record_provider_call("yahoo_finance")
+        record_provider_call("yahoo_finance")
+        record_provider_call("finnhub")
+
+        summary = profiler.summary()
+
+        assert summary["cache_hit_rate"] == pytest.approx(2 / 3)
+        assert summary["provider_calls"] == {"yahoo_finance": 2, "finnhub": 1}
+
+    def test_cache_manager_records_hits_and_misses(self, profiler):
+        """Test that CacheManager.get reports lookups to the active profiler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CacheManager(tmpdir)
+            cache.get("missing")
+            cache.set("present", {"value": 1}, ttl_hours=1)
+            cache.get("present")
+
+        counters = profiler.summary()["counters"]
+        assert counters["cache.hits"] == 1
+        assert counters["cache.misses"] == 1
+
+    def test_spans_from_threads(self, profiler):
+        """Test that concurrent spans are recorded with their own ticker stacks."""
+
+        def worker(ticker: str) -> None:
+            with span("worker", ticker):
+                with span("inner"):
+                    pass
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in ["A", "B", "C", "D"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = profiler.summary()
+        assert summary["phases"]["inner"]["count"] == 4
+        assert all("inner" in summary["tickers"][t] for t in ["A", "B", "C", "D"])
+
+    def test_write_trace(self, profiler):
+        """Test Chrome trace export with embedded summary."""
+        with span("filtering"):
+            with span("data.prices", "AAPL", attempt=1):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = profiler.write_trace(Path(tmpdir) / "profiles" / "run.json")
+            data = json.loads(path.read_text())
+
+        events = data["traceEvents"]
+        assert [e["name"] for e in events] == ["filtering", "data.prices"]
+        assert all(e["ph"] == "X" for e in events)
+        assert events[1]["cat"] == "data"
+        assert events[1]["args"] == {"attempt": "1", "ticker": "AAPL"}
+        assert events[0]["dur"] >= events[1]["dur"]
+        assert "filtering" in data["summary"]["phases"]
+
+
+class TestRunSessionProfile:
+    """Test suite for storing run profiles with run sessions."""
+
+    def test_store_and_get_profile(self):
+        """Test that a profile is stored, replaced and read back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = RunSessionRepository(Path(tmpdir) / "test.db")
+            session_id = repo.create_session(analysis_mode="rule_based")
+
+            assert repo.get_profile(session_id) is None
+
+            profiler = start_run_profile()
+            with span("analysis", "AAPL"):
+                record_provider_call("yahoo_finance")
+            stop_run_profile()
+
+            assert repo.store_profile(session_id, profiler.summary())
+            assert repo.store_profile(session_id, profiler.summary())
+
+            profile = repo.get_profile(session_id)
+            assert profile["phases"]["analysis"]["count"] == 1
+            assert profile["provider_calls"] == {"yahoo_finance": 1}
@@ -1,11 +1,23 @@
 """Unit tests for the resilience module."""
 
+import asyncio
+import threading
 import time
 
 import pytest
 
 from src.utils.errors import RetryableException
-from src.utils.resilience import RateLimiter, fallback, retry, timeout
+from src.utils.resilience import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    CircuitState,
+    RateLimiter,
+    fallback,
+    parse_retry_after,
+    retry,
+    run_concurrently,
+    timeout,
+)
 
 
 class TestRetryDecorator:
@@ -282,6 +294,135 @@ class TestRateLimiter:
         # Should have waited for refill
         assert elapsed >= 0.1
 
+    def test_waiters_served_in_order_at_rate(self):
+        """Test that concurrent waiters queue behind each other instead of bursting."""
+        limiter = RateLimiter(rate=1, period=0.05)
+        limiter.acquire(1)
+        finished = []
+
+        def worker(i):
+            limiter.wait_if_needed(1)
+            finished.append((i, time.monotonic()))
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.005)
+        for thread in threads:
+            thread.join()
+
+        assert [i for i, _ in finished] == [0, 1, 2, 3]
+        # Four more tokens at one per 50ms
+        assert finished[-1][1] - start >= 0.18
+
+    def test_wait_async(self):
+        """Test that asyncio tasks share the bucket without blocking the loop."""
+        limiter = RateLimiter(rate=2, period=0.1)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.wait_async() for _ in range(4)))
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+
+        # Two immediately, two more after one refill period
+        assert 0.08 <= elapsed < 0.3
+
+    def test_pause_blocks_until_elapsed(self):
+        """Test that pause() grants no tokens until the pause is over."""
+        limiter = RateLimiter(rate=100, period=1.0)
+        limiter.pause(0.1)
+
+        assert limiter.acquire(1) is False
+        start = time.monotonic()
+        limiter.wait_if_needed(1)
+        assert time.monotonic() - start >= 0.09
+
+
+class TestAdaptiveRateLimiter:
+    """Test suite for AIMD rate adaptation."""
+
+    def test_throttle_decreases_and_success_recovers(self):
+        """Test multiplicative decrease on throttling and additive increase on success."""
+        limiter = AdaptiveRateLimiter(rate=10, period=1.0, min_rate=2)
+
+        limiter.record_throttle(retry_after=0)
+        assert limiter.rate == 5
+        limiter.record_throttle(retry_after=0)
+        limiter.record_throttle(retry_after=0)
+        assert limiter.rate == 2
+
+        for _ in range(200):
+            limiter.record_success()
+        assert limiter.rate == 10
+
+    def test_throttle_honors_retry_after(self):
+        """Test that a throttled response pauses the limiter for Retry-After."""
+        limiter = AdaptiveRateLimiter(rate=100, period=1.0)
+        limiter.record_throttle(retry_after=0.1)
+
+        start = time.monotonic()
+        limiter.wait_if_needed(1)
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("5", 5.0), (None, None), ("soon", None), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)],
+    )
+    def test_parse_retry_after(self, value, expected):
+        """Test parsing of delay-seconds and HTTP-date Retry-After values."""
+        assert parse_retry_after(value) == expected
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow_request() is True
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_allows_single_probe(self):
+        """Test that one probe is let through after the recovery timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing probe opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=0.05)
+        breaker.trip()
+        time.sleep(0.06)
+
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_trip_for_retry_after(self):
+        """Test that trip() keeps the circuit open for the given time."""
+        breaker = CircuitBreaker(recovery_timeout=0.01)
+        breaker.trip(10)
+        time.sleep(0.02)
+
+        assert breaker.allow_request() is False
+
 
 class TestTimeoutDecorator:
     """Test suite for the timeout decorator."""
@@ -324,6 +465,39 @@ class TestTimeoutDecorator:
         assert "docstring" in documented_func.__doc__
 
 
+class TestRunConcurrently:
+    """Test suite for run_concurrently."""
+
+    def test_tasks_run_in_parallel(self):
+        """Test that total latency is bounded by the slowest task, not the sum."""
+        start = time.monotonic()
+        results = run_concurrently(
+            {name: (lambda n=name: time.sleep(0.2) or n) for name in ["a", "b", "c", "d"]}
+        )
+
+        assert time.monotonic() - start < 0.6
+        assert results == {"a": "a", "b": "b", "c": "c", "d": "d"}
+
+    def test_timeout_and_failure_yield_none(self):
+        """Test that slow or failing tasks do not hold up or break the others."""
+
+        def failing():
+            raise ValueError("boom")
+
+        start = time.monotonic()
+        results = run_concurrently(
+            {"slow": lambda: time.sleep(1.0) or "late", "fast": lambda: "ok", "bad": failing},
+            timeouts={"slow": 0.1},
+        )
+
+        assert time.monotonic() - start < 0.5
+        assert results == {"slow": None, "fast": "ok", "bad": None}
+
+    def test_empty_tasks(self):
+        """Test that no tasks returns an empty result."""
+        assert run_concurrently({}) == {}
+
+
 class TestResilienceIntegration:
     """Integration tests combining multiple resilience patterns."""
 